@@ -22,6 +22,7 @@ from phonenumber_field.modelfields import PhoneNumber, PhoneNumberField
 from versatileimagefield.fields import VersatileImageField
 
 from ..app.models import App
+from ..core.auth_cache import invalidate_principals_on_commit
 from ..core.models import ModelWithMetadata
 from ..core.permissions import AccountPermissions, BasePermissionEnum, get_permissions
 from ..core.utils.json_serializer import CustomJsonEncoder
@@ -206,6 +207,14 @@ class User(PermissionsMixin, ModelWithMetadata, AbstractBaseUser):
         super().__init__(*args, **kwargs)
         self._effective_permissions = None
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        invalidate_principals_on_commit(User, [self.pk])
+
+    def delete(self, *args, **kwargs):
+        invalidate_principals_on_commit(User, [self.pk])
+        return super().delete(*args, **kwargs)
+
     @property
     def effective_permissions(self) -> "QuerySet[Permission]":
         if self._effective_permissions is None:
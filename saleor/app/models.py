@@ -4,6 +4,7 @@ from django.contrib.auth.models import Permission
 from django.db import models
 from oauthlib.common import generate_token
 
+from ..core.auth_cache import invalidate_principals_on_commit
 from ..core.models import Job, ModelWithMetadata
 from ..core.permissions import AppPermission
 from ..webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
@@ -66,6 +67,14 @@ class App(ModelWithMetadata):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        invalidate_principals_on_commit(App, [self.pk])
+
+    def delete(self, *args, **kwargs):
+        invalidate_principals_on_commit(App, [self.pk])
+        return super().delete(*args, **kwargs)
+
     def get_permissions(self) -> Set[str]:
         """Return the permissions of the app."""
         if not self.is_active:
@@ -104,6 +113,10 @@ class AppToken(models.Model):
     name = models.CharField(blank=True, default="", max_length=128)
     auth_token = models.CharField(default=generate_token, unique=True, max_length=30)
 
+    def delete(self, *args, **kwargs):
+        invalidate_principals_on_commit(App, [self.app_id])
+        return super().delete(*args, **kwargs)
+
 
 class AppExtension(models.Model):
     app = models.ForeignKey(App, on_delete=models.CASCADE, related_name="extensions")
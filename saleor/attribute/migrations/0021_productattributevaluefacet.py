@@ -0,0 +1,87 @@
+# Generated by Django 3.2.12 on 2026-10-17 08:29
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+POPULATE_PRODUCT_ATTRIBUTE_VALUE_FACETS = """
+    INSERT INTO attribute_productattributevaluefacet (product_id, attribute_id, value_id)
+    SELECT assignment.product_id, value.attribute_id, value.id
+    FROM attribute_assignedproductattributevalue AS assigned_value
+    INNER JOIN attribute_assignedproductattribute AS assignment
+        ON assignment.id = assigned_value.assignment_id
+    INNER JOIN attribute_attributevalue AS value
+        ON value.id = assigned_value.value_id
+    UNION
+    SELECT variant.product_id, value.attribute_id, value.id
+    FROM attribute_assignedvariantattributevalue AS assigned_value
+    INNER JOIN attribute_assignedvariantattribute AS assignment
+        ON assignment.id = assigned_value.assignment_id
+    INNER JOIN product_productvariant AS variant
+        ON variant.id = assignment.variant_id
+    INNER JOIN attribute_attributevalue AS value
+        ON value.id = assigned_value.value_id
+    ON CONFLICT DO NOTHING;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0164_product_search_index_dirty"),
+        ("attribute", "0020_auto_20220214_1027"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductAttributeValueFacet",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "attribute",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="product_facets",
+                        to="attribute.attribute",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="attribute_facets",
+                        to="product.product",
+                    ),
+                ),
+                (
+                    "value",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="product_facets",
+                        to="attribute.attributevalue",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="productattributevaluefacet",
+            index=models.Index(
+                fields=["product", "attribute"], name="attribute_p_product_fc47c4_idx"
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="productattributevaluefacet",
+            unique_together={("value", "product")},
+        ),
+        migrations.RunSQL(
+            POPULATE_PRODUCT_ATTRIBUTE_VALUE_FACETS,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -68,3 +68,25 @@ class AttributeProduct(SortableModel):
 
     def get_ordering_queryset(self):
         return self.product_type.attributeproduct.all()
+
+
+class ProductAttributeValueFacet(models.Model):
+    """Denormalized attribute values assigned to a product or any of its variants.
+
+    Kept in sync with the product and variant assignments, allows filtering and
+    counting products by attribute values with a single join.
+    """
+
+    product = models.ForeignKey(
+        Product, related_name="attribute_facets", on_delete=models.CASCADE
+    )
+    attribute = models.ForeignKey(
+        "Attribute", related_name="product_facets", on_delete=models.CASCADE
+    )
+    value = models.ForeignKey(
+        "AttributeValue", related_name="product_facets", on_delete=models.CASCADE
+    )
+
+    class Meta:
+        unique_together = (("value", "product"),)
+        indexes = [models.Index(fields=["product", "attribute"])]
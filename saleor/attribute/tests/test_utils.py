@@ -1,7 +1,11 @@
 import pytest
 
-from ...product.models import ProductType
-from ..utils import associate_attribute_values_to_instance
+from ...product.models import Product, ProductType
+from ..utils import (
+    associate_attribute_values_to_instance,
+    get_product_attribute_value_counts,
+    update_products_attribute_facets,
+)
 
 
 def test_associate_attribute_to_non_product_instance(color_attribute):
@@ -106,3 +110,71 @@ def test_associate_attribute_to_variant_instance_multiple_values(variant):
     assert list(
         new_assignment.variantvalueassignment.values_list("value__pk", "sort_order")
     ) == [(values[0].pk, 0), (values[1].pk, 1)]
+
+
+def _get_product_facets(product):
+    return set(product.attribute_facets.values_list("attribute_id", "value_id"))
+
+
+def test_associate_attribute_to_product_instance_updates_facets(product):
+    # given
+    assignment = product.attributes.first()
+    attribute = assignment.attribute
+    values = attribute.values.all()
+
+    # when
+    associate_attribute_values_to_instance(product, attribute, values[1])
+
+    # then
+    facets = _get_product_facets(product)
+    assert (attribute.pk, values[1].pk) in facets
+    assert (attribute.pk, values[0].pk) not in facets
+
+
+def test_associate_attribute_to_variant_instance_updates_product_facets(product):
+    # given
+    variant = product.variants.first()
+    assignment = variant.attributes.first()
+    attribute = assignment.attribute
+    value = attribute.values.exclude(pk__in=assignment.values.all()).first()
+
+    # when
+    associate_attribute_values_to_instance(variant, attribute, value)
+
+    # then
+    assert _get_product_facets(product) & {
+        (attribute.pk, value.pk) for value in attribute.values.all()
+    } == {(attribute.pk, value.pk)}
+
+
+def test_update_products_attribute_facets(product):
+    # given
+    expected_facets = {
+        (assignment.attribute.pk, value.pk)
+        for instance in [product, *product.variants.all()]
+        for assignment in instance.attributes.all()
+        for value in assignment.values.all()
+    }
+    product.attribute_facets.all().delete()
+
+    # when
+    update_products_attribute_facets([product.pk])
+
+    # then
+    assert expected_facets
+    assert _get_product_facets(product) == expected_facets
+
+
+def test_get_product_attribute_value_counts(product_list):
+    # given
+    attribute = product_list[0].product_type.product_attributes.first()
+    value = attribute.values.first()
+    for product in product_list[:2]:
+        associate_attribute_values_to_instance(product, attribute, value)
+    associate_attribute_values_to_instance(product_list[2], attribute)
+
+    # when
+    counts = get_product_attribute_value_counts(Product.objects.all(), [attribute.pk])
+
+    # then
+    assert counts == {value.pk: 2}
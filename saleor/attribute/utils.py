@@ -1,4 +1,7 @@
-from typing import TYPE_CHECKING, Iterable, Set, Union
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Set, Union
+
+from django.db import transaction
+from django.db.models import Count
 
 from ..page.models import Page
 from ..product.models import Product, ProductVariant
@@ -11,6 +14,7 @@ from .models import (
     AssignedVariantAttributeValue,
     Attribute,
     AttributeValue,
+    ProductAttributeValueFacet,
 )
 
 AttributeAssignmentType = Union[
@@ -20,6 +24,8 @@ T_INSTANCE = Union[Product, ProductVariant, Page]
 
 
 if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
     from .models import AttributePage, AttributeProduct, AttributeVariant
 
 
@@ -44,6 +50,11 @@ def associate_attribute_values_to_instance(
     assignment.values.set(values)
     sort_assigned_attribute_values(instance, assignment, values)
 
+    if isinstance(instance, Product):
+        update_products_attribute_facets([instance.pk], [attribute.pk])
+    elif isinstance(instance, ProductVariant):
+        update_products_attribute_facets([instance.product_id], [attribute.pk])
+
     return assignment
 
 
@@ -115,3 +126,68 @@ def sort_assigned_attribute_values(
         value_assignment.sort_order = index
 
     assignment_model.objects.bulk_update(values_assignment, ["sort_order"])
+
+
+def update_products_attribute_facets(
+    product_ids: Iterable[int], attribute_ids: Optional[Iterable[int]] = None
+) -> None:
+    """Rebuild the attribute value facets of the given products.
+
+    The facets are the union of values assigned to a product and to its variants.
+    When `attribute_ids` are given, only facets of these attributes are rebuilt.
+    """
+    product_ids = list(product_ids)
+    product_values = AssignedProductAttributeValue.objects.filter(
+        assignment__product_id__in=product_ids
+    )
+    variant_values = AssignedVariantAttributeValue.objects.filter(
+        assignment__variant__product_id__in=product_ids
+    )
+    facets = ProductAttributeValueFacet.objects.filter(product_id__in=product_ids)
+    if attribute_ids is not None:
+        attribute_ids = list(attribute_ids)
+        product_values = product_values.filter(value__attribute_id__in=attribute_ids)
+        variant_values = variant_values.filter(value__attribute_id__in=attribute_ids)
+        facets = facets.filter(attribute_id__in=attribute_ids)
+
+    facets_data = set(
+        product_values.values_list(
+            "assignment__product_id", "value__attribute_id", "value_id"
+        )
+    )
+    facets_data.update(
+        variant_values.values_list(
+            "assignment__variant__product_id", "value__attribute_id", "value_id"
+        )
+    )
+    with transaction.atomic():
+        facets.delete()
+        ProductAttributeValueFacet.objects.bulk_create(
+            [
+                ProductAttributeValueFacet(
+                    product_id=product_id, attribute_id=attribute_id, value_id=value_id
+                )
+                for product_id, attribute_id, value_id in facets_data
+            ],
+            ignore_conflicts=True,
+        )
+
+
+def get_product_attribute_value_counts(
+    products: "QuerySet", attribute_ids: Optional[Iterable[int]] = None
+) -> Dict[int, int]:
+    """Return the number of given products having each attribute value assigned.
+
+    The result maps attribute value IDs to product counts, values that are not
+    assigned to any of the products are omitted.
+    """
+    facets = ProductAttributeValueFacet.objects.filter(
+        product_id__in=products.order_by().values("pk")
+    )
+    if attribute_ids is not None:
+        facets = facets.filter(attribute_id__in=list(attribute_ids))
+    return dict(
+        facets.values("value_id")
+        .annotate(count=Count("product_id"))
+        .values_list("value_id", "count")
+    )
@@ -1,17 +1,29 @@
 from typing import TYPE_CHECKING, Iterable, Optional
 
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from prices import Money, TaxedMoney
+
 from ..core.prices import quantize_price
 from ..core.taxes import zero_taxed_money
+from ..core.versioned_cache import VersionedProcessCache
 from ..discount import DiscountInfo
 from .interface import CheckoutTaxedPricesData
+from .models import Checkout, CheckoutLine
 
 if TYPE_CHECKING:
-    from prices import TaxedMoney
-
     from ..account.models import Address
     from ..plugins.manager import PluginsManager
     from .fetch import CheckoutInfo, CheckoutLineInfo
 
+CHECKOUT_TAXES_VERSION_CACHE_KEY = "checkout_taxes_version"
+
+# Only the version is used, it's a part of the prices version of checkouts.
+checkout_taxes_cache: VersionedProcessCache[None] = VersionedProcessCache(
+    CHECKOUT_TAXES_VERSION_CACHE_KEY
+)
+
 
 def checkout_shipping_price(
     *,
@@ -112,3 +124,128 @@ def checkout_line_total(
         discounts or [],
     )
     return calculated_line_total
+
+
+def get_checkout_prices_version() -> str:
+    """Return the version of the shared data persisted checkout prices depend on.
+
+    The version changes when active discounts are invalidated or tax settings
+    change. It has to be read before the discounts used to calculate the prices
+    are fetched.
+    """
+    from ..discount.utils import active_discounts_cache
+
+    discounts_version = active_discounts_cache.get_version()
+    return f"{discounts_version}:{checkout_taxes_cache.get_version()}"
+
+
+def invalidate_checkout_taxes():
+    """Expire prices persisted on all checkouts.
+
+    Should be called each time tax settings or tax plugins configuration change.
+    """
+    checkout_taxes_cache.invalidate()
+
+
+def fetch_checkout_prices_if_expired(
+    manager: "PluginsManager",
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+    discounts: Optional[Iterable[DiscountInfo]] = None,
+    force_update: bool = False,
+    prices_version: Optional[str] = None,
+) -> "CheckoutInfo":
+    """Fetch checkout prices with plugins unless the persisted prices are valid.
+
+    Calculated prices are stored on the checkout and its lines for
+    `settings.CHECKOUT_PRICES_TTL`, but not longer than until the next sale starts
+    or ends, together with the prices version. The checkout is not saved when it
+    was changed in the meantime, as its prices could already be outdated.
+
+    `prices_version` should be read with `get_checkout_prices_version` before
+    the discounts were fetched.
+    """
+    from ..discount.utils import get_next_discounts_change
+
+    checkout = checkout_info.checkout
+    now = timezone.now()
+    if prices_version is None:
+        prices_version = get_checkout_prices_version()
+    if (
+        not force_update
+        and checkout.price_expiration > now
+        and checkout.prices_version == prices_version
+    ):
+        return checkout_info
+
+    discounts = discounts or []
+    address = checkout_info.shipping_address or checkout_info.billing_address
+    checkout.total = checkout_total(
+        manager=manager,
+        checkout_info=checkout_info,
+        lines=lines,
+        address=address,
+        discounts=discounts,
+    )
+    checkout.subtotal = checkout_subtotal(
+        manager=manager,
+        checkout_info=checkout_info,
+        lines=lines,
+        address=address,
+        discounts=discounts,
+    )
+    checkout.shipping_price = checkout_shipping_price(
+        manager=manager,
+        checkout_info=checkout_info,
+        lines=lines,
+        address=checkout_info.shipping_address,
+        discounts=discounts,
+    )
+    updated_lines = []
+    for line_info in lines:
+        line_total = manager.calculate_checkout_line_total(
+            checkout_info, lines, line_info, address, discounts
+        ).price_with_sale
+        line = line_info.line
+        line.total_price_net_amount = line_total.net.amount
+        line.total_price_gross_amount = line_total.gross.amount
+        updated_lines.append(line)
+
+    if not settings.CHECKOUT_PRICES_TTL:
+        return checkout_info
+
+    price_expiration = now + settings.CHECKOUT_PRICES_TTL
+    next_discounts_change = get_next_discounts_change(now)
+    if next_discounts_change:
+        price_expiration = min(price_expiration, next_discounts_change)
+    checkout.price_expiration = price_expiration
+    checkout.prices_version = prices_version
+    with transaction.atomic():
+        updated = Checkout.objects.filter(
+            pk=checkout.pk, last_change=checkout.last_change
+        ).update(
+            total_net_amount=checkout.total_net_amount,
+            total_gross_amount=checkout.total_gross_amount,
+            subtotal_net_amount=checkout.subtotal_net_amount,
+            subtotal_gross_amount=checkout.subtotal_gross_amount,
+            shipping_price_net_amount=checkout.shipping_price_net_amount,
+            shipping_price_gross_amount=checkout.shipping_price_gross_amount,
+            price_expiration=checkout.price_expiration,
+            prices_version=checkout.prices_version,
+        )
+        if updated:
+            CheckoutLine.objects.bulk_update(
+                updated_lines,
+                ["total_price_net_amount", "total_price_gross_amount"],
+            )
+    return checkout_info
+
+
+def get_checkout_line_total_price(
+    checkout: "Checkout", line: "CheckoutLine"
+) -> "TaxedMoney":
+    """Return the line total stored by `fetch_checkout_prices_if_expired`."""
+    return TaxedMoney(
+        net=Money(line.total_price_net_amount, checkout.currency),
+        gross=Money(line.total_price_gross_amount, checkout.currency),
+    )
@@ -0,0 +1,59 @@
+# Generated by Django 3.2.12 on 2026-10-17 07:39
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("checkout", "0039_alter_checkout_email"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="checkout",
+            name="price_expiration",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="shipping_price_gross_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="shipping_price_net_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="subtotal_gross_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="subtotal_net_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="total_gross_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="total_net_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkoutline",
+            name="total_price_gross_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="checkoutline",
+            name="total_price_net_amount",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.12 on 2026-10-17 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("checkout", "0040_checkout_prices_snapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="checkout",
+            name="prices_version",
+            field=models.CharField(blank=True, default="", max_length=73),
+        ),
+    ]
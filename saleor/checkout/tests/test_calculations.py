@@ -0,0 +1,237 @@
+import datetime
+from unittest.mock import Mock
+
+from django.utils import timezone
+from freezegun import freeze_time
+from prices import Money, TaxedMoney
+
+from ...discount.utils import invalidate_active_discounts
+from ...plugins.manager import get_plugins_manager
+from ...discount.models import Sale
+from ..calculations import (
+    fetch_checkout_prices_if_expired,
+    get_checkout_line_total_price,
+    get_checkout_prices_version,
+    invalidate_checkout_taxes,
+)
+from ..fetch import fetch_checkout_info, fetch_checkout_lines
+from ..models import Checkout
+from ..utils import invalidate_checkout_prices, invalidate_checkouts_prices
+
+CHECKOUT_PRICES_TTL = datetime.timedelta(hours=1)
+
+
+def _get_mocked_manager(currency):
+    price = TaxedMoney(net=Money("10.00", currency), gross=Money("12.30", currency))
+    manager = Mock(
+        calculate_checkout_total=Mock(return_value=price),
+        calculate_checkout_subtotal=Mock(return_value=price),
+        calculate_checkout_shipping=Mock(return_value=price),
+    )
+    manager.calculate_checkout_line_total.return_value.price_with_sale = price
+    return manager
+
+
+@freeze_time("2022-05-12 12:00:00")
+def test_fetch_checkout_prices_if_expired_persists_prices(
+    checkout_with_items, settings
+):
+    # given
+    settings.CHECKOUT_PRICES_TTL = CHECKOUT_PRICES_TTL
+    checkout = checkout_with_items
+    checkout.price_expiration = timezone.now()
+    checkout.save(update_fields=["price_expiration"])
+    manager = get_plugins_manager()
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, [], manager)
+
+    # when
+    fetch_checkout_prices_if_expired(manager, checkout_info, lines, [])
+
+    # then
+    checkout.refresh_from_db()
+    assert checkout.price_expiration == timezone.now() + CHECKOUT_PRICES_TTL
+    assert checkout.total == checkout_info.checkout.total
+    assert checkout.total.gross.amount > 0
+    assert checkout.subtotal == checkout_info.checkout.subtotal
+    for line_info in lines:
+        line = checkout.lines.get(pk=line_info.line.pk)
+        assert get_checkout_line_total_price(checkout, line) == (
+            get_checkout_line_total_price(checkout, line_info.line)
+        )
+        assert line.total_price_gross_amount > 0
+
+
+def test_fetch_checkout_prices_if_expired_uses_valid_prices(checkout_with_item):
+    # given
+    checkout = checkout_with_item
+    checkout.price_expiration = timezone.now() + CHECKOUT_PRICES_TTL
+    checkout.prices_version = get_checkout_prices_version()
+    checkout.total_gross_amount = checkout.total_net_amount = 15
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, [], get_plugins_manager())
+    manager = _get_mocked_manager(checkout.currency)
+
+    # when
+    fetch_checkout_prices_if_expired(manager, checkout_info, lines, [])
+
+    # then
+    manager.calculate_checkout_total.assert_not_called()
+    manager.calculate_checkout_line_total.assert_not_called()
+    assert checkout.total.gross == Money(15, checkout.currency)
+
+
+def test_fetch_checkout_prices_if_expired_recalculates_expired_prices(
+    checkout_with_item, settings
+):
+    # given
+    settings.CHECKOUT_PRICES_TTL = CHECKOUT_PRICES_TTL
+    checkout = checkout_with_item
+    checkout.price_expiration = timezone.now() - datetime.timedelta(seconds=1)
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, [], get_plugins_manager())
+    manager = _get_mocked_manager(checkout.currency)
+
+    # when
+    fetch_checkout_prices_if_expired(manager, checkout_info, lines, [])
+
+    # then
+    manager.calculate_checkout_total.assert_called_once()
+    checkout.refresh_from_db()
+    assert checkout.total.gross == Money("12.30", checkout.currency)
+    assert checkout.shipping_price.net == Money("10.00", checkout.currency)
+    line = checkout.lines.get()
+    assert get_checkout_line_total_price(checkout, line).gross == Money(
+        "12.30", checkout.currency
+    )
+
+
+def test_fetch_checkout_prices_if_expired_skips_saving_changed_checkout(
+    checkout_with_item, settings
+):
+    # given
+    settings.CHECKOUT_PRICES_TTL = CHECKOUT_PRICES_TTL
+    checkout = checkout_with_item
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, [], get_plugins_manager())
+    manager = _get_mocked_manager(checkout.currency)
+    Checkout.objects.get(pk=checkout.pk).save(update_fields=["last_change"])
+
+    # when
+    fetch_checkout_prices_if_expired(manager, checkout_info, lines, [])
+
+    # then
+    assert checkout.total.gross == Money("12.30", checkout.currency)
+    checkout.refresh_from_db()
+    assert checkout.price_expiration <= timezone.now()
+    assert checkout.total_gross_amount == 0
+    assert checkout.lines.get().total_price_gross_amount == 0
+
+
+def test_fetch_checkout_prices_if_expired_without_ttl(checkout_with_item, settings):
+    # given
+    settings.CHECKOUT_PRICES_TTL = datetime.timedelta(0)
+    checkout = checkout_with_item
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, [], get_plugins_manager())
+    manager = _get_mocked_manager(checkout.currency)
+
+    # when
+    fetch_checkout_prices_if_expired(manager, checkout_info, lines, [])
+
+    # then
+    assert checkout.total.gross == Money("12.30", checkout.currency)
+    checkout.refresh_from_db()
+    assert checkout.total_gross_amount == 0
+
+
+def test_invalidate_checkout_prices(checkout):
+    # given
+    checkout.price_expiration = timezone.now() + CHECKOUT_PRICES_TTL
+    checkout.save(update_fields=["price_expiration"])
+
+    # when
+    invalidate_checkout_prices(checkout, save=True)
+
+    # then
+    checkout.refresh_from_db()
+    assert checkout.price_expiration <= timezone.now()
+
+
+@freeze_time("2022-05-12 12:00:00")
+def test_fetch_checkout_prices_if_expired_until_next_sale_change(
+    checkout_with_item, settings
+):
+    # given
+    settings.CHECKOUT_PRICES_TTL = CHECKOUT_PRICES_TTL
+    sale_start = timezone.now() + datetime.timedelta(minutes=10)
+    Sale.objects.create(name="Upcoming sale", start_date=sale_start)
+    checkout = checkout_with_item
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, [], get_plugins_manager())
+    manager = _get_mocked_manager(checkout.currency)
+
+    # when
+    fetch_checkout_prices_if_expired(manager, checkout_info, lines, [])
+
+    # then
+    checkout.refresh_from_db()
+    assert checkout.price_expiration == sale_start
+
+
+def test_invalidate_checkouts_prices(checkout):
+    # given
+    checkout.price_expiration = timezone.now() + CHECKOUT_PRICES_TTL
+    checkout.save(update_fields=["price_expiration"])
+    last_change = checkout.last_change
+
+    # when
+    invalidate_checkouts_prices(Checkout.objects.filter(pk=checkout.pk))
+
+    # then
+    checkout.refresh_from_db()
+    assert checkout.price_expiration <= timezone.now()
+    assert checkout.last_change > last_change
+
+
+def test_invalidate_active_discounts_expires_checkout_prices(
+    checkout_with_item, settings
+):
+    # given
+    settings.CHECKOUT_PRICES_TTL = CHECKOUT_PRICES_TTL
+    checkout = checkout_with_item
+    checkout.price_expiration = timezone.now() + CHECKOUT_PRICES_TTL
+    checkout.prices_version = get_checkout_prices_version()
+    checkout.save(update_fields=["price_expiration", "prices_version"])
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, [], get_plugins_manager())
+    manager = _get_mocked_manager(checkout.currency)
+
+    # when
+    invalidate_active_discounts()
+    fetch_checkout_prices_if_expired(manager, checkout_info, lines, [])
+
+    # then
+    manager.calculate_checkout_total.assert_called_once()
+    checkout.refresh_from_db()
+    assert checkout.prices_version == get_checkout_prices_version()
+
+
+def test_invalidate_checkout_taxes_expires_checkout_prices(
+    checkout_with_item, settings
+):
+    # given
+    settings.CHECKOUT_PRICES_TTL = CHECKOUT_PRICES_TTL
+    checkout = checkout_with_item
+    checkout.price_expiration = timezone.now() + CHECKOUT_PRICES_TTL
+    checkout.prices_version = get_checkout_prices_version()
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, [], get_plugins_manager())
+    manager = _get_mocked_manager(checkout.currency)
+
+    # when
+    invalidate_checkout_taxes()
+    fetch_checkout_prices_if_expired(manager, checkout_info, lines, [])
+
+    # then
+    manager.calculate_checkout_total.assert_called_once()
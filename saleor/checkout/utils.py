@@ -45,6 +45,7 @@ from .models import Checkout, CheckoutLine
 
 if TYPE_CHECKING:
     # flake8: noqa
+    from django.db.models import QuerySet
     from prices import TaxedMoney
 
     from ..account.models import Address
@@ -237,6 +238,26 @@ def _check_new_checkout_address(checkout, address, address_type):
     return has_address_changed, remove_old_address
 
 
+def invalidate_checkout_prices(checkout: Checkout, *, save: bool = False):
+    """Mark the persisted checkout prices as expired.
+
+    The prices will be recalculated the next time they are requested.
+    """
+    checkout.price_expiration = timezone.now()
+    if save:
+        checkout.save(update_fields=["price_expiration", "last_change"])
+
+
+def invalidate_checkouts_prices(checkouts: "QuerySet[Checkout]"):
+    """Mark the persisted prices of the given checkouts as expired.
+
+    `last_change` is updated as well, so prices calculated concurrently with
+    the previous data are not stored.
+    """
+    now = timezone.now()
+    checkouts.update(price_expiration=now, last_change=now)
+
+
 def change_billing_address_in_checkout(checkout, address):
     """Save billing address in checkout if changed.
 
@@ -249,7 +270,10 @@ def change_billing_address_in_checkout(checkout, address):
         if remove:
             checkout.billing_address.delete()
         checkout.billing_address = address
-        checkout.save(update_fields=["billing_address", "last_change"])
+        invalidate_checkout_prices(checkout)
+        checkout.save(
+            update_fields=["billing_address", "price_expiration", "last_change"]
+        )
 
 
 def change_shipping_address_in_checkout(
@@ -275,7 +299,10 @@ def change_shipping_address_in_checkout(
         update_checkout_info_shipping_address(
             checkout_info, address, lines, discounts, manager, shipping_channel_listings
         )
-        checkout.save(update_fields=["shipping_address", "last_change"])
+        invalidate_checkout_prices(checkout)
+        checkout.save(
+            update_fields=["shipping_address", "price_expiration", "last_change"]
+        )
 
 
 def _get_shipping_voucher_discount_for_checkout(
@@ -511,12 +538,14 @@ def recalculate_checkout_discount(
                 if voucher.translated.name != voucher.name
                 else ""
             )
+            invalidate_checkout_prices(checkout)
             checkout.save(
                 update_fields=[
                     "translated_discount_name",
                     "discount_amount",
                     "discount_name",
                     "currency",
+                    "price_expiration",
                     "last_change",
                 ]
             )
@@ -603,12 +632,14 @@ def add_voucher_to_checkout(
         voucher.translated.name if voucher.translated.name != voucher.name else ""
     )
     checkout.discount = discount
+    invalidate_checkout_prices(checkout)
     checkout.save(
         update_fields=[
             "voucher_code",
             "discount_name",
             "translated_discount_name",
             "discount_amount",
+            "price_expiration",
             "last_change",
         ]
     )
@@ -637,6 +668,7 @@ def remove_voucher_from_checkout(checkout: Checkout):
     checkout.discount_name = None
     checkout.translated_discount_name = None
     checkout.discount_amount = 0
+    invalidate_checkout_prices(checkout)
     checkout.save(
         update_fields=[
             "voucher_code",
@@ -644,6 +676,7 @@ def remove_voucher_from_checkout(checkout: Checkout):
             "translated_discount_name",
             "discount_amount",
             "currency",
+            "price_expiration",
             "last_change",
         ]
     )
@@ -717,11 +750,13 @@ def clear_delivery_method(checkout_info: "CheckoutInfo"):
     checkout.shipping_method = None
     update_checkout_info_delivery_method(checkout_info, None)
     delete_external_shipping_id(checkout=checkout)
+    invalidate_checkout_prices(checkout)
     checkout.save(
         update_fields=[
             "shipping_method",
             "collection_point",
             "private_metadata",
+            "price_expiration",
             "last_change",
         ]
     )
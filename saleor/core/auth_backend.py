@@ -1,6 +1,7 @@
 from django.contrib.auth.backends import ModelBackend
 
 from ..account.models import User
+from ..plugins.manager import is_plugin_hook_implemented
 from .auth import get_token_from_request
 from .jwt import get_user_from_access_token
 
@@ -52,4 +53,8 @@ class PluginBackend(JSONWebTokenBackend):
     def authenticate(self, request=None, **kwargs):
         if request is None:
             return None
+        # don't build the plugins manager of the request if no plugin can
+        # authenticate the user
+        if not is_plugin_hook_implemented("authenticate_user"):
+            return None
         return request.plugins.authenticate_user(request)
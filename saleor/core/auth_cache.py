@@ -0,0 +1,87 @@
+import time
+from hashlib import sha256
+from typing import Iterable, Optional, Type
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import models, transaction
+
+from .versioned_cache import get_cache_version
+
+PRINCIPAL_CACHE_KEY_PREFIX = "principal"
+PRINCIPAL_VERSION_CACHE_KEY_PREFIX = "principal_version"
+
+
+def _get_principal_cache_key(model: Type[models.Model], token: str) -> str:
+    token_hash = sha256(token.encode()).hexdigest()
+    return f"{PRINCIPAL_CACHE_KEY_PREFIX}:{model._meta.label_lower}:{token_hash}"
+
+
+def _get_principal_version_cache_key(model: Type[models.Model], pk) -> str:
+    return f"{PRINCIPAL_VERSION_CACHE_KEY_PREFIX}:{model._meta.label_lower}:{pk}"
+
+
+def get_cached_principal(model: Type[models.Model], token: str):
+    """Return the user or app authenticated with the token, if it's cached.
+
+    A cached principal is returned only if it wasn't invalidated with
+    `invalidate_principals` after it had been stored.
+    """
+    if not settings.AUTH_PRINCIPAL_CACHE_TIMEOUT:
+        return None
+    cached = cache.get(_get_principal_cache_key(model, token))
+    if cached is None:
+        return None
+    version, principal = cached
+    version_key = _get_principal_version_cache_key(model, principal.pk)
+    if cache.get(version_key) != version:
+        return None
+    return principal
+
+
+def get_principal_version(model: Type[models.Model], pk) -> Optional[str]:
+    """Return the current version of the cached principals of the user or app."""
+    version_key = _get_principal_version_cache_key(model, pk)
+    return get_cache_version(version_key, timeout=DEFAULT_TIMEOUT)
+
+
+def cache_principal(
+    token: str,
+    principal: models.Model,
+    version: Optional[str],
+    expires_at: Optional[float] = None,
+):
+    """Store the user or app authenticated with the token.
+
+    The principal is pickled together with its evaluated permission sets and
+    kept for `AUTH_PRINCIPAL_CACHE_TIMEOUT` seconds, or until the token expires
+    if that happens earlier. `version` must be read with `get_principal_version`
+    before the principal was fetched.
+    """
+    timeout = settings.AUTH_PRINCIPAL_CACHE_TIMEOUT
+    if expires_at is not None:
+        timeout = min(timeout, int(expires_at - time.time()))
+    if timeout <= 0 or version is None:
+        return
+    cache.set(
+        _get_principal_cache_key(type(principal), token),
+        (version, principal),
+        timeout=timeout,
+    )
+
+
+def invalidate_principals(model: Type[models.Model], pks: Iterable):
+    """Drop cached principals of all tokens of the given users or apps.
+
+    Should be called each time the principals, their permissions or tokens are
+    changed.
+    """
+    version_keys = [_get_principal_version_cache_key(model, pk) for pk in pks]
+    if version_keys:
+        cache.delete_many(version_keys)
+
+
+def invalidate_principals_on_commit(model: Type[models.Model], pks: Iterable):
+    pks = list(pks)
+    transaction.on_commit(lambda: invalidate_principals(model, pks))
@@ -1,3 +1,4 @@
+import copy
 from datetime import datetime, timedelta
 from typing import Any, Dict, Iterable, Optional
 
@@ -8,6 +9,7 @@ from django.contrib.auth.models import Permission
 
 from ..account.models import User
 from ..app.models import App, AppExtension
+from .auth_cache import cache_principal, get_cached_principal, get_principal_version
 from .jwt_manager import get_jwt_manager
 from .permissions import (
     get_permission_names,
@@ -130,10 +132,41 @@ def is_saleor_token(token: str) -> bool:
 
 
 def get_user_from_access_token(token: str) -> Optional[User]:
+    user = get_cached_principal(User, token)
+    if user is not None:
+        return user
     if not is_saleor_token(token):
         return None
     payload = jwt_decode(token)
-    return get_user_from_access_payload(payload)
+    # Users of tokens limited to the given permissions are not cached, as their
+    # effective permissions differ from the permissions of the user.
+    user_pk = None
+    if PERMISSIONS_FIELD not in payload and settings.AUTH_PRINCIPAL_CACHE_TIMEOUT:
+        user_pk = _get_user_pk_from_payload(payload)
+    # The version is read before the user and its permissions, so the user isn't
+    # cached with permissions that were revoked in the meantime.
+    version = get_principal_version(User, user_pk) if user_pk else None
+    user = get_user_from_access_payload(payload)
+    if user and version and str(user.pk) == user_pk:
+        _cache_user(token, user, payload, version)
+    return user
+
+
+def _get_user_pk_from_payload(payload: Dict[str, Any]) -> Optional[str]:
+    try:
+        _type, user_pk = graphene.Node.from_global_id(payload.get("user_id"))
+    except (TypeError, ValueError):
+        return None
+    return user_pk if _type == "User" else None
+
+
+def _cache_user(token: str, user: User, payload: Dict[str, Any], version: str):
+    # evaluate the permissions, so they are stored together with the user
+    user.get_all_permissions()
+    cached_user = copy.copy(user)
+    cached_user._effective_permissions = None
+    expires_at = payload.get("exp") if settings.JWT_EXPIRE else None
+    cache_principal(token, cached_user, version, expires_at=expires_at)
 
 
 def get_user_from_access_payload(payload: dict) -> Optional[User]:
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from ....warehouse.availability import update_channel_stocks
+from ....warehouse.models import ChannelStock
+from ....warehouse.tasks import get_channel_stocks_variant_id_batches
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild quantities of product variants available in channels "
+        "from stocks and allocations."
+    )
+
+    def handle(self, *args, **options):
+        variants_count = 0
+        corrected_variant_ids = set()
+        for variant_ids in get_channel_stocks_variant_id_batches():
+            channel_stocks = ChannelStock.objects.filter(
+                product_variant_id__in=variant_ids
+            ).values_list("product_variant_id", "channel_id", "available_quantity")
+            channel_stocks_before = set(channel_stocks)
+            update_channel_stocks(variant_ids)
+            channel_stocks_after = set(channel_stocks.all())
+            for variant_id, _, _ in channel_stocks_before ^ channel_stocks_after:
+                corrected_variant_ids.add(variant_id)
+            variants_count += len(variant_ids)
+
+        self.stdout.write(
+            f"Updated channel stocks of {variants_count} variants, "
+            f"{len(corrected_variant_ids)} were corrected."
+        )
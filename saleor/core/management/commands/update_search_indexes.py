@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.db.models import Q
 
 from ....account.models import User
 from ....order.models import Order
@@ -15,7 +16,9 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         # Update products
-        products_total_count = Product.objects.filter(search_document="").count()
+        products_total_count = Product.objects.filter(
+            Q(search_document="") | Q(search_vector=None)
+        ).count()
         set_product_search_document_values.delay(products_total_count, 0)
         self.stdout.write(f"Updating products: {products_total_count}")
 
@@ -10,7 +10,7 @@ from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
 from django.utils.translation import get_language
 
-from ..discount.utils import fetch_discounts
+from ..discount.utils import fetch_active_discounts
 from ..graphql.utils import get_user_or_app_from_context
 from ..plugins.manager import PluginsManager, get_plugins_manager
 from . import analytics
@@ -59,9 +59,7 @@ def discounts(get_response):
     """Assign active discounts to `request.discounts`."""
 
     def _discounts_middleware(request):
-        request.discounts = SimpleLazyObject(
-            lambda: fetch_discounts(request.request_time)
-        )
+        request.discounts = SimpleLazyObject(fetch_active_discounts)
         return get_response(request)
 
     return _discounts_middleware
@@ -1,14 +1,19 @@
 from celery.utils.log import get_task_logger
+from django.db.models import Q
 
 from ..account.models import User
 from ..account.search import prepare_user_search_document_value
 from ..celeryconf import app
 from ..order.models import Order
-from ..order.search import prepare_order_search_document_value
+from ..order.search import (
+    ORDER_FIELDS_TO_PREFETCH_IN_BULK,
+    prepare_order_search_document_value,
+)
 from ..product.models import Product
 from ..product.search import (
     PRODUCT_FIELDS_TO_PREFETCH,
     prepare_product_search_document_value,
+    prepare_product_search_vector_value,
 )
 
 task_logger = get_task_logger(__name__)
@@ -39,12 +44,7 @@ def set_user_search_document_values(total_count, updated_count):
 @app.task
 def set_order_search_document_values(total_count, updated_count):
     qs = Order.objects.filter(search_document="").prefetch_related(
-        "user",
-        "billing_address",
-        "shipping_address",
-        "payments",
-        "discounts",
-        "lines",
+        *ORDER_FIELDS_TO_PREFETCH_IN_BULK
     )[:BATCH_SIZE]
     if not qs:
         task_logger.info("No orders to update.")
@@ -66,15 +66,19 @@ def set_product_search_document_values(total_count, updated_count):
     # set lower batch size as it was crashing for products with
     # lots of attributes because out of memory issues
     batch_size = 500
-    qs = Product.objects.filter(search_document="").prefetch_related(
-        *PRODUCT_FIELDS_TO_PREFETCH
-    )[:batch_size]
+    qs = Product.objects.filter(
+        Q(search_document="") | Q(search_vector=None)
+    ).prefetch_related(*PRODUCT_FIELDS_TO_PREFETCH)[:batch_size]
     if not qs:
         task_logger.info("No products to update.")
         return
 
     updated_count = set_search_document_values(
-        qs, total_count, updated_count, prepare_product_search_document_value
+        qs,
+        total_count,
+        updated_count,
+        prepare_product_search_document_value,
+        prepare_product_search_vector_value,
     )
 
     if updated_count == total_count:
@@ -85,16 +89,27 @@ def set_product_search_document_values(total_count, updated_count):
 
 
 def set_search_document_values(
-    qs, total_count, updated_count, prepare_search_document_func
+    qs,
+    total_count,
+    updated_count,
+    prepare_search_document_func,
+    prepare_search_vector_func=None,
 ):
     Model = qs.model
+    fields_to_update = ["search_document"]
+    if prepare_search_vector_func:
+        fields_to_update.append("search_vector")
     instances = []
     for instance in qs:
         instance.search_document = prepare_search_document_func(
             instance, already_prefetched=True
         )
+        if prepare_search_vector_func:
+            instance.search_vector = prepare_search_vector_func(
+                instance, already_prefetched=True
+            )
         instances.append(instance)
-    Model.objects.bulk_update(instances, ["search_document"])
+    Model.objects.bulk_update(instances, fields_to_update)
 
     updated_count += len(instances)
     progress = round((updated_count / total_count) * 100, 2)
@@ -1,10 +1,13 @@
+from unittest.mock import Mock
+
 import jwt
 import pytest
 from django.contrib.auth.models import Permission
 from freezegun import freeze_time
 from jwt import ExpiredSignatureError, InvalidSignatureError, InvalidTokenError
 
-from ..auth_backend import JSONWebTokenBackend
+from ...plugins.manager import PluginsManager
+from ..auth_backend import JSONWebTokenBackend, PluginBackend
 from ..jwt import (
     JWT_ACCESS_TYPE,
     create_access_token,
@@ -217,3 +220,30 @@ def test_user_payload_doesnt_have_user_token(prefix, rf, staff_user, settings):
     backend = JSONWebTokenBackend()
     with pytest.raises(InvalidTokenError):
         backend.authenticate(request)
+
+
+def test_plugin_backend_authenticates_user(rf, settings, admin_user):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    request = rf.request()
+    request.plugins = PluginsManager(plugins=settings.PLUGINS)
+
+    # when
+    user = PluginBackend().authenticate(request)
+
+    # then
+    assert user == admin_user
+
+
+def test_plugin_backend_without_authenticating_plugins(rf, settings):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ActivePlugin"]
+    request = rf.request()
+    request.plugins = Mock()
+
+    # when
+    user = PluginBackend().authenticate(request)
+
+    # then
+    assert user is None
+    request.plugins.authenticate_user.assert_not_called()
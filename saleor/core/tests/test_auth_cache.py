@@ -0,0 +1,161 @@
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+from ...account.models import User
+from ...graphql.context import get_app
+from ...tests.utils import flush_post_commit_hooks
+from ..auth_cache import get_cached_principal, invalidate_principals
+from ..jwt import (
+    create_access_token,
+    create_access_token_for_app_extension,
+    get_user_from_access_payload,
+    get_user_from_access_token,
+)
+from ..permissions import OrderPermissions
+
+
+@pytest.fixture
+def principal_cache(settings):
+    settings.AUTH_PRINCIPAL_CACHE_TIMEOUT = 60
+
+
+def test_get_user_from_access_token_cached(
+    principal_cache,
+    staff_user,
+    permission_manage_orders,
+    django_assert_num_queries,
+):
+    # given
+    staff_user.user_permissions.add(permission_manage_orders)
+    token = create_access_token(staff_user)
+    get_user_from_access_token(token)
+
+    # when
+    with django_assert_num_queries(0):
+        user = get_user_from_access_token(token)
+        has_perm = user.has_perm(OrderPermissions.MANAGE_ORDERS)
+
+    # then
+    assert user == staff_user
+    assert has_perm
+
+
+def test_get_user_from_access_token_cache_invalidated_on_save(
+    principal_cache, staff_user
+):
+    # given
+    token = create_access_token(staff_user)
+    get_user_from_access_token(token)
+
+    # when
+    staff_user.is_active = False
+    staff_user.save(update_fields=["is_active"])
+    flush_post_commit_hooks()
+
+    # then
+    assert get_cached_principal(User, token) is None
+    with pytest.raises(jwt.InvalidTokenError):
+        get_user_from_access_token(token)
+
+
+def test_get_user_from_access_token_invalidated_during_fetch_not_cached(
+    principal_cache, staff_user
+):
+    # given
+    token = create_access_token(staff_user)
+
+    def get_user_and_invalidate(payload):
+        user = get_user_from_access_payload(payload)
+        invalidate_principals(User, [staff_user.pk])
+        return user
+
+    # when
+    with patch(
+        "saleor.core.jwt.get_user_from_access_payload",
+        side_effect=get_user_and_invalidate,
+    ):
+        user = get_user_from_access_token(token)
+
+    # then
+    assert user == staff_user
+    assert get_cached_principal(User, token) is None
+
+
+def test_get_user_from_access_token_with_permissions_not_cached(
+    principal_cache, app_with_extensions, staff_user, permission_manage_products
+):
+    # given
+    staff_user.user_permissions.add(permission_manage_products)
+    _, extensions = app_with_extensions
+    token = create_access_token_for_app_extension(
+        app_extension=extensions[0],
+        permissions=extensions[0].permissions.all(),
+        user=staff_user,
+    )
+
+    # when
+    user = get_user_from_access_token(token)
+
+    # then
+    assert user == staff_user
+    assert get_cached_principal(User, token) is None
+
+
+def test_get_user_from_access_token_cache_disabled(settings, staff_user):
+    # given
+    settings.AUTH_PRINCIPAL_CACHE_TIMEOUT = 0
+    token = create_access_token(staff_user)
+
+    # when
+    get_user_from_access_token(token)
+
+    # then
+    assert get_cached_principal(User, token) is None
+
+
+def test_get_app_cached(
+    principal_cache, app, permission_manage_orders, django_assert_num_queries
+):
+    # given
+    app.permissions.add(permission_manage_orders)
+    auth_token = app.tokens.get().auth_token
+    get_app(auth_token)
+
+    # when
+    with django_assert_num_queries(0):
+        cached_app = get_app(auth_token)
+        has_perm = cached_app.has_perm(OrderPermissions.MANAGE_ORDERS)
+
+    # then
+    assert cached_app == app
+    assert has_perm
+
+
+def test_get_app_cache_invalidated_on_token_delete(principal_cache, app):
+    # given
+    app_token = app.tokens.get()
+    get_app(app_token.auth_token)
+
+    # when
+    app_token.delete()
+    flush_post_commit_hooks()
+
+    # then
+    assert get_app(app_token.auth_token) is None
+
+
+def test_invalidate_principals(principal_cache, app, staff_user):
+    # given
+    token = create_access_token(staff_user)
+    get_user_from_access_token(token)
+    auth_token = app.tokens.get().auth_token
+    get_app(auth_token)
+
+    # when
+    invalidate_principals(User, [staff_user.pk])
+
+    # then
+    assert get_cached_principal(User, token) is None
+    assert get_cached_principal(type(app), auth_token) == app
@@ -20,6 +20,7 @@ from ...order.models import Order, OrderLine
 from ...product import ProductTypeKind
 from ...product.models import ProductMedia, ProductType
 from ...shipping.models import ShippingZone
+from ...warehouse.models import ChannelStock
 from ..storages import S3MediaStorage
 from ..utils import (
     build_absolute_uri,
@@ -374,3 +375,20 @@ def test_delete_versatile_image(product_with_image, media_root):
     assert not default_storage.exists(img_name)
     assert not default_storage.exists(thumb_400x400)
     assert not default_storage.exists(thumb_400x400)
+
+
+def test_update_channel_stocks_command(variant_with_many_stocks, channel_USD):
+    # given
+    ChannelStock.objects.create(
+        product_variant=variant_with_many_stocks,
+        product=variant_with_many_stocks.product,
+        channel=channel_USD,
+        available_quantity=100,
+    )
+
+    # when
+    call_command("update_channel_stocks")
+
+    # then
+    channel_stock = ChannelStock.objects.get(product_variant=variant_with_many_stocks)
+    assert channel_stock.available_quantity == 7
@@ -0,0 +1,94 @@
+import time
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from ..versioned_cache import VersionedProcessCache, bump_cache_version
+
+VERSION_CACHE_KEY = "test_versioned_cache_version"
+
+
+@pytest.fixture
+def versioned_cache(settings):
+    settings.PROCESS_CACHE_VERSION_CHECK_INTERVAL = 60
+    process_cache = VersionedProcessCache(VERSION_CACHE_KEY)
+    process_cache.invalidate()
+    return process_cache
+
+
+def test_versioned_process_cache_get(versioned_cache):
+    # given
+    version, _ = versioned_cache.get(60)
+    versioned_cache.set(version, "value")
+
+    # when
+    cached_version, value = versioned_cache.get(60)
+
+    # then
+    assert cached_version == version
+    assert value == "value"
+
+
+def test_versioned_process_cache_get_expired(versioned_cache):
+    # given
+    version, _ = versioned_cache.get(60)
+    versioned_cache.set(version, "value")
+
+    # when
+    with patch(
+        "saleor.core.versioned_cache.time.monotonic",
+        return_value=time.monotonic() + 61,
+    ):
+        _, value = versioned_cache.get(60)
+
+    # then
+    assert value is None
+
+
+def test_versioned_process_cache_checks_version_once_per_interval(versioned_cache):
+    # given
+    version = versioned_cache.get_version()
+
+    # when
+    with patch("saleor.core.versioned_cache.cache") as mocked_cache:
+        cached_version = versioned_cache.get_version()
+
+    # then
+    assert cached_version == version
+    mocked_cache.get.assert_not_called()
+
+
+def test_versioned_process_cache_notices_invalidation_after_interval(
+    versioned_cache,
+):
+    # given
+    version, _ = versioned_cache.get(60)
+    versioned_cache.set(version, "value")
+    new_version = bump_cache_version(VERSION_CACHE_KEY)
+
+    # when
+    with patch(
+        "saleor.core.versioned_cache.time.monotonic",
+        return_value=time.monotonic() + 61,
+    ):
+        cached_version, value = versioned_cache.get(120)
+
+    # then
+    assert cached_version == new_version
+    assert value is None
+
+
+def test_versioned_process_cache_invalidate(versioned_cache):
+    # given
+    version, _ = versioned_cache.get(60)
+    versioned_cache.set(version, "value")
+
+    # when
+    versioned_cache.invalidate()
+
+    # then
+    new_version, value = versioned_cache.get(60)
+    assert new_version != version
+    assert new_version == cache.get(VERSION_CACHE_KEY)
+    assert value is None
@@ -39,6 +39,7 @@ from ...attribute.models import (
     AttributeValue,
     AttributeVariant,
 )
+from ...attribute.utils import update_products_attribute_facets
 from ...channel.models import Channel
 from ...checkout import AddressType
 from ...checkout.fetch import fetch_checkout_info
@@ -94,6 +95,7 @@ from ...shipping.models import (
     ShippingZone,
 )
 from ...warehouse import WarehouseClickAndCollectOption
+from ...warehouse.availability import update_channel_stocks
 from ...warehouse.management import increase_stock
 from ...warehouse.models import PreorderAllocation, Stock, Warehouse
 
@@ -470,6 +472,8 @@ def create_products_by_schema(placeholder_dir, create_images):
     )
     assign_products_to_collections(associations=types["product.collectionproduct"])
 
+    update_products_attribute_facets(Product.objects.values_list("id", flat=True))
+    update_channel_stocks(ProductVariant.objects.values_list("id", flat=True))
     update_products_search_document(Product.objects.all())
 
 
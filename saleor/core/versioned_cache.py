@@ -0,0 +1,87 @@
+import time
+from threading import Lock
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+T = TypeVar("T")
+
+
+def get_cache_version(key: str, timeout: Any = None) -> str:
+    """Return the version stored in the shared cache under the key.
+
+    A new version is stored if there's none yet. The version has to be read
+    before the data it describes is fetched from the database, so an invalidation
+    that happens in the meantime isn't lost.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, str(uuid4()), timeout=timeout)
+        version = cache.get(key)
+    return version
+
+
+def bump_cache_version(key: str) -> str:
+    version = str(uuid4())
+    cache.set(key, version, timeout=None)
+    return version
+
+
+class VersionedProcessCache(Generic[T]):
+    """Values kept in the process for as long as their shared version is current.
+
+    The shared version is read at most once per
+    `PROCESS_CACHE_VERSION_CHECK_INTERVAL`, so invalidations made by other workers
+    are noticed with that delay. `invalidate` takes effect in the current process
+    immediately.
+    """
+
+    def __init__(self, version_key: str):
+        self.version_key = version_key
+        self._lock = Lock()
+        self._version: Optional[Tuple[str, float]] = None
+        self._values: Dict[Hashable, Tuple[str, float, T]] = {}
+
+    def get_version(self) -> str:
+        now = time.monotonic()
+        with self._lock:
+            local_version = self._version
+        if local_version:
+            version, checked_at = local_version
+            if now - checked_at < settings.PROCESS_CACHE_VERSION_CHECK_INTERVAL:
+                return version
+
+        version = get_cache_version(self.version_key)
+        with self._lock:
+            # Don't overwrite a version set by a concurrent invalidation.
+            if self._version is local_version:
+                self._version = (version, now)
+        return version
+
+    def get(self, timeout: float, key: Hashable = None) -> Tuple[str, Optional[T]]:
+        """Return the current version and the value stored for it.
+
+        The value is None if it wasn't stored for the current version or it's
+        older than `timeout` seconds.
+        """
+        version = self.get_version()
+        with self._lock:
+            cached = self._values.get(key)
+        if cached:
+            cached_version, created_at, value = cached
+            if cached_version == version and time.monotonic() - created_at < timeout:
+                return version, value
+        return version, None
+
+    def set(self, version: str, value: T, key: Hashable = None):
+        with self._lock:
+            self._values[key] = (version, time.monotonic(), value)
+
+    def invalidate(self):
+        """Drop the values in all workers."""
+        version = bump_cache_version(self.version_key)
+        with self._lock:
+            self._version = (version, time.monotonic())
+            self._values.clear()
@@ -1,12 +1,10 @@
 import datetime
 import json
 import shutil
-from tempfile import NamedTemporaryFile
 from unittest.mock import ANY, MagicMock, patch
 
 import graphene
 import openpyxl
-import petl as etl
 import pytest
 from django.core.files import File
 from freezegun import freeze_time
@@ -18,7 +16,7 @@ from ....graphql.product.filters import ProductFilter
 from ....product.models import Product, ProductChannelListing
 from ... import FileTypes
 from ...utils.export import (
-    append_to_file,
+    ExportFileWriter,
     create_file_with_headers,
     export_gift_cards,
     export_gift_cards_in_batches,
@@ -60,8 +58,9 @@ def test_export_products(
         "channels": [],
     }
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     product_list[0].variants.update(sku=None)
 
@@ -81,9 +80,8 @@ def test_export_products(
         export_info,
         {"id", "name", "variants__id", "variants__sku"},
         ["id", "name", "variants__id", "variants__sku"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
+        user_export_file,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
@@ -109,8 +107,9 @@ def test_export_products_ids(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(user_export_file, {"ids": pks}, export_info, file_type)
@@ -128,9 +127,8 @@ def test_export_products_ids(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
+        user_export_file,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
@@ -160,8 +158,9 @@ def test_export_products_filter_is_published(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(
@@ -185,9 +184,8 @@ def test_export_products_filter_is_published(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
+        user_export_file,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
@@ -216,8 +214,9 @@ def test_export_products_filter_collections(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(
@@ -237,7 +236,13 @@ def test_export_products_filter_collections(
     assert export_products_in_batches_mock.call_count == 1
     batch_args, _ = export_products_in_batches_mock.call_args
     assert set(batch_args[0].values_list("pk", flat=True)) == {product_list[-1].pk}
-    assert batch_args[1:] == (export_info, {"id"}, ["id"], ",", mock_file, file_type)
+    assert batch_args[1:] == (
+        export_info,
+        {"id"},
+        ["id"],
+        mock_writer,
+        user_export_file,
+    )
     send_email_mock.assert_called_once_with(user_export_file, "products")
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
 
@@ -263,8 +268,9 @@ def test_export_products_by_app(
     }
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(app_export_file, {"all": ""}, export_info, file_type)
@@ -283,9 +289,8 @@ def test_export_products_by_app(
         export_info,
         {"id", "name"},
         ["id", "name"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
+        app_export_file,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "products")
@@ -309,8 +314,9 @@ def test_export_gift_cards(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_gift_cards(user_export_file, {"all": ""}, file_type)
@@ -325,9 +331,8 @@ def test_export_gift_cards(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
+        user_export_file,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
@@ -351,8 +356,9 @@ def test_export_gift_cards_by_app(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_gift_cards(app_export_file, {"all": ""}, file_type)
@@ -367,9 +373,8 @@ def test_export_gift_cards_by_app(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
+        app_export_file,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "gift cards")
@@ -393,8 +398,9 @@ def test_export_gift_cards_ids(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
     pks = [gift_card.pk]
 
     # when
@@ -408,9 +414,8 @@ def test_export_gift_cards_ids(
     assert set(args[0].values_list("pk", flat=True)) == set(pks)
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
+        user_export_file,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
@@ -435,8 +440,9 @@ def test_export_gift_cards_with_filter(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     gift_card_expiry_date.product = shippable_gift_card_product
     gift_card_used.product = shippable_gift_card_product
@@ -465,9 +471,8 @@ def test_export_gift_cards_with_filter(
     assert set(args[0].values_list("pk", flat=True)) == {gift_card_expiry_date.pk}
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
+        user_export_file,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
@@ -521,7 +526,8 @@ def test_create_file_with_headers_csv(user_export_file, tmpdir, media_root):
     assert not user_export_file.content_file
 
     # when
-    csv_file = create_file_with_headers(file_headers, ",", FileTypes.CSV)
+    writer = create_file_with_headers(file_headers, ",", FileTypes.CSV)
+    csv_file = writer.close()
 
     # then
     assert csv_file
@@ -540,7 +546,8 @@ def test_create_file_with_headers_xlsx(user_export_file, tmpdir, media_root):
     assert not user_export_file.content_file
 
     # when
-    xlsx_file = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
+    writer = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
+    xlsx_file = writer.close()
 
     # then
     assert xlsx_file
@@ -571,7 +578,7 @@ def test_save_csv_file_in_export_file(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
+def test_export_file_writer_write_rows_for_csv(user_export_file, tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
@@ -580,17 +587,14 @@ def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
     headers = ["id", "name", "collections"]
     delimiter = ","
 
-    table = etl.fromdicts([{"id": "1", "name": "A"}], header=headers, missing=" ")
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=delimiter)
+    writer = ExportFileWriter(headers, delimiter, FileTypes.CSV)
+    writer.write_rows([{"id": "1", "name": "A"}], headers)
 
     # when
-    append_to_file(export_data, headers, temp_file, FileTypes.CSV, delimiter)
+    writer.write_rows(export_data, headers)
 
     # then
-    user_export_file.refresh_from_db()
-
+    temp_file = writer.close()
     file_content = temp_file.read().decode().split("\r\n")
     assert ",".join(headers) in file_content
     assert ",".join(export_data[0].values()) in file_content
@@ -600,7 +604,7 @@ def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
+def test_export_file_writer_write_rows_for_xlsx(user_export_file, tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
@@ -609,19 +613,14 @@ def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
     expected_headers = ["id", "name", "collections"]
     delimiter = ","
 
-    table = etl.fromdicts(
-        [{"id": "1", "name": "A"}], header=expected_headers, missing=" "
-    )
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = ExportFileWriter(expected_headers, delimiter, FileTypes.XLSX)
+    writer.write_rows([{"id": "1", "name": "A"}], expected_headers)
 
     # when
-    append_to_file(export_data, expected_headers, temp_file, FileTypes.XLSX, delimiter)
+    writer.write_rows(export_data, expected_headers)
 
     # then
-    user_export_file.refresh_from_db()
-
+    temp_file = writer.close()
     wb_obj = openpyxl.load_workbook(temp_file)
 
     sheet_obj = wb_obj.active
@@ -669,10 +668,7 @@ def test_export_products_in_batches_for_csv(
     export_fields = ["id", "name", "variants__sku"]
     expected_headers = ["id", "name", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = ExportFileWriter(expected_headers, ",", FileTypes.CSV)
 
     # when
     export_products_in_batches(
@@ -680,12 +676,14 @@ def test_export_products_in_batches_for_csv(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.CSV,
+        writer,
+        user_export_file,
     )
 
     # then
+    temp_file = writer.close()
+    user_export_file.refresh_from_db()
+    assert user_export_file.message == f"Exported {qs.count()} of {qs.count()} items."
 
     expected_data = []
     for product in qs.order_by("pk"):
@@ -739,10 +737,7 @@ def test_export_products_in_batches_for_xlsx(
     export_fields = ["id", "name", "description_as_str", "variants__sku"]
     expected_headers = ["id", "name", "description", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = ExportFileWriter(expected_headers, ",", FileTypes.XLSX)
 
     # when
     export_products_in_batches(
@@ -750,12 +745,11 @@ def test_export_products_in_batches_for_xlsx(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.XLSX,
+        writer,
     )
 
     # then
+    temp_file = writer.close()
     expected_data = []
     for product in qs:
         product_data = []
@@ -798,20 +792,13 @@ def test_export_gift_cards_in_batches_to_csv(
     # given
     gift_cards = GiftCard.objects.exclude(id=gift_card_used.id).order_by("pk")
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = ExportFileWriter(["code"], ",", FileTypes.CSV)
 
     # when
-    export_gift_cards_in_batches(
-        gift_cards,
-        ["code"],
-        ",",
-        temp_file,
-        "csv",
-    )
+    export_gift_cards_in_batches(gift_cards, ["code"], writer)
 
     # then
+    temp_file = writer.close()
     file_content = temp_file.read().decode().split("\r\n")
 
     # ensure headers are in the file
@@ -833,20 +820,13 @@ def test_export_gift_cards_in_batches_to_xlsx(
     # given
     gift_cards = GiftCard.objects.exclude(id=gift_card_used.id).order_by("pk")
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = ExportFileWriter(["code"], ",", FileTypes.XLSX)
 
     # when
-    export_gift_cards_in_batches(
-        gift_cards,
-        ["code"],
-        ",",
-        temp_file,
-        "xlsx",
-    )
+    export_gift_cards_in_batches(gift_cards, ["code"], writer)
 
     # then
+    temp_file = writer.close()
     wb_obj = openpyxl.load_workbook(temp_file)
 
     sheet_obj = wb_obj.active
@@ -1,9 +1,11 @@
+import csv
+import io
 import uuid
 from datetime import date, datetime
 from tempfile import NamedTemporaryFile
-from typing import IO, TYPE_CHECKING, Any, Dict, List, Set, Union
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Union
 
-import petl as etl
+import openpyxl
 from django.utils import timezone
 
 from ...giftcard.models import GiftCard
@@ -21,6 +23,8 @@ if TYPE_CHECKING:
 
 
 BATCH_SIZE = 10000
+# Value written for fields missing in the exported row.
+MISSING_VALUE = " "
 
 
 def export_products(
@@ -41,18 +45,18 @@ def export_products(
         data_headers,
     ) = get_product_export_fields_and_headers_info(export_info)
 
-    temporary_file = create_file_with_headers(file_headers, delimiter, file_type)
+    writer = create_file_with_headers(file_headers, delimiter, file_type)
 
     export_products_in_batches(
         queryset,
         export_info,
         set(export_fields),
         data_headers,
-        delimiter,
-        temporary_file,
-        file_type,
+        writer,
+        export_file,
     )
 
+    temporary_file = writer.close()
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
     temporary_file.close()
 
@@ -74,16 +78,11 @@ def export_gift_cards(
     queryset = queryset.filter(used_by_email__isnull=True)
 
     export_fields = ["code"]
-    temporary_file = create_file_with_headers(export_fields, delimiter, file_type)
+    writer = create_file_with_headers(export_fields, delimiter, file_type)
 
-    export_gift_cards_in_batches(
-        queryset,
-        export_fields,
-        delimiter,
-        temporary_file,
-        file_type,
-    )
+    export_gift_cards_in_batches(queryset, export_fields, writer, export_file)
 
+    temporary_file = writer.close()
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
     temporary_file.close()
 
@@ -135,17 +134,46 @@ def parse_input(data: Any) -> Dict[str, Union[str, dict]]:
     return data
 
 
-def create_file_with_headers(file_headers: List[str], delimiter: str, file_type: str):
-    table = etl.wrap([file_headers])
+class ExportFileWriter:
+    """Write exported rows to a temporary file kept open for the whole export.
 
-    if file_type == FileTypes.CSV:
-        temp_file = NamedTemporaryFile("ab+", suffix=".csv")
-        etl.tocsv(table, temp_file.name, delimiter=delimiter)
-    else:
-        temp_file = NamedTemporaryFile("ab+", suffix=".xlsx")
-        etl.io.xlsx.toxlsx(table, temp_file.name)
+    CSV rows go through a single csv writer. XLSX rows are appended to
+    a write-only workbook, which is saved to the file when the writer is closed.
+    """
 
-    return temp_file
+    def __init__(self, file_headers: List[str], delimiter: str, file_type: str):
+        self.file_type = file_type
+        self.file = NamedTemporaryFile("w+b", suffix=f".{file_type}")
+        if file_type == FileTypes.CSV:
+            self._stream = io.TextIOWrapper(self.file, encoding="utf-8", newline="")
+            self._csv_writer = csv.writer(self._stream, delimiter=delimiter)
+            self._write_row = self._csv_writer.writerow
+        else:
+            self._workbook = openpyxl.Workbook(write_only=True)
+            self._worksheet = self._workbook.create_sheet()
+            self._write_row = self._worksheet.append
+        self._write_row(file_headers)
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]], headers: List[str]):
+        for row in rows:
+            self._write_row([row.get(header, MISSING_VALUE) for header in headers])
+
+    def close(self) -> IO[bytes]:
+        """Finish writing and return the file positioned at its beginning."""
+        if self.file_type == FileTypes.CSV:
+            self._stream.flush()
+            # don't let the wrapper close the temporary file
+            self._stream.detach()
+        else:
+            self._workbook.save(self.file)
+        self.file.seek(0)
+        return self.file
+
+
+def create_file_with_headers(
+    file_headers: List[str], delimiter: str, file_type: str
+) -> ExportFileWriter:
+    return ExportFileWriter(file_headers, delimiter, file_type)
 
 
 def export_products_in_batches(
@@ -153,44 +181,51 @@ def export_products_in_batches(
     export_info: Dict[str, list],
     export_fields: Set[str],
     headers: List[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportFileWriter,
+    export_file: Optional["ExportFile"] = None,
 ):
     warehouses = export_info.get("warehouses")
     attributes = export_info.get("attributes")
     channels = export_info.get("channels")
 
+    total_count = queryset.count()
+    exported_count = 0
     for batch_pks in queryset_in_batches(queryset):
-        product_batch = Product.objects.filter(pk__in=batch_pks).prefetch_related(
-            "attributes",
-            "variants",
-            "collections",
-            "media",
-            "product_type",
-            "category",
-        )
+        # products data is fetched with `values()`, no model instances are needed
+        product_batch = Product.objects.filter(pk__in=batch_pks)
 
         export_data = get_products_data(
             product_batch, export_fields, attributes, warehouses, channels
         )
 
-        append_to_file(export_data, headers, temporary_file, file_type, delimiter)
+        writer.write_rows(export_data, headers)
+        exported_count += len(batch_pks)
+        if export_file:
+            update_export_progress(export_file, exported_count, total_count)
 
 
 def export_gift_cards_in_batches(
     queryset: "QuerySet",
     export_fields: List[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportFileWriter,
+    export_file: Optional["ExportFile"] = None,
 ):
+    total_count = queryset.count()
+    exported_count = 0
     for batch_pks in queryset_in_batches(queryset):
         gift_card_batch = GiftCard.objects.filter(pk__in=batch_pks)
 
-        export_data = list(gift_card_batch.values(*export_fields))
+        writer.write_rows(gift_card_batch.values(*export_fields), export_fields)
+        exported_count += len(batch_pks)
+        if export_file:
+            update_export_progress(export_file, exported_count, total_count)
 
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+
+def update_export_progress(
+    export_file: "ExportFile", exported_count: int, total_count: int
+):
+    export_file.message = f"Exported {exported_count} of {total_count} items."
+    export_file.save(update_fields=["message", "updated_at"])
 
 
 def queryset_in_batches(queryset):
@@ -212,21 +247,6 @@ def queryset_in_batches(queryset):
         start_pk = pks[-1]
 
 
-def append_to_file(
-    export_data: List[Dict[str, Union[str, bool]]],
-    headers: List[str],
-    temporary_file: Any,
-    file_type: str,
-    delimiter: str,
-):
-    table = etl.fromdicts(export_data, header=headers, missing=" ")
-
-    if file_type == FileTypes.CSV:
-        etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
-    else:
-        etl.io.xlsx.appendxlsx(table, temporary_file.name)
-
-
 def save_csv_file_in_export_file(
     export_file: "ExportFile", temporary_file: IO[bytes], file_name: str
 ):
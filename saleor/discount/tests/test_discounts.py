@@ -1,5 +1,6 @@
 from datetime import timedelta
 from decimal import Decimal
+from unittest import mock
 
 import pytest
 from django.utils import timezone
@@ -21,9 +22,12 @@ from ..models import (
 from ..utils import (
     add_voucher_usage_by_customer,
     decrease_voucher_usage,
+    fetch_active_discounts,
     fetch_catalogue_info,
+    get_next_discounts_change,
     get_product_discount_on_sale,
     increase_voucher_usage,
+    invalidate_active_discounts,
     remove_voucher_usage_by_customer,
     validate_voucher,
 )
@@ -784,3 +788,75 @@ def test_fetch_catalogue_info_for_sale_has_one_element_sets(sale):
     assert catalogue_info["collections"] == collection_ids
     assert catalogue_info["products"] == product_ids
     assert catalogue_info["variants"] == variant_ids
+
+
+def test_fetch_active_discounts_cached(settings, sale, django_assert_num_queries):
+    # given
+    settings.DISCOUNTS_CACHE_TIMEOUT = 60
+    invalidate_active_discounts()
+    first_discounts = fetch_active_discounts()
+
+    # when
+    with django_assert_num_queries(0):
+        discounts = fetch_active_discounts()
+
+    # then
+    assert discounts is first_discounts
+    assert [discount.sale for discount in discounts] == [sale]
+    invalidate_active_discounts()
+
+
+def test_fetch_active_discounts_refetched_after_invalidation(settings, sale, new_sale):
+    # given
+    settings.DISCOUNTS_CACHE_TIMEOUT = 60
+    invalidate_active_discounts()
+    fetch_active_discounts()
+    new_sale.delete()
+
+    # when
+    invalidate_active_discounts()
+    discounts = fetch_active_discounts()
+
+    # then
+    assert [discount.sale for discount in discounts] == [sale]
+    invalidate_active_discounts()
+
+
+def test_fetch_active_discounts_refetched_when_sale_starts(settings, sale, new_sale):
+    # given
+    settings.DISCOUNTS_CACHE_TIMEOUT = 60
+    start_date = timezone.now() + timedelta(hours=1)
+    new_sale.start_date = start_date
+    new_sale.save(update_fields=["start_date"])
+    invalidate_active_discounts()
+    assert [discount.sale for discount in fetch_active_discounts()] == [sale]
+
+    # when
+    with mock.patch(
+        "saleor.discount.utils.timezone.now",
+        return_value=start_date + timedelta(seconds=1),
+    ):
+        discounts = fetch_active_discounts()
+
+    # then
+    assert {discount.sale for discount in discounts} == {sale, new_sale}
+    invalidate_active_discounts()
+
+
+def test_get_next_discounts_change(sale, new_sale):
+    # given
+    now = timezone.now()
+    sale.end_date = now + timedelta(days=2)
+    sale.save(update_fields=["end_date"])
+    new_sale.start_date = now + timedelta(days=1)
+    new_sale.save(update_fields=["start_date"])
+
+    # when
+    next_change = get_next_discounts_change(now)
+
+    # then
+    assert next_change == new_sale.start_date
+
+
+def test_get_next_discounts_change_no_upcoming_changes(sale):
+    assert get_next_discounts_change(timezone.now()) is None
@@ -14,13 +14,16 @@ from typing import (
     cast,
 )
 
-from django.db.models import F
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Min, Q
 from django.utils import timezone
 from prices import Money, TaxedMoney
 
 from ..channel.models import Channel
 from ..checkout import calculations
 from ..core.taxes import zero_money
+from ..core.versioned_cache import VersionedProcessCache
 from . import DiscountInfo
 from .models import NotApplicable, Sale, SaleChannelListing, VoucherCustomer
 
@@ -35,6 +38,8 @@ if TYPE_CHECKING:
 
 CatalogueInfo = DefaultDict[str, Set[int]]
 
+ACTIVE_DISCOUNTS_VERSION_CACHE_KEY = "active_discounts_version"
+
 
 def increase_voucher_usage(voucher: "Voucher") -> None:
     """Increase voucher uses by 1."""
@@ -349,8 +354,72 @@ def fetch_discounts(date: datetime.date) -> List[DiscountInfo]:
     ]
 
 
+# Process-wide active discounts, stored together with the date until which they
+# stay valid.
+active_discounts_cache: VersionedProcessCache[
+    Tuple[Optional[datetime.datetime], List[DiscountInfo]]
+] = VersionedProcessCache(ACTIVE_DISCOUNTS_VERSION_CACHE_KEY)
+
+
+def get_active_discounts_cache_key(version: str) -> str:
+    return f"active_discounts-{version}"
+
+
+def invalidate_active_discounts():
+    """Refetch active discounts in all workers on the next use.
+
+    Should be called each time sales, their catalogues or channel listings
+    are changed. Checkout prices persisted with the previous discounts expire,
+    as the version is a part of their prices version.
+    """
+    active_discounts_cache.invalidate()
+
+
+def get_next_discounts_change(
+    date: datetime.datetime,
+) -> Optional[datetime.datetime]:
+    """Return the closest date after the given one on which a sale starts or ends."""
+    dates = Sale.objects.aggregate(
+        next_start=Min("start_date", filter=Q(start_date__gt=date)),
+        next_end=Min("end_date", filter=Q(end_date__gt=date)),
+    )
+    return min(filter(None, dates.values()), default=None)
+
+
 def fetch_active_discounts() -> List[DiscountInfo]:
-    return fetch_discounts(timezone.now())
+    """Return discounts that are active now.
+
+    Discounts are cached in the process and in the shared cache until the next
+    sale starts or ends, the cache is invalidated with
+    `invalidate_active_discounts` or `DISCOUNTS_CACHE_TIMEOUT` passes.
+    The returned list is shared between requests and must not be modified.
+    """
+    now = timezone.now()
+    timeout = settings.DISCOUNTS_CACHE_TIMEOUT
+    if not timeout:
+        return fetch_discounts(now)
+
+    version, cached = active_discounts_cache.get(timeout)
+    if cached:
+        valid_until, discounts = cached
+        if valid_until is None or now < valid_until:
+            return discounts
+
+    cache_key = get_active_discounts_cache_key(version)
+    shared = cache.get(cache_key)
+    if shared is not None:
+        valid_until, discounts = shared
+        if valid_until is None or now < valid_until:
+            active_discounts_cache.set(version, shared)
+            return discounts
+
+    valid_until = get_next_discounts_change(now)
+    discounts = fetch_discounts(now)
+    if valid_until:
+        timeout = min(timeout, (valid_until - now).total_seconds())
+    cache.set(cache_key, (valid_until, discounts), timeout=timeout)
+    active_discounts_cache.set(version, (valid_until, discounts))
+    return discounts
 
 
 def fetch_catalogue_info(instance: Sale) -> CatalogueInfo:
@@ -5,6 +5,7 @@ from django.core.exceptions import ValidationError
 
 from ...account import models
 from ...account.error_codes import AccountErrorCode
+from ...core.auth_cache import invalidate_principals_on_commit
 from ...core.permissions import AccountPermissions
 from ..core.mutations import BaseBulkMutation, ModelBulkDeleteMutation
 from ..core.types.common import AccountError, StaffError
@@ -21,6 +22,13 @@ class UserBulkDelete(ModelBulkDeleteMutation):
     class Meta:
         abstract = True
 
+    @classmethod
+    def bulk_action(cls, info, queryset):
+        invalidate_principals_on_commit(
+            models.User, queryset.values_list("pk", flat=True)
+        )
+        super().bulk_action(info, queryset)
+
 
 class CustomerBulkDelete(CustomerDeleteMixin, UserBulkDelete):
     class Meta:
@@ -113,3 +121,6 @@ class UserBulkSetActive(BaseBulkMutation):
     @classmethod
     def bulk_action(cls, info, queryset, is_active):
         queryset.update(is_active=is_active)
+        invalidate_principals_on_commit(
+            models.User, queryset.values_list("pk", flat=True)
+        )
@@ -5,7 +5,9 @@ import graphene
 from django.contrib.auth import models as auth_models
 from django.core.exceptions import ValidationError
 
+from ....account import models
 from ....account.error_codes import PermissionGroupErrorCode
+from ....core.auth_cache import invalidate_principals_on_commit
 from ....core.permissions import AccountPermissions, get_permissions
 from ....core.tracing import traced_atomic_transaction
 from ...account.utils import (
@@ -67,6 +69,9 @@ class PermissionGroupCreate(ModelMutation):
         users = cleaned_data.get("add_users")
         if users:
             instance.user_set.add(*users)
+        invalidate_principals_on_commit(
+            models.User, instance.user_set.values_list("pk", flat=True)
+        )
 
     @classmethod
     def clean_input(
@@ -207,6 +212,10 @@ class PermissionGroupUpdate(PermissionGroupCreate):
         remove_permissions = cleaned_data.get("remove_permissions")
         if remove_permissions:
             instance.permissions.remove(*remove_permissions)
+        if remove_users:
+            invalidate_principals_on_commit(
+                models.User, [user.pk for user in remove_users]
+            )
 
     @classmethod
     def clean_input(
@@ -431,6 +440,14 @@ class PermissionGroupDelete(ModelDeleteMutation):
 
         cls.check_if_group_can_be_removed(requestor, instance)
 
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        group = cls.get_node_or_error(info, data.get("id"), only_type=Group)
+        user_ids = list(group.user_set.values_list("pk", flat=True))
+        response = super().perform_mutation(_root, info, **data)
+        invalidate_principals_on_commit(models.User, user_ids)
+        return response
+
     @classmethod
     def check_if_group_can_be_removed(cls, requestor, group):
         cls.ensure_deleting_not_left_not_manageable_permissions(group)
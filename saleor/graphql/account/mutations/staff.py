@@ -15,6 +15,7 @@ from ....account.utils import (
     remove_the_oldest_user_address_if_address_limit_is_reached,
 )
 from ....checkout import AddressType
+from ....core.auth_cache import invalidate_principals_on_commit
 from ....core.exceptions import PermissionDenied
 from ....core.permissions import AccountPermissions
 from ....core.tracing import traced_atomic_transaction
@@ -401,6 +402,8 @@ class StaffUpdate(StaffCreate):
         remove_groups = cleaned_data.get("remove_groups")
         if remove_groups:
             instance.groups.remove(*remove_groups)
+        if add_groups or remove_groups:
+            invalidate_principals_on_commit(models.User, [instance.pk])
 
     @classmethod
     def perform_mutation(cls, _root, info, **data):
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import graphene
 import pytest
 from django.contrib.auth.models import Group
@@ -1878,6 +1880,41 @@ def test_group_delete_mutation(
     assert permission_group_data["permissions"] == []
 
 
+@patch(
+    "saleor.graphql.account.mutations.permission_group."
+    "invalidate_principals_on_commit"
+)
+def test_group_delete_mutation_invalidates_cached_principals(
+    mocked_invalidate_principals,
+    staff_users,
+    permission_manage_staff,
+    permission_manage_orders,
+    staff_api_client,
+):
+    # given
+    staff_user, _, staff_user2 = staff_users
+    staff_user.user_permissions.add(permission_manage_orders)
+    group, other_group = Group.objects.bulk_create(
+        [Group(name="manage orders"), Group(name="manage orders and staff")]
+    )
+    group.permissions.add(permission_manage_orders)
+    other_group.permissions.add(permission_manage_orders, permission_manage_staff)
+    staff_user2.groups.add(group, other_group)
+    variables = {"id": graphene.Node.to_global_id("Group", group.id)}
+
+    # when
+    response = staff_api_client.post_graphql(
+        PERMISSION_GROUP_DELETE_MUTATION,
+        variables,
+        permissions=(permission_manage_staff,),
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["permissionGroupDelete"]["errors"] == []
+    mocked_invalidate_principals.assert_called_once_with(User, [staff_user2.pk])
+
+
 def test_group_delete_mutation_app_no_permission(
     staff_users,
     permission_manage_staff,
@@ -3,6 +3,7 @@ from typing import Dict, List
 import graphene
 import requests
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from ...app import models
 from ...app.error_codes import AppErrorCode
@@ -10,7 +11,9 @@ from ...app.installation_utils import REQUEST_TIMEOUT
 from ...app.manifest_validations import clean_manifest_data, clean_manifest_url
 from ...app.tasks import install_app_task
 from ...core import JobStatus
+from ...core.auth_cache import invalidate_principals_on_commit
 from ...core.permissions import AppPermission, get_permissions
+from ...webhook.utils import invalidate_webhooks_registry
 from ..account.utils import can_manage_app
 from ..core import types as grapqhl_types
 from ..core.enums import PermissionEnum
@@ -201,6 +204,12 @@ class AppUpdate(ModelMutation):
             ensure_can_manage_permissions(requestor, permissions)
         return cleaned_input
 
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        transaction.on_commit(invalidate_webhooks_registry)
+        # permissions are assigned after the app is saved
+        invalidate_principals_on_commit(models.App, [instance.pk])
+
 
 class AppDelete(ModelDeleteMutation):
     class Arguments:
@@ -224,6 +233,12 @@ class AppDelete(ModelDeleteMutation):
             code = AppErrorCode.OUT_OF_SCOPE_APP.value
             raise ValidationError({"id": ValidationError(msg, code=code)})
 
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        response = super().perform_mutation(_root, info, **data)
+        transaction.on_commit(invalidate_webhooks_registry)
+        return response
+
 
 class AppActivate(ModelMutation):
     class Arguments:
@@ -242,6 +257,7 @@ class AppActivate(ModelMutation):
         app = cls.get_instance(info, **data)
         app.is_active = True
         cls.save(info, app, cleaned_input=None)
+        transaction.on_commit(invalidate_webhooks_registry)
         return cls.success_response(app)
 
 
@@ -262,6 +278,7 @@ class AppDeactivate(ModelMutation):
         app = cls.get_instance(info, **data)
         app.is_active = False
         cls.save(info, app, cleaned_input=None)
+        transaction.on_commit(invalidate_webhooks_registry)
         return cls.success_response(app)
 
 
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import graphene
 
 from .....app.models import App
@@ -42,6 +44,26 @@ def test_deactivate_app(app, staff_api_client, permission_manage_apps):
     assert not app.is_active
 
 
+@patch("saleor.graphql.app.mutations.invalidate_webhooks_registry")
+def test_deactivate_app_invalidates_webhooks_registry(
+    invalidate_webhooks_registry_mock, app, staff_api_client, permission_manage_apps
+):
+    # given
+    variables = {"id": graphene.Node.to_global_id("App", app.id)}
+
+    # when
+    response = staff_api_client.post_graphql(
+        APP_DEACTIVATE_MUTATION,
+        variables=variables,
+        permissions=(permission_manage_apps,),
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["appDeactivate"]["errors"]
+    invalidate_webhooks_registry_mock.assert_called_once_with()
+
+
 def test_deactivate_app_by_app(app, app_api_client, permission_manage_apps):
     # given
     app = App.objects.create(name="Sample app objects", is_active=True)
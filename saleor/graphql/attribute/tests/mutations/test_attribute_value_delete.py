@@ -2,6 +2,7 @@ import graphene
 import pytest
 
 from .....attribute.utils import associate_attribute_values_to_instance
+from .....product.tasks import update_products_search_index_task
 
 ATTRIBUTE_VALUE_DELETE_MUTATION = """
     mutation AttributeValueDelete($id: ID!) {
@@ -87,6 +88,11 @@ def test_delete_attribute_value_product_search_document_updated(
     with pytest.raises(value._meta.model.DoesNotExist):
         value.refresh_from_db()
 
+    product.refresh_from_db()
+    assert product.search_index_dirty
+
+    update_products_search_index_task()
+
     product.refresh_from_db()
     assert product.search_document
     assert name.lower() not in product.search_document
@@ -122,6 +128,11 @@ def test_delete_attribute_value_product_search_document_updated_variant_attribut
     with pytest.raises(value._meta.model.DoesNotExist):
         value.refresh_from_db()
 
+    product.refresh_from_db()
+    assert product.search_index_dirty
+
+    update_products_search_index_task()
+
     product.refresh_from_db()
     assert product.search_document
     assert name.lower() not in product.search_document
@@ -4,6 +4,7 @@ from django.utils.text import slugify
 
 from .....attribute.error_codes import AttributeErrorCode
 from .....attribute.utils import associate_attribute_values_to_instance
+from .....product.tasks import update_products_search_index_task
 from ....tests.utils import get_graphql_content
 
 UPDATE_ATTRIBUTE_VALUE_MUTATION = """
@@ -127,6 +128,11 @@ def test_update_attribute_value_product_search_document_updated(
         value["node"]["name"] for value in data["attribute"]["choices"]["edges"]
     ]
 
+    product.refresh_from_db()
+    assert product.search_index_dirty
+
+    update_products_search_index_task()
+
     product.refresh_from_db()
     assert name.lower() in product.search_document
 
@@ -167,6 +173,11 @@ def test_update_attribute_value_product_search_document_updated_variant_attribut
         value["node"]["name"] for value in data["attribute"]["choices"]["edges"]
     ]
 
+    product.refresh_from_db()
+    assert product.search_index_dirty
+
+    update_products_search_index_task()
+
     product.refresh_from_db()
     assert name.lower() in product.search_document
 
@@ -3,6 +3,7 @@ import pytest
 
 from .....attribute.models import Attribute, AttributeValue
 from .....attribute.utils import associate_attribute_values_to_instance
+from .....product.tasks import update_products_search_index_task
 from ....tests.utils import get_graphql_content
 
 ATTRIBUTE_BULK_DELETE_MUTATION = """
@@ -193,6 +194,13 @@ def test_delete_attribute_values_search_document_updated(
         id__in=[val.id for val in attribute_value_list]
     ).exists()
 
+    product_1.refresh_from_db()
+    product_2.refresh_from_db()
+    assert product_1.search_index_dirty
+    assert product_2.search_index_dirty
+
+    update_products_search_index_task()
+
     product_1.refresh_from_db()
     product_2.refresh_from_db()
     assert product_1.search_document
@@ -3,6 +3,7 @@ from typing import DefaultDict, Dict, Iterable, List
 
 import graphene
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.utils.text import slugify
 
 from ...channel import models
@@ -10,7 +11,10 @@ from ...checkout.models import Checkout
 from ...core.permissions import ChannelPermissions
 from ...core.tracing import traced_atomic_transaction
 from ...order.models import Order
+from ...plugins.manager import invalidate_plugins_manager
 from ...shipping.tasks import drop_invalid_shipping_methods_relations_for_given_channels
+from ...warehouse.models import Warehouse
+from ...warehouse.tasks import update_channel_stocks_task
 from ..account.enums import CountryCodeEnum
 from ..core.descriptions import ADDED_IN_31
 from ..core.mutations import BaseMutation, ModelDeleteMutation, ModelMutation
@@ -79,6 +83,24 @@ class ChannelCreate(ModelMutation):
         shipping_zones = cleaned_data.get("add_shipping_zones")
         if shipping_zones:
             instance.shipping_zones.add(*shipping_zones)
+            # warehouses are available in channels of their shipping zones
+            update_channel_stocks_of_shipping_zones_on_commit(shipping_zones)
+
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        transaction.on_commit(invalidate_plugins_manager)
+
+
+def update_channel_stocks_of_shipping_zones_on_commit(shipping_zones):
+    """Recalculate channel stocks of warehouses of the given shipping zones."""
+    warehouse_ids = list(
+        Warehouse.objects.filter(shipping_zones__in=shipping_zones)
+        .values_list("pk", flat=True)
+        .distinct()
+    )
+    if warehouse_ids:
+        # the task has to see the committed shipping zone assignment
+        transaction.on_commit(lambda: update_channel_stocks_task.delay(warehouse_ids))
 
 
 class ChannelUpdateInput(ChannelInput):
@@ -154,6 +176,17 @@ class ChannelUpdate(ModelMutation):
             drop_invalid_shipping_methods_relations_for_given_channels.delay(
                 shipping_method_ids, [instance.id]
             )
+        # warehouses are available in channels of their shipping zones
+        changed_shipping_zones = [
+            *(add_shipping_zones or []),
+            *(remove_shipping_zones or []),
+        ]
+        if changed_shipping_zones:
+            update_channel_stocks_of_shipping_zones_on_commit(changed_shipping_zones)
+
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        transaction.on_commit(invalidate_plugins_manager)
 
 
 class ChannelDeleteInput(graphene.InputObjectType):
@@ -252,6 +285,7 @@ class ChannelDelete(ModelDeleteMutation):
         else:
             cls.perform_delete_channel_without_order(origin_channel)
 
+        transaction.on_commit(invalidate_plugins_manager)
         return super().perform_mutation(_root, info, **data)
 
 
@@ -375,6 +409,7 @@ class ChannelActivate(BaseMutation):
         cls.clean_channel_availability(channel)
         channel.is_active = True
         channel.save(update_fields=["is_active"])
+        transaction.on_commit(invalidate_plugins_manager)
 
         return ChannelActivate(channel=channel)
 
@@ -409,5 +444,6 @@ class ChannelDeactivate(BaseMutation):
         cls.clean_channel_availability(channel)
         channel.is_active = False
         channel.save(update_fields=["is_active"])
+        transaction.on_commit(invalidate_plugins_manager)
 
         return ChannelDeactivate(channel=channel)
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import graphene
 from django.utils.text import slugify
 
@@ -267,3 +269,66 @@ def test_channel_create_mutation_with_shipping_zones(
     assert channel_data["currencyCode"] == channel.currency_code == currency_code
     for shipping_zone in shipping_zones:
         shipping_zone.channels.get(slug=slug)
+
+
+@patch("saleor.graphql.channel.mutations.update_channel_stocks_task.delay")
+def test_channel_create_mutation_with_shipping_zones_updates_channel_stocks(
+    update_channel_stocks_task_mock,
+    permission_manage_channels,
+    staff_api_client,
+    warehouse,
+):
+    # given
+    shipping_zone = warehouse.shipping_zones.first()
+    variables = {
+        "input": {
+            "name": "testName",
+            "slug": "test_slug",
+            "currencyCode": "USD",
+            "addShippingZones": [
+                graphene.Node.to_global_id("ShippingZone", shipping_zone.pk)
+            ],
+            "defaultCountry": "US",
+        }
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CHANNEL_CREATE_MUTATION,
+        variables=variables,
+        permissions=(permission_manage_channels,),
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["channelCreate"]["errors"]
+    update_channel_stocks_task_mock.assert_called_once_with([warehouse.pk])
+
+
+@patch("saleor.graphql.channel.mutations.invalidate_plugins_manager")
+def test_channel_create_invalidates_plugins_manager(
+    mocked_invalidate_plugins_manager,
+    permission_manage_channels,
+    staff_api_client,
+):
+    # given
+    variables = {
+        "input": {
+            "name": "testName",
+            "slug": "test_slug",
+            "currencyCode": "USD",
+            "defaultCountry": "US",
+        }
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CHANNEL_CREATE_MUTATION,
+        variables=variables,
+        permissions=(permission_manage_channels,),
+    )
+    content = get_graphql_content(response)
+
+    # then
+    assert not content["data"]["channelCreate"]["errors"]
+    mocked_invalidate_plugins_manager.assert_called_once_with()
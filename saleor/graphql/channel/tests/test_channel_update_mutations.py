@@ -364,6 +364,46 @@ def test_channel_update_mutation_add_and_remove_shipping_zone(
     assert len(zones) == len(shipping_zones)
 
 
+@patch("saleor.graphql.channel.mutations.update_channel_stocks_task.delay")
+def test_channel_update_mutation_shipping_zones_update_channel_stocks(
+    update_channel_stocks_task_mock,
+    permission_manage_channels,
+    staff_api_client,
+    channel_USD,
+    shipping_zones,
+    warehouse,
+):
+    # given
+    channel_USD.shipping_zones.add(*shipping_zones)
+    removed_zone = shipping_zones[0]
+    removed_zone.warehouses.add(warehouse)
+    added_zone = warehouse.shipping_zones.exclude(pk=removed_zone.pk).first()
+    channel_USD.shipping_zones.remove(added_zone)
+    variables = {
+        "id": graphene.Node.to_global_id("Channel", channel_USD.id),
+        "input": {
+            "addShippingZones": [
+                graphene.Node.to_global_id("ShippingZone", added_zone.pk)
+            ],
+            "removeShippingZones": [
+                graphene.Node.to_global_id("ShippingZone", removed_zone.pk)
+            ],
+        },
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CHANNEL_UPDATE_MUTATION,
+        variables=variables,
+        permissions=(permission_manage_channels,),
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["channelUpdate"]["errors"]
+    update_channel_stocks_task_mock.assert_called_once_with([warehouse.pk])
+
+
 def test_channel_update_mutation_duplicated_shipping_zone(
     permission_manage_channels,
     staff_api_client,
@@ -3,6 +3,10 @@ from collections import defaultdict
 from django.db.models import F
 from promise import Promise
 
+from ...checkout.calculations import (
+    fetch_checkout_prices_if_expired,
+    get_checkout_prices_version,
+)
 from ...checkout.fetch import (
     CheckoutInfo,
     CheckoutLineInfo,
@@ -10,6 +14,7 @@ from ...checkout.fetch import (
     update_delivery_method_lists_for_checkout_info,
 )
 from ...checkout.models import Checkout, CheckoutLine
+from ...discount.utils import fetch_active_discounts
 from ..account.dataloaders import AddressByIdLoader, UserByUserIdLoader
 from ..core.dataloaders import DataLoader
 from ..discount.dataloaders import VoucherByCodeLoader
@@ -302,6 +307,36 @@ class CheckoutInfoByCheckoutTokenLoader(DataLoader):
         return Promise.all([checkouts, checkout_line_infos]).then(with_checkout)
 
 
+class CheckoutInfoWithPricesByCheckoutTokenLoader(DataLoader):
+    """Load checkout info with prices fetched at most once per request."""
+
+    context_key = "checkoutinfo_with_prices_by_checkout"
+
+    def batch_load(self, keys):
+        checkout_infos = CheckoutInfoByCheckoutTokenLoader(self.context).load_many(keys)
+        lines = CheckoutLinesInfoByCheckoutTokenLoader(self.context).load_many(keys)
+
+        def with_prices(results):
+            checkout_infos, lines = results
+            # The version is read before the discounts, so prices calculated with
+            # discounts invalidated in the meantime are never stored as valid.
+            prices_version = get_checkout_prices_version()
+            discounts = fetch_active_discounts()
+            manager = self.context.plugins
+            return [
+                fetch_checkout_prices_if_expired(
+                    manager,
+                    checkout_info,
+                    checkout_lines,
+                    discounts,
+                    prices_version=prices_version,
+                )
+                for checkout_info, checkout_lines in zip(checkout_infos, lines)
+            ]
+
+        return Promise.all([checkout_infos, lines]).then(with_prices)
+
+
 class CheckoutLineByIdLoader(DataLoader):
     context_key = "checkout_line_by_id"
 
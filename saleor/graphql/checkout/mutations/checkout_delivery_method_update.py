@@ -7,6 +7,7 @@ from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ....checkout.utils import (
     delete_external_shipping_id,
+    invalidate_checkout_prices,
     is_shipping_required,
     recalculate_checkout_discount,
     set_external_shipping_id,
@@ -178,11 +179,13 @@ class CheckoutDeliveryMethodUpdate(BaseMutation):
             delete_external_shipping_id(checkout=checkout)
         checkout.shipping_method = shipping_method
         checkout.collection_point = collection_point
+        invalidate_checkout_prices(checkout)
         checkout.save(
             update_fields=[
                 "private_metadata",
                 "shipping_method",
                 "collection_point",
+                "price_expiration",
                 "last_change",
             ]
         )
@@ -1305,6 +1305,7 @@ def test_complete_checkout_with_out_of_stock_webhook(
     product_variant_out_of_stock_webhook_mock,
     api_client,
     checkout_with_charged_payment,
+    product_with_single_variant,
     count_queries,
 ):
     query = COMPLETE_CHECKOUT_MUTATION
@@ -1315,11 +1316,37 @@ def test_complete_checkout_with_out_of_stock_webhook(
 
     response = get_graphql_content(api_client.post_graphql(query, variables))
     assert not response["data"]["checkoutComplete"]["errors"]
+    # only the line with quantity 10 allocates the whole stock
     product_variant_out_of_stock_webhook_mock.assert_called_once_with(
-        Stock.objects.last()
+        Stock.objects.get(product_variant=product_with_single_variant.variants.get())
     )
 
 
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+@patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_complete_checkout_allocating_whole_stocks(
+    product_variant_out_of_stock_webhook_mock,
+    api_client,
+    checkout_with_charged_payment,
+    count_queries,
+):
+    query = COMPLETE_CHECKOUT_MUTATION
+    lines = list(checkout_with_charged_payment.lines.all())
+    for line in lines:
+        Stock.objects.filter(product_variant=line.variant).update(
+            quantity=line.quantity
+        )
+    variables = {
+        "token": checkout_with_charged_payment.token,
+    }
+
+    response = get_graphql_content(api_client.post_graphql(query, variables))
+    assert not response["data"]["checkoutComplete"]["errors"]
+    # every line allocates the whole stock, so each of them emits an event
+    assert product_variant_out_of_stock_webhook_mock.call_count == len(lines)
+
+
 @pytest.mark.django_db
 @pytest.mark.count_queries(autouse=False)
 def test_complete_checkout_with_single_line(
@@ -14,7 +14,7 @@ from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 from django_countries.fields import Country
 from measurement.measures import Weight
-from prices import Money
+from prices import Money, TaxedMoney
 
 from ....account.models import User
 from ....channel.utils import DEPRECATION_WARNING_MESSAGE
@@ -3492,6 +3492,61 @@ def test_checkout_prices(user_api_client, checkout_with_item):
     assert data["subtotalPrice"]["gross"]["amount"] == (subtotal.gross.amount)
 
 
+QUERY_CHECKOUT_PRICES = """
+    query getCheckout($token: UUID!) {
+        checkout(token: $token) {
+            totalPrice {
+                gross {
+                    amount
+                }
+            }
+            subtotalPrice {
+                gross {
+                    amount
+                }
+            }
+            shippingPrice {
+                gross {
+                    amount
+                }
+            }
+            lines {
+                totalPrice {
+                    gross {
+                        amount
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@patch("saleor.plugins.manager.PluginsManager.calculate_checkout_total")
+def test_checkout_prices_use_persisted_prices(
+    mocked_calculate_checkout_total, user_api_client, checkout_with_item, settings
+):
+    # given
+    settings.CHECKOUT_PRICES_TTL = datetime.timedelta(hours=1)
+    mocked_calculate_checkout_total.return_value = TaxedMoney(
+        net=Money("30.00", "USD"), gross=Money("36.90", "USD")
+    )
+    variables = {"token": str(checkout_with_item.token)}
+    content = get_graphql_content(
+        user_api_client.post_graphql(QUERY_CHECKOUT_PRICES, variables)
+    )
+
+    # when
+    response = user_api_client.post_graphql(QUERY_CHECKOUT_PRICES, variables)
+
+    # then
+    assert get_graphql_content(response) == content
+    assert content["data"]["checkout"]["totalPrice"]["gross"]["amount"] == 36.9
+    mocked_calculate_checkout_total.assert_called_once()
+    checkout_with_item.refresh_from_db()
+    assert checkout_with_item.price_expiration > timezone.now()
+
+
 MUTATION_UPDATE_SHIPPING_METHOD = """
     mutation checkoutShippingMethodUpdate(
             $token: UUID, $shippingMethodId: ID!){
@@ -691,6 +691,30 @@ def test_checkout_lines_update(
     assert checkout.last_change != previous_last_change
 
 
+def test_checkout_lines_update_expires_checkout_prices(
+    user_api_client, checkout_with_item
+):
+    # given
+    checkout = checkout_with_item
+    checkout.price_expiration = timezone.now() + datetime.timedelta(hours=1)
+    checkout.save(update_fields=["price_expiration"])
+    line = checkout.lines.first()
+    variant_id = graphene.Node.to_global_id("ProductVariant", line.variant_id)
+    variables = {
+        "token": checkout.token,
+        "lines": [{"variantId": variant_id, "quantity": 1}],
+    }
+
+    # when
+    response = user_api_client.post_graphql(MUTATION_CHECKOUT_LINES_UPDATE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["checkoutLinesUpdate"]["errors"]
+    checkout.refresh_from_db()
+    assert checkout.price_expiration <= timezone.now()
+
+
 def test_checkout_lines_update_with_new_reservations(
     site_settings_with_reservations,
     user_api_client,
@@ -20,7 +20,6 @@ from ..core.enums import LanguageCodeEnum
 from ..core.scalars import UUID
 from ..core.types import ModelObjectType, Money, TaxedMoney
 from ..core.utils import str_to_enum
-from ..discount.dataloaders import DiscountsByDateTimeLoader
 from ..giftcard.types import GiftCard
 from ..meta.types import ObjectWithMetadata
 from ..product.dataloaders import (
@@ -35,6 +34,7 @@ from ..warehouse.types import Warehouse
 from .dataloaders import (
     CheckoutByTokenLoader,
     CheckoutInfoByCheckoutTokenLoader,
+    CheckoutInfoWithPricesByCheckoutTokenLoader,
     CheckoutLinesByCheckoutTokenLoader,
     CheckoutLinesInfoByCheckoutTokenLoader,
 )
@@ -101,45 +101,25 @@ class CheckoutLine(ModelObjectType):
     @traced_resolver
     def resolve_total_price(root, info):
         def with_checkout(checkout):
-            discounts = DiscountsByDateTimeLoader(info.context).load(
-                info.context.request_time
-            )
-            checkout_info = CheckoutInfoByCheckoutTokenLoader(info.context).load(
-                checkout.token
-            )
+            # Line totals are calculated together with the checkout prices and
+            # stored on the lines, the same way as the checkout totals.
+            checkout_info = CheckoutInfoWithPricesByCheckoutTokenLoader(
+                info.context
+            ).load(checkout.token)
             lines = CheckoutLinesInfoByCheckoutTokenLoader(info.context).load(
                 checkout.token
             )
 
-            def calculate_line_total_price(data):
-                (
-                    discounts,
-                    checkout_info,
-                    lines,
-                ) = data
-                line_info = None
+            def get_line_total_price(data):
+                checkout_info, lines = data
                 for line_info in lines:
                     if line_info.line.pk == root.pk:
-                        address = (
-                            checkout_info.shipping_address
-                            or checkout_info.billing_address
+                        return calculations.get_checkout_line_total_price(
+                            checkout_info.checkout, line_info.line
                         )
-                        return info.context.plugins.calculate_checkout_line_total(
-                            checkout_info=checkout_info,
-                            lines=lines,
-                            checkout_line_info=line_info,
-                            address=address,
-                            discounts=discounts,
-                        ).price_with_sale
                 return None
 
-            return Promise.all(
-                [
-                    discounts,
-                    checkout_info,
-                    lines,
-                ]
-            ).then(calculate_line_total_price)
+            return Promise.all([checkout_info, lines]).then(get_line_total_price)
 
         return (
             CheckoutByTokenLoader(info.context)
@@ -354,88 +334,35 @@ class Checkout(ModelObjectType):
 
     @staticmethod
     @traced_resolver
-    # TODO: We should optimize it in/after PR#5819
     def resolve_total_price(root: models.Checkout, info):
-        def calculate_total_price(data):
-            address, lines, checkout_info, discounts = data
+        def get_total_price(checkout_info):
             taxed_total = (
-                calculations.checkout_total(
-                    manager=info.context.plugins,
-                    checkout_info=checkout_info,
-                    lines=lines,
-                    address=address,
-                    discounts=discounts,
-                )
-                - root.get_total_gift_cards_balance()
+                checkout_info.checkout.total - root.get_total_gift_cards_balance()
             )
             return max(taxed_total, zero_taxed_money(root.currency))
 
-        address_id = root.shipping_address_id or root.billing_address_id
-        address = (
-            AddressByIdLoader(info.context).load(address_id) if address_id else None
-        )
-        lines = CheckoutLinesInfoByCheckoutTokenLoader(info.context).load(root.token)
-        checkout_info = CheckoutInfoByCheckoutTokenLoader(info.context).load(root.token)
-        discounts = DiscountsByDateTimeLoader(info.context).load(
-            info.context.request_time
-        )
-        return Promise.all([address, lines, checkout_info, discounts]).then(
-            calculate_total_price
+        return (
+            CheckoutInfoWithPricesByCheckoutTokenLoader(info.context)
+            .load(root.token)
+            .then(get_total_price)
         )
 
     @staticmethod
     @traced_resolver
-    # TODO: We should optimize it in/after PR#5819
     def resolve_subtotal_price(root: models.Checkout, info):
-        def calculate_subtotal_price(data):
-            address, lines, checkout_info, discounts = data
-            return calculations.checkout_subtotal(
-                manager=info.context.plugins,
-                checkout_info=checkout_info,
-                lines=lines,
-                address=address,
-                discounts=discounts,
-            )
-
-        address_id = root.shipping_address_id or root.billing_address_id
-        address = (
-            AddressByIdLoader(info.context).load(address_id) if address_id else None
-        )
-        lines = CheckoutLinesInfoByCheckoutTokenLoader(info.context).load(root.token)
-        checkout_info = CheckoutInfoByCheckoutTokenLoader(info.context).load(root.token)
-        discounts = DiscountsByDateTimeLoader(info.context).load(
-            info.context.request_time
-        )
-        return Promise.all([address, lines, checkout_info, discounts]).then(
-            calculate_subtotal_price
+        return (
+            CheckoutInfoWithPricesByCheckoutTokenLoader(info.context)
+            .load(root.token)
+            .then(lambda checkout_info: checkout_info.checkout.subtotal)
         )
 
     @staticmethod
     @traced_resolver
-    # TODO: We should optimize it in/after PR#5819
     def resolve_shipping_price(root: models.Checkout, info):
-        def calculate_shipping_price(data):
-            address, lines, checkout_info, discounts = data
-            return calculations.checkout_shipping_price(
-                manager=info.context.plugins,
-                checkout_info=checkout_info,
-                lines=lines,
-                address=address,
-                discounts=discounts,
-            )
-
-        address = (
-            AddressByIdLoader(info.context).load(root.shipping_address_id)
-            if root.shipping_address_id
-            else None
-        )
-        lines = CheckoutLinesInfoByCheckoutTokenLoader(info.context).load(root.token)
-        checkout_info = CheckoutInfoByCheckoutTokenLoader(info.context).load(root.token)
-        discounts = DiscountsByDateTimeLoader(info.context).load(
-            info.context.request_time
-        )
-        return Promise.all([address, lines, checkout_info, discounts]).then(
-            calculate_shipping_price
+        return (
+            CheckoutInfoWithPricesByCheckoutTokenLoader(info.context)
+            .load(root.token)
+            .then(lambda checkout_info: checkout_info.checkout.shipping_price)
         )
 
     @staticmethod
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from django.conf import settings
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import AnonymousUser
 from django.db.models import Exists, OuterRef
@@ -7,6 +8,11 @@ from django.utils.functional import SimpleLazyObject
 
 from ..app.models import App, AppToken
 from ..core.auth import get_token_from_request
+from ..core.auth_cache import (
+    cache_principal,
+    get_cached_principal,
+    get_principal_version,
+)
 from .api import API_PATH
 
 
@@ -17,10 +23,28 @@ def get_context_value(request):
 
 
 def get_app(auth_token) -> Optional[App]:
-    tokens = AppToken.objects.filter(auth_token=auth_token).values("pk")
-    return App.objects.filter(
-        Exists(tokens.filter(app_id=OuterRef("pk"))), is_active=True
-    ).first()
+    app = get_cached_principal(App, auth_token)
+    if app is not None:
+        return app
+    tokens = AppToken.objects.filter(auth_token=auth_token)
+    apps = App.objects.filter(
+        Exists(tokens.filter(app_id=OuterRef("pk")).values("pk")), is_active=True
+    )
+    if not settings.AUTH_PRINCIPAL_CACHE_TIMEOUT:
+        return apps.first()
+
+    app_id = tokens.values_list("app_id", flat=True).first()
+    if app_id is None:
+        return None
+    # The version is read before the app and its permissions, so the app isn't
+    # cached with permissions that were revoked in the meantime.
+    version = get_principal_version(App, app_id)
+    app = apps.filter(pk=app_id).first()
+    if app:
+        # evaluate the permissions, so they are stored together with the app
+        app.get_permissions()
+        cache_principal(auth_token, app, version)
+    return app
 
 
 def set_app_on_context(request):
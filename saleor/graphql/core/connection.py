@@ -4,6 +4,8 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 import graphene
 from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
 from django.db.models import Model as DjangoModel
 from django.db.models import Q, QuerySet
 from graphene.relay import Connection
@@ -26,6 +28,19 @@ FILTERS_NAME = "_FILTERS_NAME"
 FILTERSET_CLASS = "_FILTERSET_CLASS"
 
 
+class TotalCountMode:
+    """Strategies of counting items of the countable connection.
+
+    EXACT counts all items. ESTIMATED returns the PostgreSQL planner estimate when it
+    exceeds `GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD` and counts exactly below it.
+    CAPPED counts exactly, but stops at `GRAPHQL_TOTAL_COUNT_LIMIT` items.
+    """
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CAPPED = "capped"
+
+
 def to_global_cursor(values):
     if not isinstance(values, Iterable):
         values = [values]
@@ -140,17 +155,13 @@ def _get_sorting_direction(sort_by, last=None):
     return "lt" if sorting_desc else "gt"
 
 
-def _get_page_info(matching_records, cursor, first, last):
-    requested_count = first or last
+def _get_page_info(records_left, cursor, first, last):
     page_info = {
         "has_previous_page": False,
         "has_next_page": False,
         "start_cursor": None,
         "end_cursor": None,
     }
-    records_left = False
-    if requested_count is not None:
-        records_left = len(matching_records) > requested_count
     has_pages_before = True if cursor else False
     if first:
         page_info["has_next_page"] = records_left
@@ -174,18 +185,15 @@ def _get_edges_for_connection(edge_type, qs, args, sorting_fields):
     if not first and not last:
         return [], {"has_previous_page": False, "has_next_page": False}
 
-    if last:
-        start_slice, end_slice = 1, None
-    else:
-        start_slice, end_slice = 0, requested_count
-
+    # The queryset fetches one record more than requested to check if there are
+    # records left; the extra record is dropped and, for `last`, the records
+    # fetched in reversed order are put back in place.
     matching_records = list(qs)
+    records_left = len(matching_records) > requested_count
+    del matching_records[requested_count:]
     if last:
-        matching_records = list(reversed(matching_records))
-        if len(matching_records) <= requested_count:
-            start_slice = 0
-    page_info = _get_page_info(matching_records, cursor, first, last)
-    matching_records = matching_records[start_slice:end_slice]
+        matching_records.reverse()
+    page_info = _get_page_info(records_left, cursor, first, last)
 
     edges = [
         edge_type(
@@ -202,6 +210,46 @@ def _get_edges_for_connection(edge_type, qs, args, sorting_fields):
     return edges, page_info
 
 
+def get_estimated_count(qs: QuerySet) -> int:
+    """Return the number of rows in the queryset estimated by the PostgreSQL planner."""
+    try:
+        sql, params = qs.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    with connections[qs.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_total_count_mode(connection_type) -> str:
+    """Return the total count mode selected for the connection by the operator.
+
+    Connections count items exactly unless they name a setting in
+    `total_count_mode_setting` and that setting selects another mode.
+    """
+    setting_name = getattr(connection_type, "total_count_mode_setting", None)
+    if not setting_name:
+        return TotalCountMode.EXACT
+    mode = getattr(settings, setting_name, None)
+    if mode not in (TotalCountMode.ESTIMATED, TotalCountMode.CAPPED):
+        return TotalCountMode.EXACT
+    return mode
+
+
+def get_total_count(qs: QuerySet, mode: str = TotalCountMode.EXACT) -> int:
+    if mode == TotalCountMode.ESTIMATED:
+        estimated_count = get_estimated_count(qs)
+        if estimated_count >= settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD:
+            return estimated_count
+    elif mode == TotalCountMode.CAPPED:
+        limit = settings.GRAPHQL_TOTAL_COUNT_LIMIT
+        return qs.order_by()[:limit].count()
+    return qs.count()
+
+
 def connection_from_queryset_slice(
     qs: QuerySet,
     args: ConnectionArguments = None,
@@ -241,14 +289,15 @@ def connection_from_queryset_slice(
     )
 
     if "total_count" in connection_type._meta.fields:
+        total_count_mode = get_total_count_mode(connection_type)
 
-        def get_total_count():
-            return qs.count()
+        def resolve_total_count():
+            return get_total_count(qs, total_count_mode)
 
         return connection_type(
             edges=edges,
             page_info=pageinfo_type(**page_info),
-            total_count=get_total_count,
+            total_count=resolve_total_count,
         )
 
     return connection_type(
@@ -462,6 +511,10 @@ class CountableConnection(NonNullConnection):
 
     total_count = graphene.Int(description="A total count of items in the collection.")
 
+    # Name of the setting which may select a `TotalCountMode` other than EXACT
+    # for resolving `total_count`.
+    total_count_mode_setting: Optional[str] = None
+
     def resolve_total_count(root, *_):
         try:
             if isinstance(root, dict):
@@ -0,0 +1,198 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from ...api import schema
+from ...document_cache import (
+    GraphQLDocumentCacheBackend,
+    get_persisted_query_cache_key,
+    get_query_hash,
+)
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+
+SHOP_QUERY = "query ShopName { shop { name } }"
+
+
+@pytest.fixture
+def persisted_query_extensions():
+    return {"persistedQuery": {"version": 1, "sha256Hash": get_query_hash(SHOP_QUERY)}}
+
+
+@pytest.fixture(autouse=True)
+def clear_persisted_queries():
+    yield
+    cache.delete(get_persisted_query_cache_key(get_query_hash(SHOP_QUERY)))
+
+
+def test_backend_returns_cached_document():
+    # given
+    backend = GraphQLDocumentCacheBackend(maxsize=10)
+
+    # when
+    document = backend.document_from_string(schema, SHOP_QUERY)
+
+    # then
+    assert backend.document_from_string(schema, SHOP_QUERY) is document
+    assert backend.get_document(schema, get_query_hash(SHOP_QUERY)) is document
+    assert len(backend) == 1
+
+
+def test_backend_evicts_least_recently_used_document():
+    # given
+    backend = GraphQLDocumentCacheBackend(maxsize=2)
+    first_query = "{ shop { name } }"
+    second_query = "{ shop { domain { host } } }"
+    third_query = "{ shop { description } }"
+    backend.document_from_string(schema, first_query)
+    backend.document_from_string(schema, second_query)
+    backend.document_from_string(schema, first_query)
+
+    # when
+    backend.document_from_string(schema, third_query)
+
+    # then
+    assert len(backend) == 2
+    assert backend.get_document(schema, get_query_hash(first_query))
+    assert backend.get_document(schema, get_query_hash(second_query)) is None
+    assert backend.get_document(schema, get_query_hash(third_query))
+
+
+def test_backend_with_disabled_cache():
+    # given
+    backend = GraphQLDocumentCacheBackend(maxsize=0)
+
+    # when
+    document = backend.document_from_string(schema, SHOP_QUERY)
+
+    # then
+    assert backend.document_from_string(schema, SHOP_QUERY) is not document
+    assert len(backend) == 0
+
+
+@mock.patch("saleor.graphql.document_cache.validate")
+def test_cached_document_is_validated_once(mocked_validate):
+    # given
+    mocked_validate.return_value = []
+    backend = GraphQLDocumentCacheBackend(maxsize=10)
+    document = backend.document_from_string(schema, SHOP_QUERY)
+
+    # when
+    document.execute(context_value=mock.Mock())
+    backend.document_from_string(schema, SHOP_QUERY).execute(context_value=mock.Mock())
+
+    # then
+    mocked_validate.assert_called_once_with(schema, document.document_ast)
+
+
+def test_cached_document_returns_validation_errors():
+    # given
+    backend = GraphQLDocumentCacheBackend(maxsize=10)
+    document = backend.document_from_string(schema, "{ shop { invalid } }")
+
+    # when
+    first_result = document.execute()
+    second_result = document.execute()
+
+    # then
+    assert first_result.invalid
+    assert second_result.invalid
+    assert first_result.errors == second_result.errors
+
+
+def test_persisted_query_registered_and_executed_by_hash(
+    api_client, persisted_query_extensions
+):
+    # given
+    response = api_client.post(
+        {"query": SHOP_QUERY, "extensions": persisted_query_extensions}
+    )
+    assert get_graphql_content(response)["data"]["shop"]["name"]
+
+    # when
+    response = api_client.post({"extensions": persisted_query_extensions})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"]
+
+
+@mock.patch("saleor.graphql.views.document_cache_backend.get_document")
+def test_persisted_query_resolved_from_shared_cache(
+    mocked_get_document, api_client, persisted_query_extensions
+):
+    # given
+    mocked_get_document.return_value = None
+    cache.set(get_persisted_query_cache_key(get_query_hash(SHOP_QUERY)), SHOP_QUERY)
+
+    # when
+    response = api_client.post({"extensions": persisted_query_extensions})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"]
+
+
+def test_persisted_query_not_found(api_client):
+    # given
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": "a" * 64}}
+
+    # when
+    response = api_client.post({"extensions": extensions})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    error = content["errors"][0]
+    assert error["message"] == "PersistedQueryNotFound"
+    assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_hash_mismatch(api_client):
+    # given
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": "a" * 64}}
+
+    # when
+    response = api_client.post({"query": SHOP_QUERY, "extensions": extensions})
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == (
+        "PERSISTED_QUERY_HASH_MISMATCH"
+    )
+    assert cache.get(get_persisted_query_cache_key("a" * 64)) is None
+
+
+@override_settings(GRAPHQL_PERSISTED_QUERIES_ENABLED=False)
+def test_persisted_queries_disabled(api_client, persisted_query_extensions):
+    # when
+    response = api_client.post(
+        {"query": SHOP_QUERY, "extensions": persisted_query_extensions}
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == (
+        "PERSISTED_QUERY_NOT_SUPPORTED"
+    )
+
+
+def test_persisted_queries_disabled_ignores_cached_document(
+    api_client, persisted_query_extensions, settings
+):
+    # given
+    response = api_client.post(
+        {"query": SHOP_QUERY, "extensions": persisted_query_extensions}
+    )
+    assert get_graphql_content(response)["data"]["shop"]["name"]
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+
+    # when
+    response = api_client.post({"extensions": persisted_query_extensions})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == (
+        "PERSISTED_QUERY_NOT_SUPPORTED"
+    )
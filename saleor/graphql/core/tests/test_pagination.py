@@ -1,10 +1,17 @@
 import math
+from unittest.mock import patch
 
 import graphene
 import pytest
 
 from ....tests.models import Book
-from ..connection import CountableConnection, create_connection_slice
+from ..connection import (
+    CountableConnection,
+    TotalCountMode,
+    create_connection_slice,
+    get_estimated_count,
+    get_total_count,
+)
 from ..fields import ConnectionField
 
 
@@ -17,13 +24,27 @@ class BookTypeCountableConnection(CountableConnection):
         node = BookType
 
 
+class BookTypeEstimatedCountableConnection(CountableConnection):
+    total_count_mode_setting = "GRAPHQL_BOOKS_TOTAL_COUNT_MODE"
+
+    class Meta:
+        node = BookType
+
+
 class Query(graphene.ObjectType):
     books = ConnectionField(BookTypeCountableConnection)
+    estimated_books = ConnectionField(BookTypeEstimatedCountableConnection)
 
     def resolve_books(self, info, **kwargs):
         qs = Book.objects.all()
         return create_connection_slice(qs, info, kwargs, BookTypeCountableConnection)
 
+    def resolve_estimated_books(self, info, **kwargs):
+        qs = Book.objects.all()
+        return create_connection_slice(
+            qs, info, kwargs, BookTypeEstimatedCountableConnection
+        )
+
 
 schema = graphene.Schema(query=Query)
 
@@ -298,3 +319,94 @@ def test_query_with_pagination_and_fragments_no_first_or_last_raises_an_error(bo
         "the `books` connection."
     )
     assert str(result.errors[0]) == expected_err_msg
+
+
+QUERY_TOTAL_COUNT = """
+    query BooksTotalCount($first: Int){
+        books(first: $first) {
+            totalCount
+        }
+        estimatedBooks(first: $first) {
+            totalCount
+        }
+    }
+"""
+
+
+def test_pagination_total_count(books, settings):
+    # given
+    settings.GRAPHQL_BOOKS_TOTAL_COUNT_MODE = TotalCountMode.ESTIMATED
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 10**9
+
+    # when
+    result = schema.execute(QUERY_TOTAL_COUNT, variables={"first": 1})
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == len(books)
+    assert result.data["estimatedBooks"]["totalCount"] == len(books)
+
+
+@patch("saleor.graphql.core.connection.get_estimated_count")
+def test_pagination_total_count_exact_by_default(
+    mocked_get_estimated_count, books, settings
+):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 0
+    mocked_get_estimated_count.return_value = 10**9
+
+    # when
+    result = schema.execute(QUERY_TOTAL_COUNT, variables={"first": 1})
+
+    # then
+    assert not result.errors
+    assert result.data["estimatedBooks"]["totalCount"] == len(books)
+    mocked_get_estimated_count.assert_not_called()
+
+
+@patch("saleor.graphql.core.connection.get_estimated_count")
+def test_pagination_total_count_mode_from_settings(
+    mocked_get_estimated_count, books, settings
+):
+    # given
+    settings.GRAPHQL_BOOKS_TOTAL_COUNT_MODE = TotalCountMode.ESTIMATED
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 0
+    mocked_get_estimated_count.return_value = 10**9
+
+    # when
+    result = schema.execute(QUERY_TOTAL_COUNT, variables={"first": 1})
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == len(books)
+    assert result.data["estimatedBooks"]["totalCount"] == 10**9
+
+
+def test_pagination_estimated_total_count(books, settings, django_assert_num_queries):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 0
+    qs = Book.objects.all()
+
+    # when
+    with django_assert_num_queries(1):
+        total_count = get_total_count(qs, TotalCountMode.ESTIMATED)
+
+    # then
+    assert total_count == get_estimated_count(qs)
+
+
+def test_pagination_estimated_total_count_for_empty_queryset(books):
+    assert get_estimated_count(Book.objects.none()) == 0
+
+
+def test_pagination_capped_total_count(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_LIMIT = 10
+
+    # when
+    total_count = get_total_count(Book.objects.all(), TotalCountMode.CAPPED)
+
+    # then
+    assert total_count == 10
+    settings.GRAPHQL_TOTAL_COUNT_LIMIT = 100
+    assert get_total_count(Book.objects.all(), TotalCountMode.CAPPED) == len(books)
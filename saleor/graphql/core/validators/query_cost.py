@@ -1,6 +1,6 @@
 from functools import reduce
 from operator import add, mul
-from typing import Any, Dict, List, Optional, Type, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
 
 from graphql import (
     GraphQLError,
@@ -127,9 +127,10 @@ class CostValidator(ValidationRule):
         self, node, key, parent, path, ancestors
     ):  # pylint: disable=unused-argument
         if self.cost_map:
-            try:
-                validate_cost_map(self.cost_map, self.context.get_schema())
-            except GraphQLError as cost_map_error:
+            cost_map_error = get_cost_map_error(
+                self.cost_map, self.context.get_schema()
+            )
+            if cost_map_error:
                 self.context.report_error(cost_map_error)
                 return
 
@@ -252,6 +253,28 @@ def validate_cost_map(cost_map: Dict[str, Dict[str, Any]], schema: GraphQLSchema
                 )
 
 
+# Cost maps are static, so validation results are kept for the lifetime of the
+# process instead of walking the whole map for every validated operation.
+_cost_map_errors: Dict[Tuple[int, int], Tuple[Any, Optional[GraphQLError]]] = {}
+
+
+def get_cost_map_error(
+    cost_map: Dict[str, Dict[str, Any]], schema: GraphQLSchema
+) -> Optional[GraphQLError]:
+    key = (id(cost_map), id(schema))
+    cached = _cost_map_errors.get(key)
+    if cached is None:
+        error = None
+        try:
+            validate_cost_map(cost_map, schema)
+        except GraphQLError as cost_map_error:
+            error = cost_map_error
+        # Keep references to validated objects so their ids are not reused.
+        cached = ((cost_map, schema), error)
+        _cost_map_errors[key] = cached
+    return cached[1]
+
+
 def report_error(context: ValidationContext, error: Exception):
     context.report_error(GraphQLError(str(error)))
 
@@ -1,7 +1,9 @@
 import graphene
+from django.db import transaction
 
 from ...core.permissions import DiscountPermissions
 from ...discount import models
+from ...discount.utils import invalidate_active_discounts
 from ..core.mutations import ModelBulkDeleteMutation
 from ..core.types.common import DiscountError
 from .types import Sale, Voucher
@@ -21,6 +23,11 @@ class SaleBulkDelete(ModelBulkDeleteMutation):
         error_type_class = DiscountError
         error_type_field = "discount_errors"
 
+    @classmethod
+    def bulk_action(cls, info, queryset):
+        super().bulk_action(info, queryset)
+        transaction.on_commit(invalidate_active_discounts)
+
 
 class VoucherBulkDelete(ModelBulkDeleteMutation):
     class Arguments:
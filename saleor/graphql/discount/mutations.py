@@ -11,7 +11,11 @@ from ...core.utils.promo_code import generate_promo_code, is_available_promo_cod
 from ...discount import DiscountValueType, models
 from ...discount.error_codes import DiscountErrorCode
 from ...discount.models import SaleChannelListing
-from ...discount.utils import CatalogueInfo, fetch_catalogue_info
+from ...discount.utils import (
+    CatalogueInfo,
+    fetch_catalogue_info,
+    invalidate_active_discounts,
+)
 from ...product.tasks import (
     update_products_discounted_prices_of_catalogues_task,
     update_products_discounted_prices_of_discount_task,
@@ -557,6 +561,7 @@ class SaleUpdateDiscountedPriceMixin:
         # Update the "discounted_prices" of the associated, discounted
         # products (including collections and categories).
         update_products_discounted_prices_of_discount_task.delay(instance.pk)
+        transaction.on_commit(invalidate_active_discounts)
         return super().success_response(
             ChannelContext(node=instance, channel_slug=None)
         )
@@ -697,6 +702,7 @@ class SaleAddCatalogues(SaleBaseCatalogueMutation):
         cls.add_catalogues_to_node(sale, data.get("input"))
         current_catalogue = fetch_catalogue_info(sale)
 
+        transaction.on_commit(invalidate_active_discounts)
         transaction.on_commit(
             lambda: info.context.plugins.sale_updated(
                 sale,
@@ -729,6 +735,7 @@ class SaleRemoveCatalogues(SaleBaseCatalogueMutation):
         cls.remove_catalogues_from_node(sale, data.get("input"))
         current_catalogue = fetch_catalogue_info(sale)
 
+        transaction.on_commit(invalidate_active_discounts)
         transaction.on_commit(
             lambda: info.context.plugins.sale_updated(
                 sale,
@@ -845,6 +852,7 @@ class SaleChannelListingUpdate(BaseChannelListingMutation):
         cls.add_channels(sale, cleaned_input.get("add_channels", []))
         cls.remove_channels(sale, cleaned_input.get("remove_channels", []))
         update_products_discounted_prices_of_discount_task.delay(sale.pk)
+        transaction.on_commit(invalidate_active_discounts)
 
     @classmethod
     def perform_mutation(cls, _root, info, id, input):
@@ -1,3 +1,4 @@
+import graphene
 import pytest
 
 from .....discount.models import Sale, SaleChannelListing
@@ -127,3 +128,48 @@ def test_sales_query_withot_channel_slug(
             check_no_permissions=False,
         )
     )
+
+
+SALE_CATALOGUES_ADD_MUTATION = """
+mutation SaleCataloguesAdd($id: ID!, $input: CatalogueInput!) {
+  saleCataloguesAdd(id: $id, input: $input) {
+    sale {
+      id
+    }
+    errors {
+      field
+      code
+      message
+    }
+  }
+}
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_sale_catalogues_add_products(
+    staff_api_client,
+    sales_list,
+    product_list,
+    permission_manage_discounts,
+    count_queries,
+):
+    variables = {
+        "id": graphene.Node.to_global_id("Sale", sales_list[0].pk),
+        "input": {
+            "products": [
+                graphene.Node.to_global_id("Product", product.pk)
+                for product in product_list
+            ]
+        },
+    }
+    content = get_graphql_content(
+        staff_api_client.post_graphql(
+            SALE_CATALOGUES_ADD_MUTATION,
+            variables,
+            permissions=[permission_manage_discounts],
+            check_no_permissions=False,
+        )
+    )
+    assert not content["data"]["saleCataloguesAdd"]["errors"]
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import graphene
 import pytest
 
@@ -74,6 +76,34 @@ def test_delete_sales(staff_api_client, sale_list, permission_manage_discounts):
     assert not Sale.objects.filter(id__in=[sale.id for sale in sale_list]).exists()
 
 
+@patch("saleor.graphql.discount.bulk_mutations.invalidate_active_discounts")
+def test_delete_sales_invalidates_active_discounts(
+    invalidate_active_discounts_mock,
+    staff_api_client,
+    sale_list,
+    permission_manage_discounts,
+):
+    # given
+    query = """
+    mutation saleBulkDelete($ids: [ID]!) {
+        saleBulkDelete(ids: $ids) {
+            count
+        }
+    }
+    """
+    variables = {
+        "ids": [graphene.Node.to_global_id("Sale", sale.id) for sale in sale_list]
+    }
+
+    # when
+    staff_api_client.post_graphql(
+        query, variables, permissions=[permission_manage_discounts]
+    )
+
+    # then
+    invalidate_active_discounts_mock.assert_called_once_with()
+
+
 def test_delete_vouchers(staff_api_client, voucher_list, permission_manage_discounts):
     query = """
     mutation voucherBulkDelete($ids: [ID]!) {
@@ -1065,6 +1065,36 @@ def test_update_sale(
     )
 
 
+@patch("saleor.graphql.discount.mutations.invalidate_active_discounts")
+def test_update_sale_invalidates_active_discounts(
+    invalidate_active_discounts_mock,
+    staff_api_client,
+    sale,
+    permission_manage_discounts,
+):
+    # given
+    query = """
+    mutation saleUpdate($id: ID!, $name: String) {
+        saleUpdate(id: $id, input: {name: $name}) {
+            errors {
+                field
+            }
+        }
+    }
+    """
+    variables = {"id": graphene.Node.to_global_id("Sale", sale.id), "name": "New"}
+
+    # when
+    response = staff_api_client.post_graphql(
+        query, variables, permissions=[permission_manage_discounts]
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["saleUpdate"]["errors"]
+    invalidate_active_discounts_mock.assert_called_once_with()
+
+
 @patch("saleor.plugins.manager.PluginsManager.sale_deleted")
 def test_sale_delete_mutation(
     deleted_webhook_mock, staff_api_client, sale, permission_manage_discounts
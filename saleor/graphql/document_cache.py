@@ -0,0 +1,193 @@
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql import GraphQLDocument
+from graphql.backend import core as core_backend
+from graphql.backend.base import GraphQLBackend
+from graphql.error import GraphQLError
+from graphql.execution import ExecutionResult
+from graphql.language.base import parse
+from graphql.validation import validate
+
+from .. import __version__ as saleor_version
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+
+PERSISTED_QUERY_VERSION = 1
+
+
+class PersistedQueryNotFound(GraphQLError):
+    def __init__(self):
+        super().__init__(
+            "PersistedQueryNotFound",
+            extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+        )
+
+
+class PersistedQueryNotSupported(GraphQLError):
+    def __init__(self):
+        super().__init__(
+            "PersistedQueryNotSupported",
+            extensions={"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+        )
+
+
+class PersistedQueryHashMismatch(GraphQLError):
+    def __init__(self):
+        super().__init__(
+            "Provided sha256Hash does not match query.",
+            extensions={"code": "PERSISTED_QUERY_HASH_MISMATCH"},
+        )
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class CachedDocument(GraphQLDocument):
+    """GraphQL document that validates its AST against the schema only once.
+
+    The validation result is stored on the document, so subsequent executions of
+    the same cached document skip straight to the executor.
+    """
+
+    def __init__(self, schema, document_string, document_ast, execute_params):
+        super().__init__(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            execute=self._execute,
+        )
+        self.execute_params = execute_params
+        self.validation_errors: Optional[List[GraphQLError]] = None
+
+    def validate(self) -> List[GraphQLError]:
+        if self.validation_errors is None:
+            self.validation_errors = validate(self.schema, self.document_ast)
+        return self.validation_errors
+
+    def _execute(self, *args, **kwargs):
+        if kwargs.pop("validate", True):
+            validation_errors = self.validate()
+            if validation_errors:
+                return ExecutionResult(errors=validation_errors, invalid=True)
+        params = {**self.execute_params, **kwargs}
+        return core_backend.execute_and_validate(
+            self.schema, self.document_ast, *args, validate=False, **params
+        )
+
+
+class GraphQLDocumentCacheBackend(GraphQLBackend):
+    """Backend keeping a bounded, process-local LRU of parsed documents.
+
+    Documents are keyed by the schema and the SHA-256 hash of the query string.
+    Each document carries its own validation result, so repeated operations pay
+    neither for parsing nor for validation.
+    """
+
+    def __init__(self, maxsize: int, executor=None):
+        self.maxsize = maxsize
+        self.execute_params = {"executor": executor}
+        self._documents: "OrderedDict[Tuple[GraphQLSchema, str], CachedDocument]" = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._documents)
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+    def get_document(
+        self, schema: "GraphQLSchema", query_hash: str
+    ) -> Optional[CachedDocument]:
+        key = (schema, query_hash)
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+            return document
+
+    def document_from_string(
+        self, schema: "GraphQLSchema", document_string: str, query_hash=None
+    ) -> CachedDocument:
+        assert isinstance(document_string, str), "The query must be a string"
+        if query_hash is None:
+            query_hash = get_query_hash(document_string)
+        document = self.get_document(schema, query_hash)
+        if document is not None:
+            return document
+
+        # Parse outside of the lock; a concurrent miss for the same query only
+        # results in the document being parsed twice.
+        document = CachedDocument(
+            schema=schema,
+            document_string=document_string,
+            document_ast=parse(document_string),
+            execute_params=self.execute_params,
+        )
+        if self.maxsize > 0:
+            key = (schema, query_hash)
+            with self._lock:
+                self._documents[key] = document
+                self._documents.move_to_end(key)
+                while len(self._documents) > self.maxsize:
+                    self._documents.popitem(last=False)
+        return document
+
+
+def get_persisted_query_cache_key(query_hash: str) -> str:
+    return f"{saleor_version}-persisted-query-{query_hash}"
+
+
+def get_persisted_query_hash(extensions: Any) -> Optional[str]:
+    """Return the SHA-256 hash of an Apollo-style persisted query, if any.
+
+    Raise an error when persisted queries are disabled, so neither the shared cache
+    nor the local document cache can serve a query by its hash.
+    """
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return None
+    if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+        raise PersistedQueryNotSupported()
+    if persisted_query.get("version") != PERSISTED_QUERY_VERSION:
+        raise PersistedQueryNotSupported()
+    query_hash = persisted_query.get("sha256Hash")
+    if not isinstance(query_hash, str):
+        raise PersistedQueryNotSupported()
+    return query_hash.lower()
+
+
+def resolve_persisted_query(query: Optional[str], query_hash: str) -> str:
+    """Resolve a query string for the given persisted query hash.
+
+    When the query is sent along with its hash, it's verified against the hash
+    and stored in the shared cache, so every worker is able to serve subsequent
+    hash-only requests. Otherwise, the query is looked up in the shared cache.
+    """
+    cache_key = get_persisted_query_cache_key(query_hash)
+    if query:
+        if not isinstance(query, str) or get_query_hash(query) != query_hash:
+            raise PersistedQueryHashMismatch()
+        cache.set(cache_key, query, settings.GRAPHQL_PERSISTED_QUERIES_TIMEOUT)
+        return query
+
+    query = cache.get(cache_key)
+    if query is None:
+        raise PersistedQueryNotFound()
+    return query
+
+
+document_cache_backend = GraphQLDocumentCacheBackend(
+    maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE
+)
@@ -18,7 +18,7 @@ from ....order.error_codes import OrderErrorCode
 from ....order.fetch import OrderInfo, OrderLineInfo
 from ....order.search import (
     prepare_order_search_document_value,
-    update_order_search_document,
+    update_order_search_document_on_commit,
 )
 from ....order.utils import (
     add_variant_to_order,
@@ -344,7 +344,7 @@ class DraftOrderCreate(ModelMutation, I18nMixin):
 
         # Post-process the results
         recalculate_order(instance)
-        update_order_search_document(instance)
+        update_order_search_document_on_commit(instance)
 
 
 class DraftOrderUpdate(DraftOrderCreate):
@@ -23,7 +23,7 @@ from ....order.error_codes import OrderErrorCode
 from ....order.fetch import OrderLineInfo, fetch_order_info
 from ....order.search import (
     prepare_order_search_document_value,
-    update_order_search_document,
+    update_order_search_document_on_commit,
 )
 from ....order.utils import (
     add_variant_to_order,
@@ -533,7 +533,7 @@ class OrderMarkAsPaid(BaseMutation):
             order, user, app, info.context.plugins, transaction_reference
         )
 
-        update_order_search_document(order)
+        update_order_search_document_on_commit(order)
 
         return OrderMarkAsPaid(order=order)
 
@@ -880,7 +880,7 @@ class OrderLinesCreate(EditableOrderValidationMixin, BaseMutation):
         )
 
         recalculate_order(order)
-        update_order_search_document(order)
+        update_order_search_document_on_commit(order)
 
         func = get_webhook_handler_by_order_status(order.status, info)
         transaction.on_commit(lambda: func(order))
@@ -953,7 +953,7 @@ class OrderLineDelete(EditableOrderValidationMixin, BaseMutation):
         )
 
         recalculate_order(order)
-        update_order_search_document(order)
+        update_order_search_document_on_commit(order)
         func = get_webhook_handler_by_order_status(order.status, info)
         transaction.on_commit(lambda: func(order))
         return OrderLineDelete(order=order, order_line=line)
@@ -3,9 +3,9 @@ from ...core.tracing import traced_resolver
 from ...order import OrderStatus, models
 from ...order.events import OrderEvents
 from ...order.models import OrderEvent
-from ...order.utils import sum_order_totals
+from ...order.utils import get_orders_total
 from ..channel.utils import get_default_channel_slug_or_graphql_error
-from ..utils.filters import filter_by_period
+from ..utils.filters import reporting_period_to_date
 
 ORDER_SEARCH_FIELDS = ("id", "discount_name", "token", "user_email", "user__email")
 
@@ -29,13 +29,7 @@ def resolve_orders_total(_info, period, channel_slug):
     channel = Channel.objects.filter(slug=str(channel_slug)).first()
     if not channel:
         return None
-    qs = (
-        models.Order.objects.non_draft()
-        .exclude(status=OrderStatus.CANCELED)
-        .filter(channel__slug=str(channel_slug))
-    )
-    qs = filter_by_period(qs, period, "created")
-    return sum_order_totals(qs, channel.currency_code)
+    return get_orders_total(channel, reporting_period_to_date(period))
 
 
 def resolve_order(id):
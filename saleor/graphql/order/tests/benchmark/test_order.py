@@ -222,6 +222,46 @@ def test_staff_multiple_orders(
     assert content["data"]["orders"] is not None
 
 
+ORDERS_PAGINATION_QUERY = """
+    query ($last: Int) {
+      orders(last: $last) {
+        totalCount
+        edges {
+          node {
+            id
+          }
+        }
+        pageInfo {
+          hasPreviousPage
+        }
+      }
+    }
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_staff_orders_pagination_with_capped_total_count(
+    staff_api_client,
+    permission_manage_orders,
+    orders_for_benchmarks,
+    count_queries,
+    settings,
+):
+    settings.GRAPHQL_ORDERS_TOTAL_COUNT_MODE = "capped"
+    settings.GRAPHQL_TOTAL_COUNT_LIMIT = 5
+    staff_api_client.user.user_permissions.add(permission_manage_orders)
+
+    content = get_graphql_content(
+        staff_api_client.post_graphql(ORDERS_PAGINATION_QUERY, {"last": 2})
+    )
+
+    data = content["data"]["orders"]
+    assert len(data["edges"]) == 2
+    assert data["pageInfo"]["hasPreviousPage"]
+    assert data["totalCount"] == 5
+
+
 MULTIPLE_DRAFT_ORDER_DETAILS_QUERY = (
     FRAGMENT_STAFF_ORDER_DETAILS
     + """
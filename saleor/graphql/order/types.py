@@ -1215,5 +1215,15 @@ class Order(ModelObjectType):
 
 
 class OrderCountableConnection(CountableConnection):
+    total_count_mode_setting = "GRAPHQL_ORDERS_TOTAL_COUNT_MODE"
+
+    total_count = graphene.Int(
+        description=(
+            "A total count of items in the collection. The count is exact unless "
+            "the server is configured to cap it; a capped count never exceeds the "
+            "configured limit, so the collection may contain more items."
+        )
+    )
+
     class Meta:
         node = Order
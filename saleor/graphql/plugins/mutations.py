@@ -1,6 +1,7 @@
 import graphene
 from django.core.exceptions import ValidationError
 
+from ...checkout.calculations import invalidate_checkout_taxes
 from ...core.permissions import PluginsPermissions
 from ...plugins.error_codes import PluginErrorCode
 from ...plugins.manager import get_plugins_manager
@@ -99,5 +100,7 @@ class PluginUpdate(BaseMutation):
         input_data = cleaned_data["data"]
         manager = info.context.plugins
         manager.save_plugin_configuration(plugin_id, channel_slug, input_data)
+        # Tax plugins calculate checkout prices, so the persisted ones expire.
+        invalidate_checkout_taxes()
         manager = get_plugins_manager()
         return PluginUpdate(plugin=resolve_plugin(plugin_id, manager))
@@ -11,6 +11,7 @@ from graphene.types import InputObjectType
 
 from ....attribute import AttributeInputType
 from ....attribute import models as attribute_models
+from ....attribute.utils import update_products_attribute_facets
 from ....core.permissions import ProductPermissions, ProductTypePermissions
 from ....core.tracing import traced_atomic_transaction
 from ....order import events as order_events
@@ -19,13 +20,14 @@ from ....order.tasks import recalculate_orders_task
 from ....product import models
 from ....product.error_codes import ProductErrorCode
 from ....product.search import (
-    prepare_product_search_document_value,
+    mark_products_search_index_dirty,
     update_product_search_document,
 )
 from ....product.tasks import update_product_discounted_price_task
 from ....product.utils import delete_categories
 from ....product.utils.variants import generate_and_set_variant_name
 from ....warehouse import models as warehouse_models
+from ....warehouse.availability import update_channel_stocks
 from ....warehouse.error_codes import StockErrorCode
 from ...channel import ChannelContext
 from ...channel.types import Channel
@@ -642,11 +644,13 @@ class ProductVariantBulkDelete(ModelBulkDeleteMutation):
             pk__in=product_pks, default_variant__isnull=True
         )
         for product in products:
-            product.search_document = prepare_product_search_document_value(product)
             product.default_variant = product.variants.first()
-            product.save(
-                update_fields=["default_variant", "search_document", "updated_at"]
-            )
+            product.save(update_fields=["default_variant", "updated_at"])
+
+        # SKUs and attributes of the deleted variants are part of the products
+        # search index and attribute facets
+        update_products_attribute_facets(product_pks)
+        mark_products_search_index_dirty(product_pks)
 
         return response
 
@@ -839,6 +843,7 @@ class ProductVariantStocksUpdate(ProductVariantStocksCreate):
             stocks.append(stock)
 
         warehouse_models.Stock.objects.bulk_update(stocks, ["quantity"])
+        update_channel_stocks([variant.pk])
 
 
 class ProductVariantStocksDelete(BaseMutation):
@@ -879,6 +884,7 @@ class ProductVariantStocksDelete(BaseMutation):
             transaction.on_commit(lambda: manager.product_variant_out_of_stock(stock))
 
         stocks_to_delete.delete()
+        update_channel_stocks([variant.pk])
 
         StocksWithAvailableQuantityByProductVariantIdCountryCodeAndChannelLoader(
             info.context
@@ -7,18 +7,11 @@ import graphene
 from django.db.models import Exists, FloatField, OuterRef, Q, Subquery, Sum
 from django.db.models.expressions import ExpressionWrapper
 from django.db.models.fields import IntegerField
-from django.db.models.functions import Cast, Coalesce
+from django.db.models.functions import Cast
 from django.utils import timezone
 
 from ...attribute import AttributeInputType
-from ...attribute.models import (
-    AssignedProductAttribute,
-    AssignedProductAttributeValue,
-    AssignedVariantAttribute,
-    AssignedVariantAttributeValue,
-    Attribute,
-    AttributeValue,
-)
+from ...attribute.models import Attribute, AttributeValue, ProductAttributeValueFacet
 from ...channel.models import Channel
 from ...product import ProductTypeKind
 from ...product.models import (
@@ -32,7 +25,7 @@ from ...product.models import (
     ProductVariantChannelListing,
 )
 from ...product.search import search_products
-from ...warehouse.models import Allocation, Stock, Warehouse
+from ...warehouse.models import ChannelStock, Stock, Warehouse
 from ..channel.filters import get_channel_slug_from_filter_data
 from ..core.filters import (
     EnumFilter,
@@ -185,35 +178,8 @@ def _clean_product_attributes_boolean_filter_input(filter_value, queries):
 def filter_products_by_attributes_values(qs, queries: T_PRODUCT_FILTER_QUERIES):
     filters = []
     for values in queries.values():
-        assigned_product_attribute_values = (
-            AssignedProductAttributeValue.objects.filter(value_id__in=values)
-        )
-        assigned_product_attributes = AssignedProductAttribute.objects.filter(
-            Exists(
-                assigned_product_attribute_values.filter(assignment_id=OuterRef("pk"))
-            )
-        )
-        product_attribute_filter = Q(
-            Exists(assigned_product_attributes.filter(product_id=OuterRef("pk")))
-        )
-
-        assigned_variant_attribute_values = (
-            AssignedVariantAttributeValue.objects.filter(value_id__in=values)
-        )
-        assigned_variant_attributes = AssignedVariantAttribute.objects.filter(
-            Exists(
-                assigned_variant_attribute_values.filter(assignment_id=OuterRef("pk"))
-            )
-        )
-        product_variants = ProductVariant.objects.filter(
-            Exists(assigned_variant_attributes.filter(variant_id=OuterRef("pk")))
-        )
-        variant_attribute_filter = Q(
-            Exists(product_variants.filter(product_id=OuterRef("pk")))
-        )
-
-        filters.append(product_attribute_filter | variant_attribute_filter)
-
+        facets = ProductAttributeValueFacet.objects.filter(value_id__in=values)
+        filters.append(Exists(facets.filter(product_id=OuterRef("pk"))))
     return qs.filter(*filters)
 
 
@@ -307,26 +273,15 @@ def filter_products_by_collections(qs, collection_pks):
 
 
 def filter_products_by_stock_availability(qs, stock_availability, channel_slug):
-    allocations = (
-        Allocation.objects.values("stock_id")
-        .filter(quantity_allocated__gt=0, stock_id=OuterRef("pk"))
-        .values_list(Sum("quantity_allocated"))
-    )
-    allocated_subquery = Subquery(queryset=allocations, output_field=IntegerField())
-
-    stocks = (
-        Stock.objects.for_channel(channel_slug)
-        .filter(quantity__gt=Coalesce(allocated_subquery, 0))
-        .values("product_variant_id")
-    )
-    variants = ProductVariant.objects.filter(
-        Exists(stocks.filter(product_variant_id=OuterRef("pk")))
+    channel_stocks = ChannelStock.objects.filter(
+        channel_id__in=Channel.objects.filter(slug=str(channel_slug)).values("pk"),
+        available_quantity__gt=0,
     ).values("product_id")
 
     if stock_availability == StockAvailability.IN_STOCK:
-        qs = qs.filter(Exists(variants.filter(product_id=OuterRef("pk"))))
+        qs = qs.filter(Exists(channel_stocks.filter(product_id=OuterRef("pk"))))
     if stock_availability == StockAvailability.OUT_OF_STOCK:
-        qs = qs.filter(~Exists(variants.filter(product_id=OuterRef("pk"))))
+        qs = qs.filter(~Exists(channel_stocks.filter(product_id=OuterRef("pk"))))
     return qs
 
 
@@ -7,11 +7,12 @@ from django.db.models import Q
 
 from ....attribute import AttributeInputType, AttributeType
 from ....attribute import models as attribute_models
+from ....attribute.utils import update_products_attribute_facets
 from ....core.permissions import ProductPermissions, ProductTypePermissions
 from ....core.tracing import traced_atomic_transaction
 from ....product import models
 from ....product.error_codes import ProductErrorCode
-from ....product.search import update_products_search_document
+from ....product.search import mark_products_search_index_dirty
 from ...attribute.mutations import (
     BaseReorderAttributesMutation,
     BaseReorderAttributeValuesMutation,
@@ -344,7 +345,9 @@ class ProductAttributeUnassign(BaseMutation):
         cls.save_field_values(product_type, "product_attributes", attribute_pks)
         cls.save_field_values(product_type, "variant_attributes", attribute_pks)
 
-        update_products_search_document(product_type.products.all())
+        product_ids = product_type.products.values_list("id", flat=True)
+        update_products_attribute_facets(product_ids, attribute_pks)
+        mark_products_search_index_dirty(product_type.products.all())
 
         return cls(product_type=product_type)
 
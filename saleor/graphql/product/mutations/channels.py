@@ -7,7 +7,8 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.utils import IntegrityError
 
-from ....checkout.models import CheckoutLine
+from ....checkout.models import Checkout, CheckoutLine
+from ....checkout.utils import invalidate_checkouts_prices
 from ....core.permissions import ProductPermissions
 from ....core.tracing import traced_atomic_transaction
 from ....product.error_codes import CollectionErrorCode, ProductErrorCode
@@ -252,8 +253,10 @@ class ProductChannelListingUpdate(BaseChannelListingMutation):
             ).values("id", "checkout__pk")
         )
         lines_ids = {line["id"] for line in lines_id_and_checkout_id}
+        checkout_ids = {line["checkout__pk"] for line in lines_id_and_checkout_id}
 
         CheckoutLine.objects.filter(id__in=lines_ids).delete()
+        invalidate_checkouts_prices(Checkout.objects.filter(pk__in=checkout_ids))
 
     @classmethod
     def remove_channels(cls, product: "ProductModel", remove_channels: List[Dict]):
@@ -442,6 +445,7 @@ class ProductVariantChannelListingUpdate(BaseMutation):
                 defaults=defaults,
             )
         update_product_discounted_price_task.delay(variant.product_id)
+        invalidate_checkouts_prices(Checkout.objects.filter(lines__variant=variant))
 
         transaction.on_commit(
             lambda: info.context.plugins.product_variant_updated(variant)
@@ -10,6 +10,7 @@ from django.utils.text import slugify
 
 from ....attribute import AttributeInputType, AttributeType
 from ....attribute import models as attribute_models
+from ....attribute.utils import update_products_attribute_facets
 from ....core.exceptions import PermissionDenied, PreorderAllocationError
 from ....core.permissions import ProductPermissions, ProductTypePermissions
 from ....core.tasks import delete_product_media_task
@@ -23,8 +24,8 @@ from ....order.tasks import recalculate_orders_task
 from ....product import ProductMediaTypes, ProductTypeKind, models
 from ....product.error_codes import CollectionErrorCode, ProductErrorCode
 from ....product.search import (
+    mark_products_search_index_dirty,
     update_product_search_document,
-    update_products_search_document,
 )
 from ....product.tasks import (
     update_product_discounted_price_task,
@@ -1142,6 +1143,7 @@ class ProductVariantDelete(ModelDeleteMutation):
     def success_response(cls, instance):
         # Update the "discounted_prices" of the parent product
         update_product_discounted_price_task.delay(instance.product_id)
+        update_products_attribute_facets([instance.product_id])
         product = models.Product.objects.get(id=instance.product_id)
         update_product_search_document(product)
         # if the product default variant has been removed set the new one
@@ -1368,6 +1370,21 @@ class ProductTypeUpdate(ProductTypeCreate):
     def clean_product_kind(cls, instance, data):
         return data.get("kind", instance.kind)
 
+    @classmethod
+    def _save_m2m(cls, info, instance, cleaned_data):
+        old_attribute_ids = set(
+            instance.product_attributes.values_list("pk", flat=True)
+        ) | set(instance.variant_attributes.values_list("pk", flat=True))
+        super()._save_m2m(info, instance, cleaned_data)
+        attribute_ids = set(
+            instance.product_attributes.values_list("pk", flat=True)
+        ) | set(instance.variant_attributes.values_list("pk", flat=True))
+        # assignments of removed attributes are deleted, so are their facets
+        removed_attribute_ids = old_attribute_ids - attribute_ids
+        if removed_attribute_ids:
+            product_ids = instance.products.values_list("id", flat=True)
+            update_products_attribute_facets(product_ids, removed_attribute_ids)
+
     @classmethod
     def save(cls, info, instance, cleaned_input):
         variant_attr = cleaned_input.get("variant_attributes")
@@ -1384,7 +1401,7 @@ class ProductTypeUpdate(ProductTypeCreate):
             or "variant_attributes" in cleaned_input
         ):
             products = models.Product.objects.filter(product_type=instance)
-            update_products_search_document(products)
+            mark_products_search_index_dirty(products)
 
 
 class ProductTypeDelete(ModelDeleteMutation):
@@ -1,14 +1,17 @@
 from django.db.models import Exists, OuterRef, Sum
+from prices import Money, MoneyRange
 
 from ...channel.models import Channel
 from ...core.db.utils import get_database_connection_name
-from ...core.permissions import has_one_of_permissions
+from ...core.permissions import ProductPermissions, has_one_of_permissions
 from ...core.tracing import traced_resolver
 from ...order import OrderStatus
 from ...order.models import Order
 from ...product import models
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
+from ...product.utils.facets import get_product_facet_counts
 from ..channel import ChannelQsContext
+from ..channel.dataloaders import ChannelBySlugLoader
 from ..core.utils import from_global_id_or_error
 from ..utils import get_user_or_app_from_context
 from ..utils.filters import filter_by_period
@@ -177,3 +180,48 @@ def resolve_report_product_sales(period, channel_slug) -> ChannelQsContext:
     qs = qs.order_by("-quantity_ordered")
 
     return ChannelQsContext(qs=qs, channel_slug=channel_slug)
+
+
+@traced_resolver
+def resolve_product_facets(info, qs, channel_slug=None, price_bucket_size=None):
+    requestor = get_user_or_app_from_context(info.context)
+    # attributes hidden in the storefront are exposed only to product managers,
+    # the same way as in the product attributes
+    visible_attributes_only = not (
+        requestor.is_active and requestor.has_perm(ProductPermissions.MANAGE_PRODUCTS)
+    )
+    counts = get_product_facet_counts(
+        qs, channel_slug, price_bucket_size, visible_attributes_only
+    )
+    facets = {
+        "attribute_values": [
+            {"value_id": value_id, "count": count}
+            for value_id, count in sorted(
+                counts.attribute_values.items(), key=lambda item: (-item[1], item[0])
+            )
+        ],
+        "categories": [
+            {"category_id": category_id, "count": count}
+            for category_id, count in sorted(
+                counts.categories.items(), key=lambda item: (-item[1], item[0])
+            )
+        ],
+        "price_buckets": [],
+    }
+    if not counts.price_buckets:
+        return facets
+
+    def with_price_buckets(channel):
+        currency = channel.currency_code
+        facets["price_buckets"] = [
+            {
+                "range": MoneyRange(
+                    Money(start, currency), Money(start + price_bucket_size, currency)
+                ),
+                "count": count,
+            }
+            for start, count in sorted(counts.price_buckets.items())
+        ]
+        return facets
+
+    return ChannelBySlugLoader(info.context).load(channel_slug).then(with_price_buckets)
@@ -6,9 +6,15 @@ from ...core.permissions import ProductPermissions, has_one_of_permissions
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
 from ..channel import ChannelContext
 from ..channel.utils import get_default_channel_slug_or_graphql_error
-from ..core.connection import create_connection_slice, filter_connection_queryset
+from ..core.connection import (
+    FILTERS_NAME,
+    FILTERSET_CLASS,
+    create_connection_slice,
+    filter_connection_queryset,
+)
 from ..core.enums import ReportingPeriod
 from ..core.fields import ConnectionField, FilterConnectionField
+from ..core.scalars import PositiveDecimal
 from ..core.utils import from_global_id_or_error
 from ..core.validators import validate_one_of_args_is_in_query
 from ..decorators import permission_required
@@ -34,6 +40,7 @@ from .bulk_mutations.products import (
 from .filters import (
     CategoryFilterInput,
     CollectionFilterInput,
+    ProductFilter,
     ProductFilterInput,
     ProductTypeFilterInput,
     ProductVariantFilterInput,
@@ -97,6 +104,7 @@ from .resolvers import (
     resolve_digital_contents,
     resolve_product_by_id,
     resolve_product_by_slug,
+    resolve_product_facets,
     resolve_product_type_by_id,
     resolve_product_types,
     resolve_product_variant_by_sku,
@@ -121,6 +129,7 @@ from .types import (
     DigitalContentCountableConnection,
     Product,
     ProductCountableConnection,
+    ProductFacets,
     ProductType,
     ProductTypeCountableConnection,
     ProductVariant,
@@ -197,6 +206,20 @@ class ProductQueries(graphene.ObjectType):
         ),
         description="List of the shop's products.",
     )
+    product_facets = graphene.Field(
+        ProductFacets,
+        filter=ProductFilterInput(description="Filtering options for products."),
+        channel=graphene.String(
+            description="Slug of a channel for which the data should be returned."
+        ),
+        price_bucket_size=PositiveDecimal(
+            description="Width of the price buckets to count the products in."
+        ),
+        description=(
+            "Number of the shop's products matching the filter per attribute value, "
+            "category and price bucket."
+        ),
+    )
     product_type = graphene.Field(
         ProductType,
         id=graphene.Argument(
@@ -348,6 +371,22 @@ class ProductQueries(graphene.ObjectType):
         qs = filter_connection_queryset(qs, kwargs)
         return create_connection_slice(qs, info, kwargs, ProductCountableConnection)
 
+    def resolve_product_facets(
+        self, info, channel=None, price_bucket_size=None, **kwargs
+    ):
+        requestor = get_user_or_app_from_context(info.context)
+        has_required_permissions = has_one_of_permissions(
+            requestor, ALL_PRODUCTS_PERMISSIONS
+        )
+        if channel is None and not has_required_permissions:
+            channel = get_default_channel_slug_or_graphql_error()
+        qs = resolve_products(info, requestor, channel_slug=channel, **kwargs)
+        kwargs["channel"] = channel
+        kwargs[FILTERSET_CLASS] = ProductFilter
+        kwargs[FILTERS_NAME] = "filter"
+        qs = filter_connection_queryset(qs, kwargs)
+        return resolve_product_facets(info, qs.qs, channel, price_bucket_size)
+
     def resolve_product_type(self, info, id, **_kwargs):
         _, id = from_global_id_or_error(id, ProductType)
         return resolve_product_type_by_id(id)
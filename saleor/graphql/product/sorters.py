@@ -5,12 +5,14 @@ from django.db.models import (
     DateField,
     ExpressionWrapper,
     F,
+    FloatField,
     IntegerField,
     Min,
     OuterRef,
     Q,
     QuerySet,
     Subquery,
+    Value,
 )
 from django.db.models.expressions import Window
 from django.db.models.functions import Coalesce, DenseRank
@@ -123,7 +125,7 @@ class CollectionSortingInput(ChannelSortInputObjectType):
 
 class ProductOrderField(graphene.Enum):
     NAME = ["name", "slug"]
-    RANK = ["name", "slug"]
+    RANK = ["search_rank", "name", "slug"]
     PRICE = ["min_variants_price_amount", "name", "slug"]
     MINIMAL_PRICE = ["discounted_price_amount", "name", "slug"]
     LAST_MODIFIED = ["updated_at", "name", "slug"]
@@ -167,6 +169,14 @@ class ProductOrderField(graphene.Enum):
             return f"Sort products by {descriptions[self.name]}"
         raise ValueError("Unsupported enum value: %s" % self.value)
 
+    @staticmethod
+    def qs_with_rank(queryset: QuerySet, **_kwargs) -> QuerySet:
+        # Rank is annotated by the full-text product search, without it all
+        # products are equally relevant.
+        if "search_rank" in queryset.query.annotations:
+            return queryset
+        return queryset.annotate(search_rank=Value(0, output_field=FloatField()))
+
     @staticmethod
     def qs_with_price(queryset: QuerySet, channel_slug: str) -> QuerySet:
         return queryset.annotate(
@@ -717,7 +717,7 @@ def test_products_for_federation_query_count(
         ],
     }
 
-    with django_assert_num_queries(3):
+    with django_assert_num_queries(1):
         response = api_client.post_graphql(query, variables)
         content = get_graphql_content(response)
         assert len(content["data"]["_entities"]) == 1
@@ -739,7 +739,7 @@ def test_products_for_federation_query_count(
         ],
     }
 
-    with django_assert_num_queries(3):
+    with django_assert_num_queries(1):
         response = api_client.post_graphql(query, variables)
         content = get_graphql_content(response)
         assert len(content["data"]["_entities"]) == 2
@@ -859,3 +859,39 @@ def test_products_types_for_federation_query_count(
         response = api_client.post_graphql(query, variables)
         content = get_graphql_content(response)
         assert len(content["data"]["_entities"]) == 2
+
+
+PRODUCTS_PAGINATION_QUERY = """
+    query ($channel: String, $last: Int) {
+        products(last: $last, channel: $channel) {
+            totalCount
+            edges {
+                node {
+                    id
+                }
+            }
+            pageInfo {
+                hasPreviousPage
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_products_pagination_with_estimated_total_count(
+    product_list, api_client, count_queries, channel_USD, settings
+):
+    settings.GRAPHQL_PRODUCTS_TOTAL_COUNT_MODE = "estimated"
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 0
+    variables = {"channel": channel_USD.slug, "last": 2}
+
+    content = get_graphql_content(
+        api_client.post_graphql(PRODUCTS_PAGINATION_QUERY, variables)
+    )
+
+    data = content["data"]["products"]
+    assert len(data["edges"]) == 2
+    assert data["pageInfo"]["hasPreviousPage"]
+    assert data["totalCount"] is not None
@@ -0,0 +1,81 @@
+import graphene
+import pytest
+
+from ....tests.utils import get_graphql_content
+
+PRODUCT_FACETS_QUERY = """
+    query ($filter: ProductFilterInput, $channel: String) {
+        productFacets(filter: $filter, channel: $channel, priceBucketSize: 20) {
+            attributeValues {
+                value {
+                    slug
+                }
+                count
+            }
+            categories {
+                category {
+                    id
+                }
+                count
+            }
+            priceBuckets {
+                range {
+                    start {
+                        amount
+                    }
+                }
+                count
+            }
+        }
+    }
+"""
+
+PRODUCTS_COUNT_QUERY = """
+    query ($filter: ProductFilterInput, $channel: String) {
+        products(first: 1, filter: $filter, channel: $channel) {
+            totalCount
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_product_facets(api_client, product_list, category, channel_USD, count_queries):
+    variables = {
+        "filter": {"categories": [graphene.Node.to_global_id("Category", category.pk)]},
+        "channel": channel_USD.slug,
+    }
+
+    content = get_graphql_content(
+        api_client.post_graphql(PRODUCT_FACETS_QUERY, variables)
+    )
+
+    assert content["data"]["productFacets"]["attributeValues"][0]["count"] == 3
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_product_counts_with_query_per_facet(
+    api_client, product_list, category, color_attribute, channel_USD, count_queries
+):
+    # counts the same facets as `test_product_facets` with one query per facet
+    category_id = graphene.Node.to_global_id("Category", category.pk)
+    facet_filters = [
+        {"attributes": [{"slug": color_attribute.slug, "values": [value.slug]}]}
+        for value in color_attribute.values.all()
+    ]
+    facet_filters.append({})
+    facet_filters.extend(
+        {"price": {"gte": start, "lte": start + 20}} for start in [0, 20]
+    )
+
+    for facet_filter in facet_filters:
+        variables = {
+            "filter": {"categories": [category_id], **facet_filter},
+            "channel": channel_USD.slug,
+        }
+        content = get_graphql_content(
+            api_client.post_graphql(PRODUCTS_COUNT_QUERY, variables)
+        )
+        assert content["data"]["products"]["totalCount"] is not None
@@ -0,0 +1,76 @@
+from unittest.mock import Mock
+
+import pytest
+
+from .....core.utils import random_data
+from .....product.models import Product
+from .....product.search import ProductSearchBackend, update_products_search_document
+from ....tests.utils import get_graphql_content
+
+# Every product of the populatedb catalogue is copied this many times.
+CATALOGUE_COPIES = 20
+
+SEARCH_PRODUCTS_QUERY = """
+    query ($search: String, $channel: String) {
+        products(first: 20, filter: {search: $search}, channel: $channel) {
+            edges {
+                node {
+                    id
+                    name
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def catalogue(db, monkeypatch, image, media_root):
+    monkeypatch.setattr(
+        "saleor.core.utils.random_data.get_image", Mock(return_value=image)
+    )
+    for _ in random_data.create_channels():
+        pass
+    for _ in random_data.create_page_type():
+        pass
+    for _ in random_data.create_pages():
+        pass
+    random_data.create_products_by_schema("/", False)
+    products = list(Product.objects.all())
+    # populatedb products are created with explicit IDs
+    next_pk = max(product.pk for product in products) + 1
+    copies = []
+    for i in range(CATALOGUE_COPIES):
+        for product in products:
+            copies.append(
+                Product(
+                    pk=next_pk + len(copies),
+                    name=f"{product.name} {i}",
+                    slug=f"{product.slug}-copy-{i}",
+                    description_plaintext=product.description_plaintext,
+                    product_type_id=product.product_type_id,
+                    category_id=product.category_id,
+                )
+            )
+    Product.objects.bulk_create(copies)
+    update_products_search_document(Product.objects.all())
+    return Product.objects.count()
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+@pytest.mark.parametrize(
+    "backend", [ProductSearchBackend.ILIKE, ProductSearchBackend.FULL_TEXT]
+)
+@pytest.mark.parametrize("search", ["juice", "red paint"])
+def test_search_products(
+    backend, search, catalogue, staff_api_client, permission_manage_products, settings
+):
+    settings.PRODUCT_SEARCH_BACKEND = backend
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    variables = {"search": search, "channel": settings.DEFAULT_CHANNEL_SLUG}
+
+    response = staff_api_client.post_graphql(SEARCH_PRODUCTS_QUERY, variables)
+
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["edges"]
@@ -14,6 +14,7 @@ from ....attribute.utils import associate_attribute_values_to_instance
 from ....product import ProductTypeKind
 from ....product.error_codes import ProductErrorCode
 from ....product.models import Product, ProductType
+from ....product.tasks import update_products_search_index_task
 from ...attribute.enums import AttributeTypeEnum
 from ...core.utils import snake_to_camel_case
 from ...tests.utils import get_graphql_content
@@ -1087,6 +1088,11 @@ def test_unassign_attributes_from_product_type(
         == remaining_attribute_global_id
     )
 
+    product.refresh_from_db()
+    assert product.search_index_dirty
+
+    update_products_search_index_task()
+
     product.refresh_from_db()
     assert product.search_document
     assert product_attr_value.name not in product.search_document
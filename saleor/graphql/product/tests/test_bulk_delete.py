@@ -25,6 +25,7 @@ from ....product.models import (
     ProductVariantChannelListing,
     VariantMedia,
 )
+from ....product.tasks import update_products_search_index_task
 from ....tests.utils import flush_post_commit_hooks
 from ...tests.utils import get_graphql_content
 
@@ -882,12 +883,44 @@ def test_delete_product_variants(
         == content["data"]["productVariantBulkDelete"]["count"]
     )
     mocked_recalculate_orders_task.assert_not_called()
+    product.refresh_from_db()
+    assert product.search_index_dirty
+
+    update_products_search_index_task()
+
     product.refresh_from_db()
     assert product.search_document
     for sku in variants_sku:
         assert sku not in product.search_document
 
 
+def test_delete_product_variants_updates_product_attribute_facets(
+    staff_api_client, product, permission_manage_products
+):
+    # given
+    variant = product.variants.get()
+    variant_value_ids = list(
+        variant.attributes.values_list("values__id", flat=True).exclude(
+            values__id__in=product.attributes.values("values__id")
+        )
+    )
+    assert product.attribute_facets.filter(value_id__in=variant_value_ids).exists()
+    variables = {"ids": [graphene.Node.to_global_id("ProductVariant", variant.id)]}
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_BULK_DELETE_MUTATION,
+        variables,
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariantBulkDelete"]["count"] == 1
+    assert not product.attribute_facets.filter(value_id__in=variant_value_ids).exists()
+    assert product.attribute_facets.exists()
+
+
 def test_delete_product_variants_invalid_object_typed_of_given_ids(
     staff_api_client, product_variant_list, permission_manage_products, staff_user
 ):
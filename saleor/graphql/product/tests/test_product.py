@@ -22,7 +22,11 @@ from measurement.measures import Weight
 from prices import Money, TaxedMoney
 
 from ....attribute import AttributeInputType, AttributeType
-from ....attribute.models import Attribute, AttributeValue
+from ....attribute.models import (
+    Attribute,
+    AttributeValue,
+    ProductAttributeValueFacet,
+)
 from ....attribute.utils import associate_attribute_values_to_instance
 from ....core.taxes import TaxType
 from ....core.units import MeasurementUnits, WeightUnits
@@ -43,12 +47,17 @@ from ....product.models import (
     ProductVariant,
     ProductVariantChannelListing,
 )
-from ....product.search import prepare_product_search_document_value
-from ....product.tasks import update_variants_names
+from ....product.search import (
+    ProductSearchBackend,
+    prepare_product_search_document_value,
+    update_products_search_document,
+)
+from ....product.tasks import update_products_search_index_task, update_variants_names
 from ....product.tests.utils import create_image, create_pdf_file_with_image_ext
 from ....product.utils.availability import get_variant_availability
 from ....product.utils.costs import get_product_costs_data
 from ....tests.utils import dummy_editorjs, flush_post_commit_hooks
+from ....warehouse.availability import update_channel_stocks
 from ....warehouse.models import Allocation, Stock, Warehouse
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.payloads import generate_product_deleted_payload
@@ -2980,6 +2989,7 @@ def test_products_query_with_filter_stock_availability_as_staff(
         Allocation.objects.create(
             order_line=order_line, stock=stock, quantity_allocated=stock.quantity
         )
+    update_channel_stocks(ProductVariant.objects.values_list("pk", flat=True))
     product = product_list[0]
     product.variants.first().channel_listings.filter(channel=channel_USD).update(
         price_amount=None
@@ -3010,6 +3020,7 @@ def test_products_query_with_filter_stock_availability_as_user(
         Allocation.objects.create(
             order_line=order_line, stock=stock, quantity_allocated=stock.quantity
         )
+    update_channel_stocks(ProductVariant.objects.values_list("pk", flat=True))
     product = product_list[0]
     product.variants.first().channel_listings.filter(channel=channel_USD).update(
         price_amount=None
@@ -4448,6 +4459,33 @@ def test_sort_product_by_rank_without_search(
     assert len(data) == product_count
 
 
+def test_sort_product_by_rank_with_full_text_search(
+    user_api_client, product_list, channel_USD, settings
+):
+    # given
+    settings.PRODUCT_SEARCH_BACKEND = ProductSearchBackend.FULL_TEXT
+    product_1, product_2, product_3 = product_list
+    product_1.description_plaintext = "new product"
+    product_2.name = "new product"
+    product_3.description_plaintext = "desc without searched word"
+    Product.objects.bulk_update(product_list, ["name", "description_plaintext"])
+    update_products_search_document(Product.objects.all())
+
+    variables = {
+        "filters": {"search": "new"},
+        "sortBy": {"field": "RANK", "direction": "DESC"},
+        "channel": channel_USD.slug,
+    }
+
+    # when
+    response = user_api_client.post_graphql(SEARCH_PRODUCTS_QUERY, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["products"]["edges"]
+    assert [node["node"]["name"] for node in data] == [product_2.name, product_1.name]
+
+
 def test_search_product_by_description_and_name_without_sort_by(
     user_api_client, product_list, product, channel_USD, category, product_type
 ):
@@ -8985,11 +9023,50 @@ def test_product_type_update_mutation(
     assert not data["productAttributes"]
     assert len(data["variantAttributes"]) == (variant_attributes.count())
 
+    product.refresh_from_db()
+    assert product.search_index_dirty
+
+    update_products_search_index_task()
+
     product.refresh_from_db()
     assert product.search_document
     assert value.name not in product.search_document
 
 
+def test_product_type_update_mutation_removes_attribute_facets(
+    staff_api_client,
+    product_type,
+    product,
+    permission_manage_product_types_and_attributes,
+):
+    # given
+    product_attr = product.attributes.first().attribute
+    assert ProductAttributeValueFacet.objects.filter(
+        product=product, attribute=product_attr
+    ).exists()
+    variables = {
+        "id": graphene.Node.to_global_id("ProductType", product_type.id),
+        "name": product_type.name,
+        "hasVariants": product_type.has_variants,
+        "isShippingRequired": product_type.is_shipping_required,
+        "productAttributes": [],
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_TYPE_UPDATE_MUTATION,
+        variables,
+        permissions=[permission_manage_product_types_and_attributes],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["productTypeUpdate"]["errors"]
+    assert not ProductAttributeValueFacet.objects.filter(
+        product=product, attribute=product_attr
+    ).exists()
+
+
 def test_product_type_update_mutation_not_valid_attributes(
     staff_api_client,
     product_type,
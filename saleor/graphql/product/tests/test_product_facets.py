@@ -0,0 +1,172 @@
+import graphene
+
+from ....attribute.utils import associate_attribute_values_to_instance
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCT_FACETS = """
+    query (
+        $filter: ProductFilterInput
+        $channel: String
+        $priceBucketSize: PositiveDecimal
+    ) {
+        productFacets(
+            filter: $filter, channel: $channel, priceBucketSize: $priceBucketSize
+        ) {
+            attributeValues {
+                attribute {
+                    slug
+                }
+                value {
+                    slug
+                }
+                count
+            }
+            categories {
+                category {
+                    id
+                }
+                count
+            }
+            priceBuckets {
+                range {
+                    start {
+                        amount
+                        currency
+                    }
+                    stop {
+                        amount
+                    }
+                }
+                count
+            }
+        }
+    }
+"""
+
+
+def test_product_facets(api_client, product_list, color_attribute, channel_USD):
+    # given
+    blue = color_attribute.values.get(slug="blue")
+    associate_attribute_values_to_instance(product_list[2], color_attribute, blue)
+    variables = {"channel": channel_USD.slug, "priceBucketSize": 20}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["attributeValues"] == [
+        {"attribute": {"slug": "color"}, "value": {"slug": "red"}, "count": 2},
+        {"attribute": {"slug": "color"}, "value": {"slug": "blue"}, "count": 1},
+    ]
+    assert data["categories"] == [
+        {
+            "category": {
+                "id": graphene.Node.to_global_id(
+                    "Category", product_list[0].category_id
+                )
+            },
+            "count": 3,
+        }
+    ]
+    assert data["priceBuckets"] == [
+        {
+            "range": {
+                "start": {"amount": 0.0, "currency": "USD"},
+                "stop": {"amount": 20.0},
+            },
+            "count": 1,
+        },
+        {
+            "range": {
+                "start": {"amount": 20.0, "currency": "USD"},
+                "stop": {"amount": 40.0},
+            },
+            "count": 2,
+        },
+    ]
+
+
+def test_product_facets_with_filter(
+    api_client, product_list, color_attribute, channel_USD
+):
+    # given
+    blue = color_attribute.values.get(slug="blue")
+    associate_attribute_values_to_instance(product_list[2], color_attribute, blue)
+    variables = {
+        "channel": channel_USD.slug,
+        "priceBucketSize": 20,
+        "filter": {"attributes": [{"slug": "color", "values": ["blue"]}]},
+    }
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["attributeValues"] == [
+        {"attribute": {"slug": "color"}, "value": {"slug": "blue"}, "count": 1}
+    ]
+    assert data["categories"][0]["count"] == 1
+    assert len(data["priceBuckets"]) == 1
+    assert data["priceBuckets"][0]["range"]["start"]["amount"] == 20.0
+
+
+def test_product_facets_without_price_bucket_size(
+    api_client, product_list, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["priceBuckets"] == []
+    assert data["attributeValues"][0]["count"] == 3
+
+
+def test_product_facets_skip_attributes_hidden_in_storefront(
+    api_client, product_list, color_attribute, channel_USD
+):
+    # given
+    color_attribute.visible_in_storefront = False
+    color_attribute.save(update_fields=["visible_in_storefront"])
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["attributeValues"] == []
+    assert data["categories"][0]["count"] == 3
+
+
+def test_product_facets_attributes_hidden_in_storefront_as_staff(
+    staff_api_client,
+    product_list,
+    color_attribute,
+    channel_USD,
+    permission_manage_products,
+):
+    # given
+    color_attribute.visible_in_storefront = False
+    color_attribute.save(update_fields=["visible_in_storefront"])
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["attributeValues"] == [
+        {"attribute": {"slug": "color"}, "value": {"slug": "red"}, "count": 3}
+    ]
@@ -17,6 +17,7 @@ from ....product.models import (
     ProductVariantChannelListing,
 )
 from ....tests.utils import dummy_editorjs
+from ....warehouse.availability import update_channel_stocks
 from ....warehouse.models import Stock
 from ...tests.utils import get_graphql_content
 
@@ -447,6 +448,7 @@ def products_for_pagination(
             Stock(warehouse=warehouse, product_variant=variants[2], quantity=0),
         ]
     )
+    update_channel_stocks([variant.pk for variant in variants])
 
     return products
 
@@ -1,6 +1,8 @@
+import datetime
 from unittest.mock import patch
 
 import graphene
+from django.utils import timezone
 
 from ....product.error_codes import ProductErrorCode
 from ....product.models import ProductChannelListing
@@ -241,6 +243,38 @@ def test_variant_channel_listing_update_as_staff_user(
     assert channel_pln_data["channel"]["slug"] == channel_PLN.slug
 
 
+def test_variant_channel_listing_update_expires_checkout_prices(
+    staff_api_client, checkout_with_item, permission_manage_products, channel_USD
+):
+    # given
+    checkout = checkout_with_item
+    checkout.price_expiration = timezone.now() + datetime.timedelta(hours=1)
+    checkout.save(update_fields=["price_expiration"])
+    variant = checkout.lines.get().variant
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant.id),
+        "input": [
+            {
+                "channelId": graphene.Node.to_global_id("Channel", channel_USD.id),
+                "price": 1,
+            }
+        ],
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_CHANNEL_LISTING_UPDATE_MUTATION,
+        variables=variables,
+        permissions=(permission_manage_products,),
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["productVariantChannelListingUpdate"]["errors"]
+    checkout.refresh_from_db()
+    assert checkout.price_expiration <= timezone.now()
+
+
 @patch("saleor.plugins.manager.PluginsManager.product_variant_updated")
 def test_variant_channel_listing_update_trigger_webhook_product_variant_updated(
     mock_product_variant_updated,
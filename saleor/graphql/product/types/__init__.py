@@ -4,6 +4,7 @@ from .digital_contents import (
     DigitalContentCountableConnection,
     DigitalContentUrl,
 )
+from .facets import ProductFacets
 from .products import (
     Category,
     CategoryCountableConnection,
@@ -0,0 +1,90 @@
+import graphene
+
+from ...attribute.dataloaders import AttributesByAttributeId, AttributeValueByIdLoader
+from ...attribute.types import Attribute, AttributeValue
+from ...core.types import MoneyRange
+from ..dataloaders import CategoryByIdLoader
+from .products import Category
+
+
+class AttributeValueFacet(graphene.ObjectType):
+    attribute = graphene.Field(
+        Attribute, required=True, description="Attribute of the value."
+    )
+    value = graphene.Field(
+        AttributeValue, required=True, description="Attribute value."
+    )
+    count = graphene.Int(
+        required=True, description="Number of products with the value assigned."
+    )
+
+    class Meta:
+        description = "Represents the number of products with an attribute value."
+
+    @staticmethod
+    def resolve_attribute(root, info):
+        return (
+            AttributeValueByIdLoader(info.context)
+            .load(root["value_id"])
+            .then(
+                lambda value: AttributesByAttributeId(info.context).load(
+                    value.attribute_id
+                )
+            )
+        )
+
+    @staticmethod
+    def resolve_value(root, info):
+        return AttributeValueByIdLoader(info.context).load(root["value_id"])
+
+
+class CategoryFacet(graphene.ObjectType):
+    category = graphene.Field(Category, required=True, description="Category.")
+    count = graphene.Int(
+        required=True, description="Number of products in the category."
+    )
+
+    class Meta:
+        description = "Represents the number of products in a category."
+
+    @staticmethod
+    def resolve_category(root, info):
+        return CategoryByIdLoader(info.context).load(root["category_id"])
+
+
+class PriceBucketFacet(graphene.ObjectType):
+    range = graphene.Field(
+        MoneyRange,
+        required=True,
+        description="Price range of the bucket, the upper bound is exclusive.",
+    )
+    count = graphene.Int(
+        required=True, description="Number of products with a price in the range."
+    )
+
+    class Meta:
+        description = "Represents the number of products with a price in a range."
+
+
+class ProductFacets(graphene.ObjectType):
+    attribute_values = graphene.List(
+        graphene.NonNull(AttributeValueFacet),
+        required=True,
+        description="Number of products per attribute value.",
+    )
+    categories = graphene.List(
+        graphene.NonNull(CategoryFacet),
+        required=True,
+        description="Number of products per category.",
+    )
+    price_buckets = graphene.List(
+        graphene.NonNull(PriceBucketFacet),
+        required=True,
+        description=(
+            "Number of products per price bucket. Returned only when a channel and "
+            "a bucket size are given."
+        ),
+    )
+
+    class Meta:
+        description = "Represents the number of filtered products per facet."
@@ -1195,6 +1195,17 @@ class Product(ChannelContextTypeWithMetadata, ModelObjectType):
 
 
 class ProductCountableConnection(CountableConnection):
+    total_count_mode_setting = "GRAPHQL_PRODUCTS_TOTAL_COUNT_MODE"
+
+    total_count = graphene.Int(
+        description=(
+            "A total count of items in the collection. The count is exact unless "
+            "the server is configured to estimate it; an estimated count is "
+            "returned only for collections of at least the configured number of "
+            "items and may differ from the number of items that can be fetched."
+        )
+    )
+
     class Meta:
         node = Product
 
@@ -9,6 +9,7 @@ from django.db.utils import IntegrityError
 from ...core.tracing import traced_atomic_transaction
 from ...order import OrderStatus
 from ...order import models as order_models
+from ...warehouse.availability import update_channel_stocks
 from ...warehouse.models import Stock
 from ..core.enums import ProductErrorCode
 
@@ -86,6 +87,7 @@ def create_stocks(
     except IntegrityError:
         msg = "Stock for one of warehouses already exists for this product variant."
         raise ValidationError(msg)
+    update_channel_stocks([variant.pk])
     return new_stocks
 
 
@@ -2,6 +2,7 @@ from collections import defaultdict
 
 import graphene
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.utils import IntegrityError
 
 from ....core.permissions import ShippingPermissions
@@ -16,6 +17,7 @@ from ....shipping.utils import (
     default_shipping_zone_exists,
     get_countries_without_shipping_zone,
 )
+from ....warehouse.tasks import update_channel_stocks_task
 from ...channel.types import ChannelContext
 from ...core.fields import JSONString
 from ...core.mutations import BaseMutation, ModelDeleteMutation, ModelMutation
@@ -166,13 +168,16 @@ class ShippingZoneMixin:
     def _save_m2m(cls, info, instance, cleaned_data):
         super()._save_m2m(info, instance, cleaned_data)
 
+        warehouse_ids = set()
         add_warehouses = cleaned_data.get("add_warehouses")
         if add_warehouses:
             instance.warehouses.add(*add_warehouses)
+            warehouse_ids.update(warehouse.pk for warehouse in add_warehouses)
 
         remove_warehouses = cleaned_data.get("remove_warehouses")
         if remove_warehouses:
             instance.warehouses.remove(*remove_warehouses)
+            warehouse_ids.update(warehouse.pk for warehouse in remove_warehouses)
 
         add_channels = cleaned_data.get("add_channels")
         if add_channels:
@@ -195,6 +200,15 @@ class ShippingZoneMixin:
                 shipping_method_ids, channel_ids
             )
 
+        # warehouses are available in channels of their shipping zones
+        if add_channels or remove_channels:
+            warehouse_ids.update(instance.warehouses.values_list("pk", flat=True))
+        if warehouse_ids:
+            # the task has to see the committed shipping zone assignment
+            transaction.on_commit(
+                lambda: update_channel_stocks_task.delay(list(warehouse_ids))
+            )
+
 
 class ShippingZoneCreate(ShippingZoneMixin, ModelMutation):
     class Arguments:
@@ -253,6 +267,17 @@ class ShippingZoneDelete(ModelDeleteMutation):
         error_type_class = ShippingError
         error_type_field = "shipping_errors"
 
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        instance = cls.get_node_or_error(info, data.get("id"), only_type=ShippingZone)
+        warehouse_ids = list(instance.warehouses.values_list("pk", flat=True))
+        response = super().perform_mutation(_root, info, **data)
+        if warehouse_ids:
+            transaction.on_commit(
+                lambda: update_channel_stocks_task.delay(warehouse_ids)
+            )
+        return response
+
     @classmethod
     def success_response(cls, instance):
         instance = ChannelContext(node=instance, channel_slug=None)
@@ -2,6 +2,7 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from ...account import models as account_models
+from ...checkout.calculations import invalidate_checkout_taxes
 from ...core.error_codes import ShopErrorCode
 from ...core.permissions import GiftcardPermissions, OrderPermissions, SitePermissions
 from ...core.utils.url import validate_storefront_url
@@ -82,6 +83,13 @@ class ShopSettingsInput(graphene.InputObjectType):
     )
 
 
+TAX_SETTINGS_FIELDS = [
+    "include_taxes_in_prices",
+    "display_gross_prices",
+    "charge_taxes_on_shipping",
+]
+
+
 class SiteDomainInput(graphene.InputObjectType):
     domain = graphene.String(description="Domain name for shop.")
     name = graphene.String(description="Shop site name.")
@@ -151,6 +159,8 @@ class ShopSettingsUpdate(BaseMutation):
         instance = cls.construct_instance(instance, cleaned_input)
         cls.clean_instance(info, instance)
         instance.save()
+        if any(field in cleaned_input for field in TAX_SETTINGS_FIELDS):
+            invalidate_checkout_taxes()
         return ShopSettingsUpdate(shop=Shop())
 
 
@@ -235,6 +245,7 @@ class ShopFetchTaxRates(BaseMutation):
                 "valid credential for your tax plugin.",
                 code=ShopErrorCode.CANNOT_FETCH_TAX_RATES.value,
             )
+        invalidate_checkout_taxes()
         return ShopFetchTaxRates(shop=Shop())
 
 
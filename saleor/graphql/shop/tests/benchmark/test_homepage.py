@@ -1,33 +1,54 @@
 import pytest
 
+from .....plugins.manager import get_plugins_manager, invalidate_plugins_manager
 from ....order.tests.benchmark.test_order import FRAGMENT_SHIPPING_METHODS
 from ....tests.utils import get_graphql_content
 
+SHOP_QUERY = (
+    FRAGMENT_SHIPPING_METHODS
+    + """
+    query getShop($channel: String!) {
+      shop {
+        defaultCountry {
+          code
+          country
+        }
+        availableShippingMethods(channel: $channel) {
+          ...AvailableShippingMethods
+        }
+        countries {
+          country
+          code
+        }
+      }
+    }
+"""
+)
+
+
+@pytest.fixture
+def cached_plugins_manager(settings, channel_USD):
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    settings.PLUGINS_MANAGER_CACHE_TIMEOUT = 60
+    invalidate_plugins_manager()
+    get_plugins_manager()
+    yield
+    invalidate_plugins_manager()
+
 
 @pytest.mark.django_db
 @pytest.mark.count_queries(autouse=False)
 def test_retrieve_shop(api_client, channel_USD, count_queries):
-    query = (
-        FRAGMENT_SHIPPING_METHODS
-        + """
-        query getShop($channel: String!) {
-          shop {
-            defaultCountry {
-              code
-              country
-            }
-            availableShippingMethods(channel: $channel) {
-              ...AvailableShippingMethods
-            }
-            countries {
-              country
-              code
-            }
-          }
-        }
-    """
+    get_graphql_content(
+        api_client.post_graphql(SHOP_QUERY, variables={"channel": channel_USD.slug})
     )
 
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_retrieve_shop_with_cached_plugins_manager(
+    api_client, channel_USD, cached_plugins_manager, count_queries
+):
     get_graphql_content(
-        api_client.post_graphql(query, variables={"channel": channel_USD.slug})
+        api_client.post_graphql(SHOP_QUERY, variables={"channel": channel_USD.slug})
     )
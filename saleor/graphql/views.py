@@ -16,7 +16,7 @@ from django.db.backends.postgresql.base import DatabaseWrapper
 from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
 from django.shortcuts import render
 from django.views.generic import View
-from graphql import GraphQLDocument, get_default_backend
+from graphql import GraphQLDocument
 from graphql.error import GraphQLError, GraphQLSyntaxError
 from graphql.error import format_error as format_graphql_error
 from graphql.execution import ExecutionResult
@@ -25,9 +25,15 @@ from jwt.exceptions import PyJWTError
 from .. import __version__ as saleor_version
 from ..core.exceptions import PermissionDenied, ReadOnlyException
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
+from ..order.search import defer_order_search_document_updates
 from .api import API_PATH, schema
 from .context import get_context_value
 from .core.validators.query_cost import validate_query_cost
+from .document_cache import (
+    document_cache_backend,
+    get_persisted_query_hash,
+    resolve_persisted_query,
+)
 from .query_cost_map import COST_MAP
 from .utils import query_fingerprint
 
@@ -74,7 +80,7 @@ class GraphQLView(View):
     ):
         super().__init__()
         if backend is None:
-            backend = get_default_backend()
+            backend = document_cache_backend
         if middleware is None:
             if middleware := settings.GRAPHENE.get("MIDDLEWARE"):
                 middleware = [
@@ -203,7 +209,10 @@ class GraphQLView(View):
     def get_response(
         self, request: HttpRequest, data: dict
     ) -> Tuple[Optional[Dict[str, List[Any]]], int]:
-        execution_result = self.execute_graphql_request(request, data)
+        # mutations of the same orders in one request rebuild their search documents
+        # once, after all of them are executed
+        with defer_order_search_document_updates():
+            execution_result = self.execute_graphql_request(request, data)
         status_code = 200
         if execution_result:
             response = {}
@@ -227,14 +236,29 @@ class GraphQLView(View):
         return self.root_value
 
     def parse_query(
-        self, query: str
+        self, query: Optional[str], extensions: Optional[dict] = None
     ) -> Tuple[Optional[GraphQLDocument], Optional[ExecutionResult]]:
         """Attempt to parse a query (mandatory) to a gql document object.
 
+        If the request contains an Apollo-style persisted query hash, the query
+        is resolved from the document cache first and the query string is optional.
         If no query was given or query is not a string, it returns an error.
         If the query is invalid, it returns an error as well.
         Otherwise, it returns the parsed gql document.
         """
+        try:
+            query_hash = get_persisted_query_hash(extensions)
+            if query_hash:
+                if not query and hasattr(self.backend, "get_document"):
+                    document = self.backend.get_document(  # type: ignore
+                        self.schema, query_hash
+                    )
+                    if document is not None:
+                        return document, None
+                query = resolve_persisted_query(query, query_hash)
+        except GraphQLError as e:
+            return None, ExecutionResult(errors=[e], invalid=True)
+
         if not query or not isinstance(query, str):
             return (
                 None,
@@ -278,7 +302,7 @@ class GraphQLView(View):
             query, variables, operation_name = self.get_graphql_params(request, data)
             query_cost = 0
 
-            document, error = self.parse_query(query)
+            document, error = self.parse_query(query, data.get("extensions"))
             if error:
                 return error
 
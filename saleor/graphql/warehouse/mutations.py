@@ -6,6 +6,7 @@ from ...core.permissions import ProductPermissions
 from ...core.tracing import traced_atomic_transaction
 from ...warehouse import WarehouseClickAndCollectOption, models
 from ...warehouse.error_codes import WarehouseErrorCode
+from ...warehouse.tasks import update_channel_stocks_task
 from ...warehouse.validation import validate_warehouse_count  # type: ignore
 from ..account.i18n import I18nMixin
 from ..core.mutations import ModelDeleteMutation, ModelMutation
@@ -123,6 +124,8 @@ class WarehouseShippingZoneAssign(WarehouseMixin, ModelMutation, I18nMixin):
             data.get("shipping_zone_ids"), "shipping_zone_id", only_type=ShippingZone
         )
         warehouse.shipping_zones.add(*shipping_zones)
+        # the task has to see the committed shipping zone assignment
+        transaction.on_commit(lambda: update_channel_stocks_task.delay([warehouse.pk]))
         return WarehouseShippingZoneAssign(warehouse=warehouse)
 
 
@@ -150,6 +153,8 @@ class WarehouseShippingZoneUnassign(WarehouseMixin, ModelMutation, I18nMixin):
             data.get("shipping_zone_ids"), "shipping_zone_id", only_type=ShippingZone
         )
         warehouse.shipping_zones.remove(*shipping_zones)
+        # the task has to see the committed shipping zone assignment
+        transaction.on_commit(lambda: update_channel_stocks_task.delay([warehouse.pk]))
         return WarehouseShippingZoneAssign(warehouse=warehouse)
 
 
@@ -198,7 +203,15 @@ class WarehouseDelete(ModelDeleteMutation):
         model_type = cls.get_type_for_model()
         instance = cls.get_node_or_error(info, node_id, only_type=model_type)
         stocks = (stock for stock in instance.stock_set.only("product_variant"))
+        variant_ids = list(
+            instance.stock_set.values_list("product_variant_id", flat=True)
+        )
         result = super(WarehouseDelete, cls).perform_mutation(_root, info, **data)
         for stock in stocks:
             transaction.on_commit(lambda: manager.product_variant_out_of_stock(stock))
+        # quantities of the deleted stocks are subtracted from all channels
+        if variant_ids:
+            transaction.on_commit(
+                lambda: update_channel_stocks_task.delay(variant_ids=variant_ids)
+            )
         return result
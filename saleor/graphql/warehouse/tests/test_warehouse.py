@@ -1031,6 +1031,32 @@ def test_delete_warehouse_mutation_with_webhooks_for_many_product_variants(
     assert product_variant_out_of_stock_webhook.call_count == 2
 
 
+@patch("saleor.graphql.warehouse.mutations.update_channel_stocks_task.delay")
+def test_delete_warehouse_mutation_updates_channel_stocks_of_its_variants(
+    update_channel_stocks_task_mock,
+    staff_api_client,
+    warehouse,
+    permission_manage_products,
+    variant_with_many_stocks,
+):
+    # given
+    warehouse_id = graphene.Node.to_global_id("Warehouse", warehouse.pk)
+
+    # when
+    response = staff_api_client.post_graphql(
+        MUTATION_DELETE_WAREHOUSE,
+        variables={"id": warehouse_id},
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["deleteWarehouse"]["errors"]
+    update_channel_stocks_task_mock.assert_called_once_with(
+        variant_ids=[variant_with_many_stocks.pk]
+    )
+
+
 def test_delete_warehouse_deletes_associated_address(
     staff_api_client, warehouse, permission_manage_products
 ):
@@ -1085,7 +1111,9 @@ def test_shipping_zone_can_be_assigned_only_to_one_warehouse(
     assert used_shipping_zone.warehouses.count() == 1
 
 
+@patch("saleor.graphql.warehouse.mutations.update_channel_stocks_task.delay")
 def test_shipping_zone_assign_to_warehouse(
+    update_channel_stocks_task_mock,
     staff_api_client,
     warehouse_no_shipping_zone,
     shipping_zone,
@@ -1106,6 +1134,9 @@ def test_shipping_zone_assign_to_warehouse(
     warehouse_no_shipping_zone.refresh_from_db()
     shipping_zone.refresh_from_db()
     assert warehouse_no_shipping_zone.shipping_zones.first().pk == shipping_zone.pk
+    update_channel_stocks_task_mock.assert_called_once_with(
+        [warehouse_no_shipping_zone.pk]
+    )
 
 
 def test_empty_shipping_zone_assign_to_warehouse(
@@ -1134,8 +1165,13 @@ def test_empty_shipping_zone_assign_to_warehouse(
     assert errors[0]["code"] == "GRAPHQL_ERROR"
 
 
+@patch("saleor.graphql.warehouse.mutations.update_channel_stocks_task.delay")
 def test_shipping_zone_unassign_from_warehouse(
-    staff_api_client, warehouse, shipping_zone, permission_manage_products
+    update_channel_stocks_task_mock,
+    staff_api_client,
+    warehouse,
+    shipping_zone,
+    permission_manage_products,
 ):
     assert warehouse.shipping_zones.first().pk == shipping_zone.pk
     staff_api_client.user.user_permissions.add(permission_manage_products)
@@ -1152,3 +1188,4 @@ def test_shipping_zone_unassign_from_warehouse(
     warehouse.refresh_from_db()
     shipping_zone.refresh_from_db()
     assert not warehouse.shipping_zones.all()
+    update_channel_stocks_task_mock.assert_called_once_with([warehouse.pk])
@@ -1,9 +1,11 @@
 import graphene
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from ...core.permissions import AppPermission
 from ...webhook import models
 from ...webhook.error_codes import WebhookErrorCode
+from ...webhook.utils import invalidate_webhooks_registry
 from ..core.descriptions import DEPRECATED_IN_3X_INPUT
 from ..core.mutations import BaseMutation, ModelDeleteMutation, ModelMutation
 from ..core.types.common import WebhookError
@@ -36,6 +38,13 @@ class WebhookCreateInput(graphene.InputObjectType):
     is_active = graphene.Boolean(
         description="Determine if webhook will be set active or not.", required=False
     )
+    batch_events = graphene.Boolean(
+        description=(
+            "Determine if asynchronous events are sent in batches, as lists of "
+            "objects with repeated events of the same object coalesced."
+        ),
+        required=False,
+    )
     secret_key = graphene.String(
         description="The secret key used to create a hash signature with each payload.",
         required=False,
@@ -116,6 +125,10 @@ class WebhookCreate(ModelMutation):
             ]
         )
 
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        transaction.on_commit(invalidate_webhooks_registry)
+
 
 class WebhookUpdateInput(graphene.InputObjectType):
     name = graphene.String(description="The new name of the webhook.", required=False)
@@ -147,6 +160,13 @@ class WebhookUpdateInput(graphene.InputObjectType):
     is_active = graphene.Boolean(
         description="Determine if webhook will be set active or not.", required=False
     )
+    batch_events = graphene.Boolean(
+        description=(
+            "Determine if asynchronous events are sent in batches, as lists of "
+            "objects with repeated events of the same object coalesced."
+        ),
+        required=False,
+    )
     secret_key = graphene.String(
         description="Use to create a hash signature with each payload.", required=False
     )
@@ -202,6 +222,10 @@ class WebhookUpdate(ModelMutation):
                 ]
             )
 
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        transaction.on_commit(invalidate_webhooks_registry)
+
 
 class WebhookDelete(ModelDeleteMutation):
     class Arguments:
@@ -241,7 +265,9 @@ class WebhookDelete(ModelDeleteMutation):
                     code=WebhookErrorCode.GRAPHQL_ERROR,
                 )
 
-        return super().perform_mutation(_root, info, **data)
+        response = super().perform_mutation(_root, info, **data)
+        transaction.on_commit(invalidate_webhooks_registry)
+        return response
 
 
 class EventDeliveryRetry(BaseMutation):
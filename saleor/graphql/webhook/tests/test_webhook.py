@@ -300,6 +300,52 @@ def test_webhook_update_by_staff(
     assert events[0].event_type == WebhookEventTypeAsyncEnum.CUSTOMER_CREATED.value
 
 
+@patch("saleor.graphql.webhook.mutations.invalidate_webhooks_registry")
+def test_webhook_update_invalidates_webhooks_registry(
+    invalidate_webhooks_registry_mock,
+    staff_api_client,
+    webhook,
+    permission_manage_apps,
+):
+    # given
+    webhook_id = graphene.Node.to_global_id("Webhook", webhook.pk)
+    variables = {"id": webhook_id, "input": {"isActive": False}}
+    staff_api_client.user.user_permissions.add(permission_manage_apps)
+
+    # when
+    response = staff_api_client.post_graphql(WEBHOOK_UPDATE, variables=variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["webhookUpdate"]["errors"]
+    invalidate_webhooks_registry_mock.assert_called_once_with()
+
+
+def test_webhook_update_batch_events(staff_api_client, webhook, permission_manage_apps):
+    # given
+    query = """
+        mutation webhookUpdate ($id: ID!, $input: WebhookUpdateInput!) {
+          webhookUpdate(id: $id, input: $input) {
+            webhook {
+              batchEvents
+            }
+          }
+        }
+    """
+    webhook_id = graphene.Node.to_global_id("Webhook", webhook.pk)
+    variables = {"id": webhook_id, "input": {"batchEvents": True}}
+    staff_api_client.user.user_permissions.add(permission_manage_apps)
+
+    # when
+    response = staff_api_client.post_graphql(query, variables=variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["webhookUpdate"]["webhook"]["batchEvents"] is True
+    webhook.refresh_from_db()
+    assert webhook.batch_events is True
+
+
 def test_webhook_update_by_staff_without_permission(staff_api_client, app, webhook):
     query = WEBHOOK_UPDATE
     webhook_id = graphene.Node.to_global_id("Webhook", webhook.pk)
@@ -166,6 +166,10 @@ class Webhook(ModelObjectType):
     target_url = graphene.String(required=True)
     is_active = graphene.Boolean(required=True)
     secret_key = graphene.String()
+    batch_events = graphene.Boolean(
+        required=True,
+        description="Determine if asynchronous events are sent in batches.",
+    )
 
     class Meta:
         description = "Webhook."
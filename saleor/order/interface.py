@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
 
 from prices import TaxedMoney
 
@@ -14,3 +16,15 @@ class OrderTaxedPricesData:
 
     undiscounted_price: TaxedMoney
     price_with_discounts: TaxedMoney
+
+
+@dataclass
+class OrderLinePricesData:
+    """Store prices of an order line calculated together with other order lines.
+
+    'tax_rate' is None when it should be calculated from the unit price.
+    """
+
+    unit_price: OrderTaxedPricesData
+    total_price: OrderTaxedPricesData
+    tax_rate: Optional[Decimal] = None
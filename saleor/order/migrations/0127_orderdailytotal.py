@@ -0,0 +1,69 @@
+# Generated by Django 3.2.12 on 2026-10-17 09:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("channel", "0003_alter_channel_default_country"),
+        ("order", "0126_alter_order_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderDailyTotal",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("draft", "Draft"),
+                            ("unconfirmed", "Unconfirmed"),
+                            ("unfulfilled", "Unfulfilled"),
+                            ("partially fulfilled", "Partially fulfilled"),
+                            ("partially_returned", "Partially returned"),
+                            ("returned", "Returned"),
+                            ("fulfilled", "Fulfilled"),
+                            ("canceled", "Canceled"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                ("currency", models.CharField(max_length=3)),
+                ("orders_count", models.PositiveIntegerField(default=0)),
+                (
+                    "total_net_amount",
+                    models.DecimalField(decimal_places=3, default=0, max_digits=12),
+                ),
+                (
+                    "total_gross_amount",
+                    models.DecimalField(decimal_places=3, default=0, max_digits=12),
+                ),
+                ("updated_at", models.DateTimeField(db_index=True)),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="order_daily_totals",
+                        to="channel.channel",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("date", "pk"),
+                "unique_together": {("date", "channel", "status")},
+            },
+        ),
+    ]
@@ -694,3 +694,39 @@ class OrderEvent(models.Model):
 
     def __repr__(self):
         return f"{self.__class__.__name__}(type={self.type!r}, user={self.user!r})"
+
+
+class OrderDailyTotal(models.Model):
+    """Totals of non-draft orders created in a channel on a day, per order status.
+
+    Rows are recalculated by `update_order_daily_totals_task` for days with orders
+    updated since its previous run; `updated_at` stores the start of that run.
+    """
+
+    date = models.DateField()
+    channel = models.ForeignKey(
+        Channel, related_name="order_daily_totals", on_delete=models.CASCADE
+    )
+    status = models.CharField(max_length=32, choices=OrderStatus.CHOICES)
+    currency = models.CharField(max_length=settings.DEFAULT_CURRENCY_CODE_LENGTH)
+    orders_count = models.PositiveIntegerField(default=0)
+    total_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+    )
+    total_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+    )
+    total = TaxedMoneyField(
+        net_amount_field="total_net_amount",
+        gross_amount_field="total_gross_amount",
+        currency_field="currency",
+    )
+    updated_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        ordering = ("date", "pk")
+        unique_together = [["date", "channel", "status"]]
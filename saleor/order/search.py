@@ -1,33 +1,111 @@
-from typing import TYPE_CHECKING
+import logging
+from contextlib import contextmanager
+from threading import local
+from typing import Iterable, Set
 
 import graphene
-from django.db.models import Q, prefetch_related_objects
+from django.db import transaction
+from django.db.models import Prefetch, Q, prefetch_related_objects
 
 from ..account.search import (
     generate_address_search_document_value,
     generate_user_fields_search_document_value,
 )
+from .models import Order, OrderLine
 
-if TYPE_CHECKING:
-    from .models import Order
+logger = logging.getLogger(__name__)
 
+ORDER_FIELDS_TO_PREFETCH = [
+    "user",
+    "billing_address",
+    "shipping_address",
+    "payments",
+    "discounts",
+    "lines",
+]
 
-def update_order_search_document(order: "Order"):
+# Bulk rebuilds load only the line fields used in the document into a separate
+# attribute, so the deferred lines never end up in the `lines` prefetch cache.
+ORDER_FIELDS_TO_PREFETCH_IN_BULK = [
+    *ORDER_FIELDS_TO_PREFETCH[:-1],
+    Prefetch(
+        "lines",
+        queryset=OrderLine.objects.only("id", "order_id", "product_sku"),
+        to_attr="search_document_lines",
+    ),
+]
+
+
+class _DeferredSearchDocumentUpdates(local):
+    def __init__(self):
+        self.order_ids: Set[int] = set()
+        self.depth = 0
+
+
+_deferred_updates = _DeferredSearchDocumentUpdates()
+
+
+def update_order_search_document(order: Order):
     order.search_document = prepare_order_search_document_value(order)
     order.save(update_fields=["search_document", "updated_at"])
 
 
-def prepare_order_search_document_value(order: "Order", *, already_prefetched=False):
-    if not already_prefetched:
-        prefetch_related_objects(
-            [order],
-            "user",
-            "billing_address",
-            "shipping_address",
-            "payments",
-            "discounts",
-            "lines",
+def update_orders_search_document(orders: Iterable[Order]):
+    """Update search documents of orders with one set of prefetches."""
+    orders = list(orders)
+    prefetch_related_objects(orders, *ORDER_FIELDS_TO_PREFETCH_IN_BULK)
+    for order in orders:
+        order.search_document = prepare_order_search_document_value(
+            order, already_prefetched=True
+        )
+    Order.objects.bulk_update(orders, ["search_document"])
+
+
+def update_order_search_document_on_commit(order: Order):
+    """Update search document of the order once the transaction is committed.
+
+    Nothing is updated if the transaction is rolled back. Updates requested
+    within `defer_order_search_document_updates` result in a single rebuild
+    of each order when the block ends.
+    """
+    order_id = order.pk
+    transaction.on_commit(lambda: _defer_order_search_document_update(order_id))
+
+
+@contextmanager
+def defer_order_search_document_updates():
+    """Postpone search document updates requested on commit until the block ends."""
+    _deferred_updates.depth += 1
+    try:
+        yield
+    finally:
+        _deferred_updates.depth -= 1
+        _update_deferred_orders_search_document()
+
+
+def _defer_order_search_document_update(order_id: int):
+    # Only called on commit, so the queue never holds orders of rolled back
+    # transactions.
+    _deferred_updates.order_ids.add(order_id)
+    _update_deferred_orders_search_document()
+
+
+def _update_deferred_orders_search_document():
+    if _deferred_updates.depth or not _deferred_updates.order_ids:
+        return
+    order_ids = _deferred_updates.order_ids
+    _deferred_updates.order_ids = set()
+    try:
+        update_orders_search_document(Order.objects.filter(pk__in=order_ids))
+    except Exception:
+        logger.exception(
+            "Failed to update search documents of orders %s.", sorted(order_ids)
         )
+
+
+def prepare_order_search_document_value(order: Order, *, already_prefetched=False):
+    if not already_prefetched:
+        prefetch_related_objects([order], *ORDER_FIELDS_TO_PREFETCH)
     search_document = f"#{str(order.id)}\n"
     user_data = order.user_email + "\n"
     if user := order.user:
@@ -47,7 +125,7 @@ def prepare_order_search_document_value(order: "Order", *, already_prefetched=Fa
     return search_document.lower()
 
 
-def generate_order_payments_search_document_value(order: "Order"):
+def generate_order_payments_search_document_value(order: Order):
     payments_data = ""
     for payment in order.payments.all():
         payments_data += graphene.Node.to_global_id("Payment", payment.id) + "\n"
@@ -56,7 +134,7 @@ def generate_order_payments_search_document_value(order: "Order"):
     return payments_data
 
 
-def generate_order_discounts_search_document_value(order: "Order"):
+def generate_order_discounts_search_document_value(order: Order):
     discount_data = ""
     for discount in order.discounts.all():
         for field in ["name", "translated_name"]:
@@ -65,10 +143,11 @@ def generate_order_discounts_search_document_value(order: "Order"):
     return discount_data
 
 
-def generate_order_lines_search_document_value(order: "Order"):
-    lines_data = "\n".join(
-        [line.product_sku for line in order.lines.all() if line.product_sku]
-    )
+def generate_order_lines_search_document_value(order: Order):
+    lines = getattr(order, "search_document_lines", None)
+    if lines is None:
+        lines = order.lines.all()
+    lines_data = "\n".join([line.product_sku for line in lines if line.product_sku])
     if lines_data:
         lines_data += "\n"
     return lines_data
@@ -1,8 +1,14 @@
 from typing import List
 
+from django.db.models import Max
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
 from ..celeryconf import app
-from .models import Order
-from .utils import recalculate_order
+from .models import Order, OrderDailyTotal
+from .utils import recalculate_order, update_order_daily_totals
+
+ORDER_DAILY_TOTALS_BATCH_SIZE = 31
 
 
 @app.task
@@ -10,3 +16,24 @@ def recalculate_orders_task(order_ids: List[int]):
     orders = Order.objects.filter(id__in=order_ids)
     for order in orders:
         recalculate_order(order)
+
+
+@app.task
+def update_order_daily_totals_task():
+    """Recalculate daily totals of days with orders updated since the last run."""
+    started_at = timezone.now()
+    last_update = OrderDailyTotal.objects.aggregate(Max("updated_at"))[
+        "updated_at__max"
+    ]
+    orders = Order.objects.non_draft()
+    if last_update:
+        orders = orders.filter(updated_at__gte=last_update)
+    dates = list(
+        orders.annotate(date=TruncDate("created"))
+        .order_by("date")
+        .values_list("date", flat=True)
+        .distinct()
+    )
+    for start in range(0, len(dates), ORDER_DAILY_TOTALS_BATCH_SIZE):
+        end = start + ORDER_DAILY_TOTALS_BATCH_SIZE
+        update_order_daily_totals(dates[start:end], started_at)
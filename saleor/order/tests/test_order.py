@@ -16,7 +16,7 @@ from ...discount.models import (
 )
 from ...discount.utils import validate_voucher_in_order
 from ...graphql.tests.utils import get_graphql_content
-from ...order.interface import OrderTaxedPricesData
+from ...order.interface import OrderLinePricesData, OrderTaxedPricesData
 from ...payment import ChargeStatus
 from ...payment.models import Payment
 from ...plugins.manager import get_plugins_manager
@@ -550,9 +550,9 @@ def test_queryset_ready_to_capture(channel_USD):
     assert OrderStatus.CANCELED not in statuses
 
 
-@patch("saleor.plugins.manager.PluginsManager.calculate_order_line_unit")
+@patch("saleor.plugins.manager.PluginsManager.calculate_order_lines_prices")
 def test_update_order_prices(
-    mocked_calculate_order_line_unit, order_with_lines, site_settings
+    mocked_calculate_order_lines_prices, order_with_lines, site_settings
 ):
     manager = get_plugins_manager()
     channel = order_with_lines.channel
@@ -578,16 +578,24 @@ def test_update_order_prices(
     )
     price_2 = TaxedMoney(net=price_2, gross=price_2)
 
-    mocked_calculate_order_line_unit.side_effect = [
-        OrderTaxedPricesData(
-            undiscounted_price=price_1,
-            price_with_discounts=price_1,
-        ),
-        OrderTaxedPricesData(
-            undiscounted_price=price_2,
-            price_with_discounts=price_2,
-        ),
-    ]
+    prices = {line_1.pk: price_1, line_2.pk: price_2}
+
+    def calculate_order_lines_prices(order, lines):
+        return [
+            OrderLinePricesData(
+                unit_price=OrderTaxedPricesData(
+                    undiscounted_price=prices[line.pk],
+                    price_with_discounts=prices[line.pk],
+                ),
+                total_price=OrderTaxedPricesData(
+                    undiscounted_price=prices[line.pk] * line.quantity,
+                    price_with_discounts=prices[line.pk] * line.quantity,
+                ),
+            )
+            for line in lines
+        ]
+
+    mocked_calculate_order_lines_prices.side_effect = calculate_order_lines_prices
 
     shipping_price = order_with_lines.shipping_method.channel_listings.get(
         channel_id=order_with_lines.channel_id
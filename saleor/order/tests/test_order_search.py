@@ -1,10 +1,19 @@
 from decimal import Decimal
+from unittest.mock import patch
 
 import graphene
+from django.db import DatabaseError, transaction
 
 from ...discount import DiscountValueType
-from ..models import OrderLine
-from ..search import prepare_order_search_document_value, update_order_search_document
+from ...tests.utils import flush_post_commit_hooks
+from ..models import Order, OrderLine
+from ..search import (
+    defer_order_search_document_updates,
+    prepare_order_search_document_value,
+    update_order_search_document,
+    update_order_search_document_on_commit,
+    update_orders_search_document,
+)
 
 
 def test_update_order_search_document(order):
@@ -119,3 +128,111 @@ def test_prepare_order_search_document_value_no_relations_data(order, address_us
 
     # then
     assert f"#{order.id}\n{order.user_email}\n".lower() == search_document_value
+
+
+def test_update_orders_search_document(order_list, django_assert_num_queries):
+    # given
+    Order.objects.update(search_document="")
+
+    # when
+    # one query for orders, five for prefetched relations and one bulk update
+    with django_assert_num_queries(7):
+        update_orders_search_document(Order.objects.all())
+
+    # then
+    for order in Order.objects.all():
+        assert order.search_document == prepare_order_search_document_value(order)
+
+
+def test_update_order_search_document_on_commit(order):
+    # given
+    order.search_document = ""
+    order.save(update_fields=["search_document"])
+
+    # when
+    update_order_search_document_on_commit(order)
+
+    # then
+    order.refresh_from_db()
+    assert not order.search_document
+    flush_post_commit_hooks()
+    order.refresh_from_db()
+    assert f"{order.id}\n{order.user_email}\n".lower() in order.search_document
+
+
+@patch("saleor.order.search.update_orders_search_document")
+def test_defer_order_search_document_updates_coalesces_updates(
+    mocked_update_orders_search_document, order_list
+):
+    # given
+    order = order_list[0]
+
+    # when
+    with defer_order_search_document_updates():
+        update_order_search_document_on_commit(order)
+        flush_post_commit_hooks()
+        update_order_search_document_on_commit(order)
+        update_order_search_document_on_commit(order_list[1])
+        flush_post_commit_hooks()
+        mocked_update_orders_search_document.assert_not_called()
+
+    # then
+    mocked_update_orders_search_document.assert_called_once()
+    (orders,) = mocked_update_orders_search_document.call_args.args
+    assert set(orders) == {order, order_list[1]}
+
+
+@patch("saleor.order.search.update_orders_search_document")
+def test_defer_order_search_document_updates_skips_rolled_back_updates(
+    mocked_update_orders_search_document, order_list
+):
+    # given
+    order = order_list[0]
+
+    # when
+    with defer_order_search_document_updates():
+        try:
+            with transaction.atomic():
+                update_order_search_document_on_commit(order_list[1])
+                raise DatabaseError()
+        except DatabaseError:
+            pass
+        update_order_search_document_on_commit(order)
+        flush_post_commit_hooks()
+
+    # then
+    mocked_update_orders_search_document.assert_called_once()
+    (orders,) = mocked_update_orders_search_document.call_args.args
+    assert list(orders) == [order]
+
+
+@patch(
+    "saleor.order.search.update_orders_search_document",
+    side_effect=DatabaseError(),
+)
+def test_defer_order_search_document_updates_logs_errors(
+    mocked_update_orders_search_document, order, caplog
+):
+    # when
+    with defer_order_search_document_updates():
+        update_order_search_document_on_commit(order)
+        flush_post_commit_hooks()
+
+    # then
+    mocked_update_orders_search_document.assert_called_once()
+    assert "Failed to update search documents of orders" in caplog.text
+
+
+def test_prepare_order_search_document_value_prefetches_full_lines(
+    order_with_lines, django_assert_num_queries
+):
+    # given
+    order = Order.objects.get(pk=order_with_lines.pk)
+    prepare_order_search_document_value(order)
+
+    # when
+    with django_assert_num_queries(0):
+        quantities = [line.quantity for line in order.lines.all()]
+
+    # then
+    assert quantities == [line.quantity for line in order_with_lines.lines.all()]
@@ -1,25 +1,30 @@
 import copy
+from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import Mock
 
 import pytest
+from django.utils import timezone
 from prices import Money, TaxedMoney
 
 from ...checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ...giftcard import GiftCardEvents
 from ...giftcard.models import GiftCardEvent
-from ...order.interface import OrderTaxedPricesData
+from ...order.interface import OrderLinePricesData, OrderTaxedPricesData
 from ...plugins.manager import get_plugins_manager
 from .. import OrderStatus
 from ..events import OrderEvents
 from ..fetch import OrderLineInfo
-from ..models import Order, OrderEvent
+from ..models import Order, OrderDailyTotal, OrderEvent
 from ..utils import (
     add_gift_cards_to_order,
     add_variant_to_order,
     change_order_line_quantity,
+    get_orders_total,
     get_valid_shipping_methods_for_order,
     match_orders_with_new_user,
+    sum_order_totals,
+    update_order_daily_totals,
     update_taxes_for_order_line,
     update_taxes_for_order_lines,
 )
@@ -258,9 +263,12 @@ def test_update_taxes_for_order_lines(order_with_lines):
         price_with_discounts=total_price,
     )
     manager = Mock(
-        calculate_order_line_unit=Mock(return_value=unit_price_data),
-        calculate_order_line_total=Mock(return_value=total_price_data),
-        get_order_line_tax_rate=Mock(return_value=tax_rate),
+        calculate_order_lines_prices=Mock(
+            side_effect=lambda order, lines: [
+                OrderLinePricesData(unit_price_data, total_price_data, tax_rate)
+                for _ in lines
+            ]
+        )
     )
 
     # when
@@ -296,9 +304,12 @@ def test_update_taxes_for_order_lines_discounted_price(order_with_lines):
         price_with_discounts=total_price,
     )
     manager = Mock(
-        calculate_order_line_unit=Mock(return_value=unit_price_data),
-        calculate_order_line_total=Mock(return_value=total_price_data),
-        get_order_line_tax_rate=Mock(return_value=tax_rate),
+        calculate_order_lines_prices=Mock(
+            side_effect=lambda order, lines: [
+                OrderLinePricesData(unit_price_data, total_price_data, tax_rate)
+                for _ in lines
+            ]
+        )
     )
 
     # when
@@ -495,3 +506,109 @@ def test_update_taxes_for_order_line_deleted_variant(order_with_lines):
     assert order_line.tax_rate == order_line_unchanged_copy.tax_rate
     assert order_line.undiscounted_unit_price == order_line_unchanged_copy.unit_price
     assert order_line.undiscounted_total_price == order_line_unchanged_copy.total_price
+
+
+def test_sum_order_totals(order_list):
+    # given
+    Order.objects.update(total_net_amount=10, total_gross_amount=12)
+
+    # when
+    total = sum_order_totals(Order.objects.all(), "USD")
+
+    # then
+    assert total == TaxedMoney(net=Money(30, "USD"), gross=Money(36, "USD"))
+
+
+def test_sum_order_totals_no_orders():
+    # when
+    total = sum_order_totals(Order.objects.none(), "USD")
+
+    # then
+    assert total == TaxedMoney(net=Money(0, "USD"), gross=Money(0, "USD"))
+
+
+def test_update_order_daily_totals(order_list, channel_USD):
+    # given
+    now = timezone.now()
+    yesterday = now - timedelta(days=1)
+    Order.objects.update(total_net_amount=10, total_gross_amount=12)
+    Order.objects.filter(pk=order_list[0].pk).update(created=yesterday)
+    Order.objects.filter(pk=order_list[2].pk).update(status=OrderStatus.CANCELED)
+
+    # when
+    update_order_daily_totals([yesterday.date(), now.date()], now)
+
+    # then
+    daily_totals = {
+        (daily_total.date, daily_total.status): daily_total
+        for daily_total in OrderDailyTotal.objects.filter(channel=channel_USD)
+    }
+    assert len(daily_totals) == 3
+    yesterday_total = daily_totals[(yesterday.date(), OrderStatus.UNFULFILLED)]
+    assert yesterday_total.orders_count == 1
+    assert yesterday_total.total == TaxedMoney(
+        net=Money(10, "USD"), gross=Money(12, "USD")
+    )
+    assert yesterday_total.updated_at == now
+    canceled_total = daily_totals[(now.date(), OrderStatus.CANCELED)]
+    assert canceled_total.orders_count == 1
+    assert canceled_total.total_gross_amount == 12
+
+
+def test_get_orders_total_uses_daily_totals(order_list, channel_USD):
+    # given
+    now = timezone.now()
+    start_date = (now - timedelta(days=3)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    Order.objects.update(total_net_amount=10, total_gross_amount=12)
+    Order.objects.filter(pk=order_list[0].pk).update(created=now - timedelta(days=2))
+    update_order_daily_totals([(now - timedelta(days=2)).date()], now)
+    # daily totals are read instead of orders created before the last update
+    Order.objects.filter(pk=order_list[0].pk).update(total_gross_amount=100)
+
+    # when
+    total = get_orders_total(channel_USD, start_date)
+
+    # then
+    assert total == TaxedMoney(net=Money(30, "USD"), gross=Money(36, "USD"))
+
+
+def test_get_orders_total_recalculates_days_with_updated_orders(
+    order_list, channel_USD
+):
+    # given
+    now = timezone.now()
+    start_date = (now - timedelta(days=3)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    Order.objects.update(total_net_amount=10, total_gross_amount=12)
+    Order.objects.filter(pk__in=[order_list[0].pk, order_list[1].pk]).update(
+        created=now - timedelta(days=2)
+    )
+    update_order_daily_totals([(now - timedelta(days=2)).date()], now)
+    # the order is canceled after the last update of daily totals
+    Order.objects.filter(pk=order_list[0].pk).update(
+        status=OrderStatus.CANCELED, updated_at=now + timedelta(minutes=1)
+    )
+
+    # when
+    total = get_orders_total(channel_USD, start_date)
+
+    # then
+    assert total == TaxedMoney(net=Money(20, "USD"), gross=Money(24, "USD"))
+
+
+def test_get_orders_total_without_daily_totals(order_list, channel_USD):
+    # given
+    now = timezone.now()
+    start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    Order.objects.update(total_net_amount=10, total_gross_amount=12)
+    Order.objects.filter(pk=order_list[0].pk).update(status=OrderStatus.CANCELED)
+    Order.objects.filter(pk=order_list[1].pk).update(created=now - timedelta(days=2))
+
+    # when
+    total = get_orders_total(channel_USD, start_date)
+
+    # then
+    assert total == TaxedMoney(net=Money(10, "USD"), gross=Money(12, "USD"))
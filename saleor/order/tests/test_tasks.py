@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .. import OrderStatus
+from ..models import Order, OrderDailyTotal
+from ..tasks import update_order_daily_totals_task
+
+
+def test_update_order_daily_totals_task(order_list, channel_USD):
+    # given
+    Order.objects.update(total_net_amount=10, total_gross_amount=12)
+
+    # when
+    update_order_daily_totals_task()
+
+    # then
+    daily_total = OrderDailyTotal.objects.get(channel=channel_USD)
+    assert daily_total.status == OrderStatus.UNFULFILLED
+    assert daily_total.orders_count == 3
+    assert daily_total.total_gross_amount == 36
+
+
+def test_update_order_daily_totals_task_updates_days_of_updated_orders(
+    order_list, channel_USD
+):
+    # given
+    created = timezone.now() - timedelta(days=5)
+    Order.objects.update(total_net_amount=10, total_gross_amount=12)
+    Order.objects.filter(pk=order_list[0].pk).update(created=created)
+    update_order_daily_totals_task()
+    Order.objects.filter(pk=order_list[0].pk).update(
+        status=OrderStatus.CANCELED, updated_at=timezone.now()
+    )
+
+    # when
+    update_order_daily_totals_task()
+
+    # then
+    daily_total = OrderDailyTotal.objects.get(date=created.date())
+    assert daily_total.status == OrderStatus.CANCELED
+    assert daily_total.orders_count == 1
+    assert OrderDailyTotal.objects.get(date=timezone.now().date()).orders_count == 2
@@ -1,15 +1,19 @@
 import copy
+from datetime import date, datetime
 from decimal import Decimal
 from functools import partial, wraps
 from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union, cast
 
 import graphene
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from prices import Money, TaxedMoney, fixed_discount, percentage_discount
 
 from ..account.models import User
-from ..core.taxes import zero_money
+from ..core.taxes import zero_money, zero_taxed_money
 from ..core.tracing import traced_atomic_transaction
 from ..core.weight import zero_weight
 from ..discount import DiscountValueType, OrderDiscountType
@@ -23,7 +27,7 @@ from ..giftcard import events as gift_card_events
 from ..giftcard.models import GiftCard
 from ..order import FulfillmentStatus, OrderStatus
 from ..order.fetch import OrderLineInfo
-from ..order.models import Order, OrderLine
+from ..order.models import Order, OrderDailyTotal, OrderLine
 from ..product.utils.digital_products import get_default_digital_content_settings
 from ..shipping.interface import ShippingMethodData
 from ..shipping.models import ShippingMethod, ShippingMethodChannelListing
@@ -42,6 +46,7 @@ from . import events
 
 if TYPE_CHECKING:
     from ..app.models import App
+    from ..channel.models import Channel
     from ..checkout.fetch import CheckoutInfo
     from ..plugins.manager import PluginsManager
 
@@ -137,9 +142,12 @@ def recalculate_order_discounts(
 
 
 @update_voucher_discount
-def recalculate_order_prices(order: Order, **kwargs):
-    # avoid using prefetched order lines
-    lines = OrderLine.objects.filter(order_id=order.pk)
+def recalculate_order_prices(
+    order: Order, lines: Optional[Iterable[OrderLine]] = None, **kwargs
+):
+    if lines is None:
+        # avoid using prefetched order lines
+        lines = OrderLine.objects.filter(order_id=order.pk)
     prices = [line.total_price for line in lines]
     total = sum(prices, order.shipping_price)
     undiscounted_total = TaxedMoney(total.net, total.gross)
@@ -170,33 +178,52 @@ def recalculate_order(order: Order, **kwargs):
     Voucher discount amount is recalculated by default. To avoid this, pass
     update_voucher_discount argument set to False.
     """
+    _recalculate_order(order, get_order_lines_for_recalculation(order), **kwargs)
+
+
+def get_order_lines_for_recalculation(order: Order) -> List[OrderLine]:
+    # avoid using prefetched order lines
+    return list(
+        OrderLine.objects.filter(order_id=order.pk).select_related(
+            "variant__product__product_type"
+        )
+    )
+
 
-    recalculate_order_prices(order, **kwargs)
+def _recalculate_order(
+    order: Order,
+    lines: List[OrderLine],
+    update_fields: Iterable[str] = (),
+    **kwargs,
+):
+    """Recalculate prices and weight of the order and save it once."""
+    recalculate_order_prices(order, lines=lines, **kwargs)
 
     changed_order_discounts = recalculate_order_discounts(order)
     events.order_discounts_automatically_updated_event(order, changed_order_discounts)
 
+    order.weight = calculate_order_weight(lines)
     order.save(
         update_fields=[
+            *update_fields,
             "total_net_amount",
             "total_gross_amount",
             "undiscounted_total_net_amount",
             "undiscounted_total_gross_amount",
             "currency",
+            "weight",
             "updated_at",
         ]
     )
-    recalculate_order_weight(order)
 
 
-def recalculate_order_weight(order):
-    """Recalculate order weights."""
+def calculate_order_weight(lines: Iterable[OrderLine]):
+    """Calculate weight of order lines with fetched variants."""
     weight = zero_weight()
-    for line in order.lines.all():
+    for line in lines:
         if line.variant:
             weight += line.variant.get_weight() * line.quantity
-    order.weight = weight
-    order.save(update_fields=["weight", "updated_at"])
+    return weight
 
 
 def update_taxes_for_order_line(
@@ -225,8 +252,20 @@ def update_taxes_for_order_line(
 def update_taxes_for_order_lines(
     lines: Iterable[OrderLine], order: "Order", manager, tax_included
 ):
+    """Update prices and tax rates of order lines with one call to plugins."""
+    lines = [line for line in lines if line.variant]
     for line in lines:
-        update_taxes_for_order_line(line, order, manager, tax_included=tax_included)
+        line_price = line.unit_price.gross if tax_included else line.unit_price.net
+        line.unit_price = TaxedMoney(line_price, line_price)
+
+    lines_prices = manager.calculate_order_lines_prices(order, lines)
+    for line, line_prices in zip(lines, lines_prices):
+        line.unit_price = line_prices.unit_price.price_with_discounts
+        line.total_price = line_prices.total_price.price_with_discounts
+        line.undiscounted_unit_price = line_prices.unit_price.undiscounted_price
+        line.undiscounted_total_price = line_prices.total_price.undiscounted_price
+        if line_prices.tax_rate is not None:
+            line.tax_rate = line_prices.tax_rate
     OrderLine.objects.bulk_update(
         lines,
         [
@@ -245,26 +284,23 @@ def update_taxes_for_order_lines(
 
 def update_order_prices(order: Order, manager: "PluginsManager", tax_included: bool):
     """Update prices in order with given discounts and proper taxes."""
+    lines = get_order_lines_for_recalculation(order)
+    update_taxes_for_order_lines(lines, order, manager, tax_included)
 
-    update_taxes_for_order_lines(order.lines.all(), order, manager, tax_included)
-
+    update_fields = []
     if order.shipping_method:
         shipping_price = manager.calculate_order_shipping(order)
         order.shipping_price = shipping_price
         order.shipping_tax_rate = manager.get_order_shipping_tax_rate(
             order, shipping_price
         )
-        order.save(
-            update_fields=[
-                "shipping_price_net_amount",
-                "shipping_price_gross_amount",
-                "shipping_tax_rate",
-                "currency",
-                "updated_at",
-            ]
-        )
+        update_fields = [
+            "shipping_price_net_amount",
+            "shipping_price_gross_amount",
+            "shipping_tax_rate",
+        ]
 
-    recalculate_order(order)
+    _recalculate_order(order, lines, update_fields=update_fields)
 
 
 def _calculate_quantity_including_returns(order):
@@ -652,9 +688,99 @@ def restock_fulfillment_lines(fulfillment, warehouse):
 
 
 def sum_order_totals(qs, currency_code):
-    zero = Money(0, currency=currency_code)
-    taxed_zero = TaxedMoney(zero, zero)
-    return sum([order.total for order in qs], taxed_zero)
+    """Sum totals of orders or order daily totals in the database."""
+    totals = qs.order_by().aggregate(
+        net=Sum("total_net_amount"), gross=Sum("total_gross_amount")
+    )
+    return TaxedMoney(
+        net=Money(totals["net"] or 0, currency_code),
+        gross=Money(totals["gross"] or 0, currency_code),
+    )
+
+
+def update_order_daily_totals(dates: Iterable[date], updated_at: datetime):
+    """Recalculate totals of orders created on given days."""
+    dates = set(dates)
+    if not dates:
+        return
+    totals = (
+        Order.objects.non_draft()
+        .filter(created__date__in=dates)
+        .annotate(date=TruncDate("created"))
+        .order_by()
+        .values("date", "channel_id", "status", "channel__currency_code")
+        .annotate(
+            orders_count=Count("pk"),
+            net=Sum("total_net_amount"),
+            gross=Sum("total_gross_amount"),
+        )
+    )
+    daily_totals = [
+        OrderDailyTotal(
+            date=total["date"],
+            channel_id=total["channel_id"],
+            status=total["status"],
+            currency=total["channel__currency_code"],
+            orders_count=total["orders_count"],
+            total_net_amount=total["net"],
+            total_gross_amount=total["gross"],
+            updated_at=updated_at,
+        )
+        for total in totals
+    ]
+    with transaction.atomic():
+        OrderDailyTotal.objects.filter(date__in=dates).delete()
+        OrderDailyTotal.objects.bulk_create(daily_totals)
+
+
+def get_orders_total(channel: "Channel", start_date: datetime) -> TaxedMoney:
+    """Return the total of non-draft orders, not canceled, created since given date.
+
+    Totals of days before the last run of `update_order_daily_totals_task` are read
+    from `OrderDailyTotal`, unless orders created on them were updated after that
+    run; orders of such days and orders created later are summed. The start date
+    is expected to be a start of a day.
+    """
+    total = zero_taxed_money(channel.currency_code)
+    orders = (
+        Order.objects.non_draft()
+        .exclude(status=OrderStatus.CANCELED)
+        .filter(channel=channel, created__gte=start_date)
+    )
+    last_update = OrderDailyTotal.objects.aggregate(Max("updated_at"))[
+        "updated_at__max"
+    ]
+    if last_update:
+        rollup_end = last_update.replace(hour=0, minute=0, second=0, microsecond=0)
+        if rollup_end > start_date:
+            # days with orders updated since the last run have outdated totals
+            outdated_dates = set(
+                Order.objects.non_draft()
+                .filter(
+                    channel=channel,
+                    created__gte=start_date,
+                    created__lt=rollup_end,
+                    updated_at__gte=last_update,
+                )
+                .annotate(date=TruncDate("created"))
+                .order_by()
+                .values_list("date", flat=True)
+                .distinct()
+            )
+            daily_totals = (
+                OrderDailyTotal.objects.filter(
+                    channel=channel,
+                    date__gte=start_date.date(),
+                    date__lt=rollup_end.date(),
+                )
+                .exclude(status=OrderStatus.CANCELED)
+                .exclude(date__in=outdated_dates)
+            )
+            total += sum_order_totals(daily_totals, channel.currency_code)
+            orders = orders.filter(
+                Q(created__gte=rollup_end) | Q(created__date__in=outdated_dates)
+            )
+    return total + sum_order_totals(orders, channel.currency_code)
 
 
 def get_valid_shipping_methods_for_order(
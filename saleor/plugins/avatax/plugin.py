@@ -17,7 +17,7 @@ from ...checkout.fetch import fetch_checkout_lines
 from ...checkout.interface import CheckoutTaxedPricesData
 from ...core.taxes import TaxError, TaxType, charge_taxes_on_shipping, zero_taxed_money
 from ...discount import DiscountInfo
-from ...order.interface import OrderTaxedPricesData
+from ...order.interface import OrderLinePricesData, OrderTaxedPricesData
 from ...product.models import ProductType
 from ..base_plugin import BasePlugin, ConfigurationTypeField
 from ..error_codes import PluginErrorCode
@@ -629,6 +629,54 @@ class AvataxPlugin(BasePlugin):
             / quantity,
         )
 
+    def calculate_order_lines_prices(
+        self,
+        order: "Order",
+        lines: List["OrderLine"],
+        previous_value: List[OrderLinePricesData],
+    ) -> List[OrderLinePricesData]:
+        """Calculate prices and tax rates of all order lines with one tax request."""
+        taxes_data = self._get_order_tax_data(order, previous_value)
+        if taxes_data is None:
+            return previous_value
+
+        tax_included = (
+            lambda: Site.objects.get_current().settings.include_taxes_in_prices
+        )
+
+        for line, line_prices in zip(lines, previous_value):
+            variant = line.variant
+            if not variant or not variant.product.charge_taxes:
+                continue
+            item_code = variant.sku or variant.get_global_id()
+            quantity = line.quantity
+            unit_price = line_prices.unit_price
+            default_total = OrderTaxedPricesData(
+                price_with_discounts=unit_price.price_with_discounts * quantity,
+                undiscounted_price=unit_price.undiscounted_price * quantity,
+            )
+            unit_total = self._calculate_order_line_total_price(
+                taxes_data, item_code, tax_included, default_total
+            )
+            line_prices.unit_price = OrderTaxedPricesData(
+                undiscounted_price=unit_total.undiscounted_price / quantity,
+                price_with_discounts=unit_total.price_with_discounts / quantity,
+            )
+            line_prices.total_price = self._calculate_order_line_total_price(
+                taxes_data, item_code, tax_included, line_prices.total_price
+            )
+            unit_price_with_discounts = line_prices.unit_price.price_with_discounts
+            if unit_price_with_discounts.tax and unit_price_with_discounts.net:
+                base_rate = line_prices.tax_rate
+                if base_rate is None:
+                    base_rate = base_calculations.base_tax_rate(
+                        unit_price_with_discounts
+                    )
+                line_prices.tax_rate = self._get_unit_tax_rate(
+                    taxes_data, item_code, base_rate
+                )
+        return previous_value
+
     def calculate_order_shipping(
         self, order: "Order", previous_value: TaxedMoney
     ) -> TaxedMoney:
@@ -756,7 +804,9 @@ class AvataxPlugin(BasePlugin):
         return response
 
     def _get_order_tax_data(
-        self, order: "Order", base_value: Union[Decimal, OrderTaxedPricesData]
+        self,
+        order: "Order",
+        base_value: Union[Decimal, OrderTaxedPricesData, List[OrderLinePricesData]],
     ):
         if self._skip_plugin(base_value):
             return None
@@ -567,6 +567,61 @@ def test_calculate_order_line_total(
     assert total == TaxedMoney(net=Money("24.39", "USD"), gross=Money("30.00", "USD"))
 
 
+@pytest.mark.vcr()
+@override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
+@patch("saleor.plugins.avatax.plugin.get_order_tax_data", wraps=get_order_tax_data)
+def test_calculate_order_lines_prices(
+    mocked_get_order_tax_data,
+    order_line,
+    address,
+    ship_to_pl_address,
+    shipping_zone,
+    site_settings,
+    plugin_configuration,
+):
+    # given
+    plugin_configuration()
+    manager = get_plugins_manager()
+
+    site_settings.company_address = address
+    site_settings.save(update_fields=["company_address"])
+
+    order = order_line.order
+    order.shipping_address = ship_to_pl_address
+    order.shipping_method = shipping_zone.shipping_methods.get()
+    order.save(update_fields=["shipping_address", "shipping_method"])
+
+    variant = order_line.variant
+    product = variant.product
+    product.metadata = {}
+    product.charge_taxes = True
+    product.save()
+    product.product_type.save()
+
+    channel = order_line.order.channel
+    channel_listing = variant.channel_listings.get(channel=channel)
+
+    net = variant.get_price(product, [], channel, channel_listing)
+    unit_price = TaxedMoney(net=net, gross=net)
+    order_line.unit_price = unit_price
+    order_line.total_price = unit_price * order_line.quantity
+    order_line.save()
+
+    # when
+    lines_prices = manager.calculate_order_lines_prices(order, [order_line])
+
+    # then
+    mocked_get_order_tax_data.assert_called_once()
+    (line_prices,) = lines_prices
+    assert line_prices.total_price.price_with_discounts == TaxedMoney(
+        net=Money("24.39", "USD"), gross=Money("30.00", "USD")
+    )
+    assert line_prices.unit_price.price_with_discounts == TaxedMoney(
+        net=Money("8.13", "USD"), gross=Money("10.00", "USD")
+    )
+    assert line_prices.tax_rate == Decimal("0.23")
+
+
 @pytest.mark.vcr()
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
 def test_calculate_order_line_without_sku_total(
@@ -1,7 +1,17 @@
 from copy import copy
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from django.core.handlers.wsgi import WSGIRequest
 from django.http import HttpResponse
@@ -37,6 +47,7 @@ if TYPE_CHECKING:
     from ..discount.models import Sale
     from ..graphql.discount.mutations import NodeCatalogueInfo
     from ..invoice.models import Invoice
+    from ..order.interface import OrderLinePricesData
     from ..order.models import Fulfillment, Order, OrderLine
     from ..page.models import Page
     from ..product.models import Collection, Product, ProductType, ProductVariant
@@ -96,6 +107,16 @@ class BasePlugin:
     DEFAULT_CONFIGURATION = []
     DEFAULT_ACTIVE = False
     HIDDEN = False
+    # Names of the hooks implemented by the plugin class, set when it's defined.
+    IMPLEMENTED_HOOKS = frozenset()  # type: FrozenSet[str]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Hooks are only declared on `BasePlugin`, so the plugin class implements
+        # the hooks it has an attribute for.
+        cls.IMPLEMENTED_HOOKS = frozenset(
+            hook for hook in PLUGIN_HOOKS if hasattr(cls, hook)
+        )
 
     @classmethod
     def check_plugin_id(cls, plugin_id: str) -> bool:
@@ -122,6 +143,21 @@ class BasePlugin:
     def __str__(self):
         return self.PLUGIN_NAME
 
+    def clone(
+        self, requestor_getter: Optional[Callable[[], "Requestor"]] = None
+    ) -> "BasePlugin":
+        """Return a shallow copy of the plugin bound to the given requestor.
+
+        Used by the plugins manager to reuse already configured plugin instances
+        between requests. Overwrite this method if the plugin keeps any
+        request-specific state.
+        """
+        plugin = copy(self)
+        plugin.requestor = (
+            SimpleLazyObject(requestor_getter) if requestor_getter else requestor_getter
+        )
+        return plugin
+
     #  Apply taxes to the product price based on the customer country.
     #
     #  Overwrite this method if you want to show products with taxes.
@@ -218,6 +254,19 @@ class BasePlugin:
         ["Order", "OrderLine", "ProductVariant", "Product", TaxedMoney], TaxedMoney
     ]
 
+    #  Calculate prices of all order lines at once.
+    #
+    #  Overwrite this method if you can calculate unit prices, total prices and tax
+    #  rates of many order lines in one go, e.g. with a single request to a tax
+    #  service. Return a list of OrderLinePricesData in the order of given lines.
+    #  Tax rates of the lines are taken from the returned data, so
+    #  `get_order_line_tax_rate` of the plugin isn't called for them. When not
+    #  implemented, the per-line methods of the plugin are used.
+    calculate_order_lines_prices: Callable[
+        ["Order", List["OrderLine"], List["OrderLinePricesData"]],
+        List["OrderLinePricesData"],
+    ]
+
     #  Calculate the shipping costs for the order.
     #
     #  Update shipping costs in the order in case of changes in shipping address or
@@ -740,3 +789,7 @@ class BasePlugin:
 
     def is_event_active(self, event: str, channel=Optional[str]):
         return hasattr(self, event)
+
+
+# Names of all hooks that can be implemented by plugins.
+PLUGIN_HOOKS = frozenset(BasePlugin.__annotations__)
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from copy import copy
 from decimal import Decimal
 from typing import (
     TYPE_CHECKING,
@@ -16,6 +17,7 @@ from typing import (
 import opentracing
 from django.conf import settings
 from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
 from django.http import HttpResponse, HttpResponseNotFound
 from django.utils.module_loading import import_string
 from django_countries.fields import Country
@@ -31,9 +33,10 @@ from ..core.models import EventDelivery
 from ..core.payments import PaymentInterface
 from ..core.prices import quantize_price
 from ..core.taxes import TaxType, zero_taxed_money
+from ..core.versioned_cache import VersionedProcessCache
 from ..discount import DiscountInfo
-from ..order.interface import OrderTaxedPricesData
-from .base_plugin import ExcludedShippingMethod, ExternalAccessTokens
+from ..order.interface import OrderLinePricesData, OrderTaxedPricesData
+from .base_plugin import PLUGIN_HOOKS, ExcludedShippingMethod, ExternalAccessTokens
 from .models import PluginConfiguration
 
 if TYPE_CHECKING:
@@ -62,6 +65,8 @@ if TYPE_CHECKING:
 
 NotifyEventTypeChoice = str
 
+PLUGINS_MANAGER_VERSION_CACHE_KEY = "plugins_manager_version"
+
 
 class PluginsManager(PaymentInterface):
     """Base manager for handling plugins logic."""
@@ -97,6 +102,7 @@ class PluginsManager(PaymentInterface):
 
     def __init__(self, plugins: List[str], requestor_getter=None):
         with opentracing.global_tracer().start_active_span("PluginsManager.__init__"):
+            self.checkout_prices_memo: Dict[tuple, Any] = {}
             self.all_plugins = []
             self.global_plugins = []
             self.plugins_per_channel = defaultdict(list)
@@ -127,6 +133,28 @@ class PluginsManager(PaymentInterface):
             for channel in channels:
                 self.plugins_per_channel[channel.slug].extend(self.global_plugins)
 
+    def clone(
+        self, requestor_getter: Optional[Callable[[], "Requestor"]] = None
+    ) -> "PluginsManager":
+        """Return a copy of the manager with plugins bound to the given requestor.
+
+        Plugins configuration is shared with the original manager, so cloning
+        doesn't hit the database.
+        """
+        manager = self.__class__.__new__(self.__class__)
+        manager.checkout_prices_memo = {}
+        cloned_plugins = {
+            id(plugin): plugin.clone(requestor_getter) for plugin in self.all_plugins
+        }
+        manager.all_plugins = [cloned_plugins[id(p)] for p in self.all_plugins]
+        manager.global_plugins = [cloned_plugins[id(p)] for p in self.global_plugins]
+        manager.plugins_per_channel = defaultdict(list)
+        for channel_slug, plugins in self.plugins_per_channel.items():
+            manager.plugins_per_channel[channel_slug] = [
+                cloned_plugins[id(p)] for p in plugins
+            ]
+        return manager
+
     def _get_db_plugin_configs(self):
         with opentracing.global_tracer().start_active_span("_get_db_plugin_configs"):
             qs = (
@@ -146,6 +174,76 @@ class PluginsManager(PaymentInterface):
                     ] = db_plugin_config
             return global_configs, channel_configs
 
+    def _get_checkout_prices_memo_key(
+        self,
+        method_name: str,
+        checkout_info: "CheckoutInfo",
+        lines: List["CheckoutLineInfo"],
+        address: Optional["Address"],
+        discounts: Iterable[DiscountInfo],
+        *args,
+    ) -> tuple:
+        """Return a key identifying the checkout content used by the calculation.
+
+        The lines are iterated, so callers have to pass them as a list, not
+        an iterator that plugins would then get exhausted.
+        """
+        from ..checkout.utils import get_external_shipping_id
+
+        checkout = checkout_info.checkout
+        return (
+            method_name,
+            checkout.token,
+            checkout_info.channel.slug,
+            checkout.currency,
+            checkout.discount_amount,
+            checkout.voucher_code,
+            checkout.shipping_address_id,
+            checkout.billing_address_id,
+            checkout.shipping_method_id,
+            checkout.collection_point_id,
+            get_external_shipping_id(checkout),
+            tuple(
+                (
+                    line_info.line.pk,
+                    line_info.variant.pk,
+                    line_info.line.quantity,
+                    line_info.channel_listing.price_amount
+                    if line_info.channel_listing
+                    else None,
+                    line_info.voucher.pk if line_info.voucher else None,
+                )
+                for line_info in lines
+            ),
+            tuple(sorted(address.as_data().items())) if address else None,
+            tuple(
+                (
+                    type(discount.sale).__name__,
+                    discount.sale.pk,
+                    getattr(discount.sale, "updated_at", None),
+                )
+                for discount in discounts or []
+            ),
+            *(
+                (arg.net.amount, arg.gross.amount, arg.currency)
+                if isinstance(arg, TaxedMoney)
+                else arg
+                for arg in args
+            ),
+        )
+
+    def _memoize_checkout_price(
+        self, memo_key: tuple, calculate: Callable[[], Any]
+    ) -> Any:
+        """Return the value calculated for the same checkout content in the request.
+
+        The manager is created for every request, so calculations repeated by
+        resolvers and by other calculations don't run plugins again.
+        """
+        if memo_key not in self.checkout_prices_memo:
+            self.checkout_prices_memo[memo_key] = calculate()
+        return copy(self.checkout_prices_memo[memo_key])
+
     def __run_method_on_plugins(
         self,
         method_name: str,
@@ -156,7 +254,7 @@ class PluginsManager(PaymentInterface):
     ):
         """Try to run a method with the given name on each declared active plugin."""
         value = default_value
-        plugins = self.get_plugins(channel_slug=channel_slug, active_only=True)
+        plugins = self._get_plugins_with_hook(method_name, channel_slug=channel_slug)
         for plugin in plugins:
             value = self.__run_method_on_single_plugin(
                 plugin, method_name, value, *args, **kwargs
@@ -206,6 +304,23 @@ class PluginsManager(PaymentInterface):
         lines: Iterable["CheckoutLineInfo"],
         address: Optional["Address"],
         discounts: Iterable[DiscountInfo],
+    ) -> TaxedMoney:
+        lines = list(lines)
+        return self._memoize_checkout_price(
+            self._get_checkout_prices_memo_key(
+                "calculate_checkout_total", checkout_info, lines, address, discounts
+            ),
+            lambda: self._calculate_checkout_total(
+                checkout_info, lines, address, discounts
+            ),
+        )
+
+    def _calculate_checkout_total(
+        self,
+        checkout_info: "CheckoutInfo",
+        lines: Iterable["CheckoutLineInfo"],
+        address: Optional["Address"],
+        discounts: Iterable[DiscountInfo],
     ) -> TaxedMoney:
         currency = checkout_info.checkout.currency
         default_value = base_calculations.base_checkout_total(
@@ -244,6 +359,23 @@ class PluginsManager(PaymentInterface):
         lines: Iterable["CheckoutLineInfo"],
         address: Optional["Address"],
         discounts: Iterable[DiscountInfo],
+    ) -> TaxedMoney:
+        lines = list(lines)
+        return self._memoize_checkout_price(
+            self._get_checkout_prices_memo_key(
+                "calculate_checkout_subtotal", checkout_info, lines, address, discounts
+            ),
+            lambda: self._calculate_checkout_subtotal(
+                checkout_info, lines, address, discounts
+            ),
+        )
+
+    def _calculate_checkout_subtotal(
+        self,
+        checkout_info: "CheckoutInfo",
+        lines: Iterable["CheckoutLineInfo"],
+        address: Optional["Address"],
+        discounts: Iterable[DiscountInfo],
     ) -> TaxedMoney:
         line_totals = [
             self.calculate_checkout_line_total(
@@ -268,6 +400,23 @@ class PluginsManager(PaymentInterface):
         lines: Iterable["CheckoutLineInfo"],
         address: Optional["Address"],
         discounts: Iterable[DiscountInfo],
+    ) -> TaxedMoney:
+        lines = list(lines)
+        return self._memoize_checkout_price(
+            self._get_checkout_prices_memo_key(
+                "calculate_checkout_shipping", checkout_info, lines, address, discounts
+            ),
+            lambda: self._calculate_checkout_shipping(
+                checkout_info, lines, address, discounts
+            ),
+        )
+
+    def _calculate_checkout_shipping(
+        self,
+        checkout_info: "CheckoutInfo",
+        lines: Iterable["CheckoutLineInfo"],
+        address: Optional["Address"],
+        discounts: Iterable[DiscountInfo],
     ) -> TaxedMoney:
         default_value = base_calculations.base_checkout_delivery_price(
             checkout_info, lines
@@ -316,16 +465,27 @@ class PluginsManager(PaymentInterface):
         discounts: Iterable[DiscountInfo],
         shipping_price: TaxedMoney,
     ):
+        lines = list(lines)
         default_value = base_calculations.base_tax_rate(shipping_price)
-        return self.__run_method_on_plugins(
-            "get_checkout_shipping_tax_rate",
-            default_value,
-            checkout_info,
-            lines,
-            address,
-            discounts,
-            channel_slug=checkout_info.channel.slug,
-        ).quantize(Decimal(".0001"))
+        return self._memoize_checkout_price(
+            self._get_checkout_prices_memo_key(
+                "get_checkout_shipping_tax_rate",
+                checkout_info,
+                lines,
+                address,
+                discounts,
+                shipping_price,
+            ),
+            lambda: self.__run_method_on_plugins(
+                "get_checkout_shipping_tax_rate",
+                default_value,
+                checkout_info,
+                lines,
+                address,
+                discounts,
+                channel_slug=checkout_info.channel.slug,
+            ).quantize(Decimal(".0001")),
+        )
 
     def get_order_shipping_tax_rate(self, order: "Order", shipping_price: TaxedMoney):
         default_value = base_calculations.base_tax_rate(shipping_price)
@@ -343,6 +503,29 @@ class PluginsManager(PaymentInterface):
         checkout_line_info: "CheckoutLineInfo",
         address: Optional["Address"],
         discounts: Iterable["DiscountInfo"],
+    ) -> CheckoutTaxedPricesData:
+        lines = list(lines)
+        return self._memoize_checkout_price(
+            self._get_checkout_prices_memo_key(
+                "calculate_checkout_line_total",
+                checkout_info,
+                lines,
+                address,
+                discounts,
+                checkout_line_info.line.pk,
+            ),
+            lambda: self._calculate_checkout_line_total(
+                checkout_info, lines, checkout_line_info, address, discounts
+            ),
+        )
+
+    def _calculate_checkout_line_total(
+        self,
+        checkout_info: "CheckoutInfo",
+        lines: Iterable["CheckoutLineInfo"],
+        checkout_line_info: "CheckoutLineInfo",
+        address: Optional["Address"],
+        discounts: Iterable["DiscountInfo"],
     ) -> CheckoutTaxedPricesData:
         default_value = base_calculations.base_checkout_line_total(
             checkout_line_info,
@@ -404,6 +587,29 @@ class PluginsManager(PaymentInterface):
         checkout_line_info: "CheckoutLineInfo",
         address: Optional["Address"],
         discounts: Iterable["DiscountInfo"],
+    ) -> CheckoutTaxedPricesData:
+        lines = list(lines)
+        return self._memoize_checkout_price(
+            self._get_checkout_prices_memo_key(
+                "calculate_checkout_line_unit_price",
+                checkout_info,
+                lines,
+                address,
+                discounts,
+                checkout_line_info.line.pk,
+            ),
+            lambda: self._calculate_checkout_line_unit_price(
+                checkout_info, lines, checkout_line_info, address, discounts
+            ),
+        )
+
+    def _calculate_checkout_line_unit_price(
+        self,
+        checkout_info: "CheckoutInfo",
+        lines: Iterable["CheckoutLineInfo"],
+        checkout_line_info: "CheckoutLineInfo",
+        address: Optional["Address"],
+        discounts: Iterable["DiscountInfo"],
     ) -> CheckoutTaxedPricesData:
         default_value = base_calculations.base_checkout_line_unit_price(
             checkout_line_info, checkout_info.channel, discounts
@@ -457,6 +663,90 @@ class PluginsManager(PaymentInterface):
         )
         return line_unit
 
+    def calculate_order_lines_prices(
+        self, order: "Order", lines: List["OrderLine"]
+    ) -> List[OrderLinePricesData]:
+        """Calculate unit prices, total prices and tax rates of given order lines.
+
+        Plugins implementing `calculate_order_lines_prices` get all lines at once
+        and set tax rates of the lines themselves, the per-line methods are called
+        for the other plugins. Lines are expected to have variants with products
+        fetched.
+        """
+        plugins = self.get_plugins(channel_slug=order.channel.slug, active_only=True)
+        lines_prices = [
+            OrderLinePricesData(
+                unit_price=OrderTaxedPricesData(
+                    undiscounted_price=line.undiscounted_unit_price,
+                    price_with_discounts=line.unit_price,
+                ),
+                total_price=base_calculations.base_order_line_total(line),
+            )
+            for line in lines
+        ]
+        lines_prices_plugins = []
+        for plugin in plugins:
+            if getattr(plugin, "calculate_order_lines_prices", NotImplemented) != (
+                NotImplemented
+            ):
+                lines_prices = self.__run_method_on_single_plugin(
+                    plugin, "calculate_order_lines_prices", lines_prices, order, lines
+                )
+                lines_prices_plugins.append(plugin)
+                continue
+            for line, line_prices in zip(lines, lines_prices):
+                variant = line.variant
+                product = variant.product  # type: ignore
+                line_prices.unit_price = self.__run_method_on_single_plugin(
+                    plugin,
+                    "calculate_order_line_unit",
+                    line_prices.unit_price,
+                    order,
+                    line,
+                    variant,
+                    product,
+                )
+                line_prices.total_price = self.__run_method_on_single_plugin(
+                    plugin,
+                    "calculate_order_line_total",
+                    line_prices.total_price,
+                    order,
+                    line,
+                    variant,
+                    product,
+                )
+
+        for line, line_prices in zip(lines, lines_prices):
+            currency = line.currency
+            for prices_data in (line_prices.unit_price, line_prices.total_price):
+                prices_data.price_with_discounts = quantize_price(
+                    prices_data.price_with_discounts, currency
+                )
+                prices_data.undiscounted_price = quantize_price(
+                    prices_data.undiscounted_price, currency
+                )
+            unit_price = line_prices.unit_price.price_with_discounts
+            if not (unit_price.tax and unit_price.net):
+                continue
+            tax_rate = line_prices.tax_rate
+            if tax_rate is None:
+                tax_rate = base_calculations.base_tax_rate(unit_price)
+            variant = line.variant
+            for plugin in plugins:
+                if plugin in lines_prices_plugins:
+                    continue
+                tax_rate = self.__run_method_on_single_plugin(
+                    plugin,
+                    "get_order_line_tax_rate",
+                    tax_rate,
+                    order,
+                    variant.product,  # type: ignore
+                    variant,
+                    None,
+                )
+            line_prices.tax_rate = tax_rate.quantize(Decimal(".0001"))
+        return lines_prices
+
     def get_checkout_line_tax_rate(
         self,
         checkout_info: "CheckoutInfo",
@@ -466,17 +756,29 @@ class PluginsManager(PaymentInterface):
         discounts: Iterable[DiscountInfo],
         unit_price: TaxedMoney,
     ) -> Decimal:
+        lines = list(lines)
         default_value = base_calculations.base_tax_rate(unit_price)
-        return self.__run_method_on_plugins(
-            "get_checkout_line_tax_rate",
-            default_value,
-            checkout_info,
-            lines,
-            checkout_line_info,
-            address,
-            discounts,
-            channel_slug=checkout_info.channel.slug,
-        ).quantize(Decimal(".0001"))
+        return self._memoize_checkout_price(
+            self._get_checkout_prices_memo_key(
+                "get_checkout_line_tax_rate",
+                checkout_info,
+                lines,
+                address,
+                discounts,
+                checkout_line_info.line.pk,
+                unit_price,
+            ),
+            lambda: self.__run_method_on_plugins(
+                "get_checkout_line_tax_rate",
+                default_value,
+                checkout_info,
+                lines,
+                checkout_line_info,
+                address,
+                discounts,
+                channel_slug=checkout_info.channel.slug,
+            ).quantize(Decimal(".0001")),
+        )
 
     def get_order_line_tax_rate(
         self,
@@ -891,6 +1193,21 @@ class PluginsManager(PaymentInterface):
             "translation_updated", default_value, translation
         )
 
+    def _get_plugins_with_hook(
+        self, method_name: str, channel_slug: Optional[str] = None
+    ) -> List["BasePlugin"]:
+        """Return active plugins implementing the hook with the given name."""
+        plugins = self.get_plugins(channel_slug=channel_slug, active_only=True)
+        if method_name not in PLUGIN_HOOKS:
+            return plugins
+        return [plugin for plugin in plugins if method_name in plugin.IMPLEMENTED_HOOKS]
+
+    def is_hook_implemented(
+        self, method_name: str, channel_slug: Optional[str] = None
+    ) -> bool:
+        """Return whether any active plugin implements the hook."""
+        return bool(self._get_plugins_with_hook(method_name, channel_slug=channel_slug))
+
     def get_plugins(
         self, channel_slug: Optional[str] = None, active_only=False
     ) -> List["BasePlugin"]:
@@ -1052,6 +1369,7 @@ class PluginsManager(PaymentInterface):
                 configuration.description = plugin.PLUGIN_DESCRIPTION
                 plugin.active = configuration.active
                 plugin.configuration = configuration.configuration
+                transaction.on_commit(invalidate_plugins_manager)
                 return configuration
 
     def get_plugin(
@@ -1234,8 +1552,51 @@ class PluginsManager(PaymentInterface):
         )
 
 
+# Process-wide managers keyed by the list of plugins.
+manager_prototypes_cache: VersionedProcessCache[PluginsManager] = (
+    VersionedProcessCache(PLUGINS_MANAGER_VERSION_CACHE_KEY)
+)
+
+
+def invalidate_plugins_manager():
+    """Rebuild plugins managers in all workers on the next request.
+
+    Should be called each time plugin configurations or channels are changed.
+    """
+    manager_prototypes_cache.invalidate()
+
+
+def _get_plugins_manager_prototype(plugins: List[str]) -> PluginsManager:
+    key = tuple(plugins)
+    version, prototype = manager_prototypes_cache.get(
+        settings.PLUGINS_MANAGER_CACHE_TIMEOUT, key
+    )
+    if prototype is None:
+        prototype = PluginsManager(plugins)
+        manager_prototypes_cache.set(version, prototype, key)
+    return prototype
+
+
+def is_plugin_hook_implemented(method_name: str) -> bool:
+    """Return whether any active plugin implements the hook.
+
+    Checks the process-wide manager, so it doesn't build a manager for the request.
+    If process-wide managers are disabled, only plugin classes are checked.
+    """
+    if not settings.PLUGINS_MANAGER_CACHE_TIMEOUT:
+        return any(
+            method_name in import_string(plugin_path).IMPLEMENTED_HOOKS
+            for plugin_path in settings.PLUGINS
+        )
+    prototype = _get_plugins_manager_prototype(settings.PLUGINS)
+    return prototype.is_hook_implemented(method_name)
+
+
 def get_plugins_manager(
     requestor_getter: Optional[Callable[[], "Requestor"]] = None
 ) -> PluginsManager:
     with opentracing.global_tracer().start_active_span("get_plugins_manager"):
-        return PluginsManager(settings.PLUGINS, requestor_getter)
+        if not settings.PLUGINS_MANAGER_CACHE_TIMEOUT:
+            return PluginsManager(settings.PLUGINS, requestor_getter)
+        prototype = _get_plugins_manager_prototype(settings.PLUGINS)
+        return prototype.clone(requestor_getter)
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Iterable, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple, Union
 
 from django.core.handlers.wsgi import WSGIRequest
 from django.http import HttpResponse, HttpResponseNotFound, JsonResponse
@@ -12,7 +12,7 @@ from prices import Money, TaxedMoney
 from ...account.models import User
 from ...checkout.interface import CheckoutTaxedPricesData
 from ...core.taxes import TaxType
-from ...order.interface import OrderTaxedPricesData
+from ...order.interface import OrderLinePricesData, OrderTaxedPricesData
 from ..base_plugin import BasePlugin, ConfigurationTypeField, ExternalAccessTokens
 
 if TYPE_CHECKING:
@@ -330,6 +330,38 @@ class ActivePlugin(BasePlugin):
     CONFIGURATION_PER_CHANNEL = False
 
 
+class OrderLinesPricesPluginSample(BasePlugin):
+    PLUGIN_ID = "mirumee.x.plugin.order_lines_prices"
+    PLUGIN_NAME = "Order lines prices"
+    DEFAULT_ACTIVE = True
+    CONFIGURATION_PER_CHANNEL = False
+
+    def calculate_order_lines_prices(
+        self,
+        order: "Order",
+        lines: List["OrderLine"],
+        previous_value: List[OrderLinePricesData],
+    ) -> List[OrderLinePricesData]:
+        lines_prices = []
+        for line in lines:
+            unit_price = TaxedMoney(
+                net=Money("10.0", order.currency), gross=Money("12.0", order.currency)
+            )
+            lines_prices.append(
+                OrderLinePricesData(
+                    unit_price=OrderTaxedPricesData(
+                        undiscounted_price=unit_price, price_with_discounts=unit_price
+                    ),
+                    total_price=OrderTaxedPricesData(
+                        undiscounted_price=unit_price * line.quantity,
+                        price_with_discounts=unit_price * line.quantity,
+                    ),
+                    tax_rate=Decimal("0.2"),
+                )
+            )
+        return lines_prices
+
+
 class ActivePaymentGateway(BasePlugin):
     PLUGIN_ID = "mirumee.gateway.active"
     CLIENT_CONFIG = [
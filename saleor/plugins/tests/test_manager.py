@@ -1,4 +1,5 @@
 import json
+import time
 from decimal import Decimal
 from functools import partial
 from unittest import mock
@@ -15,8 +16,15 @@ from ...discount.utils import fetch_catalogue_info
 from ...graphql.discount.mutations import convert_catalogue_info_to_global_ids
 from ...payment.interface import PaymentGateway
 from ...product.models import Product
+from ...tests.utils import flush_post_commit_hooks
 from ..base_plugin import ExternalAccessTokens
-from ..manager import PluginsManager, get_plugins_manager
+from ..manager import (
+    PluginsManager,
+    get_plugins_manager,
+    invalidate_plugins_manager,
+    is_plugin_hook_implemented,
+    manager_prototypes_cache,
+)
 from ..models import PluginConfiguration
 from ..tests.sample_plugins import (
     ACTIVE_PLUGINS,
@@ -164,6 +172,29 @@ def test_manager_calculates_checkout_total(
     assert TaxedMoney(expected_total, expected_total) == taxed_total
 
 
+def test_manager_calculates_checkout_subtotal_of_lines_iterator(
+    checkout_with_item, discount_info
+):
+    # given
+    manager = PluginsManager(plugins=[])
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(
+        checkout_with_item, lines, [discount_info], manager
+    )
+    expected_subtotal = manager.calculate_checkout_subtotal(
+        checkout_info, lines, None, [discount_info]
+    )
+
+    # when
+    subtotal = PluginsManager(plugins=[]).calculate_checkout_subtotal(
+        checkout_info, iter(lines), None, [discount_info]
+    )
+
+    # then
+    assert subtotal == expected_subtotal
+    assert subtotal.gross.amount
+
+
 @pytest.mark.parametrize(
     "plugins, subtotal_amount",
     [(["saleor.plugins.tests.sample_plugins.PluginSample"], "1.0"), ([], "15.0")],
@@ -253,6 +284,91 @@ def test_manager_calculates_checkout_line_total(
     assert TaxedMoney(expected_total, expected_total) == taxed_total
 
 
+@mock.patch.object(
+    PluginSample,
+    "calculate_checkout_line_total",
+    autospec=True,
+    side_effect=PluginSample.calculate_checkout_line_total,
+)
+@mock.patch.object(
+    PluginSample,
+    "calculate_checkout_shipping",
+    autospec=True,
+    side_effect=PluginSample.calculate_checkout_shipping,
+)
+@mock.patch.object(
+    PluginSample,
+    "calculate_checkout_total",
+    autospec=True,
+    side_effect=PluginSample.calculate_checkout_total,
+)
+def test_manager_calculates_checkout_prices_once_per_checkout(
+    mocked_calculate_checkout_total,
+    mocked_calculate_checkout_shipping,
+    mocked_calculate_checkout_line_total,
+    checkout_with_items,
+    discount_info,
+):
+    # given
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.PluginSample"]
+    )
+    lines, _ = fetch_checkout_lines(checkout_with_items)
+    checkout_info = fetch_checkout_info(
+        checkout_with_items, lines, [discount_info], manager
+    )
+    total = manager.calculate_checkout_total(
+        checkout_info, lines, None, [discount_info]
+    )
+
+    # when
+    for _ in range(2):
+        assert (
+            manager.calculate_checkout_total(
+                checkout_info, lines, None, [discount_info]
+            )
+            == total
+        )
+        manager.calculate_checkout_subtotal(checkout_info, lines, None, [discount_info])
+        manager.calculate_checkout_shipping(checkout_info, lines, None, [discount_info])
+        for line_info in lines:
+            manager.calculate_checkout_line_total(
+                checkout_info, lines, line_info, None, [discount_info]
+            )
+
+    # then
+    mocked_calculate_checkout_total.assert_called_once()
+    mocked_calculate_checkout_shipping.assert_called_once()
+    assert mocked_calculate_checkout_line_total.call_count == len(lines)
+
+
+@mock.patch.object(
+    PluginSample,
+    "calculate_checkout_total",
+    autospec=True,
+    side_effect=PluginSample.calculate_checkout_total,
+)
+def test_manager_recalculates_checkout_prices_when_checkout_changes(
+    mocked_calculate_checkout_total, checkout_with_item, address
+):
+    # given
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.PluginSample"]
+    )
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(checkout_with_item, lines, [], manager)
+    manager.calculate_checkout_total(checkout_info, lines, None, [])
+
+    # when
+    lines[0].line.quantity += 1
+    manager.calculate_checkout_total(checkout_info, lines, None, [])
+    manager.calculate_checkout_total(checkout_info, lines, address, [])
+    manager.clone().calculate_checkout_total(checkout_info, lines, address, [])
+
+    # then
+    assert mocked_calculate_checkout_total.call_count == 4
+
+
 @pytest.mark.parametrize(
     "plugins",
     [["saleor.plugins.tests.sample_plugins.PluginSample"], []],
@@ -274,6 +390,78 @@ def test_manager_calculates_order_line_total(order_line, plugins):
     assert expected_total == taxed_total
 
 
+@pytest.mark.parametrize(
+    "plugins",
+    [["saleor.plugins.tests.sample_plugins.PluginSample"], []],
+)
+def test_manager_calculates_order_lines_prices(order_with_lines, plugins):
+    # given
+    lines = list(order_with_lines.lines.all())
+    manager = PluginsManager(plugins=plugins)
+
+    # when
+    lines_prices = manager.calculate_order_lines_prices(order_with_lines, lines)
+
+    # then
+    assert len(lines_prices) == len(lines)
+    for line, line_prices in zip(lines, lines_prices):
+        variant = line.variant
+        expected_unit_price = manager.calculate_order_line_unit(
+            order_with_lines, line, variant, variant.product
+        )
+        expected_total_price = manager.calculate_order_line_total(
+            order_with_lines, line, variant, variant.product
+        )
+        assert line_prices.unit_price == expected_unit_price
+        assert line_prices.total_price == expected_total_price
+
+
+def test_manager_calculates_order_lines_prices_with_lines_prices_plugin(
+    order_with_lines,
+):
+    # given
+    plugins = [
+        "saleor.plugins.tests.sample_plugins.OrderLinesPricesPluginSample",
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+    ]
+    lines = list(order_with_lines.lines.all())
+
+    # when
+    lines_prices = PluginsManager(plugins=plugins).calculate_order_lines_prices(
+        order_with_lines, lines
+    )
+
+    # then
+    price = Money("1.0", order_with_lines.currency)
+    for line_prices in lines_prices:
+        # per-line methods of the next plugin get prices of the previous one
+        assert line_prices.unit_price.price_with_discounts == TaxedMoney(price, price)
+        assert line_prices.total_price.price_with_discounts == TaxedMoney(price, price)
+
+
+def test_manager_calculates_order_lines_prices_tax_rate_from_lines_prices_plugin(
+    order_with_lines,
+):
+    # given
+    plugins = ["saleor.plugins.tests.sample_plugins.OrderLinesPricesPluginSample"]
+    line = order_with_lines.lines.first()
+
+    # when
+    lines_prices = PluginsManager(plugins=plugins).calculate_order_lines_prices(
+        order_with_lines, [line]
+    )
+
+    # then
+    line_prices = lines_prices[0]
+    assert line_prices.unit_price.price_with_discounts.gross == Money(
+        "12.0", order_with_lines.currency
+    )
+    assert line_prices.total_price.price_with_discounts.net == Money(
+        10 * line.quantity, order_with_lines.currency
+    )
+    assert line_prices.tax_rate == Decimal("0.2")
+
+
 def test_manager_get_checkout_line_tax_rate_sample_plugin(
     checkout_with_item, discount_info
 ):
@@ -868,6 +1056,46 @@ def test_manager_authenticate_user(rf, admin_user):
     assert user == admin_user
 
 
+def test_plugin_implemented_hooks():
+    assert PluginInactive.IMPLEMENTED_HOOKS == {"external_obtain_access_tokens"}
+    assert "authenticate_user" in PluginSample.IMPLEMENTED_HOOKS
+    assert "authenticate_user" in ChannelPluginSample.IMPLEMENTED_HOOKS
+
+
+def test_manager_is_hook_implemented():
+    plugins = [
+        "saleor.plugins.tests.sample_plugins.PluginInactive",
+        "saleor.plugins.tests.sample_plugins.ActivePlugin",
+    ]
+    manager = PluginsManager(plugins=plugins)
+
+    assert not manager.is_hook_implemented("authenticate_user")
+    # the only plugin implementing the hook is inactive
+    assert not manager.is_hook_implemented("external_obtain_access_tokens")
+
+
+@pytest.mark.parametrize(
+    "cache_timeout, expected_result",
+    [
+        # process-wide managers know that the plugin is inactive
+        (60, False),
+        (0, True),
+    ],
+)
+def test_is_plugin_hook_implemented(cache_timeout, expected_result, settings):
+    # given
+    settings.PLUGINS_MANAGER_CACHE_TIMEOUT = cache_timeout
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginInactive"]
+    invalidate_plugins_manager()
+
+    # when
+    result = is_plugin_hook_implemented("external_obtain_access_tokens")
+
+    # then
+    assert result is expected_result
+    assert not is_plugin_hook_implemented("authenticate_user")
+
+
 def test_manager_external_logout(rf, admin_user):
     plugins = [
         "saleor.plugins.tests.sample_plugins.PluginInactive",
@@ -1096,3 +1324,107 @@ def test_calculate_checkout_total_zero_default_value(
     # then
     assert "calculate_checkout_total" not in mocked_run_method.call_args_list
     assert taxed_total == zero_taxed_money(currency)
+
+
+def test_manager_clone(settings, channel_USD, channel_PLN):
+    # given
+    settings.PLUGINS = [
+        "saleor.plugins.tests.sample_plugins.ChannelPluginSample",
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+    ]
+    manager = PluginsManager(plugins=settings.PLUGINS)
+    requestor = mock.Mock()
+
+    # when
+    cloned_manager = manager.clone(lambda: requestor)
+
+    # then
+    assert len(cloned_manager.all_plugins) == len(manager.all_plugins)
+    assert not set(map(id, cloned_manager.all_plugins)) & set(
+        map(id, manager.all_plugins)
+    )
+    assert cloned_manager.plugins_per_channel.keys() == (
+        manager.plugins_per_channel.keys()
+    )
+    global_plugin = cloned_manager.global_plugins[0]
+    for plugins in cloned_manager.plugins_per_channel.values():
+        assert global_plugin in plugins
+        assert all(plugin in cloned_manager.all_plugins for plugin in plugins)
+    assert all(plugin.requestor == requestor for plugin in cloned_manager.all_plugins)
+    assert all(plugin.requestor is None for plugin in manager.all_plugins)
+
+
+def test_get_plugins_manager_reuses_prototype(
+    settings, channel_USD, django_assert_num_queries
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    settings.PLUGINS_MANAGER_CACHE_TIMEOUT = 60
+    invalidate_plugins_manager()
+    first_manager = get_plugins_manager()
+
+    # when
+    with django_assert_num_queries(0):
+        second_manager = get_plugins_manager()
+
+    # then
+    assert second_manager is not first_manager
+    assert second_manager.all_plugins[0] is not first_manager.all_plugins[0]
+    assert set(second_manager.plugins_per_channel.keys()) == {channel_USD.slug}
+
+
+def test_get_plugins_manager_rebuilt_after_invalidation(
+    settings, channel_USD, channel_PLN
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    settings.PLUGINS_MANAGER_CACHE_TIMEOUT = 60
+    invalidate_plugins_manager()
+    get_plugins_manager()
+    channel_PLN.slug = "new-slug"
+    channel_PLN.save(update_fields=["slug"])
+
+    # when
+    invalidate_plugins_manager()
+    manager = get_plugins_manager()
+
+    # then
+    assert set(manager.plugins_per_channel.keys()) == {channel_USD.slug, "new-slug"}
+
+
+def test_get_plugins_manager_rebuilt_after_timeout(settings, channel_USD):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    settings.PLUGINS_MANAGER_CACHE_TIMEOUT = 60
+    invalidate_plugins_manager()
+    get_plugins_manager()
+
+    # when
+    with mock.patch(
+        "saleor.plugins.manager.PluginsManager.__init__", return_value=None
+    ) as mocked_init, mock.patch(
+        "saleor.core.versioned_cache.time.monotonic",
+        return_value=time.monotonic() + 61,
+    ):
+        get_plugins_manager()
+
+    # then
+    mocked_init.assert_called_once_with(settings.PLUGINS)
+    invalidate_plugins_manager()
+
+
+def test_save_plugin_configuration_invalidates_plugins_manager(settings, channel_USD):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    settings.PLUGINS_MANAGER_CACHE_TIMEOUT = 60
+    invalidate_plugins_manager()
+    manager = get_plugins_manager()
+    version = manager_prototypes_cache.get_version()
+
+    # when
+    manager.save_plugin_configuration(PluginSample.PLUGIN_ID, None, {"active": False})
+    flush_post_commit_hooks()
+
+    # then
+    assert manager_prototypes_cache.get_version() != version
+    assert get_plugins_manager().all_plugins[0].active is False
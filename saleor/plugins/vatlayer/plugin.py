@@ -18,7 +18,7 @@ from prices import Money, TaxedMoney, TaxedMoneyRange
 from ...checkout import base_calculations, calculations
 from ...checkout.interface import CheckoutTaxedPricesData
 from ...core.taxes import TaxType
-from ...order.interface import OrderTaxedPricesData
+from ...order.interface import OrderLinePricesData, OrderTaxedPricesData
 from ...plugins.error_codes import PluginErrorCode
 from ...product.models import ProductType
 from ..base_plugin import BasePlugin, ConfigurationTypeField
@@ -125,6 +125,11 @@ class VatlayerPlugin(BasePlugin):
         )
         self._cached_taxes = {}
 
+    def clone(self, requestor_getter=None):
+        plugin = super().clone(requestor_getter)
+        plugin._cached_taxes = {}
+        return plugin
+
     def _skip_plugin(
         self,
         previous_value: Union[
@@ -375,6 +380,35 @@ class VatlayerPlugin(BasePlugin):
         )
         return unit_price_data if unit_price_data is not None else previous_value
 
+    def calculate_order_lines_prices(
+        self,
+        order: "Order",
+        lines: List["OrderLine"],
+        previous_value: List[OrderLinePricesData],
+    ) -> List[OrderLinePricesData]:
+        for line, line_prices in zip(lines, previous_value):
+            variant = line.variant
+            if not variant:
+                continue
+            product = variant.product
+            unit_price_data = self.__calculate_order_line_unit(
+                order, line, variant, product, line_prices.unit_price
+            )
+            if unit_price_data is not None:
+                line_prices.unit_price = unit_price_data
+            total_unit_price_data = self.__calculate_order_line_unit(
+                order, line, variant, product, line_prices.total_price
+            )
+            if total_unit_price_data is not None:
+                quantity = line.quantity
+                line_prices.total_price = OrderTaxedPricesData(
+                    undiscounted_price=total_unit_price_data.undiscounted_price
+                    * quantity,
+                    price_with_discounts=total_unit_price_data.price_with_discounts
+                    * quantity,
+                )
+        return previous_value
+
     def __calculate_order_line_unit(
         self,
         order: "Order",
@@ -1703,3 +1703,40 @@ def test_calculate_checkout_shipping_no_shipping_price(
     assert shipping_price == TaxedMoney(
         net=Money("0.00", "USD"), gross=Money("0.00", "USD")
     )
+
+
+def test_calculate_order_lines_prices(
+    vatlayer, order_line, shipping_zone, site_settings
+):
+    # given
+    manager = get_plugins_manager()
+    order_line.unit_price = TaxedMoney(
+        net=Money("10.00", "USD"), gross=Money("10.00", "USD")
+    )
+    order_line.total_price = order_line.unit_price * order_line.quantity
+    order_line.save()
+
+    order = order_line.order
+    method = shipping_zone.shipping_methods.get()
+    order.shipping_address = order.billing_address.get_copy()
+    order.shipping_method_name = method.name
+    order.shipping_method = method
+    order.save()
+
+    variant = order_line.variant
+    product = variant.product
+    manager.assign_tax_code_to_object_meta(product, "standard")
+    product.save()
+
+    # when
+    [line_prices] = manager.calculate_order_lines_prices(order, [order_line])
+
+    # then
+    unit_price = line_prices.unit_price.price_with_discounts
+    assert quantize_price(unit_price, unit_price.currency) == TaxedMoney(
+        net=Money("8.13", "USD"), gross=Money("10.00", "USD")
+    )
+    total_price = line_prices.total_price.price_with_discounts
+    assert quantize_price(total_price, total_price.currency) == quantize_price(
+        unit_price * order_line.quantity, unit_price.currency
+    )
@@ -2,6 +2,8 @@ import json
 import logging
 from typing import TYPE_CHECKING, Any, List, Optional, Union
 
+from django.conf import settings
+
 from ...app.models import App
 from ...core import EventDeliveryStatus
 from ...core.models import EventDelivery
@@ -23,7 +25,6 @@ from ...webhook.payloads import (
     generate_page_payload,
     generate_payment_payload,
     generate_product_deleted_payload,
-    generate_product_payload,
     generate_product_variant_payload,
     generate_product_variant_with_stock_payload,
     generate_requestor,
@@ -34,10 +35,13 @@ from ..base_plugin import BasePlugin, ExcludedShippingMethod
 from .const import CACHE_EXCLUDED_SHIPPING_KEY
 from .shipping import get_excluded_shipping_data, parse_list_shipping_methods_response
 from .tasks import (
+    DEFERRED_PAYLOAD_EVENTS,
     _get_webhooks_for_event,
+    defer_webhook_event,
     send_webhook_request_async,
     trigger_webhook_sync,
     trigger_webhooks_async,
+    trigger_webhooks_sync,
 )
 from .utils import (
     delivery_update,
@@ -47,6 +51,8 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
+    from django.db.models import Model
+
     from ...account.models import User
     from ...checkout.models import Checkout
     from ...discount.models import Sale
@@ -59,6 +65,7 @@ if TYPE_CHECKING:
     from ...shipping.interface import ShippingMethodData
     from ...translation.models import Translation
     from ...warehouse.models import Stock
+    from ...webhook.models import Webhook
 
 logger = logging.getLogger(__name__)
 
@@ -81,37 +88,43 @@ class WebhookPlugin(BasePlugin):
         super().__init__(*args, **kwargs)
         self.active = True
 
+    def _trigger_deferrable_event(
+        self, event_type: str, instance: "Model", webhooks: List["Webhook"]
+    ):
+        if settings.WEBHOOK_DEFERRED_PAYLOADS:
+            defer_webhook_event(event_type, instance, self.requestor)
+            return
+        _, generate_payload = DEFERRED_PAYLOAD_EVENTS[event_type]
+        data = generate_payload(instance, self.requestor)
+        trigger_webhooks_async(data, event_type, webhooks)
+
     def order_created(self, order: "Order", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         event_type = WebhookEventAsyncType.ORDER_CREATED
         if webhooks := _get_webhooks_for_event(event_type):
-            order_data = generate_order_payload(order, self.requestor)
-            trigger_webhooks_async(order_data, event_type, webhooks)
+            self._trigger_deferrable_event(event_type, order, webhooks)
 
     def order_confirmed(self, order: "Order", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         event_type = WebhookEventAsyncType.ORDER_CONFIRMED
         if webhooks := _get_webhooks_for_event(event_type):
-            order_data = generate_order_payload(order, self.requestor)
-            trigger_webhooks_async(order_data, event_type, webhooks)
+            self._trigger_deferrable_event(event_type, order, webhooks)
 
     def order_fully_paid(self, order: "Order", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         event_type = WebhookEventAsyncType.ORDER_FULLY_PAID
         if webhooks := _get_webhooks_for_event(event_type):
-            order_data = generate_order_payload(order, self.requestor)
-            trigger_webhooks_async(order_data, event_type, webhooks)
+            self._trigger_deferrable_event(event_type, order, webhooks)
 
     def order_updated(self, order: "Order", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         event_type = WebhookEventAsyncType.ORDER_UPDATED
         if webhooks := _get_webhooks_for_event(event_type):
-            order_data = generate_order_payload(order, self.requestor)
-            trigger_webhooks_async(order_data, event_type, webhooks)
+            self._trigger_deferrable_event(event_type, order, webhooks)
 
     def sale_created(
         self, sale: "Sale", current_catalogue: "NodeCatalogueInfo", previous_value: Any
@@ -191,32 +204,28 @@ class WebhookPlugin(BasePlugin):
             return previous_value
         event_type = WebhookEventAsyncType.ORDER_CANCELLED
         if webhooks := _get_webhooks_for_event(event_type):
-            order_data = generate_order_payload(order, self.requestor)
-            trigger_webhooks_async(order_data, event_type, webhooks)
+            self._trigger_deferrable_event(event_type, order, webhooks)
 
     def order_fulfilled(self, order: "Order", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         event_type = WebhookEventAsyncType.ORDER_FULFILLED
         if webhooks := _get_webhooks_for_event(event_type):
-            order_data = generate_order_payload(order, self.requestor)
-            trigger_webhooks_async(order_data, event_type, webhooks)
+            self._trigger_deferrable_event(event_type, order, webhooks)
 
     def draft_order_created(self, order: "Order", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         event_type = WebhookEventAsyncType.DRAFT_ORDER_CREATED
         if webhooks := _get_webhooks_for_event(event_type):
-            order_data = generate_order_payload(order, self.requestor)
-            trigger_webhooks_async(order_data, event_type, webhooks)
+            self._trigger_deferrable_event(event_type, order, webhooks)
 
     def draft_order_updated(self, order: "Order", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         event_type = WebhookEventAsyncType.DRAFT_ORDER_UPDATED
         if webhooks := _get_webhooks_for_event(event_type):
-            order_data = generate_order_payload(order, self.requestor)
-            trigger_webhooks_async(order_data, event_type, webhooks)
+            self._trigger_deferrable_event(event_type, order, webhooks)
 
     def draft_order_deleted(self, order: "Order", previous_value: Any) -> Any:
         if not self.active:
@@ -287,16 +296,14 @@ class WebhookPlugin(BasePlugin):
             return previous_value
         event_type = WebhookEventAsyncType.PRODUCT_CREATED
         if webhooks := _get_webhooks_for_event(event_type):
-            product_data = generate_product_payload(product, self.requestor)
-            trigger_webhooks_async(product_data, event_type, webhooks)
+            self._trigger_deferrable_event(event_type, product, webhooks)
 
     def product_updated(self, product: "Product", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         event_type = WebhookEventAsyncType.PRODUCT_UPDATED
         if webhooks := _get_webhooks_for_event(event_type):
-            product_data = generate_product_payload(product, self.requestor)
-            trigger_webhooks_async(product_data, event_type, webhooks)
+            self._trigger_deferrable_event(event_type, product, webhooks)
 
     def product_deleted(
         self, product: "Product", variants: List[int], previous_value: Any
@@ -605,17 +612,12 @@ class WebhookPlugin(BasePlugin):
         self, checkout: "Checkout", previous_value: Any
     ) -> List["ShippingMethodData"]:
         methods = []
-        apps = App.objects.for_event_type(
-            WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
-        ).prefetch_related("webhooks")
-        if apps:
+        event_type = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+        if webhooks := _get_webhooks_for_event(event_type):
             payload = generate_checkout_payload(checkout, self.requestor)
-            for app in apps:
-                response_data = trigger_webhook_sync(
-                    event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
-                    data=payload,
-                    app=app,
-                )
+            for app, response_data in trigger_webhooks_sync(
+                event_type, payload, webhooks
+            ):
                 if response_data:
                     shipping_methods = parse_list_shipping_methods_response(
                         response_data, app
@@ -13,7 +13,7 @@ from ...graphql.shipping.types import ShippingMethod
 from ...shipping.interface import ShippingMethodData
 from ..base_plugin import ExcludedShippingMethod
 from .const import CACHE_EXCLUDED_SHIPPING_TIME, EXCLUDED_SHIPPING_REQUEST_TIMEOUT
-from .tasks import _get_webhooks_for_event, trigger_webhook_sync
+from .tasks import _get_webhooks_for_event, trigger_webhooks_sync
 from .utils import APP_ID_PREFIX
 
 if TYPE_CHECKING:
@@ -57,7 +57,7 @@ def get_excluded_shipping_methods_or_fetch(
     """Return data of all excluded shipping methods.
 
     The data will be fetched from the cache. If missing it will fetch it from all
-    defined webhooks by calling a request to each of them one by one.
+    defined webhooks by calling them concurrently.
     """
     cached_data = cache.get(cache_key)
     if cached_data:
@@ -67,13 +67,10 @@ def get_excluded_shipping_methods_or_fetch(
 
     excluded_methods = []
     # Gather responses from webhooks
-    for webhook in webhooks:
-        response_data = trigger_webhook_sync(
-            event_type,
-            payload,
-            webhook.app,
-            EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
-        )
+    responses = trigger_webhooks_sync(
+        event_type, payload, webhooks, EXCLUDED_SHIPPING_REQUEST_TIMEOUT
+    )
+    for _app, response_data in responses:
         if response_data:
             excluded_methods.extend(
                 get_excluded_shipping_methods_from_response(response_data)
@@ -1,9 +1,27 @@
 import json
 import logging
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from datetime import timedelta
 from enum import Enum
+from functools import partial
 from json import JSONDecodeError
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 from urllib.parse import urlparse, urlunparse
 
 import boto3
@@ -11,18 +29,30 @@ import requests
 from botocore.exceptions import ClientError
 from celery.exceptions import MaxRetriesExceededError
 from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from google.cloud import pubsub_v1
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
+from ...account.models import User
+from ...app.models import App
 from ...celeryconf import app
 from ...core import EventDeliveryStatus
-from ...core.models import EventDelivery, EventPayload
+from ...core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ...core.tracing import webhooks_opentracing_trace
+from ...order.models import Order
 from ...payment import PaymentError
+from ...product.models import Product
 from ...settings import WEBHOOK_SYNC_TIMEOUT, WEBHOOK_TIMEOUT
 from ...site.models import Site
-from ...webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
-from ...webhook.models import Webhook
+from ...webhook.event_types import WebhookEventAsyncType
+from ...webhook.models import BatchedWebhookEvent, DeferredWebhookEvent, Webhook
+from ...webhook.payloads import generate_order_payload, generate_product_payload
+from ...webhook.utils import get_required_permission, get_webhooks_registry
 from . import signature_for_payload
 from .utils import (
     attempt_update,
@@ -34,11 +64,42 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
-    from ...app.models import App
+    from django.db.models import Model
 
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(__name__)
 
+WEBHOOK_RETRY_BACKOFF = 10
+WEBHOOK_MAX_RETRIES = 5
+
+AWS_SQS_MAX_BATCH_SIZE = 10
+BATCHED_WEBHOOK_EVENTS_CHUNK_SIZE = 5000
+GOOGLE_CLOUD_PUBSUB_EXCEPTIONS = (
+    pubsub_v1.publisher.exceptions.MessageTooLargeError,
+    RuntimeError,
+)
+
+_http_sessions: Dict[str, requests.Session] = {}
+_http_sessions_lock = Lock()
+
+_publisher_clients: Dict[Hashable, Tuple[float, Any]] = {}
+_publisher_clients_lock = Lock()
+
+# Events of which payloads can be generated by a worker from the object ID, mapped
+# to the model of the object and the payload generator.
+DEFERRED_PAYLOAD_EVENTS: Dict[str, Tuple[Type["Model"], Callable]] = {
+    WebhookEventAsyncType.ORDER_CREATED: (Order, generate_order_payload),
+    WebhookEventAsyncType.ORDER_CONFIRMED: (Order, generate_order_payload),
+    WebhookEventAsyncType.ORDER_FULLY_PAID: (Order, generate_order_payload),
+    WebhookEventAsyncType.ORDER_UPDATED: (Order, generate_order_payload),
+    WebhookEventAsyncType.ORDER_CANCELLED: (Order, generate_order_payload),
+    WebhookEventAsyncType.ORDER_FULFILLED: (Order, generate_order_payload),
+    WebhookEventAsyncType.DRAFT_ORDER_CREATED: (Order, generate_order_payload),
+    WebhookEventAsyncType.DRAFT_ORDER_UPDATED: (Order, generate_order_payload),
+    WebhookEventAsyncType.PRODUCT_CREATED: (Product, generate_product_payload),
+    WebhookEventAsyncType.PRODUCT_UPDATED: (Product, generate_product_payload),
+}
+
 
 class WebhookSchemes(str, Enum):
     HTTP = "http"
@@ -47,6 +108,13 @@ class WebhookSchemes(str, Enum):
     GOOGLE_CLOUD_PUBSUB = "gcpubsub"
 
 
+@dataclass
+class WebhookMessage:
+    message: bytes
+    signature: str
+    event_type: str
+
+
 @dataclass
 class WebhookResponse:
     content: str
@@ -57,11 +125,17 @@ class WebhookResponse:
 
 
 def _get_webhooks_for_event(event_type, webhooks=None):
-    """Get active webhooks from the database for an event."""
+    """Get active webhooks for an event.
+
+    Webhooks of all apps are read from the process-wide registry, unless it's
+    disabled with `WEBHOOKS_REGISTRY_TIMEOUT`. Given webhooks are filtered
+    in the database.
+    """
+    if webhooks is None and settings.WEBHOOKS_REGISTRY_TIMEOUT:
+        return get_webhooks_registry().get(event_type, [])
+
     permissions = {}
-    required_permission = WebhookEventAsyncType.PERMISSIONS.get(
-        event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
-    )
+    required_permission = get_required_permission(event_type)
     if required_permission:
         app_label, codename = required_permission.value.split(".")
         permissions["app__permissions__content_type__app_label"] = app_label
@@ -83,16 +157,207 @@ def _get_webhooks_for_event(event_type, webhooks=None):
 
 
 def trigger_webhooks_async(data, event_type, webhooks):
+    batched_webhooks = []
+    if settings.WEBHOOK_EVENTS_BATCHING:
+        batched_webhooks = [webhook for webhook in webhooks if webhook.batch_events]
+    if batched_webhooks and batch_webhook_event(data, event_type, batched_webhooks):
+        webhooks = [webhook for webhook in webhooks if not webhook.batch_events]
+        if not webhooks:
+            return
     payload = EventPayload.objects.create(payload=data)
     deliveries = create_event_delivery_list_for_webhooks(
         webhooks=webhooks,
         event_payload=payload,
         event_type=event_type,
     )
+    send_event_deliveries_async(deliveries)
+
+
+def send_event_deliveries_async(deliveries: Iterable[EventDelivery]):
+    if settings.WEBHOOK_BATCH_DELIVERY:
+        send_webhook_requests_batch_task.delay([delivery.id for delivery in deliveries])
+        return
     for delivery in deliveries:
         send_webhook_request_async.delay(delivery.id)
 
 
+def batch_webhook_event(data: str, event_type: str, webhooks: List[Webhook]) -> bool:
+    """Store objects of the payload to be sent in batches to the given webhooks.
+
+    Return False when the payload isn't a list of objects with IDs, which can't
+    be batched.
+    """
+    try:
+        objects = json.loads(data)
+        object_ids = [str(obj["id"]) for obj in objects]
+    except (JSONDecodeError, KeyError, TypeError):
+        return False
+    BatchedWebhookEvent.objects.bulk_create(
+        [
+            BatchedWebhookEvent(
+                webhook=webhook,
+                event_type=event_type,
+                object_id=object_id,
+                payload=json.dumps(obj),
+            )
+            for webhook in webhooks
+            for object_id, obj in zip(object_ids, objects)
+        ]
+    )
+    return True
+
+
+@app.task
+def send_batched_webhook_events_task():
+    """Send events stored for webhooks receiving events in batches.
+
+    Events are grouped by webhook and event type. Repeated events of the same object
+    are coalesced into the latest one. Each delivery contains a list of at most
+    `WEBHOOK_EVENTS_BATCH_SIZE` objects.
+
+    At most `BATCHED_WEBHOOK_EVENTS_CHUNK_SIZE` oldest events are locked and sent
+    by one task; the task schedules itself again when more events may be left.
+    """
+    chunk_size = BATCHED_WEBHOOK_EVENTS_CHUNK_SIZE
+    deliveries = []
+    with transaction.atomic():
+        events = list(
+            BatchedWebhookEvent.objects.select_for_update(
+                of=("self",), skip_locked=True
+            )
+            .select_related("webhook__app")
+            .order_by("pk")[:chunk_size]
+        )
+        webhooks = {}
+        grouped_events: Dict[Tuple[int, str], Dict[str, str]] = defaultdict(dict)
+        for event in events:
+            webhooks[event.webhook_id] = event.webhook
+            objects = grouped_events[(event.webhook_id, event.event_type)]
+            objects.pop(event.object_id, None)
+            objects[event.object_id] = event.payload
+
+        batch_size = settings.WEBHOOK_EVENTS_BATCH_SIZE
+        for (webhook_id, event_type), objects in grouped_events.items():
+            webhook = webhooks[webhook_id]
+            if not webhook.is_active or not webhook.app.is_active:
+                continue
+            payloads = list(objects.values())
+            for start in range(0, len(payloads), batch_size):
+                end = start + batch_size
+                event_payload = EventPayload.objects.create(
+                    payload="[%s]" % ", ".join(payloads[start:end])
+                )
+                deliveries.extend(
+                    create_event_delivery_list_for_webhooks(
+                        webhooks=[webhook],
+                        event_payload=event_payload,
+                        event_type=event_type,
+                    )
+                )
+        BatchedWebhookEvent.objects.filter(
+            pk__in=[event.pk for event in events]
+        ).delete()
+    send_event_deliveries_async(deliveries)
+    if len(events) == chunk_size:
+        send_batched_webhook_events_task.delay()
+
+
+def defer_webhook_event(event_type: str, instance: "Model", requestor=None):
+    """Record the event to generate and send its payload in a worker.
+
+    The event is recorded after the transaction is committed. Payloads are
+    generated from the state of the object at the time the worker processes
+    the event.
+    """
+    model, _ = DEFERRED_PAYLOAD_EVENTS[event_type]
+    object_type = model._meta.label_lower
+    object_id = str(instance.pk)
+    requestor_user_id = requestor.pk if isinstance(requestor, User) else None
+    requestor_app_id = requestor.pk if isinstance(requestor, App) else None
+
+    def record_event():
+        DeferredWebhookEvent.objects.create(
+            event_type=event_type,
+            object_type=object_type,
+            object_id=object_id,
+            requestor_user_id=requestor_user_id,
+            requestor_app_id=requestor_app_id,
+        )
+        send_deferred_webhook_events_task.delay(object_type, object_id)
+
+    transaction.on_commit(record_event)
+
+
+@app.task(
+    bind=True,
+    retry_backoff=WEBHOOK_RETRY_BACKOFF,
+    retry_kwargs={"max_retries": WEBHOOK_MAX_RETRIES},
+)
+def send_deferred_webhook_events_task(self, object_type: str, object_id: str):
+    """Generate and send payloads of the deferred events of an object.
+
+    Events of the object are processed under a database advisory lock in the order
+    they were recorded, so concurrent tasks can't send them out of order. Payloads
+    of events with the same generator and requestor are generated once.
+
+    When an event fails, the task is retried starting from that event; once
+    retries are exhausted the event is dropped and the remaining ones are sent.
+    """
+    lock_key = f"deferred_webhook_events-{object_type}-{object_id}"
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_lock(hashtext(%s))", [lock_key])
+    try:
+        events = DeferredWebhookEvent.objects.filter(
+            object_type=object_type, object_id=object_id
+        ).select_related("requestor_user", "requestor_app")
+        instances: Dict[Type["Model"], Optional["Model"]] = {}
+        payloads: Dict[Tuple[Callable, Optional[int], Optional[int]], str] = {}
+        for event in events:
+            try:
+                _send_deferred_webhook_event(event, instances, payloads)
+            except Exception:
+                try:
+                    countdown = self.retry_backoff * (2**self.request.retries)
+                    self.retry(countdown=countdown, **self.retry_kwargs)
+                except MaxRetriesExceededError:
+                    task_logger.exception(
+                        "Failed to send the %s event of %s %s: exceeded retry "
+                        "limit.",
+                        event.event_type,
+                        object_type,
+                        object_id,
+                    )
+            event.delete()
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(hashtext(%s))", [lock_key])
+
+
+def _send_deferred_webhook_event(
+    event: DeferredWebhookEvent,
+    instances: Dict[Type["Model"], Optional["Model"]],
+    payloads: Dict[Tuple[Callable, Optional[int], Optional[int]], str],
+):
+    model, generate_payload = DEFERRED_PAYLOAD_EVENTS[event.event_type]
+    if model not in instances:
+        instances[model] = model.objects.filter(pk=event.object_id).first()
+    instance = instances[model]
+    if instance is None:
+        task_logger.info(
+            "Skipped the %s event of deleted %s %s.",
+            event.event_type,
+            event.object_type,
+            event.object_id,
+        )
+        return
+    if webhooks := _get_webhooks_for_event(event.event_type):
+        key = (generate_payload, event.requestor_user_id, event.requestor_app_id)
+        if key not in payloads:
+            requestor = event.requestor_user or event.requestor_app
+            payloads[key] = generate_payload(instance, requestor)
+        trigger_webhooks_async(payloads[key], event.event_type, webhooks)
+
+
 def trigger_webhook_sync(
     event_type: str, data: str, app: "App", timeout=None
 ) -> Optional[Dict[Any, Any]]:
@@ -115,8 +380,207 @@ def trigger_webhook_sync(
     return send_webhook_request_sync(app.name, delivery, **kwargs)
 
 
+def trigger_webhooks_sync(
+    event_type: str, data: str, webhooks: Iterable[Webhook], timeout=None
+) -> List[Tuple["App", Optional[Dict[Any, Any]]]]:
+    """Send a synchronous webhook request to many apps at once.
+
+    Requests are sent concurrently and share a single deadline of `timeout`
+    seconds, so the call takes about as long as the slowest app that responds in
+    time. Apps that fail or don't respond before the deadline get `None` as their
+    response. A single webhook of every app is called, like `trigger_webhook_sync`
+    does.
+    """
+    webhooks_per_app: Dict[int, Webhook] = {}
+    for webhook in webhooks:
+        webhooks_per_app.setdefault(webhook.app_id, webhook)
+    webhooks = list(webhooks_per_app.values())
+    if not webhooks:
+        return []
+    if len(webhooks) == 1 and not settings.WEBHOOK_SYNC_SKIP_SUCCESSFUL_DELIVERIES:
+        # A single request gains nothing from threads
+        app = webhooks[0].app
+        return [(app, trigger_webhook_sync(event_type, data, app, timeout))]
+
+    timeout = timeout or WEBHOOK_SYNC_TIMEOUT
+    deliveries: Sequence[Optional[EventDelivery]] = [None] * len(webhooks)
+    if not settings.WEBHOOK_SYNC_SKIP_SUCCESSFUL_DELIVERIES:
+        deliveries = _create_sync_deliveries(event_type, data, webhooks)
+
+    domain = Site.objects.get_current().domain
+    message = data.encode("utf-8")
+    app_names = ", ".join(webhook.app.name for webhook in webhooks)
+    with webhooks_opentracing_trace(event_type, domain, sync=True, app_name=app_names):
+        responses = _send_webhook_requests_sync(
+            webhooks, message, domain, event_type, timeout
+        )
+
+    failed = []
+    successful_deliveries = []
+    results: List[Tuple["App", Optional[Dict[Any, Any]]]] = []
+    for webhook, delivery, response in zip(webhooks, deliveries, responses):
+        response_data = None
+        if response.status == EventDeliveryStatus.SUCCESS:
+            try:
+                response_data = json.loads(response.content)
+            except JSONDecodeError as e:
+                response.content = str(e)
+                response.status = EventDeliveryStatus.FAILED
+        if response.status == EventDeliveryStatus.SUCCESS:
+            if delivery:
+                successful_deliveries.append(delivery.pk)
+        else:
+            logger.warning(
+                "[Webhook] Failed sync request to %r for event %r: %r.",
+                webhook.target_url,
+                event_type,
+                response.content,
+            )
+            failed.append((webhook, delivery, response))
+        results.append((webhook.app, response_data))
+
+    _store_sync_webhook_responses(event_type, data, failed)
+    if successful_deliveries:
+        EventDelivery.objects.filter(pk__in=successful_deliveries).delete()
+    return results
+
+
+def _create_sync_deliveries(
+    event_type: str, data: str, webhooks: List[Webhook]
+) -> List[EventDelivery]:
+    event_payload = EventPayload.objects.create(payload=data)
+    return EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                status=EventDeliveryStatus.PENDING,
+                event_type=event_type,
+                payload=event_payload,
+                webhook=webhook,
+            )
+            for webhook in webhooks
+        ]
+    )
+
+
+def _send_webhook_requests_sync(
+    webhooks: List[Webhook], message: bytes, domain: str, event_type: str, timeout
+) -> List[WebhookResponse]:
+    """Send requests to webhooks in threads and wait for them until the deadline.
+
+    Threads don't access the database, so they don't open new connections.
+    """
+    pool = ThreadPoolExecutor(
+        max_workers=min(len(webhooks), settings.WEBHOOK_BATCH_CONCURRENCY)
+    )
+    futures = [
+        pool.submit(
+            _send_webhook_request_sync, webhook, message, domain, event_type, timeout
+        )
+        for webhook in webhooks
+    ]
+    done, _ = wait(futures, timeout=timeout)
+    # Don't wait for requests that exceeded the deadline, their responses are
+    # ignored anyway.
+    pool.shutdown(wait=False)
+    return [
+        future.result()
+        if future in done
+        else WebhookResponse(
+            content="Request exceeded the deadline.",
+            status=EventDeliveryStatus.FAILED,
+            duration=timeout,
+        )
+        for future in futures
+    ]
+
+
+def _send_webhook_request_sync(
+    webhook: Webhook, message: bytes, domain: str, event_type: str, timeout
+) -> WebhookResponse:
+    if urlparse(webhook.target_url).scheme.lower() not in [
+        WebhookSchemes.HTTP,
+        WebhookSchemes.HTTPS,
+    ]:
+        return WebhookResponse(
+            content="Unknown webhook scheme: %r" % (webhook.target_url,),
+            status=EventDeliveryStatus.FAILED,
+        )
+    try:
+        return send_webhook_using_http(
+            webhook.target_url,
+            message,
+            domain,
+            signature_for_payload(message, webhook.secret_key),
+            event_type,
+            timeout=timeout,
+            session=get_http_session(webhook.target_url),
+        )
+    except RequestException as e:
+        response = WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
+        if e.response is not None:
+            response.content = e.response.text
+            response.response_headers = dict(e.response.headers)
+        return response
+
+
+def _store_sync_webhook_responses(
+    event_type: str,
+    data: str,
+    failed: List[Tuple[Webhook, Optional[EventDelivery], WebhookResponse]],
+):
+    """Store failed deliveries with their attempts, creating missing deliveries."""
+    if not failed:
+        return
+    missing = [webhook for webhook, delivery, _ in failed if delivery is None]
+    created = iter(
+        _create_sync_deliveries(event_type, data, missing) if missing else []
+    )
+    deliveries = [delivery or next(created) for _, delivery, _ in failed]
+    EventDeliveryAttempt.objects.bulk_create(
+        [
+            EventDeliveryAttempt(
+                delivery=delivery,
+                duration=response.duration,
+                response=response.content,
+                response_headers=json.dumps(response.response_headers),
+                request_headers=json.dumps(response.request_headers),
+                status=EventDeliveryStatus.FAILED,
+            )
+            for delivery, (_, _, response) in zip(deliveries, failed)
+        ]
+    )
+    EventDelivery.objects.filter(
+        pk__in=[delivery.pk for delivery in deliveries]
+    ).update(status=EventDeliveryStatus.FAILED)
+
+
+def get_http_session(target_url: str) -> requests.Session:
+    """Return a session shared by all requests sent to the target URL's host.
+
+    Sessions are kept for the lifetime of the worker process, so keep-alive
+    connections are reused between deliveries.
+    """
+    parts = urlparse(target_url)
+    key = f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+    with _http_sessions_lock:
+        session = _http_sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=settings.WEBHOOK_BATCH_CONCURRENCY)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _http_sessions[key] = session
+    return session
+
+
 def send_webhook_using_http(
-    target_url, message, domain, signature, event_type, timeout=WEBHOOK_TIMEOUT
+    target_url,
+    message,
+    domain,
+    signature,
+    event_type,
+    timeout=WEBHOOK_TIMEOUT,
+    session: Optional[requests.Session] = None,
 ):
     """Send a webhook request using http / https protocol.
 
@@ -126,6 +590,8 @@ def send_webhook_using_http(
     :param signature: Webhook secret key checksum.
     :param event_type: Webhook event type.
     :param timeout: Request timeout.
+    :param session: Session used to reuse connections, if not provided a new
+    connection is opened.
 
     :return: WebhookResponse object.
     """
@@ -140,7 +606,8 @@ def send_webhook_using_http(
         "Saleor-Signature": signature,
     }
 
-    response = requests.post(target_url, data=message, headers=headers, timeout=timeout)
+    post = session.post if session else requests.post
+    response = post(target_url, data=message, headers=headers, timeout=timeout)
     return WebhookResponse(
         content=response.text,
         request_headers=headers,
@@ -152,23 +619,56 @@ def send_webhook_using_http(
     )
 
 
-def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_type):
-    parts = urlparse(target_url)
+def get_publisher_client(key: Hashable, create_client: Callable[[], Any]) -> Any:
+    """Return a cached client for the given key or create a new one.
+
+    Clients are kept for `WEBHOOK_PUBLISHER_CLIENT_TIMEOUT` seconds, so rotated
+    credentials are eventually picked up. Creating a client can be much slower
+    than sending a message with it.
+    """
+    timeout = settings.WEBHOOK_PUBLISHER_CLIENT_TIMEOUT
+    if not timeout:
+        return create_client()
+    now = time.monotonic()
+    # Clients are created while holding the lock, as boto3 doesn't support creating
+    # clients concurrently from the default session.
+    with _publisher_clients_lock:
+        cached = _publisher_clients.get(key)
+        if cached and now - cached[0] < timeout:
+            return cached[1]
+        client = create_client()
+        _publisher_clients[key] = (now, client)
+        return client
+
+
+def clear_publisher_clients():
+    with _publisher_clients_lock:
+        _publisher_clients.clear()
+
+
+def _get_aws_sqs_client(parts):
     region = "us-east-1"
     hostname_parts = parts.hostname.split(".")
     if len(hostname_parts) == 4 and hostname_parts[0] == "sqs":
         region = hostname_parts[1]
-    client = boto3.client(
-        "sqs",
-        region_name=region,
-        aws_access_key_id=parts.username,
-        aws_secret_access_key=parts.password,
+    return get_publisher_client(
+        ("sqs", region, parts.username, parts.password),
+        lambda: boto3.client(
+            "sqs",
+            region_name=region,
+            aws_access_key_id=parts.username,
+            aws_secret_access_key=parts.password,
+        ),
     )
-    queue_url = urlunparse(
+
+
+def _get_aws_sqs_queue_url(parts):
+    return urlunparse(
         ("https", parts.hostname, parts.path, parts.params, parts.query, parts.fragment)
     )
-    is_fifo = parts.path.endswith(".fifo")
 
+
+def _get_aws_sqs_message_kwargs(parts, message, domain, signature, event_type):
     msg_attributes = {
         "SaleorDomain": {"DataType": "String", "StringValue": domain},
         "EventType": {"DataType": "String", "StringValue": event_type},
@@ -177,22 +677,92 @@ def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_typ
         msg_attributes["Signature"] = {"DataType": "String", "StringValue": signature}
 
     message_kwargs = {
-        "QueueUrl": queue_url,
         "MessageAttributes": msg_attributes,
         "MessageBody": message.decode("utf-8"),
     }
-    if is_fifo:
+    if parts.path.endswith(".fifo"):
         message_kwargs["MessageGroupId"] = domain
+    return message_kwargs
+
+
+def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_type):
+    parts = urlparse(target_url)
+    client = _get_aws_sqs_client(parts)
+    message_kwargs = _get_aws_sqs_message_kwargs(
+        parts, message, domain, signature, event_type
+    )
     with catch_duration_time() as duration:
-        response = client.send_message(**message_kwargs)
+        response = client.send_message(
+            QueueUrl=_get_aws_sqs_queue_url(parts), **message_kwargs
+        )
         return WebhookResponse(content=response, duration=duration())
 
 
+def send_webhooks_using_aws_sqs_batch(
+    target_url, messages: List[WebhookMessage], domain
+) -> List[WebhookResponse]:
+    """Send messages to the queue using as few requests as possible.
+
+    Return a response for every message, in the order of the messages.
+    """
+    parts = urlparse(target_url)
+    client = _get_aws_sqs_client(parts)
+    queue_url = _get_aws_sqs_queue_url(parts)
+    responses: List[WebhookResponse] = []
+    for offset in range(0, len(messages), AWS_SQS_MAX_BATCH_SIZE):
+        entries = [
+            {
+                "Id": str(index),
+                **_get_aws_sqs_message_kwargs(
+                    parts,
+                    message.message,
+                    domain,
+                    message.signature,
+                    message.event_type,
+                ),
+            }
+            for index, message in enumerate(messages[offset:][:AWS_SQS_MAX_BATCH_SIZE])
+        ]
+        with catch_duration_time() as duration:
+            try:
+                response = client.send_message_batch(
+                    QueueUrl=queue_url, Entries=entries
+                )
+            except ClientError as e:
+                responses.extend(
+                    WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
+                    for _ in entries
+                )
+                continue
+            response_duration = duration()
+        results = {
+            result["Id"]: (result, EventDeliveryStatus.SUCCESS)
+            for result in response.get("Successful", [])
+        }
+        results.update(
+            {
+                result["Id"]: (result, EventDeliveryStatus.FAILED)
+                for result in response.get("Failed", [])
+            }
+        )
+        for entry in entries:
+            content, status = results.get(
+                entry["Id"],
+                ("Message missing in response.", EventDeliveryStatus.FAILED),
+            )
+            responses.append(
+                WebhookResponse(
+                    content=content, duration=response_duration, status=status
+                )
+            )
+    return responses
+
+
 def send_webhook_using_google_cloud_pubsub(
     target_url, message, domain, signature, event_type
 ):
     parts = urlparse(target_url)
-    client = pubsub_v1.PublisherClient()
+    client = get_publisher_client(("gcpubsub",), pubsub_v1.PublisherClient)
     topic_name = parts.path[1:]  # drop the leading slash
     with catch_duration_time() as duration:
         future = client.publish(
@@ -207,21 +777,77 @@ def send_webhook_using_google_cloud_pubsub(
         return WebhookResponse(content=response, duration=response_duration)
 
 
+def send_webhooks_using_google_cloud_pubsub_batch(
+    target_url, messages: List[WebhookMessage], domain
+) -> List[WebhookResponse]:
+    """Publish messages to the topic and wait for all of them at once.
+
+    The client batches messages published within a short time window into a single
+    request. Return a response for every message, in the order of the messages.
+    """
+    parts = urlparse(target_url)
+    batch_settings = pubsub_v1.types.BatchSettings(
+        max_messages=settings.WEBHOOK_BATCH_SIZE
+    )
+    client = get_publisher_client(
+        ("gcpubsub", batch_settings),
+        lambda: pubsub_v1.PublisherClient(batch_settings=batch_settings),
+    )
+    topic_name = parts.path[1:]  # drop the leading slash
+    futures: List[Any] = []
+    with catch_duration_time() as duration:
+        for message in messages:
+            try:
+                futures.append(
+                    client.publish(
+                        topic_name,
+                        message.message,
+                        saleorDomain=domain,
+                        eventType=message.event_type,
+                        signature=message.signature,
+                    )
+                )
+            except GOOGLE_CLOUD_PUBSUB_EXCEPTIONS as e:
+                futures.append(e)
+        response_duration = duration()
+
+    responses = []
+    for future in futures:
+        if isinstance(future, Exception):
+            response = WebhookResponse(
+                content=str(future), status=EventDeliveryStatus.FAILED
+            )
+        else:
+            try:
+                response = WebhookResponse(
+                    content=future.result(), duration=response_duration
+                )
+            except Exception as e:
+                response = WebhookResponse(
+                    content=str(e), status=EventDeliveryStatus.FAILED
+                )
+        responses.append(response)
+    return responses
+
+
 def send_webhook_using_scheme_method(
-    target_url, domain, secret, event_type, data
+    target_url, domain, secret, event_type, data, http_session=None
 ) -> WebhookResponse:
     parts = urlparse(target_url)
     message = data.encode("utf-8")
     signature = signature_for_payload(message, secret)
+    send_using_http = send_webhook_using_http
+    if http_session:
+        send_using_http = partial(send_webhook_using_http, session=http_session)
     scheme_matrix: Dict[
         WebhookSchemes, Tuple[Callable, Tuple[Type[Exception], ...]]
     ] = {
-        WebhookSchemes.HTTP: (send_webhook_using_http, (RequestException,)),
-        WebhookSchemes.HTTPS: (send_webhook_using_http, (RequestException,)),
+        WebhookSchemes.HTTP: (send_using_http, (RequestException,)),
+        WebhookSchemes.HTTPS: (send_using_http, (RequestException,)),
         WebhookSchemes.AWS_SQS: (send_webhook_using_aws_sqs, (ClientError,)),
         WebhookSchemes.GOOGLE_CLOUD_PUBSUB: (
             send_webhook_using_google_cloud_pubsub,
-            (pubsub_v1.publisher.exceptions.MessageTooLargeError, RuntimeError),
+            GOOGLE_CLOUD_PUBSUB_EXCEPTIONS,
         ),
     }
     if method := scheme_matrix.get(parts.scheme.lower()):
@@ -241,8 +867,8 @@ def send_webhook_using_scheme_method(
 
 @app.task(
     bind=True,
-    retry_backoff=10,
-    retry_kwargs={"max_retries": 5},
+    retry_backoff=WEBHOOK_RETRY_BACKOFF,
+    retry_kwargs={"max_retries": WEBHOOK_MAX_RETRIES},
 )
 def send_webhook_request_async(self, event_delivery_id):
     try:
@@ -307,6 +933,254 @@ def send_webhook_request_async(self, event_delivery_id):
     clear_successful_delivery(delivery)
 
 
+def _is_delivery_due(delivery: EventDelivery, now) -> bool:
+    """Check if the backoff after the last failed attempt has already passed."""
+    attempts_count = delivery.attempts_count  # type: ignore
+    if not attempts_count:
+        return True
+    countdown = WEBHOOK_RETRY_BACKOFF * (2 ** (attempts_count - 1))
+    last_attempt_at = delivery.last_attempt_at  # type: ignore
+    return last_attempt_at + timedelta(seconds=countdown) <= now
+
+
+def _send_delivery(delivery: EventDelivery, domain: str) -> WebhookResponse:
+    webhook = delivery.webhook
+    if not webhook or not delivery.payload:
+        return WebhookResponse(
+            content="Webhook or payload not found.", status=EventDeliveryStatus.FAILED
+        )
+    try:
+        with webhooks_opentracing_trace(
+            delivery.event_type, domain, app_name=webhook.app.name
+        ):
+            return send_webhook_using_scheme_method(
+                webhook.target_url,
+                domain,
+                webhook.secret_key,
+                delivery.event_type,
+                delivery.payload.payload,
+                http_session=get_http_session(webhook.target_url),
+            )
+    except ValueError as e:
+        return WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
+
+
+def _publish_deliveries(
+    deliveries: List[EventDelivery], domain: str
+) -> List[WebhookResponse]:
+    """Publish deliveries of a single webhook using a batch method of its scheme."""
+    webhook = deliveries[0].webhook
+    if urlparse(webhook.target_url).scheme.lower() == WebhookSchemes.AWS_SQS:
+        publish = send_webhooks_using_aws_sqs_batch
+    else:
+        publish = send_webhooks_using_google_cloud_pubsub_batch
+    messages = []
+    for delivery in deliveries:
+        message = delivery.payload.payload.encode("utf-8")
+        signature = signature_for_payload(message, webhook.secret_key)
+        messages.append(WebhookMessage(message, signature, delivery.event_type))
+    try:
+        with webhooks_opentracing_trace(
+            "publish_batch", domain, app_name=webhook.app.name
+        ):
+            return publish(webhook.target_url, messages, domain)
+    except Exception as e:
+        # Any error of the broker client fails only this group, so the responses
+        # of the other deliveries of the batch are still recorded.
+        task_logger.warning(
+            "[Webhook ID: %r] Failed to publish %r deliveries to %r: %r.",
+            webhook.id,
+            len(deliveries),
+            webhook.target_url,
+            e,
+        )
+        return [
+            WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
+            for _ in deliveries
+        ]
+
+
+def claim_deliveries(
+    deliveries: List[EventDelivery], task_id: Optional[str] = None
+) -> List[Tuple[EventDelivery, EventDeliveryAttempt]]:
+    """Create pending attempts of deliveries which are due to be sent.
+
+    Deliveries must be fetched with `attempts_count` and `last_attempt_at`
+    annotations. A pending attempt marks the delivery as being sent, so other
+    tasks skip it until `get_delivery_claim_timeout` passes.
+    """
+    now = timezone.now()
+    deliveries = [
+        delivery for delivery in deliveries if _is_delivery_due(delivery, now)
+    ]
+    attempts = EventDeliveryAttempt.objects.bulk_create(
+        [
+            EventDeliveryAttempt(
+                delivery=delivery,
+                task_id=task_id,
+                status=EventDeliveryStatus.PENDING,
+            )
+            for delivery in deliveries
+        ]
+    )
+    return list(zip(deliveries, attempts))
+
+
+def get_delivery_claim_timeout() -> timedelta:
+    """Return the time after which a delivery claimed by a task may be claimed again.
+
+    It's the longest time a batch of deliveries can take to send.
+    """
+    rounds = -(-settings.WEBHOOK_BATCH_SIZE // settings.WEBHOOK_BATCH_CONCURRENCY)
+    return timedelta(seconds=WEBHOOK_TIMEOUT * (rounds + 1))
+
+
+def send_webhook_requests_batch(
+    claimed_deliveries: List[Tuple[EventDelivery, EventDeliveryAttempt]], domain: str
+):
+    """Send a batch of claimed deliveries concurrently and store the results in bulk.
+
+    Requests are sent outside of a database transaction. Successful deliveries
+    are deleted, failed ones get their attempt updated and stay pending until they
+    exceed the retry limit.
+    """
+    if not claimed_deliveries:
+        return
+    deliveries = [delivery for delivery, _ in claimed_deliveries]
+
+    # Message brokers accept many messages in a single request, so deliveries to
+    # them are grouped by webhook. HTTP deliveries are sent one by one.
+    batch_schemes = {WebhookSchemes.AWS_SQS, WebhookSchemes.GOOGLE_CLOUD_PUBSUB}
+    deliveries_to_publish = defaultdict(list)
+    deliveries_to_send = []
+    for delivery in deliveries:
+        webhook = delivery.webhook
+        if (
+            webhook
+            and delivery.payload
+            and urlparse(webhook.target_url).scheme.lower() in batch_schemes
+        ):
+            deliveries_to_publish[webhook.pk].append(delivery)
+        else:
+            deliveries_to_send.append(delivery)
+
+    # Only the network calls are made in threads, all data required to send the
+    # requests has been fetched already.
+    responses_map: Dict[int, WebhookResponse] = {}
+    with ThreadPoolExecutor(max_workers=settings.WEBHOOK_BATCH_CONCURRENCY) as pool:
+        send_futures = [
+            (delivery, pool.submit(_send_delivery, delivery, domain))
+            for delivery in deliveries_to_send
+        ]
+        publish_futures = [
+            (group, pool.submit(_publish_deliveries, group, domain))
+            for group in deliveries_to_publish.values()
+        ]
+        for delivery, send_future in send_futures:
+            responses_map[delivery.pk] = send_future.result()
+        for group, publish_future in publish_futures:
+            for delivery, response in zip(group, publish_future.result()):
+                responses_map[delivery.pk] = response
+    responses = [responses_map[delivery.pk] for delivery in deliveries]
+
+    attempts = []
+    successful_ids = []
+    failed_ids = []
+    for (delivery, attempt), response in zip(claimed_deliveries, responses):
+        if response.status == EventDeliveryStatus.SUCCESS:
+            successful_ids.append(delivery.id)
+            continue
+        attempt.duration = response.duration
+        attempt.response = response.content
+        attempt.response_headers = json.dumps(response.response_headers)
+        attempt.request_headers = json.dumps(response.request_headers)
+        attempt.status = response.status
+        attempts.append(attempt)
+        task_logger.info(
+            "[Webhook ID: %r] Failed request to %r: %r for event: %r.",
+            delivery.webhook_id,
+            delivery.webhook.target_url if delivery.webhook else None,
+            response.content,
+            delivery.event_type,
+        )
+        if delivery.attempts_count >= WEBHOOK_MAX_RETRIES:  # type: ignore
+            failed_ids.append(delivery.id)
+
+    with transaction.atomic():
+        EventDeliveryAttempt.objects.bulk_update(
+            attempts,
+            [
+                "duration",
+                "response",
+                "response_headers",
+                "request_headers",
+                "status",
+            ],
+        )
+        if failed_ids:
+            EventDelivery.objects.filter(id__in=failed_ids).update(
+                status=EventDeliveryStatus.FAILED
+            )
+        if successful_ids:
+            EventDelivery.objects.filter(id__in=successful_ids).delete()
+
+
+@app.task(bind=True)
+def send_webhook_requests_batch_task(self, event_delivery_ids=None):
+    """Send pending async webhook deliveries in batches.
+
+    When called without IDs, all pending deliveries of async events are drained,
+    which also retries the failed ones once their backoff has passed. Every batch
+    is claimed in a short transaction and sent after it's committed; concurrent
+    tasks skip claimed deliveries.
+    """
+    attempts = EventDeliveryAttempt.objects.filter(delivery=OuterRef("pk"))
+    claimed_attempts = attempts.filter(
+        status=EventDeliveryStatus.PENDING,
+        created_at__gt=timezone.now() - get_delivery_claim_timeout(),
+    )
+    deliveries = (
+        EventDelivery.objects.filter(
+            status=EventDeliveryStatus.PENDING,
+            event_type__in=WebhookEventAsyncType.ALL,
+        )
+        .exclude(Exists(claimed_attempts))
+        .annotate(
+            attempts_count=Coalesce(
+                Subquery(
+                    attempts.order_by()
+                    .values("delivery")
+                    .annotate(count=Count("pk"))
+                    .values("count")
+                ),
+                0,
+            ),
+            last_attempt_at=Subquery(
+                attempts.order_by("-created_at").values("created_at")[:1]
+            ),
+        )
+        .select_related("payload", "webhook__app")
+        .order_by("pk")
+    )
+    if event_delivery_ids is not None:
+        deliveries = deliveries.filter(pk__in=event_delivery_ids)
+
+    domain = Site.objects.get_current().domain
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            batch = list(
+                deliveries.filter(pk__gt=last_id).select_for_update(
+                    of=("self",), skip_locked=True
+                )[: settings.WEBHOOK_BATCH_SIZE]
+            )
+            if not batch:
+                break
+            last_id = batch[-1].pk
+            claimed_deliveries = claim_deliveries(batch, self.request.id)
+        send_webhook_requests_batch(claimed_deliveries, domain)
+
+
 def send_webhook_request_sync(
     app_name, delivery, timeout=WEBHOOK_SYNC_TIMEOUT
 ) -> Optional[Dict[Any, Any]]:
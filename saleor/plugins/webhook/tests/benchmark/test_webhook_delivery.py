@@ -0,0 +1,114 @@
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+from .....core.models import EventDelivery, EventPayload
+from .....webhook.event_types import WebhookEventAsyncType
+from ...tasks import send_webhook_request_async, send_webhook_requests_batch_task
+
+DELIVERIES_COUNT = 50
+
+
+class StubWebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        # Simulate a slow receiver.
+        time.sleep(0.01)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubWebhookHandler)
+    server.daemon_threads = True
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/webhook/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def pending_deliveries(webhook, stub_server):
+    webhook.target_url = stub_server
+    webhook.save(update_fields=["target_url"])
+    payload = EventPayload.objects.create(payload='{"payload_key": "payload_value"}')
+    return EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=WebhookEventAsyncType.ORDER_CREATED,
+                payload=payload,
+                webhook=webhook,
+            )
+            for _ in range(DELIVERIES_COUNT)
+        ]
+    )
+
+
+def _send_per_delivery(deliveries):
+    for delivery in deliveries:
+        send_webhook_request_async(delivery.pk)
+
+
+def _send_in_batches(deliveries):
+    send_webhook_requests_batch_task([delivery.pk for delivery in deliveries])
+
+
+def _measure_deliveries_per_second(send, deliveries):
+    start = time.perf_counter()
+    send(deliveries)
+    return len(deliveries) / (time.perf_counter() - start)
+
+
+@pytest.mark.enable_socket
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_send_webhook_request_per_delivery(
+    pending_deliveries, count_queries, record_property
+):
+    rate = _measure_deliveries_per_second(_send_per_delivery, pending_deliveries)
+
+    record_property("deliveries_per_second", rate)
+    assert not EventDelivery.objects.exists()
+
+
+@pytest.mark.enable_socket
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_send_webhook_requests_batch(
+    pending_deliveries, count_queries, record_property
+):
+    rate = _measure_deliveries_per_second(_send_in_batches, pending_deliveries)
+
+    record_property("deliveries_per_second", rate)
+    assert not EventDelivery.objects.exists()
+
+
+@pytest.mark.enable_socket
+@pytest.mark.django_db
+def test_send_webhook_requests_batch_throughput(pending_deliveries, record_property):
+    # given
+    half = DELIVERIES_COUNT // 2
+    per_delivery, batched = pending_deliveries[:half], pending_deliveries[half:]
+
+    # when
+    per_delivery_rate = _measure_deliveries_per_second(
+        _send_per_delivery, per_delivery
+    )
+    batch_rate = _measure_deliveries_per_second(_send_in_batches, batched)
+
+    # then
+    record_property("per_delivery_deliveries_per_second", per_delivery_rate)
+    record_property("batch_deliveries_per_second", batch_rate)
+    assert not EventDelivery.objects.exists()
+    # the stub server answers after 10ms, batches send requests concurrently
+    assert batch_rate > per_delivery_rate
@@ -1,10 +1,13 @@
 import json
+import threading
+import time
 from unittest import mock
 
 import graphene
 import pytest
 
-from ....core.models import EventDelivery
+from ....core import EventDeliveryStatus
+from ....core.models import EventDelivery, EventPayload
 from ....graphql.tests.utils import get_graphql_content
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.payloads import (
@@ -18,7 +21,12 @@ from ..const import (
     EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
 )
 from ..shipping import get_excluded_shipping_methods_from_response, to_shipping_app_id
-from ..tasks import trigger_webhook_sync
+from ..tasks import (
+    WebhookResponse,
+    _get_webhooks_for_event,
+    trigger_webhook_sync,
+    trigger_webhooks_sync,
+)
 
 ORDER_QUERY_SHIPPING_METHOD = """
     query OrdersQuery {
@@ -66,7 +74,7 @@ CHECKOUT_QUERY_SHIPPING_METHOD = """
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
 )
@@ -84,14 +92,19 @@ def test_excluded_shipping_methods_for_order(
     webhook_reason = "Order contains dangerous products."
     other_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.return_value = {
-        "excluded_methods": [
+    mocked_webhook.return_value = [
+        (
+            shipping_app,
             {
-                "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                "reason": webhook_reason,
-            }
-        ]
-    }
+                "excluded_methods": [
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                        "reason": webhook_reason,
+                    }
+                ]
+            },
+        )
+    ]
     payload = mock.MagicMock()
     mocked_payload.return_value = payload
     plugin = webhook_plugin()
@@ -116,9 +129,12 @@ def test_excluded_shipping_methods_for_order(
     mocked_webhook.assert_called_once_with(
         WebhookEventSyncType.ORDER_FILTER_SHIPPING_METHODS,
         payload,
-        shipping_app,
+        mock.ANY,
         EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
     )
+    assert [webhook.app for webhook in mocked_webhook.call_args.args[2]] == [
+        shipping_app
+    ]
     expected_cache_key = CACHE_EXCLUDED_SHIPPING_KEY + order_with_lines.token
 
     expected_excluded_shipping_method = [{"id": "1", "reason": webhook_reason}]
@@ -131,7 +147,7 @@ def test_excluded_shipping_methods_for_order(
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
 )
@@ -150,27 +166,33 @@ def test_multiple_app_with_excluded_shipping_methods_for_order(
     webhook_reason = "Order contains dangerous products."
     webhook_second_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.side_effect = [
-        {
-            "excluded_methods": [
-                {
-                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                    "reason": webhook_reason,
-                }
-            ]
-        },
-        {
-            "excluded_methods": [
-                {
-                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                    "reason": webhook_second_reason,
-                },
-                {
-                    "id": graphene.Node.to_global_id("ShippingMethod", "2"),
-                    "reason": webhook_second_reason,
-                },
-            ]
-        },
+    mocked_webhook.return_value = [
+        (
+            shipping_app,
+            {
+                "excluded_methods": [
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                        "reason": webhook_reason,
+                    }
+                ]
+            },
+        ),
+        (
+            second_shipping_app,
+            {
+                "excluded_methods": [
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                        "reason": webhook_second_reason,
+                    },
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "2"),
+                        "reason": webhook_second_reason,
+                    },
+                ]
+            },
+        ),
     ]
 
     payload = mock.MagicMock()
@@ -192,18 +214,16 @@ def test_multiple_app_with_excluded_shipping_methods_for_order(
     assert em.id == "1"
     assert webhook_reason in em.reason
     assert webhook_second_reason in em.reason
-    mocked_webhook.assert_any_call(
+    mocked_webhook.assert_called_once_with(
         WebhookEventSyncType.ORDER_FILTER_SHIPPING_METHODS,
         payload,
-        shipping_app,
+        mock.ANY,
         EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
     )
-    mocked_webhook.assert_any_call(
-        WebhookEventSyncType.ORDER_FILTER_SHIPPING_METHODS,
-        payload,
+    assert {webhook.app for webhook in mocked_webhook.call_args.args[2]} == {
+        shipping_app,
         second_shipping_app,
-        EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
-    )
+    }
     expected_cache_key = CACHE_EXCLUDED_SHIPPING_KEY + order_with_lines.token
 
     expected_excluded_shipping_method = [
@@ -410,8 +430,91 @@ def test_trigger_webhook_sync(mock_request, shipping_app):
     mock_request.assert_called_once_with(shipping_app.name, event_delivery)
 
 
+def _slow_webhook_response(delays):
+    def send_webhook_using_http(target_url, message, *args, **kwargs):
+        time.sleep(delays.pop(0))
+        return WebhookResponse(content=json.dumps({"excluded_methods": []}))
+
+    return send_webhook_using_http
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_http")
+def test_trigger_webhooks_sync_sends_requests_concurrently(
+    mocked_send_webhook_using_http, shipping_app_factory
+):
+    # given
+    shipping_app = shipping_app_factory()
+    second_shipping_app = shipping_app_factory(app_name="shipping-app2")
+    # Both requests have to be in progress at the same time to pass the barrier.
+    barrier = threading.Barrier(2, timeout=1)
+
+    def send_webhook_using_http(target_url, message, *args, **kwargs):
+        barrier.wait()
+        return WebhookResponse(content=json.dumps({"excluded_methods": []}))
+
+    mocked_send_webhook_using_http.side_effect = send_webhook_using_http
+    event_type = WebhookEventSyncType.CHECKOUT_FILTER_SHIPPING_METHODS
+    webhooks = _get_webhooks_for_event(event_type)
+
+    # when
+    responses = trigger_webhooks_sync(event_type, '{"key": "value"}', webhooks, 2)
+
+    # then
+    assert not barrier.broken
+    assert {app for app, _ in responses} == {shipping_app, second_shipping_app}
+    assert all(data == {"excluded_methods": []} for _, data in responses)
+    assert mocked_send_webhook_using_http.call_count == 2
+    assert not EventDelivery.objects.exists()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_http")
+def test_trigger_webhooks_sync_skips_responses_after_deadline(
+    mocked_send_webhook_using_http, shipping_app_factory
+):
+    # given
+    shipping_app_factory()
+    shipping_app_factory(app_name="shipping-app2")
+    mocked_send_webhook_using_http.side_effect = _slow_webhook_response([0, 0.5])
+    event_type = WebhookEventSyncType.CHECKOUT_FILTER_SHIPPING_METHODS
+    webhooks = _get_webhooks_for_event(event_type)
+
+    # when
+    responses = trigger_webhooks_sync(event_type, '{"key": "value"}', webhooks, 0.2)
+
+    # then
+    assert sorted(data is None for _, data in responses) == [False, True]
+    delivery = EventDelivery.objects.get()
+    assert delivery.status == EventDeliveryStatus.FAILED
+    assert delivery.attempts.get().status == EventDeliveryStatus.FAILED
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_http")
+def test_trigger_webhooks_sync_skip_successful_deliveries(
+    mocked_send_webhook_using_http, shipping_app_factory, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_SKIP_SUCCESSFUL_DELIVERIES = True
+    shipping_app_factory()
+    shipping_app_factory(app_name="shipping-app2")
+    mocked_send_webhook_using_http.side_effect = [
+        WebhookResponse(content="{}"),
+        WebhookResponse(content="", status=EventDeliveryStatus.FAILED),
+    ]
+    event_type = WebhookEventSyncType.CHECKOUT_FILTER_SHIPPING_METHODS
+    webhooks = _get_webhooks_for_event(event_type).order_by("pk")
+
+    # when
+    responses = trigger_webhooks_sync(event_type, '{"key": "value"}', webhooks, 2)
+
+    # then
+    assert sorted(data is None for _, data in responses) == [False, True]
+    assert EventPayload.objects.count() == 1
+    delivery = EventDelivery.objects.get()
+    assert delivery.status == EventDeliveryStatus.FAILED
+
+
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
     "generate_excluded_shipping_methods_for_checkout_payload"
@@ -430,14 +533,19 @@ def test_excluded_shipping_methods_for_checkout(
     webhook_reason = "Checkout contains dangerous products."
     other_reason = "Shipping is not applicable for this checkout."
 
-    mocked_webhook.return_value = {
-        "excluded_methods": [
+    mocked_webhook.return_value = [
+        (
+            shipping_app,
             {
-                "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                "reason": webhook_reason,
-            }
-        ]
-    }
+                "excluded_methods": [
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                        "reason": webhook_reason,
+                    }
+                ]
+            },
+        )
+    ]
     payload = mock.MagicMock()
     mocked_payload.return_value = payload
     plugin = webhook_plugin()
@@ -461,9 +569,12 @@ def test_excluded_shipping_methods_for_checkout(
     mocked_webhook.assert_called_once_with(
         WebhookEventSyncType.CHECKOUT_FILTER_SHIPPING_METHODS,
         payload,
-        shipping_app,
+        mock.ANY,
         EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
     )
+    assert [webhook.app for webhook in mocked_webhook.call_args.args[2]] == [
+        shipping_app
+    ]
 
     expected_cache_key = CACHE_EXCLUDED_SHIPPING_KEY + str(checkout_with_items.token)
 
@@ -477,7 +588,7 @@ def test_excluded_shipping_methods_for_checkout(
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
     "generate_excluded_shipping_methods_for_checkout_payload"
@@ -497,27 +608,33 @@ def test_multiple_app_with_excluded_shipping_methods_for_checkout(
     webhook_reason = "Checkout contains dangerous products."
     webhook_second_reason = "Shipping is not applicable for this checkout."
 
-    mocked_webhook.side_effect = [
-        {
-            "excluded_methods": [
-                {
-                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                    "reason": webhook_reason,
-                }
-            ]
-        },
-        {
-            "excluded_methods": [
-                {
-                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                    "reason": webhook_second_reason,
-                },
-                {
-                    "id": graphene.Node.to_global_id("ShippingMethod", "2"),
-                    "reason": webhook_second_reason,
-                },
-            ]
-        },
+    mocked_webhook.return_value = [
+        (
+            shipping_app,
+            {
+                "excluded_methods": [
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                        "reason": webhook_reason,
+                    }
+                ]
+            },
+        ),
+        (
+            second_shipping_app,
+            {
+                "excluded_methods": [
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                        "reason": webhook_second_reason,
+                    },
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "2"),
+                        "reason": webhook_second_reason,
+                    },
+                ]
+            },
+        ),
     ]
     payload = mock.MagicMock()
     mocked_payload.return_value = payload
@@ -538,18 +655,16 @@ def test_multiple_app_with_excluded_shipping_methods_for_checkout(
     assert em.id == "1"
     assert webhook_reason in em.reason
     assert webhook_second_reason in em.reason
-    mocked_webhook.assert_any_call(
+    mocked_webhook.assert_called_once_with(
         WebhookEventSyncType.CHECKOUT_FILTER_SHIPPING_METHODS,
         payload,
-        shipping_app,
+        mock.ANY,
         EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
     )
-    mocked_webhook.assert_any_call(
-        WebhookEventSyncType.CHECKOUT_FILTER_SHIPPING_METHODS,
-        payload,
+    assert {webhook.app for webhook in mocked_webhook.call_args.args[2]} == {
+        shipping_app,
         second_shipping_app,
-        EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
-    )
+    }
 
     expected_cache_key = CACHE_EXCLUDED_SHIPPING_KEY + str(checkout_with_items.token)
 
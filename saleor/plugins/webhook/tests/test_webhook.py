@@ -10,6 +10,7 @@ import graphene
 import pytest
 from django.contrib.auth.tokens import default_token_generator
 from django.core.serializers import serialize
+from django.db import connection
 from django.utils import timezone
 from freezegun import freeze_time
 from kombu.asynchronous.aws.sqs.connection import AsyncSQSConnection
@@ -42,10 +43,14 @@ from ....webhook.payloads import (
     generate_product_variant_with_stock_payload,
     generate_sale_payload,
 )
+from ....webhook.utils import invalidate_webhooks_registry
 from ...manager import get_plugins_manager
 from ...webhook.tasks import (
+    WEBHOOK_MAX_RETRIES,
     WebhookResponse,
+    get_http_session,
     send_webhook_request_async,
+    send_webhook_requests_batch_task,
     trigger_webhooks_async,
 )
 
@@ -66,9 +71,11 @@ third_url = "http://www.example.com/third/"
         (WebhookEventAsyncType.CUSTOMER_CREATED, 0, set()),
     ],
 )
+@pytest.mark.parametrize("webhooks_registry_timeout", [0, 60])
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
 def test_trigger_webhooks_for_event_calls_expected_events(
     mock_request,
+    webhooks_registry_timeout,
     event_name,
     total_webhook_calls,
     expected_target_urls,
@@ -77,9 +84,12 @@ def test_trigger_webhooks_for_event_calls_expected_events(
     permission_manage_orders,
     permission_manage_users,
     permission_manage_products,
+    settings,
 ):
     """Confirm that Saleor executes only valid and allowed webhook events."""
 
+    settings.WEBHOOKS_REGISTRY_TIMEOUT = webhooks_registry_timeout
+    invalidate_webhooks_registry()
     app.permissions.add(permission_manage_orders)
     app.permissions.add(permission_manage_products)
     webhook = app.webhooks.create(target_url="http://www.example.com/first/")
@@ -113,6 +123,7 @@ def test_trigger_webhooks_for_event_calls_expected_events(
     urls_called = {delivery.webhook.target_url for delivery in deliveries_called}
     assert mock_request.call_count == total_webhook_calls
     assert urls_called == expected_target_urls
+    invalidate_webhooks_registry()
 
 
 @freeze_time("1914-06-28 10:50")
@@ -975,3 +986,173 @@ def test_send_webhook_request_async(
     assert attempt.request_headers == json.dumps(TEST_WEBHOOK_RESPONSE.request_headers)
     assert attempt.duration == TEST_WEBHOOK_RESPONSE.duration
     assert delivery.status == EventDeliveryStatus.SUCCESS
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_requests_batch_task.delay")
+def test_trigger_webhooks_async_batch_delivery(
+    mocked_batch_task, mocked_send_request, webhook, any_webhook, settings
+):
+    # given
+    settings.WEBHOOK_BATCH_DELIVERY = True
+
+    # when
+    trigger_webhooks_async(
+        "{}", WebhookEventAsyncType.ORDER_CREATED, [webhook, any_webhook]
+    )
+
+    # then
+    deliveries = EventDelivery.objects.order_by("pk")
+    assert len(deliveries) == 2
+    mocked_batch_task.assert_called_once_with([delivery.pk for delivery in deliveries])
+    mocked_send_request.assert_not_called()
+
+
+def test_get_http_session_is_shared_per_host():
+    session = get_http_session("http://www.example.com/first/")
+
+    assert get_http_session("http://WWW.example.com/second/") is session
+    assert get_http_session("https://www.example.com/first/") is not session
+
+
+@mock.patch(
+    "saleor.plugins.webhook.tasks.send_webhook_using_scheme_method",
+    return_value=TEST_WEBHOOK_RESPONSE,
+)
+def test_send_webhook_requests_batch_task(mocked_send_response, event_delivery):
+    # when
+    send_webhook_requests_batch_task()
+
+    # then
+    mocked_send_response.assert_called_once_with(
+        event_delivery.webhook.target_url,
+        "mirumee.com",
+        event_delivery.webhook.secret_key,
+        event_delivery.event_type,
+        event_delivery.payload.payload,
+        http_session=get_http_session(event_delivery.webhook.target_url),
+    )
+    assert not EventDelivery.objects.filter(pk=event_delivery.pk).exists()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_batch_task_only_given_deliveries(
+    mocked_send_response, event_delivery, event_payload, any_webhook
+):
+    # given
+    mocked_send_response.return_value = TEST_WEBHOOK_RESPONSE
+    other_delivery = EventDelivery.objects.create(
+        event_type=WebhookEventAsyncType.ANY,
+        payload=event_payload,
+        webhook=any_webhook,
+    )
+
+    # when
+    send_webhook_requests_batch_task([other_delivery.pk])
+
+    # then
+    mocked_send_response.assert_called_once()
+    assert EventDelivery.objects.filter(pk=event_delivery.pk).exists()
+    assert not EventDelivery.objects.filter(pk=other_delivery.pk).exists()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_batch_task_failed_request(
+    mocked_send_response, event_delivery
+):
+    # given
+    mocked_send_response.return_value = WebhookResponse(
+        content="error", status=EventDeliveryStatus.FAILED
+    )
+
+    # when
+    send_webhook_requests_batch_task()
+
+    # then
+    event_delivery.refresh_from_db()
+    attempt = event_delivery.attempts.get()
+    assert event_delivery.status == EventDeliveryStatus.PENDING
+    assert attempt.status == EventDeliveryStatus.FAILED
+    assert attempt.response == "error"
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_batch_task_skips_delivery_during_backoff(
+    mocked_send_response, event_attempt
+):
+    # given
+    event_attempt.status = EventDeliveryStatus.FAILED
+    event_attempt.save(update_fields=["status"])
+
+    # when
+    send_webhook_requests_batch_task()
+
+    # then
+    mocked_send_response.assert_not_called()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_batch_task_skips_claimed_delivery(
+    mocked_send_response, event_attempt
+):
+    # given
+    event_attempt.status = EventDeliveryStatus.PENDING
+    event_attempt.save(update_fields=["status"])
+
+    # when
+    send_webhook_requests_batch_task()
+
+    # then
+    mocked_send_response.assert_not_called()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_batch_task_sends_outside_transaction(
+    mocked_send_response, event_delivery
+):
+    # given
+    def send_response(*args, **kwargs):
+        # the delivery is already claimed when the request is sent
+        attempt = EventDeliveryAttempt.objects.get(delivery=event_delivery)
+        assert attempt.status == EventDeliveryStatus.PENDING
+        assert connection.savepoint_ids == savepoint_ids
+        return WebhookResponse(content="error", status=EventDeliveryStatus.FAILED)
+
+    savepoint_ids = list(connection.savepoint_ids)
+    mocked_send_response.side_effect = send_response
+
+    # when
+    send_webhook_requests_batch_task()
+
+    # then
+    mocked_send_response.assert_called_once()
+    attempt = event_delivery.attempts.get()
+    assert attempt.status == EventDeliveryStatus.FAILED
+    assert attempt.response == "error"
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_batch_task_exceeded_retries(
+    mocked_send_response, event_delivery
+):
+    # given
+    mocked_send_response.return_value = WebhookResponse(
+        content="error", status=EventDeliveryStatus.FAILED
+    )
+    with freeze_time("2020-01-01 10:00"):
+        EventDeliveryAttempt.objects.bulk_create(
+            [
+                EventDeliveryAttempt(
+                    delivery=event_delivery, status=EventDeliveryStatus.FAILED
+                )
+                for _ in range(WEBHOOK_MAX_RETRIES)
+            ]
+        )
+
+    # when
+    send_webhook_requests_batch_task()
+
+    # then
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.FAILED
+    assert event_delivery.attempts.count() == WEBHOOK_MAX_RETRIES + 1
@@ -0,0 +1,167 @@
+import json
+from unittest import mock
+
+from ....core.models import EventDelivery
+from ....webhook.event_types import WebhookEventAsyncType
+from ....webhook.models import BatchedWebhookEvent
+from ..tasks import send_batched_webhook_events_task, trigger_webhooks_async
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+def test_trigger_webhooks_async_batches_events(
+    mocked_send_webhook_request, webhook, any_webhook, settings
+):
+    # given
+    settings.WEBHOOK_EVENTS_BATCHING = True
+    any_webhook.batch_events = True
+    any_webhook.save(update_fields=["batch_events"])
+    data = json.dumps([{"id": "product-1", "name": "Product"}])
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+
+    # when
+    trigger_webhooks_async(data, event_type, [webhook, any_webhook])
+
+    # then
+    delivery = EventDelivery.objects.get()
+    assert delivery.webhook == webhook
+    mocked_send_webhook_request.assert_called_once_with(delivery.id)
+    batched_event = BatchedWebhookEvent.objects.get()
+    assert batched_event.webhook == any_webhook
+    assert batched_event.event_type == event_type
+    assert batched_event.object_id == "product-1"
+    assert json.loads(batched_event.payload) == {"id": "product-1", "name": "Product"}
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+def test_trigger_webhooks_async_sends_payload_without_ids(
+    mocked_send_webhook_request, any_webhook, settings
+):
+    # given
+    settings.WEBHOOK_EVENTS_BATCHING = True
+    any_webhook.batch_events = True
+    any_webhook.save(update_fields=["batch_events"])
+    data = json.dumps({"meta": {}})
+
+    # when
+    trigger_webhooks_async(data, WebhookEventAsyncType.ANY, [any_webhook])
+
+    # then
+    delivery = EventDelivery.objects.get()
+    mocked_send_webhook_request.assert_called_once_with(delivery.id)
+    assert not BatchedWebhookEvent.objects.exists()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+def test_trigger_webhooks_async_batching_disabled(
+    mocked_send_webhook_request, any_webhook, settings
+):
+    # given
+    settings.WEBHOOK_EVENTS_BATCHING = False
+    any_webhook.batch_events = True
+    any_webhook.save(update_fields=["batch_events"])
+    data = json.dumps([{"id": "product-1", "name": "Product"}])
+
+    # when
+    trigger_webhooks_async(data, WebhookEventAsyncType.PRODUCT_UPDATED, [any_webhook])
+
+    # then
+    delivery = EventDelivery.objects.get()
+    mocked_send_webhook_request.assert_called_once_with(delivery.id)
+    assert not BatchedWebhookEvent.objects.exists()
+
+
+def _create_batched_events(webhook, event_type, object_names):
+    BatchedWebhookEvent.objects.bulk_create(
+        [
+            BatchedWebhookEvent(
+                webhook=webhook,
+                event_type=event_type,
+                object_id=object_id,
+                payload=json.dumps({"id": object_id, "name": name}),
+            )
+            for object_id, name in object_names
+        ]
+    )
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+def test_send_batched_webhook_events_task(
+    mocked_send_webhook_request, any_webhook, settings
+):
+    # given
+    settings.WEBHOOK_EVENTS_BATCH_SIZE = 2
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    _create_batched_events(
+        any_webhook,
+        event_type,
+        [("1", "First"), ("2", "Second"), ("1", "First updated"), ("3", "Third")],
+    )
+
+    # when
+    send_batched_webhook_events_task()
+
+    # then
+    deliveries = EventDelivery.objects.order_by("pk")
+    assert [json.loads(delivery.payload.payload) for delivery in deliveries] == [
+        [{"id": "2", "name": "Second"}, {"id": "1", "name": "First updated"}],
+        [{"id": "3", "name": "Third"}],
+    ]
+    assert {delivery.event_type for delivery in deliveries} == {event_type}
+    assert {delivery.webhook for delivery in deliveries} == {any_webhook}
+    assert mocked_send_webhook_request.call_count == 2
+    assert not BatchedWebhookEvent.objects.exists()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+def test_send_batched_webhook_events_task_skips_inactive_webhooks(
+    mocked_send_webhook_request, any_webhook
+):
+    # given
+    any_webhook.is_active = False
+    any_webhook.save(update_fields=["is_active"])
+    _create_batched_events(
+        any_webhook, WebhookEventAsyncType.PRODUCT_UPDATED, [("1", "First")]
+    )
+
+    # when
+    send_batched_webhook_events_task()
+
+    # then
+    assert not EventDelivery.objects.exists()
+    mocked_send_webhook_request.assert_not_called()
+    assert not BatchedWebhookEvent.objects.exists()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_batched_webhook_events_task.delay")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+@mock.patch("saleor.plugins.webhook.tasks.BATCHED_WEBHOOK_EVENTS_CHUNK_SIZE", 2)
+def test_send_batched_webhook_events_task_in_chunks(
+    mocked_send_webhook_request, mocked_send_batched_events, any_webhook
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    _create_batched_events(
+        any_webhook, event_type, [("1", "First"), ("2", "Second"), ("3", "Third")]
+    )
+
+    # when
+    send_batched_webhook_events_task()
+
+    # then
+    delivery = EventDelivery.objects.get()
+    assert json.loads(delivery.payload.payload) == [
+        {"id": "1", "name": "First"},
+        {"id": "2", "name": "Second"},
+    ]
+    mocked_send_batched_events.assert_called_once_with()
+    assert list(BatchedWebhookEvent.objects.values_list("object_id", flat=True)) == [
+        "3"
+    ]
+
+    # when
+    send_batched_webhook_events_task()
+
+    # then
+    assert EventDelivery.objects.count() == 2
+    mocked_send_batched_events.assert_called_once_with()
+    assert not BatchedWebhookEvent.objects.exists()
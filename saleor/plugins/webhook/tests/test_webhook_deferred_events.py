@@ -0,0 +1,217 @@
+from unittest import mock
+
+import pytest
+from celery.exceptions import MaxRetriesExceededError, Retry
+from freezegun import freeze_time
+
+from ....order.models import Order
+from ....tests.utils import flush_post_commit_hooks
+from ....webhook.event_types import WebhookEventAsyncType
+from ....webhook.models import DeferredWebhookEvent
+from ....webhook.payloads import generate_order_payload
+from ...manager import get_plugins_manager
+from ..tasks import DEFERRED_PAYLOAD_EVENTS, send_deferred_webhook_events_task
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_deferred_webhook_events_task.delay")
+@mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async")
+@mock.patch("saleor.plugins.webhook.plugin._get_webhooks_for_event")
+def test_order_updated_deferred(
+    mocked_get_webhooks_for_event,
+    mocked_trigger_webhooks_async,
+    mocked_task_delay,
+    any_webhook,
+    settings,
+    order,
+    staff_user,
+):
+    # given
+    mocked_get_webhooks_for_event.return_value = [any_webhook]
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    settings.WEBHOOK_DEFERRED_PAYLOADS = True
+    manager = get_plugins_manager(lambda: staff_user)
+
+    # when
+    manager.order_updated(order)
+    flush_post_commit_hooks()
+
+    # then
+    mocked_trigger_webhooks_async.assert_not_called()
+    event = DeferredWebhookEvent.objects.get()
+    assert event.event_type == WebhookEventAsyncType.ORDER_UPDATED
+    assert event.object_type == "order.order"
+    assert event.object_id == str(order.pk)
+    assert event.requestor_user == staff_user
+    assert event.requestor_app is None
+    mocked_task_delay.assert_called_once_with("order.order", str(order.pk))
+
+
+@freeze_time("1914-06-28 10:50")
+@mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async")
+@mock.patch("saleor.plugins.webhook.plugin._get_webhooks_for_event")
+def test_order_updated_not_deferred(
+    mocked_get_webhooks_for_event,
+    mocked_trigger_webhooks_async,
+    any_webhook,
+    settings,
+    order,
+    staff_user,
+):
+    # given
+    mocked_get_webhooks_for_event.return_value = [any_webhook]
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    settings.WEBHOOK_DEFERRED_PAYLOADS = False
+    manager = get_plugins_manager(lambda: staff_user)
+
+    # when
+    manager.order_updated(order)
+    flush_post_commit_hooks()
+
+    # then
+    mocked_trigger_webhooks_async.assert_called_once_with(
+        generate_order_payload(order, staff_user),
+        WebhookEventAsyncType.ORDER_UPDATED,
+        [any_webhook],
+    )
+    assert not DeferredWebhookEvent.objects.exists()
+
+
+@freeze_time("1914-06-28 10:50")
+@mock.patch("saleor.plugins.webhook.tasks.trigger_webhooks_async")
+def test_send_deferred_webhook_events_task(
+    mocked_trigger_webhooks_async,
+    any_webhook,
+    permission_manage_orders,
+    order_with_lines,
+    staff_user,
+):
+    # given
+    any_webhook.app.permissions.add(permission_manage_orders)
+    event_types = [
+        WebhookEventAsyncType.ORDER_UPDATED,
+        WebhookEventAsyncType.ORDER_FULFILLED,
+    ]
+    DeferredWebhookEvent.objects.bulk_create(
+        [
+            DeferredWebhookEvent(
+                event_type=event_type,
+                object_type="order.order",
+                object_id=str(order_with_lines.pk),
+                requestor_user=staff_user,
+            )
+            for event_type in event_types
+        ]
+    )
+
+    # when
+    send_deferred_webhook_events_task("order.order", str(order_with_lines.pk))
+
+    # then
+    assert [call.args[1] for call in mocked_trigger_webhooks_async.mock_calls] == (
+        event_types
+    )
+    payloads = {call.args[0] for call in mocked_trigger_webhooks_async.mock_calls}
+    assert len(payloads) == 1
+    assert payloads.pop() == generate_order_payload(order_with_lines, staff_user)
+    assert not DeferredWebhookEvent.objects.exists()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.trigger_webhooks_async")
+def test_send_deferred_webhook_events_task_for_deleted_object(
+    mocked_trigger_webhooks_async, any_webhook, permission_manage_orders, order
+):
+    # given
+    any_webhook.app.permissions.add(permission_manage_orders)
+    order_id = str(order.pk)
+    DeferredWebhookEvent.objects.create(
+        event_type=WebhookEventAsyncType.ORDER_UPDATED,
+        object_type="order.order",
+        object_id=order_id,
+    )
+    order.delete()
+
+    # when
+    send_deferred_webhook_events_task("order.order", order_id)
+
+    # then
+    mocked_trigger_webhooks_async.assert_not_called()
+    assert not DeferredWebhookEvent.objects.exists()
+
+
+def _create_deferred_order_events(order, event_types):
+    DeferredWebhookEvent.objects.bulk_create(
+        [
+            DeferredWebhookEvent(
+                event_type=event_type,
+                object_type="order.order",
+                object_id=str(order.pk),
+            )
+            for event_type in event_types
+        ]
+    )
+
+
+@mock.patch.object(send_deferred_webhook_events_task, "retry")
+@mock.patch("saleor.plugins.webhook.tasks.trigger_webhooks_async")
+def test_send_deferred_webhook_events_task_retries_failed_event(
+    mocked_trigger_webhooks_async,
+    mocked_retry,
+    any_webhook,
+    permission_manage_orders,
+    order,
+):
+    # given
+    any_webhook.app.permissions.add(permission_manage_orders)
+    mocked_retry.side_effect = Retry()
+    _create_deferred_order_events(
+        order,
+        [WebhookEventAsyncType.ORDER_UPDATED, WebhookEventAsyncType.ORDER_FULFILLED],
+    )
+    failing_generator = mock.Mock(side_effect=ValueError())
+
+    # when
+    with mock.patch.dict(
+        DEFERRED_PAYLOAD_EVENTS,
+        {WebhookEventAsyncType.ORDER_UPDATED: (Order, failing_generator)},
+    ):
+        with pytest.raises(Retry):
+            send_deferred_webhook_events_task("order.order", str(order.pk))
+
+    # then
+    mocked_retry.assert_called_once()
+    mocked_trigger_webhooks_async.assert_not_called()
+    assert DeferredWebhookEvent.objects.count() == 2
+
+
+@mock.patch.object(send_deferred_webhook_events_task, "retry")
+@mock.patch("saleor.plugins.webhook.tasks.trigger_webhooks_async")
+def test_send_deferred_webhook_events_task_skips_event_after_retries(
+    mocked_trigger_webhooks_async,
+    mocked_retry,
+    any_webhook,
+    permission_manage_orders,
+    order,
+):
+    # given
+    any_webhook.app.permissions.add(permission_manage_orders)
+    mocked_retry.side_effect = MaxRetriesExceededError()
+    _create_deferred_order_events(
+        order,
+        [WebhookEventAsyncType.ORDER_UPDATED, WebhookEventAsyncType.ORDER_FULFILLED],
+    )
+    failing_generator = mock.Mock(side_effect=ValueError())
+
+    # when
+    with mock.patch.dict(
+        DEFERRED_PAYLOAD_EVENTS,
+        {WebhookEventAsyncType.ORDER_UPDATED: (Order, failing_generator)},
+    ):
+        send_deferred_webhook_events_task("order.order", str(order.pk))
+
+    # then
+    mocked_trigger_webhooks_async.assert_called_once()
+    assert (
+        mocked_trigger_webhooks_async.call_args.args[1]
+        == WebhookEventAsyncType.ORDER_FULFILLED
+    )
+    assert not DeferredWebhookEvent.objects.exists()
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.12 on 2026-10-17 07:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0163_product_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_index_dirty",
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+    ]
@@ -394,6 +394,8 @@ class Product(SeoModel, ModelWithMetadata):
     description = SanitizedJSONField(blank=True, null=True, sanitizer=clean_editor_js)
     description_plaintext = TextField(blank=True)
     search_document = models.TextField(blank=True, default="")
+    search_vector = SearchVectorField(blank=True, null=True)
+    search_index_dirty = models.BooleanField(default=False, db_index=True)
 
     category = models.ForeignKey(
         Category,
@@ -436,6 +438,7 @@ class Product(SeoModel, ModelWithMetadata):
                 fields=["search_document"],
                 opclasses=["gin_trgm_ops"],
             ),
+            GinIndex(name="product_tsearch", fields=["search_vector"]),
         ]
         indexes.extend(ModelWithMetadata.Meta.indexes)
 
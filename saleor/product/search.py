@@ -1,19 +1,35 @@
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterable, Union
 
-from django.db.models import Q, prefetch_related_objects
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, Q, QuerySet, TextField, Value, prefetch_related_objects
 
 from ..attribute import AttributeInputType
 from ..core.utils.editorjs import clean_editor_js
 from .models import Product
 
 if TYPE_CHECKING:
-    from django.db.models import QuerySet
-
     from ..attribute.models import AssignedProductAttribute, AssignedVariantAttribute
 
 ASSIGNED_ATTRIBUTE_TYPE = Union["AssignedProductAttribute", "AssignedVariantAttribute"]
 
 PRODUCT_SEARCH_FIELDS = ["name", "description_plaintext"]
+# Language agnostic config, products can be described in any language.
+PRODUCT_SEARCH_CONFIG = "simple"
+
+
+class ProductSearchBackend:
+    """Available implementations of the product search.
+
+    The `ilike` backend matches every word anywhere in the search document.
+    The `full_text` backend matches word prefixes against the weighted search
+    vector and ranks the results.
+    """
+
+    ILIKE = "ilike"
+    FULL_TEXT = "full_text"
+
+
 PRODUCT_FIELDS_TO_PREFETCH = [
     "variants__attributes__values",
     "variants__attributes__assignment__attribute",
@@ -28,13 +44,43 @@ def update_products_search_document(products: "QuerySet"):
         product.search_document = prepare_product_search_document_value(
             product, already_prefetched=True
         )
+        product.search_vector = prepare_product_search_vector_value(
+            product, already_prefetched=True
+        )
+        product.search_index_dirty = False
 
-    Product.objects.bulk_update(products, ["search_document", "updated_at"])
+    Product.objects.bulk_update(
+        products,
+        ["search_document", "search_vector", "search_index_dirty", "updated_at"],
+    )
 
 
 def update_product_search_document(product: "Product"):
     product.search_document = prepare_product_search_document_value(product)
-    product.save(update_fields=["search_document", "updated_at"])
+    product.search_vector = prepare_product_search_vector_value(
+        product, already_prefetched=True
+    )
+    product.search_index_dirty = False
+    product.save(
+        update_fields=[
+            "search_document",
+            "search_vector",
+            "search_index_dirty",
+            "updated_at",
+        ]
+    )
+
+
+def mark_products_search_index_dirty(products: Union["QuerySet", Iterable[int]]) -> int:
+    """Mark products whose search index needs to be updated.
+
+    The search documents are updated in the background by
+    `update_products_search_index_task`. Accepts a product queryset or product IDs.
+    Return the number of marked products.
+    """
+    if not isinstance(products, QuerySet):
+        products = Product.objects.filter(pk__in=products)
+    return products.filter(search_index_dirty=False).update(search_index_dirty=True)
 
 
 def prepare_product_search_document_value(
@@ -51,6 +97,37 @@ def prepare_product_search_document_value(
     return search_document.lower()
 
 
+def prepare_product_search_vector_value(
+    product: "Product", *, already_prefetched=False
+) -> SearchVector:
+    """Prepare the weighted `search_vector` value of the product.
+
+    Weights from the highest: name, variant SKUs, attribute values and description.
+    """
+    if not already_prefetched:
+        prefetch_related_objects([product], *PRODUCT_FIELDS_TO_PREFETCH)
+    variants = product.variants.all()
+    skus = "\n".join([variant.sku for variant in variants if variant.sku])
+    attributes = generate_attributes_search_document_value(product.attributes.all())
+    for variant in variants:
+        attributes += generate_attributes_search_document_value(
+            variant.attributes.all()
+        )
+    search_vector = _search_vector(product.name, "A")
+    search_vector += _search_vector(skus, "B")
+    search_vector += _search_vector(attributes, "C")
+    search_vector += _search_vector(product.description_plaintext, "D")
+    return search_vector
+
+
+def _search_vector(value: str, weight: str) -> SearchVector:
+    return SearchVector(
+        Value(value, output_field=TextField()),
+        config=PRODUCT_SEARCH_CONFIG,
+        weight=weight,
+    )
+
+
 def generate_product_fields_search_document_value(product: "Product"):
     value = "\n".join(
         [
@@ -114,9 +191,28 @@ def generate_attributes_search_document_value(
 
 
 def search_products(qs, value):
-    if value:
-        lookup = Q()
-        for val in value.split():
-            lookup &= Q(search_document__ilike=val)
-        qs = qs.filter(lookup)
-    return qs
+    if not value:
+        return qs
+    if settings.PRODUCT_SEARCH_BACKEND == ProductSearchBackend.FULL_TEXT:
+        return search_products_using_search_vector(qs, value)
+    lookup = Q()
+    for val in value.split():
+        lookup &= Q(search_document__ilike=val)
+    return qs.filter(lookup)
+
+
+def search_products_using_search_vector(qs, value):
+    """Filter products matching all words of the value and annotate their rank.
+
+    Every word is matched as a prefix, so partially typed words find products too.
+    """
+    words = [
+        "'{}':*".format(word.replace("\\", "\\\\").replace("'", "''"))
+        for word in value.split()
+    ]
+    query = SearchQuery(
+        " & ".join(words), config=PRODUCT_SEARCH_CONFIG, search_type="raw"
+    )
+    return qs.filter(search_vector=query).annotate(
+        search_rank=SearchRank(F("search_vector"), query)
+    )
@@ -1,8 +1,10 @@
 import logging
+import time
 from typing import Iterable, List, Optional
 
 from celery.utils.log import get_task_logger
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 from django.utils import timezone
 
 from ..attribute.models import Attribute
@@ -11,6 +13,7 @@ from ..core.exceptions import PreorderAllocationError
 from ..discount.models import Sale
 from ..warehouse.management import deactivate_preorder_for_variant
 from .models import Product, ProductType, ProductVariant
+from .search import update_products_search_document
 from .utils.variant_prices import (
     update_product_discounted_price,
     update_products_discounted_prices,
@@ -22,6 +25,13 @@ from .utils.variants import generate_and_set_variant_name
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(__name__)
 
+# Products are reindexed with all attributes and variants prefetched, so the batch
+# size is kept low to bound the worker memory usage.
+PRODUCTS_SEARCH_INDEX_BATCH_SIZE = 500
+# Limit of batches processed in a single run, the rest of the backlog is left
+# for the next run of the task.
+PRODUCTS_SEARCH_INDEX_MAX_BATCHES = 20
+
 
 def _update_variants_names(instance: ProductType, saved_attributes: Iterable):
     """Product variant names are created from names of assigned attributes.
@@ -108,3 +118,45 @@ def _get_preorder_variants_to_clean():
     return ProductVariant.objects.filter(
         is_preorder=True, preorder_end_date__lt=timezone.now()
     )
+
+
+@app.task
+def update_products_search_index_task():
+    """Update the search index of products marked with `search_index_dirty`."""
+    start = time.monotonic()
+    updated_count = 0
+    for _ in range(PRODUCTS_SEARCH_INDEX_MAX_BATCHES):
+        batch_count = _update_products_search_index_batch()
+        updated_count += batch_count
+        if batch_count < PRODUCTS_SEARCH_INDEX_BATCH_SIZE:
+            break
+
+    if not updated_count:
+        return
+
+    duration = time.monotonic() - start
+    backlog_count = Product.objects.filter(search_index_dirty=True).count()
+    task_logger.info(
+        "Updated search index of %s products in %.2fs (%.1f products/s), "
+        "%s products left in the backlog.",
+        updated_count,
+        duration,
+        updated_count / duration if duration else updated_count,
+        backlog_count,
+    )
+
+
+def _update_products_search_index_batch() -> int:
+    with transaction.atomic():
+        # Skip the products locked by a concurrent run of the task.
+        product_ids = list(
+            Product.objects.select_for_update(skip_locked=True)
+            .filter(search_index_dirty=True)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:PRODUCTS_SEARCH_INDEX_BATCH_SIZE]
+        )
+        if product_ids:
+            update_products_search_document(
+                Product.objects.filter(pk__in=product_ids).order_by("pk")
+            )
+    return len(product_ids)
@@ -0,0 +1,46 @@
+from decimal import Decimal
+
+from ..models import Product
+from ..utils.facets import get_product_facet_counts
+
+
+def test_get_product_facet_counts(product_list, category, channel_USD):
+    # given
+    attribute = product_list[0].product_type.product_attributes.first()
+    value = attribute.values.first()
+
+    # when
+    counts = get_product_facet_counts(
+        Product.objects.all(), channel_USD.slug, Decimal(20)
+    )
+
+    # then
+    assert counts.attribute_values == {value.pk: 3}
+    assert counts.categories == {category.pk: 3}
+    assert counts.price_buckets == {Decimal(0): 1, Decimal(20): 2}
+
+
+def test_get_product_facet_counts_for_filtered_products(
+    product_list, category, channel_USD
+):
+    # given
+    products = Product.objects.filter(
+        pk__in=[product.pk for product in product_list[1:]]
+    )
+
+    # when
+    counts = get_product_facet_counts(products, channel_USD.slug, Decimal(20))
+
+    # then
+    assert sum(counts.attribute_values.values()) == 2
+    assert counts.categories == {category.pk: 2}
+    assert counts.price_buckets == {Decimal(20): 2}
+
+
+def test_get_product_facet_counts_without_price_bucket_size(product_list, channel_USD):
+    # when
+    counts = get_product_facet_counts(Product.objects.all(), channel_USD.slug)
+
+    # then
+    assert counts.price_buckets == {}
+    assert counts.categories
@@ -3,11 +3,15 @@ from unittest.mock import patch
 from django.core.management import call_command
 from prices import Money
 
+from ..models import Product, ProductChannelListing
 from ..tasks import (
     update_products_discounted_prices_of_catalogues,
     update_products_discounted_prices_task,
 )
-from ..utils.variant_prices import update_product_discounted_price
+from ..utils.variant_prices import (
+    update_product_discounted_price,
+    update_products_discounted_prices,
+)
 
 
 def test_update_product_discounted_price(product, channel_USD):
@@ -125,6 +129,45 @@ def test_update_products_discounted_prices_task(product_list):
         assert product_channel_listing.discounted_price == price
 
 
+@patch("saleor.product.utils.variant_prices.DISCOUNTED_PRICES_BATCH_SIZE", 2)
+def test_update_products_discounted_prices_in_batches(product_list, sale, channel_USD):
+    # given
+    sale.products.add(*product_list)
+    sale_channel_listing = sale.channel_listings.get(channel=channel_USD)
+    expected_prices = {}
+    for product in product_list:
+        variant_channel_listing = product.variants.first().channel_listings.get()
+        expected_prices[product.pk] = variant_channel_listing.price - Money(
+            sale_channel_listing.discount_value, "USD"
+        )
+
+    # when
+    update_products_discounted_prices(
+        Product.objects.filter(pk__in=[product.pk for product in product_list])
+    )
+
+    # then
+    for product in product_list:
+        product_channel_listing = product.channel_listings.get()
+        assert product_channel_listing.discounted_price == expected_prices[product.pk]
+
+
+def test_update_products_discounted_prices_number_of_queries(
+    product_list, django_assert_num_queries
+):
+    # given
+    products = Product.objects.filter(pk__in=[product.pk for product in product_list])
+    ProductChannelListing.objects.filter(product__in=products).update(
+        discounted_price_amount=None
+    )
+
+    # when
+    # product ids, products, collections, variant prices, product channel listings
+    # and a single update of all changed listings
+    with django_assert_num_queries(6):
+        update_products_discounted_prices(products, discounts=[])
+
+
 @patch(
     "saleor.product.management.commands"
     ".update_all_products_discounted_prices"
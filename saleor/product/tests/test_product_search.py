@@ -4,7 +4,10 @@ from ...attribute.utils import associate_attribute_values_to_instance
 from ...core.utils.editorjs import clean_editor_js
 from ..models import Product, ProductVariant
 from ..search import (
+    ProductSearchBackend,
+    mark_products_search_index_dirty,
     prepare_product_search_document_value,
+    search_products,
     update_product_search_document,
     update_products_search_document,
 )
@@ -43,6 +46,32 @@ def test_update_products_search_document(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_document
+        assert product.search_vector
+
+
+def test_mark_products_search_index_dirty(product_list):
+    # given
+    product_1, product_2, product_3 = product_list
+
+    # when
+    marked_count = mark_products_search_index_dirty([product_1.pk, product_2.pk])
+
+    # then
+    assert marked_count == 2
+    assert set(
+        Product.objects.filter(search_index_dirty=True).values_list("pk", flat=True)
+    ) == {product_1.pk, product_2.pk}
+
+
+def test_update_products_search_document_clears_search_index_dirty(product_list):
+    # given
+    Product.objects.update(search_index_dirty=True)
+
+    # when
+    update_products_search_document(Product.objects.all())
+
+    # then
+    assert not Product.objects.filter(search_index_dirty=True).exists()
 
 
 def test_prepare_product_search_document_value_empty_product(product_type, category):
@@ -176,3 +205,50 @@ def test_prepare_product_search_document_value(
     assert date_attribute_value.date_time.isoformat().lower() in search_document_value
     assert multiselect_attr_val_1.name.lower() in search_document_value
     assert multiselect_attr_val_2.name.lower() in search_document_value
+
+
+def test_search_products_full_text_ranks_by_weight(product_list, settings):
+    # given
+    settings.PRODUCT_SEARCH_BACKEND = ProductSearchBackend.FULL_TEXT
+    first_product, second_product, third_product = product_list
+    first_product.name = "Blue shirt"
+    first_product.description_plaintext = ""
+    second_product.name = "Plain shirt"
+    second_product.description_plaintext = "Dark blue color"
+    third_product.name = "Red shirt"
+    third_product.description_plaintext = ""
+    Product.objects.bulk_update(product_list, ["name", "description_plaintext"])
+    update_products_search_document(Product.objects.all())
+
+    # when
+    results = search_products(Product.objects.all(), "blu shirt").order_by(
+        "-search_rank"
+    )
+
+    # then
+    assert list(results) == [first_product, second_product]
+
+
+def test_search_products_full_text_by_sku(product, settings):
+    # given
+    settings.PRODUCT_SEARCH_BACKEND = ProductSearchBackend.FULL_TEXT
+    variant = product.variants.first()
+    update_products_search_document(Product.objects.all())
+
+    # when
+    results = search_products(Product.objects.all(), variant.sku)
+
+    # then
+    assert list(results) == [product]
+
+
+def test_search_products_full_text_special_characters(product, settings):
+    # given
+    settings.PRODUCT_SEARCH_BACKEND = ProductSearchBackend.FULL_TEXT
+    update_products_search_document(Product.objects.all())
+
+    # when
+    results = search_products(Product.objects.all(), "it's & ! \\ :*")
+
+    # then
+    assert not results.exists()
@@ -4,10 +4,12 @@ from unittest.mock import patch
 
 from django.utils import timezone
 
+from ..models import Product
 from ..tasks import (
     _get_preorder_variants_to_clean,
     update_product_discounted_price_task,
     update_products_discounted_prices_of_discount_task,
+    update_products_search_index_task,
     update_variants_names,
 )
 
@@ -114,3 +116,45 @@ def test_get_preorder_variants_to_clean(
     variants_to_clean = _get_preorder_variants_to_clean()
     assert len(variants_to_clean) == 1
     assert variants_to_clean[0] == preorder_variant_after_end_date
+
+
+def test_update_products_search_index_task(product_list):
+    # given
+    product_1, product_2, product_3 = product_list
+    Product.objects.update(search_document="", search_vector=None)
+    Product.objects.filter(pk__in=[product_1.pk, product_2.pk]).update(
+        search_index_dirty=True
+    )
+
+    # when
+    update_products_search_index_task()
+
+    # then
+    for product in [product_1, product_2]:
+        product.refresh_from_db()
+        assert not product.search_index_dirty
+        assert product.name.lower() in product.search_document
+        assert product.search_vector
+
+    product_3.refresh_from_db()
+    assert not product_3.search_document
+
+
+@patch("saleor.product.tasks.task_logger")
+@patch("saleor.product.tasks.PRODUCTS_SEARCH_INDEX_MAX_BATCHES", 1)
+@patch("saleor.product.tasks.PRODUCTS_SEARCH_INDEX_BATCH_SIZE", 2)
+def test_update_products_search_index_task_limits_batches(
+    task_logger_mock, product_list
+):
+    # given
+    Product.objects.update(search_index_dirty=True)
+
+    # when
+    update_products_search_index_task()
+
+    # then
+    assert Product.objects.filter(search_index_dirty=True).count() == 1
+    task_logger_mock.info.assert_called_once()
+    updated_count, _, _, backlog_count = task_logger_mock.info.call_args.args[1:]
+    assert updated_count == 2
+    assert backlog_count == 1
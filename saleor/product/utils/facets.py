@@ -0,0 +1,103 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, Optional
+
+from django.db.models import CharField, Count, F, Value
+from django.db.models.functions import Floor
+
+from ...attribute.models import ProductAttributeValueFacet
+from ..models import Product, ProductChannelListing
+
+if TYPE_CHECKING:
+    from django.db.models import Expression, QuerySet
+
+
+class ProductFacet:
+    ATTRIBUTE_VALUE = "attribute_value"
+    CATEGORY = "category"
+    PRICE = "price"
+
+
+@dataclass
+class ProductFacetCounts:
+    attribute_values: Dict[int, int] = field(default_factory=dict)
+    categories: Dict[int, int] = field(default_factory=dict)
+    price_buckets: Dict[Decimal, int] = field(default_factory=dict)
+
+
+def _count_products_by_facet(
+    qs: "QuerySet", facet: str, key: "Expression", product_field: str
+) -> "QuerySet":
+    return (
+        qs.order_by()
+        .annotate(facet_key=key)
+        .values("facet_key")
+        .annotate(
+            facet=Value(facet, output_field=CharField()),
+            count=Count(product_field),
+        )
+        .values_list("facet", "facet_key", "count")
+    )
+
+
+def get_product_facet_counts(
+    products: "QuerySet",
+    channel_slug: Optional[str] = None,
+    price_bucket_size: Optional[Decimal] = None,
+    visible_attributes_only: bool = False,
+) -> ProductFacetCounts:
+    """Count the given products per attribute value, category and price bucket.
+
+    All facets are counted in a single query grouping the products by each facet.
+    Price buckets are keyed by their lower bound and are counted only when
+    both the channel and the bucket size are given. With `visible_attributes_only`,
+    values of attributes hidden in the storefront are skipped.
+    """
+    database_connection_name = products.db
+    product_ids = products.order_by().values("pk")
+
+    attribute_value_facets = ProductAttributeValueFacet.objects.using(
+        database_connection_name
+    ).filter(product_id__in=product_ids)
+    if visible_attributes_only:
+        attribute_value_facets = attribute_value_facets.filter(
+            attribute__visible_in_storefront=True
+        )
+    categories = Product.objects.using(database_connection_name).filter(
+        pk__in=product_ids, category__isnull=False
+    )
+    facet_querysets = [
+        _count_products_by_facet(
+            attribute_value_facets, ProductFacet.ATTRIBUTE_VALUE, F("value_id"), "pk"
+        ),
+        _count_products_by_facet(
+            categories, ProductFacet.CATEGORY, F("category_id"), "pk"
+        ),
+    ]
+    if channel_slug and price_bucket_size:
+        channel_listings = ProductChannelListing.objects.using(
+            database_connection_name
+        ).filter(
+            product_id__in=product_ids,
+            channel__slug=str(channel_slug),
+            discounted_price_amount__isnull=False,
+        )
+        bucket = (
+            Floor(F("discounted_price_amount") / price_bucket_size) * price_bucket_size
+        )
+        facet_querysets.append(
+            _count_products_by_facet(
+                channel_listings, ProductFacet.PRICE, bucket, "product_id"
+            )
+        )
+
+    counts = ProductFacetCounts()
+    first_qs, *other_querysets = facet_querysets
+    for facet, key, count in first_qs.union(*other_querysets, all=True):
+        if facet == ProductFacet.ATTRIBUTE_VALUE:
+            counts.attribute_values[int(key)] = count
+        elif facet == ProductFacet.CATEGORY:
+            counts.categories[int(key)] = count
+        else:
+            counts.price_buckets[Decimal(key)] = count
+    return counts
@@ -1,13 +1,23 @@
 import operator
 from collections import defaultdict
 from functools import reduce
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from django.db.models import Prefetch
 from django.db.models.query_utils import Q
 from prices import Money
 
+from ...discount import DiscountInfo
 from ...discount.utils import calculate_discounted_price, fetch_active_discounts
-from ..models import Product, ProductChannelListing, ProductVariantChannelListing
+from ..models import (
+    Collection,
+    Product,
+    ProductChannelListing,
+    ProductVariantChannelListing,
+)
+
+# Number of products whose discounted prices are recalculated together.
+DISCOUNTED_PRICES_BATCH_SIZE = 2000
 
 
 def _get_variant_prices_in_channels_dict(product):
@@ -64,12 +74,72 @@ def update_product_discounted_price(product, discounts=None):
     )
 
 
+def _get_variant_prices_in_channels_for_products(
+    product_ids: Iterable[int],
+) -> Dict[Tuple[int, int], List[Money]]:
+    prices_dict: Dict[Tuple[int, int], List[Money]] = defaultdict(list)
+    variant_channel_listings = ProductVariantChannelListing.objects.filter(
+        variant__product_id__in=product_ids, price_amount__isnull=False
+    ).values_list("variant__product_id", "channel_id", "price_amount", "currency")
+    for product_id, channel_id, price_amount, currency in variant_channel_listings:
+        prices_dict[(product_id, channel_id)].append(Money(price_amount, currency))
+    return prices_dict
+
+
+def _update_products_discounted_prices_batch(
+    product_ids: List[int], discounts: List[DiscountInfo]
+):
+    """Recalculate discounted prices of the given products with a few queries.
+
+    Collections, variant prices and channel listings of all products are fetched
+    at once and the changed listings are saved with a single update.
+    """
+    products = Product.objects.filter(pk__in=product_ids).prefetch_related(
+        Prefetch("collections", queryset=Collection.objects.only("id"))
+    )
+    products_map = {product.pk: product for product in products}
+    variant_prices_in_channels_dict = _get_variant_prices_in_channels_for_products(
+        product_ids
+    )
+    product_channel_listings = ProductChannelListing.objects.filter(
+        product_id__in=product_ids
+    ).select_related("channel")
+
+    changed_products_channels_to_update = []
+    for product_channel_listing in product_channel_listings:
+        product = products_map[product_channel_listing.product_id]
+        variant_prices = variant_prices_in_channels_dict.get(
+            (product.pk, product_channel_listing.channel_id)
+        )
+        if not variant_prices:
+            continue
+        product_discounted_price = _get_product_discounted_price(
+            variant_prices,
+            product,
+            product.collections.all(),
+            discounts,
+            product_channel_listing.channel,
+        )
+        if product_channel_listing.discounted_price != product_discounted_price:
+            product_channel_listing.discounted_price_amount = (
+                product_discounted_price.amount
+            )
+            changed_products_channels_to_update.append(product_channel_listing)
+    ProductChannelListing.objects.bulk_update(
+        changed_products_channels_to_update,
+        ["discounted_price_amount"],
+        batch_size=DISCOUNTED_PRICES_BATCH_SIZE,
+    )
+
+
 def update_products_discounted_prices(products, discounts=None):
     if discounts is None:
         discounts = fetch_active_discounts()
 
-    for product in products.prefetch_related("channel_listings"):
-        update_product_discounted_price(product, discounts)
+    product_ids = list(products.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(product_ids), DISCOUNTED_PRICES_BATCH_SIZE):
+        end = start + DISCOUNTED_PRICES_BATCH_SIZE
+        _update_products_discounted_prices_batch(product_ids[start:end], discounts)
 
 
 def update_products_discounted_prices_of_catalogues(
@@ -496,6 +496,14 @@ EMPTY_CHECKOUTS_TIMEDELTA = timedelta(
     seconds=parse(os.environ.get("EMPTY_CHECKOUTS_TIMEDELTA", "6 hours"))
 )
 
+# Lifetime of the checkout prices calculated by plugins and persisted on the
+# checkout. Prices are recalculated earlier when the checkout, variant prices,
+# active discounts or tax settings change, and when a sale starts or ends.
+# Set CHECKOUT_PRICES_TTL=0 in env to calculate prices on every read.
+CHECKOUT_PRICES_TTL = timedelta(
+    seconds=parse(os.environ.get("CHECKOUT_PRICES_TTL", "1 hour"))
+)
+
 # Exports settings - defines after what time exported files will be deleted
 EXPORT_FILES_TIMEDELTA = timedelta(
     seconds=parse(os.environ.get("EXPORT_FILES_TIMEDELTA", "30 days"))
@@ -545,6 +553,14 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.csv.tasks.delete_old_export_files",
         "schedule": crontab(hour=1, minute=0),
     },
+    "update-products-search-index": {
+        "task": "saleor.product.tasks.update_products_search_index_task",
+        "schedule": timedelta(minutes=1),
+    },
+    "update-order-daily-totals": {
+        "task": "saleor.order.tasks.update_order_daily_totals_task",
+        "schedule": timedelta(hours=1),
+    },
 }
 
 EVENT_PAYLOAD_DELETE_PERIOD = timedelta(
@@ -588,6 +604,39 @@ GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Number of parsed and validated GraphQL documents kept in memory of every worker.
+# Set GRAPHQL_DOCUMENT_CACHE_SIZE=0 in env to disable
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.environ.get("GRAPHQL_DOCUMENT_CACHE_SIZE", 1000))
+
+# Total counts of `products` and `orders` are exact by default. Set the mode to
+# "estimated" to use the PostgreSQL planner estimate as the total count of items
+# when it's at least the threshold, or to "capped" to count items only up to
+# the limit.
+GRAPHQL_PRODUCTS_TOTAL_COUNT_MODE = os.environ.get(
+    "GRAPHQL_PRODUCTS_TOTAL_COUNT_MODE", "exact"
+)
+GRAPHQL_ORDERS_TOTAL_COUNT_MODE = os.environ.get(
+    "GRAPHQL_ORDERS_TOTAL_COUNT_MODE", "exact"
+)
+GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD", 10000)
+)
+GRAPHQL_TOTAL_COUNT_LIMIT = int(os.environ.get("GRAPHQL_TOTAL_COUNT_LIMIT", 10000))
+
+# Apollo-style automatic persisted queries. Query strings are shared between workers
+# using the default cache and clients may send only the SHA-256 hash of a query.
+GRAPHQL_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ENABLED", True
+)
+GRAPHQL_PERSISTED_QUERIES_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_PERSISTED_QUERIES_TIMEOUT", "1 day")
+)
+
+# Implementation of the product search, either "ilike" or "full_text". The full-text
+# search requires product search vectors to be populated with the
+# `update_search_indexes` command.
+PRODUCT_SEARCH_BACKEND = os.environ.get("PRODUCT_SEARCH_BACKEND", "ilike")
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -625,6 +674,25 @@ for entry_point in installed_plugins:
 
 PLUGINS = BUILTIN_PLUGINS + EXTERNAL_PLUGINS
 
+# How often workers check whether process-wide caches, such as plugins managers,
+# active discounts or the webhooks registry, were invalidated by other workers.
+PROCESS_CACHE_VERSION_CHECK_INTERVAL = parse(
+    os.environ.get("PROCESS_CACHE_VERSION_CHECK_INTERVAL", "1 second")
+)
+
+# Maximum lifetime of the cached list of active discounts. The cache is refreshed
+# earlier when a sale is changed, starts or ends. Set DISCOUNTS_CACHE_TIMEOUT=0
+# in env to fetch discounts for every request.
+DISCOUNTS_CACHE_TIMEOUT = parse(os.environ.get("DISCOUNTS_CACHE_TIMEOUT", "5 minutes"))
+
+# Maximum lifetime of the process-wide plugins manager that is cloned for every
+# request. Managers are rebuilt earlier when plugin configurations or channels
+# change. Set PLUGINS_MANAGER_CACHE_TIMEOUT=0 in env to build a fresh manager
+# for every request.
+PLUGINS_MANAGER_CACHE_TIMEOUT = parse(
+    os.environ.get("PLUGINS_MANAGER_CACHE_TIMEOUT", "5 minutes")
+)
+
 if (
     not DEBUG
     and ENABLE_ACCOUNT_CONFIRMATION_BY_EMAIL
@@ -639,6 +707,49 @@ if (
 # for getting response from the server.
 WEBHOOK_TIMEOUT = 10
 WEBHOOK_SYNC_TIMEOUT = 20
+# Sync webhooks sent to many apps at once (eg. shipping webhooks) are stored as
+# event deliveries before sending. Set to True to store only the failed ones.
+WEBHOOK_SYNC_SKIP_SUCCESSFUL_DELIVERIES = get_bool_from_env(
+    "WEBHOOK_SYNC_SKIP_SUCCESSFUL_DELIVERIES", False
+)
+
+# Send async webhooks in batches, reusing HTTP connections per target host, instead
+# of scheduling a separate task for every delivery.
+WEBHOOK_BATCH_DELIVERY = get_bool_from_env("WEBHOOK_BATCH_DELIVERY", False)
+WEBHOOK_BATCH_SIZE = int(os.environ.get("WEBHOOK_BATCH_SIZE", 100))
+WEBHOOK_BATCH_CONCURRENCY = int(os.environ.get("WEBHOOK_BATCH_CONCURRENCY", 8))
+# Time after which cached AWS SQS and Google Cloud Pub/Sub clients are recreated.
+WEBHOOK_PUBLISHER_CLIENT_TIMEOUT = parse(
+    os.environ.get("WEBHOOK_PUBLISHER_CLIENT_TIMEOUT", "10 minutes")
+)
+# Set WEBHOOK_EVENTS_BATCHING=True in env to send events of webhooks with
+# `batch_events` enabled in batches of at most WEBHOOK_EVENTS_BATCH_SIZE objects
+# every WEBHOOK_EVENTS_BATCH_WINDOW. Repeated events of the same object within the
+# window are sent once.
+WEBHOOK_EVENTS_BATCHING = get_bool_from_env("WEBHOOK_EVENTS_BATCHING", False)
+WEBHOOK_EVENTS_BATCH_SIZE = int(os.environ.get("WEBHOOK_EVENTS_BATCH_SIZE", 250))
+WEBHOOK_EVENTS_BATCH_WINDOW = parse(
+    os.environ.get("WEBHOOK_EVENTS_BATCH_WINDOW", "1 minute")
+)
+# Generate payloads of order and product events in a worker instead of the request.
+# Requests only record events after the transaction is committed.
+WEBHOOK_DEFERRED_PAYLOADS = get_bool_from_env("WEBHOOK_DEFERRED_PAYLOADS", False)
+# Maximum lifetime of the process-wide registry of active webhooks per event type.
+# The registry is rebuilt earlier when webhooks or apps change. Set
+# WEBHOOKS_REGISTRY_TIMEOUT=0 in env to query webhooks for every event.
+WEBHOOKS_REGISTRY_TIMEOUT = parse(
+    os.environ.get("WEBHOOKS_REGISTRY_TIMEOUT", "5 minutes")
+)
+if WEBHOOK_BATCH_DELIVERY:
+    CELERY_BEAT_SCHEDULE["send-pending-webhooks"] = {
+        "task": "saleor.plugins.webhook.tasks.send_webhook_requests_batch_task",
+        "schedule": timedelta(minutes=1),
+    }
+if WEBHOOK_EVENTS_BATCHING:
+    CELERY_BEAT_SCHEDULE["send-batched-webhook-events"] = {
+        "task": "saleor.plugins.webhook.tasks.send_batched_webhook_events_task",
+        "schedule": timedelta(seconds=WEBHOOK_EVENTS_BATCH_WINDOW),
+    }
 
 # Initialize a simple and basic Jaeger Tracing integration
 # for open-tracing if enabled.
@@ -684,4 +795,13 @@ JWT_TTL_REQUEST_EMAIL_CHANGE = timedelta(
     seconds=parse(os.environ.get("JWT_TTL_REQUEST_EMAIL_CHANGE", "1 hour")),
 )
 
+# Lifetime of users and apps, with their permissions, cached by the hash of
+# the access token they are authenticated with. Cached principals are dropped
+# earlier when they, their permissions or tokens change. Set
+# AUTH_PRINCIPAL_CACHE_TIMEOUT=0 in env to authenticate every request against
+# the database.
+AUTH_PRINCIPAL_CACHE_TIMEOUT = parse(
+    os.environ.get("AUTH_PRINCIPAL_CACHE_TIMEOUT", "1 minute")
+)
+
 # Support multiple interface notation in schema for Apollo tooling.
@@ -1,4 +1,5 @@
 import re
+from datetime import timedelta
 from typing import List, Pattern, Union
 
 from django.utils.functional import SimpleLazyObject
@@ -43,6 +44,20 @@ AUTH_PASSWORD_VALIDATORS = []
 PASSWORD_HASHERS = ["saleor.tests.dummy_password_hasher.DummyHasher"]
 
 PLUGINS = []
+# Tests rely on database rollbacks, which can't invalidate the process-wide
+# plugins manager
+PLUGINS_MANAGER_CACHE_TIMEOUT = 0
+# Same applies to the process-wide active discounts and webhooks registry
+DISCOUNTS_CACHE_TIMEOUT = 0
+WEBHOOKS_REGISTRY_TIMEOUT = 0
+# Tests modify users and permissions directly in the database, skipping the
+# invalidation of cached principals
+AUTH_PRINCIPAL_CACHE_TIMEOUT = 0
+# Tests modify prices directly in the database, skipping the invalidation of
+# persisted checkout prices
+CHECKOUT_PRICES_TTL = timedelta(0)
+# Tests replace publisher clients with mocks, which must not outlive a test
+WEBHOOK_PUBLISHER_CLIENT_TIMEOUT = 0
 
 PATTERNS_IGNORED_IN_QUERY_CAPTURES: List[Union[Pattern, SimpleLazyObject]] = [
     lazy_re_compile(r"^SET\s+")
@@ -12,19 +12,20 @@ from typing import (
 )
 
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import F, QuerySet, Sum
 from django.db.models.functions import Coalesce
 
 from ..checkout.error_codes import CheckoutErrorCode
 from ..core.exceptions import InsufficientStock, InsufficientStockData
-from ..product.models import ProductVariantChannelListing
-from .models import Reservation, Stock, StockQuerySet
+from ..product.models import ProductVariant, ProductVariantChannelListing
+from .models import ChannelStock, Reservation, Stock, StockQuerySet, Warehouse
 from .reservations import get_listings_reservations
 
 if TYPE_CHECKING:
     from ..checkout.fetch import CheckoutLineInfo
     from ..checkout.models import CheckoutLine
-    from ..product.models import Product, ProductVariant
+    from ..product.models import Product
 
 
 class ChannelListingPreorderAvailbilityInfo(NamedTuple):
@@ -538,3 +539,61 @@ def get_reserved_stock_quantity_bulk(
             reservations[variant_id] += stock_reservations["quantity_reserved"]
 
     return reservations
+
+
+def update_channel_stocks(variant_ids: Iterable[int]):
+    """Recalculate quantities of given variants available in channels.
+
+    The quantity available in a channel is the sum of quantities left after
+    allocations in stocks of warehouses assigned to the channel shipping zones.
+    Variants are locked for the time of the update, so concurrent updates of
+    the same variants are applied one after another, each on the latest stocks.
+    """
+    variant_ids = set(variant_ids)
+    if not variant_ids:
+        return
+    with transaction.atomic():
+        # evaluate the query to trigger select_for_update lock
+        list(
+            ProductVariant.objects.select_for_update(of=("self",))
+            .filter(pk__in=variant_ids)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        stocks = list(
+            Stock.objects.filter(product_variant_id__in=variant_ids)
+            .annotate_available_quantity()
+            .values_list(
+                "warehouse_id",
+                "product_variant_id",
+                "product_variant__product_id",
+                "available_quantity",
+            )
+        )
+        WarehouseShippingZone = Warehouse.shipping_zones.through  # type: ignore
+        warehouse_channels: Dict[int, List[int]] = defaultdict(list)
+        for warehouse_id, channel_id in (
+            WarehouseShippingZone.objects.filter(
+                warehouse_id__in={stock[0] for stock in stocks},
+                shippingzone__channels__isnull=False,
+            )
+            .values_list("warehouse_id", "shippingzone__channels")
+            .distinct()
+        ):
+            warehouse_channels[warehouse_id].append(channel_id)
+
+        channel_stocks: Dict[Tuple[int, int], ChannelStock] = {}
+        for warehouse_id, variant_id, product_id, available_quantity in stocks:
+            for channel_id in warehouse_channels[warehouse_id]:
+                channel_stock = channel_stocks.setdefault(
+                    (variant_id, channel_id),
+                    ChannelStock(
+                        product_variant_id=variant_id,
+                        product_id=product_id,
+                        channel_id=channel_id,
+                    ),
+                )
+                channel_stock.available_quantity += max(available_quantity, 0)
+
+        ChannelStock.objects.filter(product_variant_id__in=variant_ids).delete()
+        ChannelStock.objects.bulk_create(channel_stocks.values())
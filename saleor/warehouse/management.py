@@ -1,4 +1,5 @@
 from collections import defaultdict, namedtuple
+from functools import partial
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, cast
 
 from django.db import transaction
@@ -18,6 +19,7 @@ from ..order.fetch import OrderLineInfo
 from ..order.models import OrderLine
 from ..plugins.manager import PluginsManager
 from ..product.models import ProductVariant, ProductVariantChannelListing
+from .availability import update_channel_stocks
 from .models import (
     Allocation,
     PreorderAllocation,
@@ -72,7 +74,7 @@ def allocate_stocks(
         .order_by("pk")
         .values("id", "product_variant", "pk", "quantity")
     )
-    stocks_id = (stock.pop("id") for stock in stocks)
+    stocks_id = [stock.pop("id") for stock in stocks]
 
     quantity_reservation_for_stocks: Dict = defaultdict(int)
 
@@ -124,31 +126,44 @@ def allocate_stocks(
             quantity_reservation_for_stocks,
             insufficient_stock,
         )
+        # keep the map up to date, so the following lines and the out of stock
+        # check see quantities allocated by this call
+        for allocation in allocation_items:
+            quantity_allocation_for_stocks[
+                allocation.stock_id
+            ] += allocation.quantity_allocated
         allocations.extend(allocation_items)
 
     if insufficient_stock:
         raise InsufficientStock(insufficient_stock)
 
     if allocations:
-        stocks_to_update = []
-        for alloc in Allocation.objects.bulk_create(allocations):
-            stock = alloc.stock
-            stock.quantity_allocated = (
-                F("quantity_allocated") + alloc.quantity_allocated
-            )
-            stocks_to_update.append(stock)
-        Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
-
+        Allocation.objects.bulk_create(allocations)
+        quantity_allocated_per_stock: Dict[int, int] = defaultdict(int)
         for allocation in allocations:
-            allocated_stock = (
-                Allocation.objects.filter(stock_id=allocation.stock_id).aggregate(
-                    Sum("quantity_allocated")
-                )["quantity_allocated__sum"]
-                or 0
-            )
-            if not max(allocation.stock.quantity - allocated_stock, 0):
+            quantity_allocated_per_stock[
+                allocation.stock_id
+            ] += allocation.quantity_allocated
+        stocks_to_update = [
+            Stock(pk=stock_pk, quantity_allocated=F("quantity_allocated") + quantity)
+            for stock_pk, quantity in quantity_allocated_per_stock.items()
+        ]
+        Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+        update_channel_stocks(variant.pk for variant in variants)
+
+        stock_quantities = {
+            stock_data["pk"]: stock_data["quantity"] for stock_data in stocks
+        }
+        out_of_stock_ids = [
+            stock_pk
+            for stock_pk in quantity_allocated_per_stock
+            if stock_quantities[stock_pk] - quantity_allocation_for_stocks[stock_pk]
+            <= 0
+        ]
+        if out_of_stock_ids:
+            for stock in Stock.objects.filter(pk__in=out_of_stock_ids):
                 transaction.on_commit(
-                    lambda: manager.product_variant_out_of_stock(allocation.stock)
+                    partial(manager.product_variant_out_of_stock, stock)
                 )
 
 
@@ -271,6 +286,7 @@ def deallocate_stock(
             )
 
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    update_channel_stocks(stock.product_variant_id for stock in stocks_to_update)
 
     if not_dellocated_lines:
         raise AllocationError(not_dellocated_lines)
@@ -315,6 +331,7 @@ def increase_stock(
             )
         stock.quantity_allocated = F("quantity_allocated") + quantity
         stock.save(update_fields=["quantity_allocated"])
+    update_channel_stocks([stock.product_variant_id])
 
 
 @traced_atomic_transaction()
@@ -347,6 +364,7 @@ def increase_allocations(
         stocks_to_update.append(stock)
     Allocation.objects.filter(pk__in=allocation_pks_to_delete).delete()
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    update_channel_stocks(stock.product_variant_id for stock in stocks_to_update)
 
     allocate_stocks(
         lines_info,
@@ -426,6 +444,7 @@ def decrease_stock(
             quantity_allocation_for_stocks,
             allow_stock_to_be_exceeded,
         )
+        update_channel_stocks(variant_and_warehouse_to_stock.keys())
 
         stock_ids = (s.id for s in stocks)
         for stock in Stock.objects.filter(
@@ -518,6 +537,7 @@ def deallocate_stock_for_order(order: "Order", manager: PluginsManager):
 
     allocations.update(quantity_allocated=0)
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    update_channel_stocks(stock.product_variant_id for stock in stocks_to_update)
 
 
 @traced_atomic_transaction()
@@ -725,6 +745,7 @@ def deactivate_preorder_for_variant(product_variant: ProductVariant):
 
     if allocations_to_create:
         Allocation.objects.bulk_create(allocations_to_create)
+        update_channel_stocks([product_variant.pk])
 
     if preorder_allocations:
         preorder_allocations.delete()
@@ -0,0 +1,97 @@
+# Generated by Django 3.2.12 on 2026-10-17 08:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+POPULATE_CHANNEL_STOCKS = """
+    INSERT INTO warehouse_channelstock (
+        product_variant_id, product_id, channel_id, available_quantity
+    )
+    SELECT
+        stock.product_variant_id,
+        variant.product_id,
+        channel_warehouse.channel_id,
+        SUM(GREATEST(stock.quantity - COALESCE(allocation.quantity, 0), 0))
+    FROM warehouse_stock AS stock
+    INNER JOIN product_productvariant AS variant
+        ON variant.id = stock.product_variant_id
+    INNER JOIN (
+        SELECT DISTINCT warehouse_zone.warehouse_id, zone_channel.channel_id
+        FROM warehouse_warehouse_shipping_zones AS warehouse_zone
+        INNER JOIN shipping_shippingzone_channels AS zone_channel
+            ON zone_channel.shippingzone_id = warehouse_zone.shippingzone_id
+    ) AS channel_warehouse
+        ON channel_warehouse.warehouse_id = stock.warehouse_id
+    LEFT JOIN (
+        SELECT stock_id, SUM(quantity_allocated) AS quantity
+        FROM warehouse_allocation
+        GROUP BY stock_id
+    ) AS allocation
+        ON allocation.stock_id = stock.id
+    GROUP BY
+        stock.product_variant_id, variant.product_id, channel_warehouse.channel_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("channel", "0003_alter_channel_default_country"),
+        ("product", "0164_product_search_index_dirty"),
+        ("shipping", "0031_alter_shippingmethodtranslation_language_code"),
+        ("warehouse", "0020_merge_20220217_1316"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChannelStock",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("available_quantity", models.IntegerField(default=0)),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="channel_stocks",
+                        to="channel.channel",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="channel_stocks",
+                        to="product.product",
+                    ),
+                ),
+                (
+                    "product_variant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="channel_stocks",
+                        to="product.productvariant",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="channelstock",
+            index=models.Index(
+                fields=["product", "channel", "available_quantity"],
+                name="warehouse_c_product_5a9901_idx",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="channelstock",
+            unique_together={("product_variant", "channel")},
+        ),
+        migrations.RunSQL(POPULATE_CHANNEL_STOCKS, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -265,6 +265,30 @@ class Stock(models.Model):
             self.save(update_fields=["quantity"])
 
 
+class ChannelStock(models.Model):
+    """Quantity of a product variant available in the warehouses of a channel.
+
+    Denormalized from stocks and allocations of warehouses assigned to shipping
+    zones of the channel, allows filtering products by stock availability with
+    an index lookup.
+    """
+
+    product_variant = models.ForeignKey(
+        ProductVariant, on_delete=models.CASCADE, related_name="channel_stocks"
+    )
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="channel_stocks"
+    )
+    channel = models.ForeignKey(
+        Channel, on_delete=models.CASCADE, related_name="channel_stocks"
+    )
+    available_quantity = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = [["product_variant", "channel"]]
+        indexes = [models.Index(fields=["product", "channel", "available_quantity"])]
+
+
 class AllocationQueryset(models.QuerySet):
     def annotate_stock_available_quantity(self):
         return self.annotate(
@@ -1,13 +1,19 @@
+from typing import Iterator, List, Optional
+
 from celery.utils.log import get_task_logger
-from django.db.models import F, Sum
+from django.db.models import Exists, F, OuterRef, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from ..celeryconf import app
+from ..product.models import ProductVariant
+from .availability import update_channel_stocks
 from .models import Allocation, PreorderReservation, Reservation, Stock
 
 task_logger = get_task_logger(__name__)
 
+CHANNEL_STOCKS_BATCH_SIZE = 1000
+
 
 @app.task
 def delete_empty_allocations_task():
@@ -54,3 +60,49 @@ def update_stocks_quantity_allocated_task():
         "Finished updating quantity_allocated on stocks, %d were corrected.",
         len(stocks_to_update),
     )
+
+
+def get_channel_stocks_variant_id_batches(
+    warehouse_ids: Optional[List[int]] = None,
+) -> Iterator[List[int]]:
+    """Yield batches of IDs of variants having stocks in given warehouses.
+
+    All variants are returned when no warehouses are given.
+    """
+    variants = ProductVariant.objects.order_by("pk")
+    if warehouse_ids is not None:
+        stocks = Stock.objects.filter(warehouse_id__in=warehouse_ids)
+        variants = variants.filter(
+            Exists(stocks.filter(product_variant_id=OuterRef("pk")))
+        )
+    last_id = 0
+    while True:
+        variant_ids = list(
+            variants.filter(pk__gt=last_id).values_list("pk", flat=True)[
+                :CHANNEL_STOCKS_BATCH_SIZE
+            ]
+        )
+        if not variant_ids:
+            return
+        yield variant_ids
+        last_id = variant_ids[-1]
+
+
+@app.task
+def update_channel_stocks_task(
+    warehouse_ids: Optional[List[int]] = None, variant_ids: Optional[List[int]] = None
+):
+    """Recalculate quantities of variants available in channels.
+
+    Used when warehouses are assigned to or removed from channels through their
+    shipping zones, or deleted. Variants of the given warehouses are updated,
+    or the given variants, if their warehouses are already gone.
+    """
+    if variant_ids is not None:
+        for offset in range(0, len(variant_ids), CHANNEL_STOCKS_BATCH_SIZE):
+            update_channel_stocks(
+                variant_ids[offset : offset + CHANNEL_STOCKS_BATCH_SIZE]
+            )
+        return
+    for variant_ids_batch in get_channel_stocks_variant_id_batches(warehouse_ids):
+        update_channel_stocks(variant_ids_batch)
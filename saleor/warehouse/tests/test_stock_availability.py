@@ -7,8 +7,9 @@ from ..availability import (
     check_stock_quantity,
     check_stock_quantity_bulk,
     get_available_quantity,
+    update_channel_stocks,
 )
-from ..models import Allocation
+from ..models import Allocation, ChannelStock, Warehouse
 
 COUNTRY_CODE = "US"
 
@@ -310,3 +311,52 @@ def test_check_stock_quantity_bulk_with_reservations(
         )
         is None
     )
+
+
+def test_update_channel_stocks(variant_with_many_stocks, order_line, channel_USD):
+    # given
+    stock = variant_with_many_stocks.stocks.first()
+    Allocation.objects.create(order_line=order_line, stock=stock, quantity_allocated=3)
+
+    # when
+    update_channel_stocks([variant_with_many_stocks.pk])
+
+    # then
+    channel_stock = ChannelStock.objects.get(product_variant=variant_with_many_stocks)
+    assert channel_stock.channel == channel_USD
+    assert channel_stock.product_id == variant_with_many_stocks.product_id
+    assert channel_stock.available_quantity == 4
+
+
+def test_update_channel_stocks_ignores_over_allocated_stocks(
+    variant_with_many_stocks, order_line
+):
+    # given
+    stock = variant_with_many_stocks.stocks.first()
+    Allocation.objects.create(
+        order_line=order_line, stock=stock, quantity_allocated=stock.quantity + 5
+    )
+
+    # when
+    update_channel_stocks([variant_with_many_stocks.pk])
+
+    # then
+    channel_stock = ChannelStock.objects.get(product_variant=variant_with_many_stocks)
+    assert channel_stock.available_quantity == 7 - stock.quantity
+
+
+def test_update_channel_stocks_warehouse_without_channels(
+    variant_with_many_stocks, channel_USD
+):
+    # given
+    update_channel_stocks([variant_with_many_stocks.pk])
+    for warehouse in Warehouse.objects.all():
+        warehouse.shipping_zones.clear()
+
+    # when
+    update_channel_stocks([variant_with_many_stocks.pk])
+
+    # then
+    assert not ChannelStock.objects.filter(
+        product_variant=variant_with_many_stocks
+    ).exists()
@@ -19,7 +19,7 @@ from ..management import (
     increase_allocations,
     increase_stock,
 )
-from ..models import Allocation, PreorderAllocation
+from ..models import Allocation, ChannelStock, PreorderAllocation
 
 COUNTRY_CODE = "US"
 
@@ -41,6 +41,24 @@ def test_allocate_stocks(order_line, stock, channel_USD):
     assert allocation.quantity_allocated == stock.quantity_allocated == 50
 
 
+def test_allocate_stocks_updates_channel_stocks(order_line, stock, channel_USD):
+    # given
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=30)
+
+    # when
+    allocate_stocks(
+        [line_data], COUNTRY_CODE, channel_USD.slug, manager=get_plugins_manager()
+    )
+
+    # then
+    channel_stock = ChannelStock.objects.get(
+        product_variant=order_line.variant, channel=channel_USD
+    )
+    assert channel_stock.available_quantity == 70
+
+
 def test_allocate_stocks_multiple_lines(order_line, order, product, stock, channel_USD):
     stock.quantity = 100
     stock.save(update_fields=["quantity"])
@@ -119,6 +137,58 @@ def test_allocate_stock_with_reservations(
     assert allocations[1].quantity_allocated == 1
 
 
+def test_allocate_stock_with_reservations_and_allocations(
+    order_line,
+    variant_with_many_stocks,
+    channel_USD,
+    order_line_with_one_allocation,
+    checkout_line_with_one_reservation,
+):
+    # given
+    stocks = variant_with_many_stocks.stocks.all().order_by("pk")
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=3)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD.slug,
+        manager=get_plugins_manager(),
+        check_reservations=True,
+    )
+
+    # then
+    allocations = Allocation.objects.filter(order_line=order_line).order_by("stock")
+    assert allocations[0].stock == stocks[0]
+    assert allocations[0].quantity_allocated == 1
+    assert allocations[1].stock == stocks[1]
+    assert allocations[1].quantity_allocated == 2
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_out_of_stock_webhook_triggered(
+    product_variant_out_of_stock_webhook_mock,
+    order_line,
+    variant_with_many_stocks,
+    channel_USD,
+):
+    # given
+    stocks = variant_with_many_stocks.stocks.all().order_by("pk")
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=5)
+
+    # when
+    allocate_stocks(
+        [line_data], COUNTRY_CODE, channel_USD.slug, manager=get_plugins_manager()
+    )
+    flush_post_commit_hooks()
+
+    # then
+    product_variant_out_of_stock_webhook_mock.assert_called_once_with(stocks[0])
+    stocks = list(stocks)
+    assert stocks[0].quantity_allocated == 4
+    assert stocks[1].quantity_allocated == 1
+
+
 def test_allocate_stock_insufficient_stock_due_to_reservations(
     order_line,
     variant_with_many_stocks,
@@ -274,6 +344,28 @@ def test_deallocate_stock(allocation):
     assert allocation.quantity_allocated == 0
 
 
+def test_deallocate_stock_updates_channel_stocks(allocation, channel_USD):
+    # given
+    stock = allocation.stock
+    stock.quantity = 100
+    stock.quantity_allocated = 80
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+    allocation.quantity_allocated = 80
+    allocation.save(update_fields=["quantity_allocated"])
+    line_info = OrderLineInfo(
+        line=allocation.order_line, quantity=30, variant=stock.product_variant
+    )
+
+    # when
+    deallocate_stock([line_info], manager=get_plugins_manager())
+
+    # then
+    channel_stock = ChannelStock.objects.get(
+        product_variant=stock.product_variant, channel=channel_USD
+    )
+    assert channel_stock.available_quantity == 50
+
+
 def test_deallocate_stock_when_quantity_less_than_zero(allocation):
     stock = allocation.stock
     stock.quantity = -10
@@ -398,6 +490,21 @@ def test_increase_stock_with_new_allocation(order_line, stock):
     assert allocation.quantity_allocated == 50
 
 
+def test_increase_stock_updates_channel_stocks(order_line, stock, channel_USD):
+    # given
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+
+    # when
+    increase_stock(order_line, stock.warehouse, 50, allocate=False)
+
+    # then
+    channel_stock = ChannelStock.objects.get(
+        product_variant=stock.product_variant, channel=channel_USD
+    )
+    assert channel_stock.available_quantity == 150
+
+
 @pytest.mark.parametrize("quantity", (19, 20))
 def test_increase_allocations(quantity, allocation):
     order_line = allocation.order_line
@@ -3,9 +3,10 @@ from datetime import timedelta
 import pytest
 from django.utils import timezone
 
-from ..models import PreorderReservation, Reservation
+from ..models import ChannelStock, PreorderReservation, Reservation
 from ..tasks import (
     delete_expired_reservations_task,
+    update_channel_stocks_task,
     update_stocks_quantity_allocated_task,
 )
 
@@ -85,3 +86,30 @@ def test_update_stocks_quantity_allocated_task_stock_without_allocations(stock):
 
     stock.refresh_from_db()
     assert stock.quantity_allocated == 0
+
+
+def test_update_channel_stocks_task(variant_with_many_stocks, channel_USD):
+    # given
+    warehouse = variant_with_many_stocks.stocks.first().warehouse
+
+    # when
+    update_channel_stocks_task([warehouse.pk])
+
+    # then
+    channel_stock = ChannelStock.objects.get(product_variant=variant_with_many_stocks)
+    assert channel_stock.channel == channel_USD
+    assert channel_stock.available_quantity == 7
+
+
+
+def test_update_channel_stocks_task_for_variants(variant_with_many_stocks, channel_USD):
+    # given
+    ChannelStock.objects.all().delete()
+
+    # when
+    update_channel_stocks_task(variant_ids=[variant_with_many_stocks.pk])
+
+    # then
+    channel_stock = ChannelStock.objects.get(product_variant=variant_with_many_stocks)
+    assert channel_stock.channel == channel_USD
+    assert channel_stock.available_quantity == 7
@@ -1,4 +1,6 @@
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 from ..app.models import App
 from ..app.validators import AppURLValidator
@@ -16,6 +18,7 @@ class Webhook(models.Model):
     target_url = WebhookURLField(max_length=255)
     is_active = models.BooleanField(default=True)
     secret_key = models.CharField(max_length=255, null=True, blank=True)
+    batch_events = models.BooleanField(default=False)
 
     class Meta:
         ordering = ("pk",)
@@ -32,3 +35,41 @@ class WebhookEvent(models.Model):
 
     def __repr__(self):
         return self.event_type
+
+
+class DeferredWebhookEvent(models.Model):
+    """Event of which webhook payload is generated and sent by a worker."""
+
+    event_type = models.CharField(max_length=128)
+    object_type = models.CharField(max_length=64)
+    object_id = models.CharField(max_length=64)
+    requestor_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="+",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+    )
+    requestor_app = models.ForeignKey(
+        App, related_name="+", null=True, blank=True, on_delete=models.SET_NULL
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ("pk",)
+        indexes = [models.Index(fields=["object_type", "object_id"])]
+
+
+class BatchedWebhookEvent(models.Model):
+    """Payload of an object waiting to be sent with other objects in a batch."""
+
+    webhook = models.ForeignKey(
+        Webhook, related_name="batched_events", on_delete=models.CASCADE
+    )
+    event_type = models.CharField(max_length=128)
+    object_id = models.CharField(max_length=255)
+    payload = models.TextField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ("pk",)
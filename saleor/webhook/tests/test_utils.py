@@ -0,0 +1,102 @@
+from ..event_types import WebhookEventAsyncType, WebhookEventSyncType
+from ..utils import (
+    build_webhooks_registry,
+    get_webhooks_registry,
+    invalidate_webhooks_registry,
+)
+
+
+def test_build_webhooks_registry(
+    webhook,
+    any_webhook,
+    permission_manage_orders,
+    permission_manage_products,
+    permission_manage_payments,
+):
+    # given
+    webhook.app.permissions.set(
+        [
+            permission_manage_orders,
+            permission_manage_products,
+            permission_manage_payments,
+        ]
+    )
+
+    # when
+    registry = build_webhooks_registry()
+
+    # then
+    assert registry[WebhookEventAsyncType.ORDER_CREATED] == [webhook, any_webhook]
+    assert registry[WebhookEventAsyncType.PRODUCT_UPDATED] == [any_webhook]
+    assert registry[WebhookEventSyncType.PAYMENT_AUTHORIZE] == [any_webhook]
+
+
+def test_build_webhooks_registry_checks_app_permissions(
+    webhook, any_webhook, permission_manage_orders
+):
+    # given
+    webhook.app.permissions.set([permission_manage_orders])
+
+    # when
+    registry = build_webhooks_registry()
+
+    # then
+    assert registry[WebhookEventAsyncType.ORDER_CREATED] == [webhook, any_webhook]
+    assert WebhookEventAsyncType.PRODUCT_UPDATED not in registry
+
+
+def test_build_webhooks_registry_skips_inactive_webhooks_and_apps(
+    webhook, app, permission_manage_orders
+):
+    # given
+    app.permissions.set([permission_manage_orders])
+    webhook.is_active = False
+    webhook.save(update_fields=["is_active"])
+    active_webhook = app.webhooks.create(target_url="http://www.example.com/active")
+    active_webhook.events.create(event_type=WebhookEventAsyncType.ORDER_CREATED)
+    assert build_webhooks_registry()[WebhookEventAsyncType.ORDER_CREATED] == [
+        active_webhook
+    ]
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # when
+    registry = build_webhooks_registry()
+
+    # then
+    assert registry == {}
+
+
+def test_get_webhooks_registry_cached(
+    settings, webhook, permission_manage_orders, django_assert_num_queries
+):
+    # given
+    webhook.app.permissions.set([permission_manage_orders])
+    settings.WEBHOOKS_REGISTRY_TIMEOUT = 60
+    invalidate_webhooks_registry()
+    first_registry = get_webhooks_registry()
+
+    # when
+    with django_assert_num_queries(0):
+        registry = get_webhooks_registry()
+
+    # then
+    assert registry is first_registry
+    assert registry[WebhookEventAsyncType.ORDER_CREATED] == [webhook]
+    invalidate_webhooks_registry()
+
+
+def test_get_webhooks_registry_rebuilt_after_invalidation(settings, webhook):
+    # given
+    settings.WEBHOOKS_REGISTRY_TIMEOUT = 60
+    invalidate_webhooks_registry()
+    get_webhooks_registry()
+    webhook.delete()
+
+    # when
+    invalidate_webhooks_registry()
+    registry = get_webhooks_registry()
+
+    # then
+    assert registry == {}
+    invalidate_webhooks_registry()
@@ -0,0 +1,77 @@
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from django.conf import settings
+
+from ..core.versioned_cache import VersionedProcessCache
+from .event_types import WebhookEventAsyncType, WebhookEventSyncType
+from .models import Webhook
+
+if TYPE_CHECKING:
+    from ..core.permissions import BasePermissionEnum
+
+WEBHOOKS_REGISTRY_VERSION_CACHE_KEY = "webhooks_registry_version"
+
+# Process-wide active webhooks per event type.
+webhooks_registry_cache: VersionedProcessCache[Dict[str, List[Webhook]]] = (
+    VersionedProcessCache(WEBHOOKS_REGISTRY_VERSION_CACHE_KEY)
+)
+
+
+def get_required_permission(event_type: str) -> Optional["BasePermissionEnum"]:
+    return WebhookEventAsyncType.PERMISSIONS.get(
+        event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
+    )
+
+
+def invalidate_webhooks_registry():
+    """Rebuild the webhooks registry in all workers on the next event.
+
+    Should be called each time webhooks, their events, apps or app permissions
+    are changed.
+    """
+    webhooks_registry_cache.invalidate()
+
+
+def build_webhooks_registry() -> Dict[str, List[Webhook]]:
+    """Map event types to active webhooks of active apps allowed to receive them.
+
+    Webhooks subscribed to `WebhookEventAsyncType.ANY` are added to all event types.
+    """
+    webhooks = (
+        Webhook.objects.filter(is_active=True, app__is_active=True)
+        .select_related("app")
+        .prefetch_related("events", "app__permissions__content_type")
+    )
+    event_types = set(WebhookEventAsyncType.DISPLAY_LABELS) | set(
+        WebhookEventSyncType.DISPLAY_LABELS
+    )
+    registry: Dict[str, List[Webhook]] = defaultdict(list)
+    for webhook in webhooks:
+        app_permissions = {
+            f"{permission.content_type.app_label}.{permission.codename}"
+            for permission in webhook.app.permissions.all()
+        }
+        subscribed_event_types = {event.event_type for event in webhook.events.all()}
+        if WebhookEventAsyncType.ANY in subscribed_event_types:
+            subscribed_event_types |= event_types
+        for event_type in subscribed_event_types:
+            required_permission = get_required_permission(event_type)
+            if required_permission and required_permission.value not in app_permissions:
+                continue
+            registry[event_type].append(webhook)
+    return dict(registry)
+
+
+def get_webhooks_registry() -> Dict[str, List[Webhook]]:
+    """Return active webhooks per event type.
+
+    The registry is built once and kept in the process until it's invalidated
+    with `invalidate_webhooks_registry` or `WEBHOOKS_REGISTRY_TIMEOUT` passes.
+    The returned webhooks are shared between requests and must not be modified.
+    """
+    version, registry = webhooks_registry_cache.get(settings.WEBHOOKS_REGISTRY_TIMEOUT)
+    if registry is None:
+        registry = build_webhooks_registry()
+        webhooks_registry_cache.set(version, registry)
+    return registry